@@ -3,7 +3,8 @@ Scheduled job: Redis index cleanup.
 
 Prunes stale entries from workflow index sets (jobs:index, jobs:active,
 jobs:by_venue, and legacy v1 index) where the underlying job data has
-already expired via TTL.
+already expired via TTL, and deletes unit state those expired jobs left
+behind (found through each job's unit index, not a keyspace scan).
 
 Runs on the 1st of each month at 04:00 UTC.
 """
@@ -79,6 +79,10 @@ async def lifespan(app: FastAPI):
     await ensure_fileshare_cleanup(scheduler)
     await ensure_dfs_blacklist(scheduler)
 
+    # Resume SZ audit jobs interrupted by the last shutdown/restart
+    from routers.sz.audit_router import schedule_interrupted_audit_resume
+    schedule_interrupted_audit_resume()
+
     yield
 
     # === Shutdown ===
@@ -88,6 +92,10 @@ async def lifespan(app: FastAPI):
     await scheduler.shutdown()
     logger.info("Scheduler service stopped")
 
+    # Close the pooled async R1 HTTP client
+    from r1api.transport import close_async_http_client
+    await close_async_http_client()
+
 
 app = FastAPI(
     title="Ruckus.Tools API",
@@ -0,0 +1,270 @@
+"""
+Process-wide batched waiter for R1 async activities.
+
+R1Client.await_task_completion used to poll GET /activities/{id} once per
+activity on a stepped 1/2/3s backoff, so 100 concurrent waits (AP rename,
+bulk tagging, pop-swap config sync, ...) cost roughly 100 GETs a second.
+Waits now register here instead: one loop per event loop wakes every TICK,
+collects the activities whose next poll is due, and checks them with a
+single POST /activities/query per tenant (query_activities_bulk, up to 500
+IDs per request).
+
+Each wait keeps its own attempt counter and backoff schedule, so
+max_attempts, TimeoutError and assume_success_on_timeout behave exactly as
+before. When the bulk query shows a terminal status the activity is fetched
+once by ID, so callers still receive the full /activities/{id} record (error
+details, entity IDs). An activity the bulk query keeps missing falls back to
+per-activity GETs.
+
+Set R1_BATCHED_ACTIVITY_WAIT=false to restore per-activity polling.
+"""
+
+import asyncio
+import logging
+import os
+import time
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BATCHED_WAIT_ENABLED = os.getenv("R1_BATCHED_ACTIVITY_WAIT", "true").lower() in ("1", "true", "yes")
+
+TICK = 0.25             # loop granularity; polls still follow each wait's own schedule
+BULK_BATCH_SIZE = 500   # R1 max page size for /activities/query
+BULK_MISS_LIMIT = 5     # bulk misses before a wait switches to individual GETs
+
+TERMINAL_STATUSES = ("SUCCESS", "FAIL")
+
+
+class _Wait:
+    """One caller's outstanding await_task_completion."""
+
+    __slots__ = (
+        "request_id", "client", "tenant_id", "max_attempts", "assume_success",
+        "future", "attempt", "next_poll", "waited", "found", "bulk_misses",
+    )
+
+    def __init__(self, client, request_id, tenant_id, max_attempts, assume_success, future):
+        self.client = client
+        self.request_id = request_id
+        self.tenant_id = tenant_id
+        self.max_attempts = max_attempts
+        self.assume_success = assume_success
+        self.future = future
+        self.attempt = 0
+        self.next_poll = 0.0      # monotonic; 0 = poll on the next tick
+        self.waited = 0.0         # sum of backoff delays, for messages
+        self.found = False        # ever seen (not 404 / not missing)
+        self.bulk_misses = 0
+
+    @property
+    def group(self) -> Tuple[str, Optional[str]]:
+        return (self.client.governor.key, self.tenant_id)
+
+
+class ActivityWaiter:
+    """
+    Coalesces activity waits for one event loop.
+
+    Usage:
+        data = await get_activity_waiter().wait(client, request_id, tenant_id)
+    """
+
+    def __init__(self):
+        self._waits: List[_Wait] = []
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"waits": 0, "bulk_queries": 0, "individual_gets": 0, "ticks": 0}
+
+    async def wait(
+        self,
+        client,
+        request_id: str,
+        override_tenant_id: str = None,
+        max_attempts: int = 40,
+        assume_success_on_timeout: bool = False,
+    ) -> dict:
+        """Same contract as R1Client.await_task_completion."""
+        logger.info(f"Waiting for task {request_id} to complete...")
+        future = asyncio.get_running_loop().create_future()
+        self._waits.append(_Wait(
+            client, request_id, override_tenant_id,
+            max_attempts, assume_success_on_timeout, future,
+        ))
+        self.stats["waits"] += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return await future
+
+    def snapshot(self) -> dict:
+        return {"pending": len(self._waits), **self.stats}
+
+    # ----- loop -----
+
+    async def _run(self) -> None:
+        while self._waits:
+            await asyncio.sleep(TICK)
+            self.stats["ticks"] += 1
+            # Drop waits whose caller gave up (cancelled)
+            self._waits = [w for w in self._waits if not w.future.done()]
+            now = time.monotonic()
+            due = [w for w in self._waits if w.next_poll <= now]
+            if not due:
+                continue
+
+            groups: Dict[Tuple[str, Optional[str]], List[_Wait]] = {}
+            for w in due:
+                groups.setdefault(w.group, []).append(w)
+            try:
+                await asyncio.gather(*(self._poll_group(g) for g in groups.values()))
+            except Exception as e:
+                # _poll_group handles its own errors; this is a safety net so
+                # one bad tick can't strand every waiter
+                logger.warning(f"Activity waiter tick failed: {e}")
+
+            self._waits = [w for w in self._waits if not w.future.done()]
+
+    async def _poll_group(self, waits: List[_Wait]) -> None:
+        """Poll due waits for one tenant: bulk where possible, GET otherwise."""
+        client = waits[0].client
+        tenant_id = waits[0].tenant_id
+
+        bulk = [w for w in waits if w.bulk_misses < BULK_MISS_LIMIT]
+        individual = [w for w in waits if w.bulk_misses >= BULK_MISS_LIMIT]
+        rows: Dict[str, dict] = {}
+
+        for start in range(0, len(bulk), BULK_BATCH_SIZE):
+            chunk = bulk[start:start + BULK_BATCH_SIZE]
+            try:
+                result = await client.aquery_activities_bulk(
+                    [w.request_id for w in chunk],
+                    override_tenant_id=tenant_id,
+                    raise_on_error=True,
+                )
+                self.stats["bulk_queries"] += 1
+            except Exception as e:
+                logger.debug(f"Bulk activity query failed ({e}); polling {len(chunk)} individually")
+                individual.extend(chunk)
+                continue
+            for activity_id, row in result.items():
+                rows[activity_id] = row
+                if row.get("requestId"):
+                    rows[row["requestId"]] = row
+
+        async def fetch(w: _Wait) -> Optional[dict]:
+            self.stats["individual_gets"] += 1
+            try:
+                response = await client.aget(f"/activities/{w.request_id}", override_tenant_id=tenant_id)
+            except Exception as e:
+                logger.debug(f"GET /activities/{w.request_id} failed: {e}")
+                return None
+            return response.json() if response.ok else None
+
+        individual_ids = {id(w) for w in individual}
+        fetched = await asyncio.gather(*(fetch(w) for w in individual))
+        individual_data = {id(w): data for w, data in zip(individual, fetched)}
+
+        terminal: List[Tuple[_Wait, dict]] = []
+        for w in waits:
+            if w.future.done():
+                continue
+            if id(w) in individual_ids:
+                data = individual_data.get(id(w))
+            else:
+                data = rows.get(w.request_id)
+                if data is None:
+                    w.bulk_misses += 1
+                    if w.bulk_misses == BULK_MISS_LIMIT:
+                        logger.debug(
+                            f"Activity {w.request_id} not returned by bulk query "
+                            f"{BULK_MISS_LIMIT} times - polling it individually"
+                        )
+                else:
+                    w.bulk_misses = 0
+
+            status = data.get("status") if data else None
+            if status in TERMINAL_STATUSES:
+                terminal.append((w, data))
+            else:
+                self._advance(w, data)
+
+        # Bulk rows are a projection; hand callers the full activity record
+        async def finish(w: _Wait, data: dict) -> None:
+            if id(w) not in individual_ids:
+                full = await fetch(w)
+                if full and full.get("status") in TERMINAL_STATUSES:
+                    data = full
+            self._resolve(w, data)
+
+        if terminal:
+            await asyncio.gather(*(finish(w, data) for w, data in terminal))
+
+    # ----- per-wait state -----
+
+    def _advance(self, w: _Wait, data: Optional[dict]) -> None:
+        """Record a non-terminal poll and schedule the next one (or time out)."""
+        w.attempt += 1
+        if data is not None:
+            w.found = True
+        elif w.attempt == 1:
+            logger.debug(f"Waiting for activity {w.request_id} to be created...")
+        elif w.attempt % 10 == 0:
+            logger.debug(
+                f"Still waiting for {w.request_id}... "
+                f"(attempt {w.attempt}/{w.max_attempts}, {w.waited:.0f}s)"
+            )
+
+        if w.attempt < w.max_attempts:
+            delay = w.client._get_poll_delay(w.attempt)
+            w.next_poll = time.monotonic() + delay
+            w.waited += delay
+            return
+
+        if not w.found and w.assume_success:
+            # Activity never appeared but POST succeeded - assume it went through
+            # This handles R1's eventual consistency under heavy load
+            logger.warning(
+                f"Task {w.request_id} activity never appeared after {w.max_attempts} attempts "
+                f"({w.waited:.0f}s), but POST succeeded - assuming success (R1 eventual consistency)"
+            )
+            w.future.set_result({
+                'requestId': w.request_id,
+                'status': 'ASSUMED_SUCCESS',
+                'message': 'Activity polling timed out but creation request was accepted'
+            })
+            return
+
+        w.future.set_exception(TimeoutError(
+            f"Task {w.request_id} did not complete after {w.max_attempts} attempts "
+            f"({w.waited:.0f} seconds)"
+        ))
+
+    def _resolve(self, w: _Wait, data: dict) -> None:
+        if w.future.done():
+            return
+        if data.get("status") == "SUCCESS":
+            logger.info(f"Task {w.request_id} completed successfully ({w.waited:.0f}s)")
+            logger.debug(f"Success response for {w.request_id}: {data}")
+            w.future.set_result(data)
+        else:
+            error_msg = w.client._extract_error_message(data)
+            logger.error(f"Task {w.request_id} failed: {error_msg}")
+            logger.debug(f"Full failure response for {w.request_id}: {data}")
+            w.future.set_exception(Exception(f"Task {w.request_id} failed: {error_msg}"))
+
+
+_waiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ActivityWaiter]" = weakref.WeakKeyDictionary()
+
+
+def get_activity_waiter() -> ActivityWaiter:
+    """Return the activity waiter for the running event loop."""
+    loop = asyncio.get_running_loop()
+    waiter = _waiters.get(loop)
+    if waiter is None:
+        waiter = _waiters[loop] = ActivityWaiter()
+    return waiter
+
+
+def get_activity_waiter_stats() -> list:
+    """Snapshot of every activity waiter in this process (for status/debug endpoints)."""
+    return [w.snapshot() for w in list(_waiters.values())]
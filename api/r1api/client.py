@@ -4,7 +4,10 @@ import json
 import requests
 import time
 import asyncio
-from r1api.token_cache import get_cached_token, store_token
+from r1api import token_cache
+from r1api.activity_waiter import BATCHED_WAIT_ENABLED, get_activity_waiter
+from r1api.governor import THROTTLE_STATUSES, get_governor, on_event_loop
+from r1api.transport import R1Response, async_transport_enabled, get_async_http_client
 from r1api.services.msp import MspService
 
 logger = logging.getLogger(__name__)
@@ -21,11 +24,23 @@ from r1api.services.radius_attributes import RadiusAttributeService
 from r1api.services.ethernet_port_profiles import EthernetPortProfileService
 from r1api.services.radius_profiles import RadiusProfileService
 
+# Retries of a request R1 answered with 429/503 (each waits out Retry-After)
+MAX_THROTTLE_RETRIES = 3
+# 503 can come from a gateway after R1 already processed the request, so it
+# is only retried for methods that are safe to repeat; 429 is always retried
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+
+def _retry_throttled(method: str, status_code: int) -> bool:
+    """Whether a throttled response may be retried for this method."""
+    if status_code == 429:
+        return True
+    return status_code in THROTTLE_STATUSES and method.upper() in IDEMPOTENT_METHODS
+
+
 class R1Client:
     def __init__(self, tenant_id, client_id, shared_secret, ec_type=None, region=None):
         logger.debug(f"Initializing R1Client for tenant_id={tenant_id}, ec_type={ec_type}, region={region}")
-        # self.token = None
-        # self.token_expiry = None  # optional if you want expiry management
         self.session = requests.Session()
 
         if region == 'EU':
@@ -34,6 +49,7 @@ class R1Client:
             self.host = 'api.asia.ruckus.cloud'
         else:
             self.host = 'api.ruckus.cloud'
+        self.base_url = f"https://{self.host}"
 
         self.ec_type = ec_type if ec_type else 'EC'
 
@@ -41,12 +57,18 @@ class R1Client:
         self.client_id = client_id
         self.shared_secret = shared_secret
 
-        token = get_cached_token(tenant_id)
-        if token:
-            self.token = token
-        else:
-            self._authenticate()
-        
+        # One adaptive concurrency budget per tenant, shared by every client
+        # and tool in the process (see r1api.governor)
+        self.governor = get_governor(f"{self.host}:{tenant_id}")
+
+        # Shared across workers via Redis (see r1api.token_cache)
+        self._token_key = token_cache.token_key(tenant_id, self.host, client_id)
+        self.token, self.token_expiry = token_cache.get_cached_entry(self._token_key)
+        if not self.token:
+            self._refresh_token()
+        elif token_cache.needs_refresh(self.token_expiry):
+            self._refresh_token(stale_token=self.token)
+
         # Attach modular services
         self.msp = MspService(self)
         self.networks = NetworksService(self)
@@ -70,7 +92,7 @@ class R1Client:
     def _authenticate(self):
         """Authenticate with R1 API using client_id and shared_secret."""
         logger.debug(f"Authenticating R1Client for tenant_id={self.tenant_id} ec_type={self.ec_type}")
-        url = f"https://{self.host}/oauth2/token/{self.tenant_id}"
+        url = f"{self.base_url}/oauth2/token/{self.tenant_id}"
         headers = {'Content-Type': 'application/x-www-form-urlencoded'}
         data = {
             'grant_type': 'client_credentials',
@@ -109,22 +131,51 @@ class R1Client:
 
         self.token = data.get('access_token') or data.get('token')
         expires_in = data.get('expires_in', 3600)  # default to 1hr if not specified
-        store_token(self.tenant_id, self.token, expires_in)
+        self.token_expiry = token_cache.store_token(self._token_key, self.token, expires_in)
+        self.auth_failed = False
 
         logger.debug(f"Authentication successful, token expires in {expires_in}s")
 
-    def _request(self, method, path, payload=None, params=None, override_tenant_id=None):
-        """General request wrapper."""
-        url = f"https://{self.host}{path}"
-        verbose = os.environ.get('R1_VERBOSE', '').lower() in ('1', 'true', 'yes')
+    def _refresh_token(self, stale_token=None, rejected=False):
+        """
+        Single-flight token refresh.
 
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
+        Only one worker re-authenticates per tenant/region/client; the others
+        block on the refresh lock and then adopt the token it cached. If a
+        proactive refresh fails, the still-valid old token is kept; a token R1
+        has rejected (`rejected=True`) is never kept.
+        """
+        previous = (self.token, self.token_expiry)
+        with token_cache.refresh_lock(self._token_key):
+            token, expiry = token_cache.get_cached_entry(self._token_key)
+            if token and token != stale_token and not token_cache.needs_refresh(expiry):
+                self.token, self.token_expiry = token, expiry
+                return
+            self._authenticate()
+
+        if not self.token and not rejected and previous[1] and previous[1] > time.time():
+            logger.warning(f"Token refresh failed for tenant {self.tenant_id}; keeping current token until expiry")
+            self.token, self.token_expiry = previous
+            self.auth_failed = False
+
+    def _token_needs_refresh(self):
+        return token_cache.needs_refresh(self.token_expiry)
+
+    def _handle_unauthorized(self, used_token):
+        """Drop a token R1 rejected with 401 and fetch a new one."""
+        logger.info(f"R1 returned 401 for tenant {self.tenant_id}; re-authenticating")
+        token_cache.invalidate_token(self._token_key, used_token)
+        self._refresh_token(stale_token=used_token, rejected=True)
+
+    def _request_headers(self, override_tenant_id=None, content_type="application/json"):
+        headers = {"Authorization": f"Bearer {self.token}"}
+        if content_type:
+            headers["Content-Type"] = content_type
         if override_tenant_id:
             headers["x-rks-tenantid"] = override_tenant_id
+        return headers
 
+    def _log_request(self, method, path, payload, params, verbose):
         if verbose:
             logger.info(f">>> {method.upper()} {path}")
             if payload:
@@ -132,24 +183,120 @@ class R1Client:
             if params:
                 logger.info(f">>> PARAMS: {params}")
 
-        response = self.session.request(
-            method,
-            url,
-            headers=headers,
-            json=payload,
-            params=params,
-            verify=True
-        )
-
+    def _log_response(self, method, path, response, verbose):
         if verbose:
             body = response.text[:3000] if response.text else '(empty)'
             logger.info(f"<<< {response.status_code} {path}\n{body}")
         else:
-            logger.debug(f"{method.upper()} {url} --> {response.status_code}")
+            logger.debug(f"{method.upper()} {self.base_url}{path} --> {response.status_code}")
 
         if not response.ok:
             logger.warning(f"Request error: {response.status_code} - {response.text[:500]}")
 
+    def _request(self, method, path, payload=None, params=None, override_tenant_id=None):
+        """General request wrapper (blocking; use the a* verbs from coroutines)."""
+        url = f"{self.base_url}{path}"
+        verbose = os.environ.get('R1_VERBOSE', '').lower() in ('1', 'true', 'yes')
+
+        if self._token_needs_refresh():
+            self._refresh_token(stale_token=self.token)
+
+        self._log_request(method, path, payload, params, verbose)
+
+        auth_retried = False
+        throttle_retries = 0
+        while True:
+            used_token = self.token
+            with self.governor.slot_sync():
+                started = time.monotonic()
+                response = self.session.request(
+                    method,
+                    url,
+                    headers=self._request_headers(override_tenant_id),
+                    json=payload,
+                    params=params,
+                    verify=True
+                )
+                self.governor.record(
+                    response.status_code, time.monotonic() - started,
+                    response.headers.get('Retry-After'),
+                )
+            # Token expired or was revoked mid-job: re-auth once and retry
+            if response.status_code == 401 and not auth_retried:
+                auth_retried = True
+                self._handle_unauthorized(used_token)
+                if self.token:
+                    continue
+            # Throttled: the governor has already paused the tenant for
+            # Retry-After, so the retry waits in slot_sync(). On the event
+            # loop thread that wait is skipped, so the response is returned.
+            if (
+                _retry_throttled(method, response.status_code)
+                and throttle_retries < MAX_THROTTLE_RETRIES
+                and not on_event_loop()
+            ):
+                throttle_retries += 1
+                logger.info(f"R1 throttled {method.upper()} {path} ({response.status_code}), retry {throttle_retries}/{MAX_THROTTLE_RETRIES}")
+                continue
+            break
+
+        self._log_response(method, path, response, verbose)
+        return response
+
+    async def _arequest(self, method, path, payload=None, params=None, override_tenant_id=None):
+        """
+        Awaitable request wrapper.
+
+        Uses the shared pooled httpx client (see r1api.transport) so the event
+        loop keeps running while R1 answers. With R1_ASYNC_TRANSPORT=0 it falls
+        back to the blocking session in a worker thread.
+        """
+        if not async_transport_enabled():
+            return await asyncio.to_thread(
+                self._request, method, path, payload=payload, params=params,
+                override_tenant_id=override_tenant_id,
+            )
+
+        url = f"{self.base_url}{path}"
+        verbose = os.environ.get('R1_VERBOSE', '').lower() in ('1', 'true', 'yes')
+
+        # Token refresh is rare and may wait on another worker's lock, so it
+        # runs in a thread rather than on the loop
+        if self._token_needs_refresh():
+            await asyncio.to_thread(self._refresh_token, self.token)
+
+        self._log_request(method, path, payload, params, verbose)
+
+        http = get_async_http_client()
+        auth_retried = False
+        throttle_retries = 0
+        while True:
+            used_token = self.token
+            async with self.governor.slot():
+                started = time.monotonic()
+                response = R1Response(await http.request(
+                    method.upper(),
+                    url,
+                    headers=self._request_headers(override_tenant_id),
+                    json=payload,
+                    params=params,
+                ))
+                self.governor.record(
+                    response.status_code, time.monotonic() - started,
+                    response.headers.get('Retry-After'),
+                )
+            if response.status_code == 401 and not auth_retried:
+                auth_retried = True
+                await asyncio.to_thread(self._handle_unauthorized, used_token)
+                if self.token:
+                    continue
+            if _retry_throttled(method, response.status_code) and throttle_retries < MAX_THROTTLE_RETRIES:
+                throttle_retries += 1
+                logger.info(f"R1 throttled {method.upper()} {path} ({response.status_code}), retry {throttle_retries}/{MAX_THROTTLE_RETRIES}")
+                continue
+            break
+
+        self._log_response(method, path, response, verbose)
         return response
 
     # Basic HTTP verbs
@@ -168,12 +315,28 @@ class R1Client:
     def patch(self, path, payload=None, override_tenant_id=None):
         return self._request("patch", path, payload=payload, override_tenant_id=override_tenant_id)
 
+    # Awaitable HTTP verbs (same signatures, non-blocking)
+    async def aget(self, path, params=None, override_tenant_id=None):
+        return await self._arequest("get", path, params=params, override_tenant_id=override_tenant_id)
+
+    async def apost(self, path, payload=None, params=None, override_tenant_id=None):
+        return await self._arequest("post", path, payload=payload, params=params, override_tenant_id=override_tenant_id)
+
+    async def aput(self, path, payload=None, override_tenant_id=None):
+        return await self._arequest("put", path, payload=payload, override_tenant_id=override_tenant_id)
+
+    async def adelete(self, path, payload=None, override_tenant_id=None):
+        return await self._arequest("delete", path, payload=payload, override_tenant_id=override_tenant_id)
+
+    async def apatch(self, path, payload=None, override_tenant_id=None):
+        return await self._arequest("patch", path, payload=payload, override_tenant_id=override_tenant_id)
+
     def safe_json(self, response):
         """
         Safely extract JSON from a response, with proper error handling.
 
         Args:
-            response: requests.Response object
+            response: requests.Response or R1Response object
 
         Returns:
             Parsed JSON data
@@ -207,23 +370,53 @@ class R1Client:
         Returns:
             Response object
         """
-        url = f"https://{self.host}{path}"
+        url = f"{self.base_url}{path}"
 
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            # Don't set Content-Type - requests will set it with boundary for multipart
-        }
-        if override_tenant_id:
-            headers["x-rks-tenantid"] = override_tenant_id
+        if self._token_needs_refresh():
+            self._refresh_token(stale_token=self.token)
+
+        # Don't set Content-Type - requests will set it with boundary for multipart
+        headers = self._request_headers(override_tenant_id, content_type=None)
 
         logger.debug(f"R1Client Multipart POST: {path}")
 
-        response = self.session.post(
-            url,
-            headers=headers,
-            files=files,
-            verify=True
-        )
+        with self.governor.slot_sync():
+            started = time.monotonic()
+            response = self.session.post(
+                url,
+                headers=headers,
+                files=files,
+                verify=True
+            )
+            self.governor.record(response.status_code, time.monotonic() - started, response.headers.get('Retry-After'))
+
+        logger.debug(f"POST (multipart) {url} --> {response.status_code}")
+        if not response.ok:
+            logger.warning(f"Multipart request error: {response.status_code} - {response.text[:500]}")
+
+        return response
+
+    async def apost_multipart(self, path, files, override_tenant_id=None):
+        """Awaitable post_multipart (same arguments and return shape)."""
+        if not async_transport_enabled():
+            return await asyncio.to_thread(
+                self.post_multipart, path, files, override_tenant_id=override_tenant_id
+            )
+
+        url = f"{self.base_url}{path}"
+
+        if self._token_needs_refresh():
+            await asyncio.to_thread(self._refresh_token, self.token)
+
+        headers = self._request_headers(override_tenant_id, content_type=None)
+
+        logger.debug(f"R1Client Multipart POST: {path}")
+
+        http = get_async_http_client()
+        async with self.governor.slot():
+            started = time.monotonic()
+            response = R1Response(await http.post(url, headers=headers, files=files))
+            self.governor.record(response.status_code, time.monotonic() - started, response.headers.get('Retry-After'))
 
         logger.debug(f"POST (multipart) {url} --> {response.status_code}")
         if not response.ok:
@@ -366,6 +559,11 @@ class R1Client:
         Uses stepped backoff: 1s for first 5 attempts, 2s for next 10, then 3s.
         This catches fast completions quickly while reducing API pressure for slow ops.
 
+        Concurrent waits in the process are coalesced by the activity waiter
+        (see r1api.activity_waiter): each tick, every wait whose next poll is
+        due is checked with one POST /activities/query per tenant instead of
+        one GET each. R1_BATCHED_ACTIVITY_WAIT=false polls individually.
+
         Args:
             request_id: The requestId returned from a 202 response
             override_tenant_id: Optional tenant ID for MSP multi-tenant calls
@@ -381,13 +579,21 @@ class R1Client:
             TimeoutError: If task doesn't complete within max_attempts
             Exception: If task status is FAIL
         """
+        if BATCHED_WAIT_ENABLED:
+            return await get_activity_waiter().wait(
+                self, request_id,
+                override_tenant_id=override_tenant_id,
+                max_attempts=max_attempts,
+                assume_success_on_timeout=assume_success_on_timeout,
+            )
+
         logger.info(f"Waiting for task {request_id} to complete...")
 
         activity_found = False  # Track if we ever got past 404
         total_wait_time = 0.0
 
         for attempt in range(1, max_attempts + 1):
-            response = self.get(f"/activities/{request_id}", override_tenant_id=override_tenant_id)
+            response = await self.aget(f"/activities/{request_id}", override_tenant_id=override_tenant_id)
 
             if not response.ok:
                 # Activity might not exist yet - this is normal for the first few attempts
@@ -511,6 +717,63 @@ class R1Client:
 
         return result
 
+    async def aquery_activities_bulk(
+        self,
+        activity_ids: list[str],
+        override_tenant_id: str = None,
+        raise_on_error: bool = False,
+    ) -> dict[str, dict]:
+        """
+        Awaitable query_activities_bulk (same payload and result shape).
+
+        Args:
+            activity_ids: List of activity/request IDs to query (max 500)
+            override_tenant_id: Optional tenant ID for MSP multi-tenant calls
+            raise_on_error: Raise instead of returning {} when the query fails,
+                so callers can tell "not found" from "couldn't ask"
+
+        Returns:
+            Dict mapping activity_id -> activity data
+        """
+        if not activity_ids:
+            return {}
+
+        # NOTE: R1 uses direct array format for filters (see query_activities_bulk)
+        payload = {
+            "filters": {
+                "id": activity_ids
+            },
+            "pageSize": min(len(activity_ids), 500),
+            "page": 1,
+            "sortField": "startDatetime",
+            "sortOrder": "DESC",
+        }
+
+        response = await self.apost(
+            "/activities/query",
+            payload=payload,
+            override_tenant_id=override_tenant_id
+        )
+
+        if not response.ok:
+            if raise_on_error:
+                raise Exception(f"POST /activities/query failed: {response.status_code}")
+            logger.warning(f"POST /activities/query failed: {response.status_code}")
+            return {}
+
+        result = {}
+        for activity in response.json().get('data', []):
+            aid = activity.get('id')
+            if aid:
+                result[aid] = activity
+
+        logger.debug(
+            f"Bulk query: requested {len(activity_ids)}, "
+            f"returned {len(result)} activities"
+        )
+
+        return result
+
     async def await_task_completion_bulk(
         self,
         request_ids: list[str],
@@ -634,7 +897,7 @@ class R1Client:
         """
         Poll multiple activities concurrently using parallel individual GET requests.
 
-        Uses concurrent GET /activities/{id} requests via asyncio thread pool to
+        Uses concurrent GET /activities/{id} requests over the async transport to
         efficiently poll multiple activities in parallel while respecting rate limits.
 
         Args:
@@ -658,10 +921,10 @@ class R1Client:
         start_time = asyncio.get_event_loop().time()
         poll_count = 0
 
-        # Helper to fetch a single activity (runs in thread pool since requests is sync)
-        def fetch_activity(req_id: str):
+        # Helper to fetch a single activity (awaits the async transport)
+        async def fetch_activity(req_id: str):
             try:
-                response = self.get(f"/activities/{req_id}", override_tenant_id=override_tenant_id)
+                response = await self.aget(f"/activities/{req_id}", override_tenant_id=override_tenant_id)
                 if response.ok:
                     return req_id, response.json()
                 elif response.status_code == 404:
@@ -675,13 +938,11 @@ class R1Client:
         while pending_ids and (asyncio.get_event_loop().time() - start_time) < max_poll_seconds:
             poll_count += 1
 
-            # Fetch all pending activities concurrently using thread pool
-            loop = asyncio.get_event_loop()
-            fetch_tasks = [
-                loop.run_in_executor(None, fetch_activity, req_id)
-                for req_id in list(pending_ids)
-            ]
-            fetch_results = await asyncio.gather(*fetch_tasks, return_exceptions=True)
+            # Fetch all pending activities concurrently
+            fetch_results = await asyncio.gather(
+                *(fetch_activity(req_id) for req_id in list(pending_ids)),
+                return_exceptions=True
+            )
 
             # Process results
             newly_completed = []
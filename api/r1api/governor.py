@@ -0,0 +1,362 @@
+"""
+Adaptive per-tenant request governor for the RuckusONE API.
+
+Every R1Client request (async verbs and the blocking verbs used from worker
+threads) takes a slot from the governor for its tenant, so a dashboard
+refresh, a per-unit SSID job and an orchestrator sync against the same tenant
+share one concurrency budget instead of each bringing its own semaphore.
+
+The budget is AIMD:
+  - additive increase: +1 slot per window of successful, fast responses
+  - multiplicative decrease: halve on 429/503, shrink 10% when short-term
+    latency climbs well above the long-term average (R1 queueing before it
+    starts throttling)
+  - Retry-After (seconds or HTTP date) pauses the whole tenant until it passes
+
+A blocking request made on an event-loop thread never waits for a slot or
+a pause: the loop's own coroutines may hold every slot, so it runs over
+budget (and is logged) instead of deadlocking the loop.
+
+Back-offs and pauses are published to Redis so other workers on the same
+tenant slow down too. That sync is fire-and-forget and at most once per
+SHARED_SYNC_INTERVAL; without Redis each worker governs itself.
+"""
+
+import asyncio
+import email.utils
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional
+
+from r1api.redis_sync import get_sync_redis, redis_failed
+
+logger = logging.getLogger(__name__)
+
+INITIAL_CONCURRENCY = float(os.getenv("R1_GOVERNOR_INITIAL", "20"))
+MIN_CONCURRENCY = float(os.getenv("R1_GOVERNOR_MIN", "2"))
+MAX_CONCURRENCY = float(os.getenv("R1_GOVERNOR_MAX", "100"))
+
+DECREASE_FACTOR = 0.5           # on 429 / 503
+LATENCY_DECREASE_FACTOR = 0.9   # on latency well above the long-term average
+LATENCY_TOLERANCE = 2.5         # "slow" = short-term latency > long-term * this
+DECREASE_COOLDOWN = 1.0         # seconds between decreases (one per RTT-ish)
+DEFAULT_THROTTLE_PAUSE = 2.0    # seconds, when R1 sends no Retry-After
+MAX_THROTTLE_PAUSE = 60.0
+THROTTLE_STATUSES = (429, 503)
+
+SHARED_SYNC_INTERVAL = 1.0
+SHARED_KEY_PREFIX = "r1:governor"
+SHARED_KEY_TTL = 300
+
+# Waiters re-check at least this often, so a lost wake-up can't stall them
+WAIT_RECHECK = 1.0
+
+
+def on_event_loop() -> bool:
+    """Whether an asyncio loop is running on the calling thread."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class R1Governor:
+    """
+    AIMD concurrency limiter shared by every R1Client for one tenant.
+
+    Thread-safe and loop-agnostic: async callers park on a future of their
+    own loop, sync callers on a threading.Event, and releases wake either.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self.limit = INITIAL_CONCURRENCY
+        self.in_flight = 0
+        self.pause_until = 0.0
+
+        # Short- and long-horizon latency averages (seconds). Comparing the
+        # two rather than using absolute thresholds keeps this independent
+        # of the endpoint mix each tenant happens to be calling.
+        self.latency_short: Optional[float] = None
+        self.latency_long: Optional[float] = None
+
+        self._lock = threading.Lock()
+        self._waiters: deque = deque()
+        self._last_decrease = 0.0
+        self._last_shared_sync = 0.0
+        self._seen_remote_backoff = 0.0
+
+        self.stats = {"requests": 0, "throttled": 0, "decreases": 0, "increases": 0, "loop_bypass": 0}
+
+    def __repr__(self):
+        return (
+            f"<R1Governor {self.key} limit={self.limit:.1f} "
+            f"in_flight={self.in_flight} paused={self.pause_remaining():.1f}s>"
+        )
+
+    # ----- slot accounting -----
+
+    def pause_remaining(self) -> float:
+        return max(0.0, self.pause_until - time.time())
+
+    def _try_acquire_locked(self) -> bool:
+        if self.in_flight < max(1, int(self.limit)) and time.time() >= self.pause_until:
+            self.in_flight += 1
+            return True
+        return False
+
+    def _wake_locked(self, count: int):
+        while count > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if isinstance(waiter, threading.Event):
+                waiter.set()
+                count -= 1
+                continue
+            loop, fut = waiter
+            if fut.done():
+                continue
+            try:
+                loop.call_soon_threadsafe(_resolve, fut)
+                count -= 1
+            except RuntimeError:
+                # Waiter's loop is closed
+                continue
+
+    def _release(self):
+        with self._lock:
+            self.in_flight -= 1
+            self._wake_locked(max(1, int(self.limit) - self.in_flight))
+
+    async def acquire(self):
+        loop = asyncio.get_running_loop()
+        self._maybe_sync_shared(loop)
+        while True:
+            pause = self.pause_remaining()
+            if pause > 0:
+                await asyncio.sleep(pause)
+            with self._lock:
+                if self._try_acquire_locked():
+                    return
+                fut = loop.create_future()
+                self._waiters.append((loop, fut))
+            try:
+                await asyncio.wait_for(fut, timeout=WAIT_RECHECK)
+            except asyncio.TimeoutError:
+                pass
+
+    def acquire_sync(self):
+        if on_event_loop():
+            # A blocking call made on the loop thread can't wait here: the
+            # coroutines holding the slots only release them once the loop
+            # runs again. Take the slot over budget instead of deadlocking.
+            self._maybe_sync_shared(asyncio.get_running_loop())
+            with self._lock:
+                self.in_flight += 1
+                self.stats["loop_bypass"] += 1
+            logger.warning(
+                f"R1 governor {self.key}: blocking request on the event loop thread "
+                f"bypassed the concurrency limit (use the async verbs)"
+            )
+            return
+        self._maybe_sync_shared(None)
+        while True:
+            pause = self.pause_remaining()
+            if pause > 0:
+                time.sleep(pause)
+            with self._lock:
+                if self._try_acquire_locked():
+                    return
+                event = threading.Event()
+                self._waiters.append(event)
+            event.wait(WAIT_RECHECK)
+
+    @asynccontextmanager
+    async def slot(self):
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    @contextmanager
+    def slot_sync(self):
+        self.acquire_sync()
+        try:
+            yield
+        finally:
+            self._release()
+
+    # ----- feedback -----
+
+    def record(self, status_code: int, latency: float, retry_after: Optional[str] = None) -> float:
+        """
+        Feed one response back into the controller.
+
+        Returns the pause (seconds) the caller should honour before retrying
+        a throttled request, or 0.0.
+        """
+        now = time.time()
+        pause = 0.0
+        backed_off = False
+        with self._lock:
+            self.stats["requests"] += 1
+
+            if status_code in THROTTLE_STATUSES:
+                self.stats["throttled"] += 1
+                pause = parse_retry_after(retry_after)
+                if pause is None:
+                    pause = DEFAULT_THROTTLE_PAUSE
+                pause = min(pause, MAX_THROTTLE_PAUSE)
+                if pause:
+                    self.pause_until = max(self.pause_until, now + pause)
+                backed_off = self._decrease_locked(now, DECREASE_FACTOR)
+            else:
+                self._observe_latency_locked(latency)
+                slow = (
+                    self.stats["requests"] > 50
+                    and self.latency_short > self.latency_long * LATENCY_TOLERANCE
+                )
+                if slow:
+                    self._decrease_locked(now, LATENCY_DECREASE_FACTOR)
+                elif status_code < 500 and self.in_flight + 1 >= int(self.limit):
+                    # Only grow when the current budget is actually in use
+                    before = int(self.limit)
+                    self.limit = min(MAX_CONCURRENCY, self.limit + 1.0 / self.limit)
+                    if int(self.limit) > before:
+                        self.stats["increases"] += 1
+                        self._wake_locked(1)
+
+        if backed_off:
+            logger.warning(
+                f"R1 governor {self.key}: HTTP {status_code}, concurrency -> "
+                f"{int(self.limit)}, pause {pause:.1f}s"
+            )
+            self._publish_backoff(now)
+        return pause
+
+    def _observe_latency_locked(self, latency: float):
+        if self.latency_short is None:
+            self.latency_short = self.latency_long = latency
+            return
+        self.latency_short = 0.8 * self.latency_short + 0.2 * latency
+        self.latency_long = 0.99 * self.latency_long + 0.01 * latency
+
+    def _decrease_locked(self, now: float, factor: float) -> bool:
+        if now - self._last_decrease < DECREASE_COOLDOWN:
+            return False
+        self._last_decrease = now
+        self.limit = max(MIN_CONCURRENCY, self.limit * factor)
+        self.stats["decreases"] += 1
+        return True
+
+    # ----- cross-worker sharing -----
+
+    def _maybe_sync_shared(self, loop: Optional[asyncio.AbstractEventLoop]):
+        now = time.time()
+        if now - self._last_shared_sync < SHARED_SYNC_INTERVAL:
+            return
+        self._last_shared_sync = now
+        if loop is not None:
+            loop.run_in_executor(None, self._sync_shared)
+        else:
+            self._sync_shared()
+
+    def _sync_shared(self):
+        """Adopt pauses and back-offs published by other workers."""
+        client = get_sync_redis()
+        if client is None:
+            return
+        try:
+            shared = client.hgetall(f"{SHARED_KEY_PREFIX}:{self.key}")
+        except Exception as e:
+            redis_failed(e)
+            return
+        if not shared:
+            return
+        remote_pause = float(shared.get("pause_until") or 0)
+        remote_backoff = float(shared.get("backoff_at") or 0)
+        with self._lock:
+            if remote_pause > self.pause_until:
+                self.pause_until = remote_pause
+            if remote_backoff > self._seen_remote_backoff:
+                self._seen_remote_backoff = remote_backoff
+                if remote_backoff > self._last_decrease:
+                    self._decrease_locked(remote_backoff, DECREASE_FACTOR)
+
+    def _publish_backoff(self, now: float):
+        client = get_sync_redis()
+        if client is None:
+            return
+
+        def publish():
+            try:
+                key = f"{SHARED_KEY_PREFIX}:{self.key}"
+                pipe = client.pipeline()
+                pipe.hset(key, mapping={"pause_until": self.pause_until, "backoff_at": now})
+                pipe.expire(key, SHARED_KEY_TTL)
+                pipe.execute()
+            except Exception as e:
+                redis_failed(e)
+
+        self._seen_remote_backoff = now
+        try:
+            asyncio.get_running_loop().run_in_executor(None, publish)
+        except RuntimeError:
+            publish()
+
+    def snapshot(self) -> dict:
+        return {
+            "key": self.key,
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "paused_for": round(self.pause_remaining(), 2),
+            "latency_short_ms": round((self.latency_short or 0) * 1000, 1),
+            "latency_long_ms": round((self.latency_long or 0) * 1000, 1),
+            **self.stats,
+        }
+
+
+def _resolve(fut: asyncio.Future):
+    if not fut.done():
+        fut.set_result(None)
+
+
+_governors: Dict[str, R1Governor] = {}
+_governors_lock = threading.Lock()
+
+
+def get_governor(key: str) -> R1Governor:
+    """Return the process-wide governor for a tenant key."""
+    governor = _governors.get(key)
+    if governor is None:
+        with _governors_lock:
+            governor = _governors.setdefault(key, R1Governor(key))
+    return governor
+
+
+def get_governor_stats() -> list:
+    """Snapshot of every governor in this process (for status/debug endpoints)."""
+    return [g.snapshot() for g in list(_governors.values())]
@@ -0,0 +1,152 @@
+"""
+Concurrent pagination for R1 query endpoints.
+
+Most R1 list endpoints are page-numbered and report a total up front, so
+once the first page is back every remaining page number is known. These
+helpers fetch page 1 (or 0) alone, then fan out the rest with bounded
+concurrency instead of walking them one round trip at a time.
+
+Two forms:
+  - fetch_all_pages(): returns every row plus the reported total
+  - iter_pages() / iter_rows(): async iterators that yield in page order
+    while keeping at most `max_concurrency` pages in flight, so callers can
+    process rows as they arrive without holding the whole result set
+
+Usage:
+    async def fetch(page, page_size):
+        return await client.dpsk.query_passphrases(pool_id, tenant_id, page=page, limit=page_size)
+
+    rows, total = await fetch_all_pages(fetch, first_page=1, page_size=500)
+
+    async for row in iter_rows(fetch, first_page=1, page_size=500):
+        ...
+
+R1 responses come in two shapes: {"data": [...], "totalCount": N} for the
+query endpoints and Spring-style {"content": [...], "totalElements": N} for
+some GET lists. Both are handled.
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+FetchPage = Callable[[int, int], Awaitable[Dict[str, Any]]]
+
+
+def page_rows(response: Any) -> List[dict]:
+    """Extract the row list from an R1 page response."""
+    if isinstance(response, list):
+        return response
+    if not isinstance(response, dict):
+        return []
+    rows = response.get('data')
+    if rows is None:
+        rows = response.get('content')
+    return rows or []
+
+
+def page_total(response: Any, default: int) -> int:
+    """Extract the total row count from an R1 page response."""
+    if not isinstance(response, dict):
+        return default
+    for key in ('totalCount', 'totalElements'):
+        value = response.get(key)
+        if isinstance(value, int):
+            return value
+    return default
+
+
+async def iter_pages(
+    fetch_page: FetchPage,
+    first_page: int = 1,
+    page_size: int = 500,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    first_response: Optional[dict] = None,
+) -> AsyncIterator[Tuple[int, List[dict], int]]:
+    """
+    Yield (page_number, rows, total) for every page, in page order.
+
+    The first page is fetched alone to learn totalCount and the effective
+    page size (R1 silently clamps oversized pageSize values). Remaining pages
+    run with up to `max_concurrency` requests in flight; later pages are
+    buffered until their predecessors have been yielded.
+
+    Args:
+        fetch_page: async callable(page, page_size) -> raw page response
+        first_page: Page number of the first page (1 for most query
+                    endpoints, 0 for Spring-style endpoints)
+        page_size: Requested page size
+        max_concurrency: Max pages in flight after the first
+        first_response: Already-fetched first page, if the caller has it
+    """
+    if first_response is None:
+        first_response = await fetch_page(first_page, page_size)
+    rows = page_rows(first_response)
+    total = page_total(first_response, len(rows))
+    yield first_page, rows, total
+
+    if not rows or total <= len(rows):
+        return
+
+    effective_size = len(rows)
+    pages_needed = (total + effective_size - 1) // effective_size
+    remaining = list(range(first_page + 1, first_page + pages_needed))
+    logger.debug(
+        f"Paginating {total} rows: page_size={effective_size}, "
+        f"{len(remaining)} more page(s), concurrency={max_concurrency}"
+    )
+
+    in_flight: Dict[int, asyncio.Task] = {}
+    next_index = 0
+
+    def schedule():
+        nonlocal next_index
+        while next_index < len(remaining) and len(in_flight) < max(1, max_concurrency):
+            page = remaining[next_index]
+            in_flight[page] = asyncio.create_task(fetch_page(page, page_size))
+            next_index += 1
+
+    try:
+        schedule()
+        for page in remaining:
+            response = await in_flight.pop(page)
+            schedule()
+            page_data = page_rows(response)
+            if not page_data:
+                # Total shrank underneath us (rows deleted mid-walk)
+                logger.debug(f"Page {page} returned no rows - stopping pagination")
+                return
+            yield page, page_data, total
+    finally:
+        for task in in_flight.values():
+            task.cancel()
+
+
+async def iter_rows(
+    fetch_page: FetchPage,
+    first_page: int = 1,
+    page_size: int = 500,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> AsyncIterator[dict]:
+    """Yield individual rows across all pages (see iter_pages)."""
+    async for _, rows, _ in iter_pages(fetch_page, first_page, page_size, max_concurrency):
+        for row in rows:
+            yield row
+
+
+async def fetch_all_pages(
+    fetch_page: FetchPage,
+    first_page: int = 1,
+    page_size: int = 500,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Tuple[List[dict], int]:
+    """Fetch every page and return (rows, reported_total)."""
+    all_rows: List[dict] = []
+    total = 0
+    async for _, rows, total in iter_pages(fetch_page, first_page, page_size, max_concurrency):
+        all_rows.extend(rows)
+    return all_rows, total
@@ -0,0 +1,49 @@
+"""
+Sync Redis client shared by r1api modules (token cache, request governor).
+
+R1Client is constructed and used from both coroutines and worker threads, so
+its cross-worker state goes through a small blocking client rather than the
+app's redis.asyncio pool. Connection settings come from the same env vars as
+redis_client.py. Redis is best-effort: after a connection error callers are
+told to skip it for REDIS_RETRY_AFTER seconds and fall back to local state.
+"""
+
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+REDIS_RETRY_AFTER = 30  # seconds to skip Redis after a connection error
+
+_redis = None
+_redis_retry_at = 0.0
+
+
+def get_sync_redis():
+    """Return the shared sync Redis client, or None while Redis is unavailable."""
+    global _redis
+    if time.time() < _redis_retry_at:
+        return None
+    if _redis is None:
+        try:
+            import redis
+        except ImportError:
+            return None
+        _redis = redis.Redis(
+            host=os.getenv("REDIS_HOST", "localhost"),
+            port=int(os.getenv("REDIS_PORT", "6379")),
+            db=int(os.getenv("REDIS_DB", "1")),
+            password=os.getenv("REDIS_PASSWORD", None),
+            decode_responses=True,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+    return _redis
+
+
+def redis_failed(e: Exception):
+    """Record a Redis error; get_sync_redis() returns None for a while."""
+    global _redis_retry_at
+    _redis_retry_at = time.time() + REDIS_RETRY_AFTER
+    logger.debug(f"r1api Redis unavailable, using process-local state: {e}")
@@ -14,8 +14,8 @@ class ApService:
         logger.debug(f"getting AP for tenant_id: {tenant_id}, ec_type: {self.client.ec_type}")
         if self.client.ec_type == "MSP":
             logger.debug("Using MSP-specific endpoint overriding tenant_id")
-            return self.client.get("/apconfig", override_tenant_id=tenant_id).json()
+            return (await self.client.aget("/apconfig", override_tenant_id=tenant_id)).json()
         else:
-            return self.client.get("/apconfig").json()
+            return (await self.client.aget("/apconfig")).json()
 
 # TODO - Implement actual AP related methods, /apconfig isn't an actual route
\ No newline at end of file
@@ -6,11 +6,53 @@ Primary endpoint: POST /venues/aps/clients/query
 Historical endpoint: POST /historicalClients/query
 """
 
-from typing import Dict, Any, Optional, List
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, Any, Optional, List
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Elasticsearch max_result_window behind /venues/aps/clients/query
+CLIENT_QUERY_WINDOW = 10000
+# Field used to partition venues larger than the window
+CLIENT_PARTITION_FIELD = "connectedTime"
+# Octets of MAC search prefix tried on slices the time split cannot shrink
+CLIENT_MAC_SPLIT_MAX_OCTETS = 3
+
+_PARTITIONS_DONE = object()
+
+
+def _to_epoch_ms(value) -> Optional[int]:
+    """Parse an R1 date-time (ISO string or epoch) into epoch milliseconds."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        # Heuristic: values below 1e11 are epoch seconds
+        return int(value if value > 1e11 else value * 1000)
+    try:
+        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
+
+
+async def _gather_or_cancel(*coros):
+    """
+    asyncio.gather that cancels the siblings when one fails or the caller is
+    cancelled, instead of leaving them running.
+    """
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
 
 class ClientsService:
     def __init__(self, client):
@@ -40,10 +82,9 @@ class ClientsService:
            "Result window is too large, from + size must be less than or
            equal to: [10000] but was [11000]". So even with working
            pagination, we can collect at most 10,000 rows per venue query.
-           If a venue genuinely has more than 10k active clients, we'll need
-           to partition the query (rangeDateFilter on lastSeenTime is the
-           likely path) or use a working scroll/PIT cursor — neither is
-           wired up today.
+           If a venue genuinely has more than 10k active clients, use
+           iter_all_clients_for_venue(), which partitions the query by
+           connectedTime until every slice fits under the window.
 
         When this helper returns exactly 10,000 rows, log a warning — the
         venue may have more clients than we're seeing.
@@ -146,6 +187,230 @@ class ClientsService:
         )
         return all_clients
 
+    async def iter_all_clients_for_venue(
+        self,
+        tenant_id: str,
+        venue_id: str,
+        fields: list = None,
+        page_size: int = 1000,
+        max_concurrency: int = 4,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream every client in a venue, including venues above the 10k window.
+
+        If the venue fits under CLIENT_QUERY_WINDOW it is paged exactly like
+        query_all_clients_for_venue. Otherwise the query is split by
+        connectedTime (rangeDateFilter, epoch ms bounds) and each half is
+        re-counted and split again until every slice fits under the window.
+        Clients without a connectedTime are fetched as their own slice
+        (mustNotHaveFields), so the slices cover the whole venue.
+
+        A slice still above the window that time cannot split (a single
+        millisecond, or the untimed slice) is split by MAC prefix: one
+        macAddress search per next octet ("3c:", then "3c:a6:", ...). Every
+        MAC contains its own leading octets, so the searches cover the
+        slice; matches elsewhere in a MAC only overlap and are de-duplicated.
+
+        Slices run concurrently (bounded by max_concurrency), and rows are
+        de-duplicated by macAddress: a client that reconnects mid-walk can
+        move between slices. Pages are handed over through a small bounded
+        queue, so memory stays at a few pages plus the MAC set however large
+        the venue is.
+
+        Args:
+            tenant_id: Tenant/EC ID. Required for MSP-scoped clients.
+            venue_id: Venue ID to query.
+            fields: Client fields to request (macAddress always included).
+            page_size: Rows per request (endpoint ceiling is 1000).
+            max_concurrency: Max concurrent R1 requests across slices.
+
+        Raises:
+            Exception: If any slice query fails, or a slice cannot be split
+                       under the window (results would be incomplete)
+        """
+        if not venue_id:
+            return
+
+        fields = list(fields) if fields else ["macAddress"]
+        if "macAddress" not in fields:
+            fields.append("macAddress")
+
+        base_body = {"filters": {"venueId": [venue_id]}}
+        semaphore = asyncio.Semaphore(max_concurrency)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency * 2)
+        stats = {"slices": 0, "splits": 0}
+
+        async def query(body: dict) -> dict:
+            async with semaphore:
+                if self.client.ec_type == "MSP":
+                    resp = await self.client.apost(
+                        "/venues/aps/clients/query", payload=body, override_tenant_id=tenant_id
+                    )
+                else:
+                    resp = await self.client.apost("/venues/aps/clients/query", payload=body)
+            return self.client.safe_json(resp) or {}
+
+        async def probe(extra: dict, sort_order: str = "ASC"):
+            data = await query({
+                **base_body, **extra,
+                "fields": ["macAddress", CLIENT_PARTITION_FIELD],
+                "sortField": CLIENT_PARTITION_FIELD,
+                "sortOrder": sort_order,
+                "page": 0,
+                "pageSize": 1,
+            })
+            rows = data.get("data") or []
+            return data.get("totalCount", len(rows)), rows
+
+        async def enumerate_slice(extra: dict, count: int):
+            stats["slices"] += 1
+            if count > CLIENT_QUERY_WINDOW:
+                raise Exception(
+                    f"Venue {venue_id} slice {extra} has {count} clients, above the "
+                    f"{CLIENT_QUERY_WINDOW} query window"
+                )
+            # Same page sequence as query_all_clients_for_venue: 0, 2, 3, ...
+            pages_needed = max(1, -(-min(count, CLIENT_QUERY_WINDOW) // page_size))
+            for page in [0] + list(range(2, pages_needed + 1)):
+                data = await query({
+                    **base_body, **extra,
+                    "fields": fields,
+                    "sortField": "macAddress",
+                    "sortOrder": "ASC",
+                    "page": page,
+                    "pageSize": page_size,
+                })
+                rows = data.get("data") or []
+                if rows:
+                    await queue.put(rows)
+                if len(rows) < page_size:
+                    break
+
+        async def fit(extra: dict, count: int):
+            if count <= CLIENT_QUERY_WINDOW:
+                await enumerate_slice(extra, count)
+            else:
+                await split_by_mac(extra, count)
+
+        async def mac_octets(extra: dict) -> List[str]:
+            # Search in the case R1 returns MACs in; the highest MAC of the
+            # slice almost always has a hex letter to tell. If not, both.
+            data = await query({
+                **base_body, **extra,
+                "fields": ["macAddress"],
+                "sortField": "macAddress",
+                "sortOrder": "DESC",
+                "page": 0,
+                "pageSize": 1,
+            })
+            rows = data.get("data") or []
+            mac = (rows[0].get("macAddress") or "") if rows else ""
+            formats = [f for f, present in (("{:02x}:", any(c in "abcdef" for c in mac)),
+                                            ("{:02X}:", any(c in "ABCDEF" for c in mac))) if present]
+            octets = {f.format(octet) for f in formats or ["{:02x}:", "{:02X}:"] for octet in range(256)}
+            return sorted(octets)
+
+        async def split_by_mac(extra: dict, count: int, prefix: str = ""):
+            if len(prefix) // 3 >= CLIENT_MAC_SPLIT_MAX_OCTETS:
+                raise Exception(
+                    f"Venue {venue_id} slice {extra} (MAC prefix {prefix}) still has "
+                    f"{count} clients, above the {CLIENT_QUERY_WINDOW} query window"
+                )
+            stats["splits"] += 1
+            searches = [
+                (sub, {**extra, "searchString": sub, "searchTargetFields": ["macAddress"]})
+                for sub in (prefix + octet for octet in await mac_octets(extra))
+            ]
+            probes = await _gather_or_cancel(*(probe(sub_extra) for _, sub_extra in searches))
+            if sum(sub_count for sub_count, _ in probes) < count:
+                raise Exception(
+                    f"MAC prefix search does not cover venue {venue_id} slice {extra}; "
+                    f"results would be incomplete"
+                )
+            tasks = []
+            for (sub, sub_extra), (sub_count, _) in zip(searches, probes):
+                if sub_count == 0:
+                    continue
+                if sub_count <= CLIENT_QUERY_WINDOW:
+                    tasks.append(enumerate_slice(sub_extra, sub_count))
+                else:
+                    tasks.append(split_by_mac(extra, sub_count, sub))
+            await _gather_or_cancel(*tasks)
+
+        async def split(lo: int, hi: int):
+            extra = {"rangeDateFilter": {"field": CLIENT_PARTITION_FIELD, "gte": lo, "lte": hi}}
+            count, _ = await probe(extra)
+            if count == 0:
+                return
+            if count <= CLIENT_QUERY_WINDOW or hi <= lo:
+                await fit(extra, count)
+                return
+            stats["splits"] += 1
+            mid = (lo + hi) // 2
+            await _gather_or_cancel(split(lo, mid), split(mid + 1, hi))
+
+        async def partition():
+            total, _ = await probe({})
+            if total <= CLIENT_QUERY_WINDOW:
+                await enumerate_slice({}, total)
+                return
+
+            logger.info(
+                f"[iter_all_clients_for_venue] venue={venue_id} has {total} "
+                f"clients - partitioning by {CLIENT_PARTITION_FIELD}"
+            )
+            has_time = {"mustHaveFields": [CLIENT_PARTITION_FIELD]}
+            no_time = {"mustNotHaveFields": [CLIENT_PARTITION_FIELD]}
+            (_, oldest), (_, newest), (untimed, _) = await _gather_or_cancel(
+                probe(has_time, "ASC"), probe(has_time, "DESC"), probe(no_time),
+            )
+            lo = _to_epoch_ms(oldest[0].get(CLIENT_PARTITION_FIELD)) if oldest else None
+            hi = _to_epoch_ms(newest[0].get(CLIENT_PARTITION_FIELD)) if newest else None
+            if lo is None or hi is None:
+                lo, hi = 0, int(datetime.now(timezone.utc).timestamp() * 1000)
+
+            tasks = [split(lo, hi)]
+            if untimed:
+                tasks.append(fit(no_time, untimed))
+            await _gather_or_cancel(*tasks)
+
+        async def produce():
+            # Cancellation (the consumer stopped early) propagates without a
+            # sentinel: nobody is reading the queue any more.
+            try:
+                await partition()
+            except Exception as e:
+                await queue.put(e)
+                return
+            await queue.put(_PARTITIONS_DONE)
+
+        producer = asyncio.create_task(produce())
+        seen: set = set()
+        try:
+            while True:
+                item = await queue.get()
+                if item is _PARTITIONS_DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                for row in item:
+                    mac = row.get("macAddress")
+                    if mac:
+                        if mac in seen:
+                            continue
+                        seen.add(mac)
+                    yield row
+        finally:
+            if not producer.done():
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+
+        logger.info(
+            f"[iter_all_clients_for_venue] tenant={tenant_id} venue={venue_id} "
+            f"streamed {len(seen)} unique clients from {stats['slices']} slice(s), "
+            f"{stats['splits']} split(s)"
+        )
+
     async def get_active_clients(
         self,
         tenant_id: Optional[str] = None,
@@ -210,9 +475,9 @@ class ClientsService:
         try:
             # Use override_tenant_id for MSP accounts
             if self.client.ec_type == "MSP" and tenant_id:
-                response = self.client.post("/venues/aps/clients/query", payload=payload, override_tenant_id=tenant_id)
+                response = await self.client.apost("/venues/aps/clients/query", payload=payload, override_tenant_id=tenant_id)
             else:
-                response = self.client.post("/venues/aps/clients/query", payload=payload)
+                response = await self.client.apost("/venues/aps/clients/query", payload=payload)
 
             data = response.json()
             return data.get('data', [])
@@ -314,7 +579,7 @@ async def query_ap_clients(
         if filters:
             payload["filters"] = filters
 
-        response = await r1_client.post(endpoint, json=payload)
+        response = await r1_client.apost(endpoint, payload=payload)
 
         if response.status_code == 200:
             data = response.json()
@@ -409,7 +674,7 @@ async def query_historical_clients(
         if detail_level:
             payload["detailLevel"] = detail_level
 
-        response = await r1_client.post(endpoint, json=payload)
+        response = await r1_client.apost(endpoint, payload=payload)
 
         if response.status_code == 200:
             data = response.json()
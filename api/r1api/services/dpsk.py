@@ -1,5 +1,7 @@
 import logging
 
+from r1api.pagination import fetch_all_pages, iter_rows
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,9 +55,9 @@ class DpskService:
         logger.debug(f"query_dpsk_pools request body: {body}")
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post("/dpskServices/query", payload=body, override_tenant_id=tenant_id)
+            response = await self.client.apost("/dpskServices/query", payload=body, override_tenant_id=tenant_id)
         else:
-            response = self.client.post("/dpskServices/query", payload=body)
+            response = await self.client.apost("/dpskServices/query", payload=body)
         return self.client.safe_json(response)
 
     async def get_dpsk_pool(self, pool_id: str, tenant_id: str = None):
@@ -70,9 +72,9 @@ class DpskService:
             DPSK pool details
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(f"/dpskServices/{pool_id}", override_tenant_id=tenant_id)
+            response = await self.client.aget(f"/dpskServices/{pool_id}", override_tenant_id=tenant_id)
         else:
-            response = self.client.get(f"/dpskServices/{pool_id}")
+            response = await self.client.aget(f"/dpskServices/{pool_id}")
         return self.client.safe_json(response)
 
     async def create_dpsk_pool(
@@ -129,13 +131,13 @@ class DpskService:
         logger.debug(f"create_dpsk_pool payload: {payload}")
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/identityGroups/{identity_group_id}/dpskServices",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/identityGroups/{identity_group_id}/dpskServices",
                 payload=payload
             )
@@ -183,13 +185,13 @@ class DpskService:
             payload["expirationOffset"] = expiration_days
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.patch(
+            response = await self.client.apatch(
                 f"/dpskServices/{pool_id}",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.patch(
+            response = await self.client.apatch(
                 f"/dpskServices/{pool_id}",
                 payload=payload
             )
@@ -208,9 +210,9 @@ class DpskService:
             Deletion response
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(f"/dpskServices/{pool_id}", override_tenant_id=tenant_id)
+            response = await self.client.adelete(f"/dpskServices/{pool_id}", override_tenant_id=tenant_id)
         else:
-            response = self.client.delete(f"/dpskServices/{pool_id}")
+            response = await self.client.adelete(f"/dpskServices/{pool_id}")
 
         if not response.content:
             return {"status": "deleted"}
@@ -248,13 +250,13 @@ class DpskService:
             params["sort"] = sort
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/dpskServices/{pool_id}/passphrases",
                 params=params,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/dpskServices/{pool_id}/passphrases",
                 params=params
             )
@@ -308,18 +310,83 @@ class DpskService:
         logger.debug(f"query_passphrases request body: {body}")
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/dpskServices/{pool_id}/passphrases/query",
                 payload=body,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/dpskServices/{pool_id}/passphrases/query",
                 payload=body
             )
         return self.client.safe_json(response)
 
+    async def query_all_passphrases(
+        self,
+        pool_id: str,
+        tenant_id: str = None,
+        filters: dict = None,
+        page_size: int = 500,
+        max_concurrency: int = 8,
+        sort_field: str = "createdDate",
+        sort_order: str = "DESC",
+    ):
+        """
+        Fetch every passphrase in a pool.
+
+        Reads page 1 to learn totalCount, then fetches the remaining pages
+        concurrently (bounded by max_concurrency).
+
+        Returns:
+            Dict with 'data' (all passphrases) and 'totalCount'
+        """
+        rows, total = await fetch_all_pages(
+            self._passphrase_page_fetcher(pool_id, tenant_id, filters, sort_field, sort_order),
+            first_page=1,
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+        )
+        return {'data': rows, 'totalCount': total}
+
+    def iter_passphrases(
+        self,
+        pool_id: str,
+        tenant_id: str = None,
+        filters: dict = None,
+        page_size: int = 500,
+        max_concurrency: int = 8,
+        sort_field: str = "createdDate",
+        sort_order: str = "DESC",
+    ):
+        """
+        Async iterator over every passphrase in a pool, yielded page by page
+        as pages arrive (at most max_concurrency pages buffered).
+
+        Usage:
+            async for pp in r1_client.dpsk.iter_passphrases(pool_id, tenant_id):
+                ...
+        """
+        return iter_rows(
+            self._passphrase_page_fetcher(pool_id, tenant_id, filters, sort_field, sort_order),
+            first_page=1,
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+        )
+
+    def _passphrase_page_fetcher(self, pool_id, tenant_id, filters, sort_field, sort_order):
+        async def fetch_page(page, page_size):
+            return await self.query_passphrases(
+                pool_id=pool_id,
+                tenant_id=tenant_id,
+                filters=filters,
+                page=page,
+                limit=page_size,
+                sort_field=sort_field,
+                sort_order=sort_order,
+            )
+        return fetch_page
+
     async def get_passphrase(
         self,
         pool_id: str,
@@ -338,12 +405,12 @@ class DpskService:
             Passphrase details
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/dpskServices/{pool_id}/passphrases/{passphrase_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/dpskServices/{pool_id}/passphrases/{passphrase_id}"
             )
         return self.client.safe_json(response)
@@ -410,13 +477,13 @@ class DpskService:
         logger.debug(f"create_passphrase payload: {payload}")
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/dpskServices/{pool_id}/passphrases",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/dpskServices/{pool_id}/passphrases",
                 payload=payload
             )
@@ -548,13 +615,13 @@ class DpskService:
             payload["vlanId"] = int(vlan_id)
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.patch(
+            response = await self.client.apatch(
                 f"/dpskServices/{pool_id}/passphrases/{passphrase_id}",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.patch(
+            response = await self.client.apatch(
                 f"/dpskServices/{pool_id}/passphrases/{passphrase_id}",
                 payload=payload
             )
@@ -606,13 +673,13 @@ class DpskService:
         payload = passphrase_ids
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/dpskServices/{pool_id}/passphrases",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/dpskServices/{pool_id}/passphrases",
                 payload=payload
             )
@@ -649,13 +716,13 @@ class DpskService:
         }
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/dpskServices/{pool_id}/passphrases/csvFiles",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/dpskServices/{pool_id}/passphrases/csvFiles",
                 payload=payload
             )
@@ -685,13 +752,13 @@ class DpskService:
             body["filters"] = filters
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/dpskServices/{pool_id}/passphrases/query/csvFiles",
                 payload=body,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/dpskServices/{pool_id}/passphrases/query/csvFiles",
                 payload=body
             )
@@ -719,12 +786,12 @@ class DpskService:
             List of devices using this passphrase
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/dpskServices/{pool_id}/passphrases/{passphrase_id}/devices",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/dpskServices/{pool_id}/passphrases/{passphrase_id}/devices"
             )
         return self.client.safe_json(response)
@@ -758,13 +825,13 @@ class DpskService:
             payload["deviceName"] = device_name
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/dpskServices/{pool_id}/passphrases/{passphrase_id}/devices",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/dpskServices/{pool_id}/passphrases/{passphrase_id}/devices",
                 payload=payload
             )
@@ -794,12 +861,12 @@ class DpskService:
         # Adjust based on actual API behavior
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/dpskServices/{pool_id}/passphrases/{passphrase_id}/devices",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/dpskServices/{pool_id}/passphrases/{passphrase_id}/devices"
             )
 
@@ -827,12 +894,12 @@ class DpskService:
             Response from API
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/dpskServices/{pool_id}/policySets/{policy_set_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/dpskServices/{pool_id}/policySets/{policy_set_id}"
             )
 
@@ -858,12 +925,12 @@ class DpskService:
             Response from API
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/dpskServices/{pool_id}/policySets/{policy_set_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/dpskServices/{pool_id}/policySets/{policy_set_id}"
             )
 
@@ -891,12 +958,12 @@ class DpskService:
             Response from API
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/wifiNetworks/{wifi_network_id}/dpskServices/{dpsk_service_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/wifiNetworks/{wifi_network_id}/dpskServices/{dpsk_service_id}"
             )
 
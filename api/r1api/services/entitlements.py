@@ -186,14 +186,14 @@ class EntitlementsService:
         # Make API call
         if self.client.ec_type == "MSP" and tenant_id:
             logger.debug(f"Making MSP request with tenant_id override: {tenant_id}")
-            response = self.client.post(
+            response = await self.client.apost(
                 "/entitlements/availabilityReports/query",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
             logger.debug(f"Making EC request (no tenant_id override)")
-            response = self.client.post(
+            response = await self.client.apost(
                 "/entitlements/availabilityReports/query",
                 payload=payload
             )
@@ -233,14 +233,14 @@ class EntitlementsService:
         # Make API call
         if self.client.ec_type == "MSP" and tenant_id:
             logger.debug(f"Making MSP utilization request with tenant_id override: {tenant_id}")
-            response = self.client.post(
+            response = await self.client.apost(
                 "/entitlements/utilizations/query",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
             logger.debug(f"Making EC utilization request (no tenant_id override)")
-            response = self.client.post(
+            response = await self.client.apost(
                 "/entitlements/utilizations/query",
                 payload=payload
             )
@@ -1,5 +1,7 @@
 import logging
 
+from r1api.pagination import fetch_all_pages, iter_rows
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,13 +42,13 @@ class IdentityService:
         }
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 "/identityGroups",
                 params=params,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 "/identityGroups",
                 params=params
             )
@@ -87,14 +89,14 @@ class IdentityService:
         }
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/identityGroups/query",
                 payload=body,
                 params=params,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/identityGroups/query",
                 payload=body,
                 params=params
@@ -117,12 +119,12 @@ class IdentityService:
             Identity group details
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/identityGroups/{group_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/identityGroups/{group_id}"
             )
         return self.client.safe_json(response)
@@ -155,13 +157,13 @@ class IdentityService:
         }
 
         if self.client.ec_type == "MSP":
-            response = self.client.post(
+            response = await self.client.apost(
                 "/identityGroups",
                 override_tenant_id=tenant_id,
                 payload=body
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/identityGroups",
                 payload=body
             )
@@ -203,12 +205,12 @@ class IdentityService:
             Deletion response
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/identityGroups/{group_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/identityGroups/{group_id}"
             )
 
@@ -237,13 +239,13 @@ class IdentityService:
             body["filters"] = filters
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/identityGroups/csvFile",
                 payload=body,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/identityGroups/csvFile",
                 payload=body
             )
@@ -276,18 +278,60 @@ class IdentityService:
         }
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 "/identities",
                 params=params,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 "/identities",
                 params=params
             )
         return self.client.safe_json(response)
 
+    async def fetch_all_identities(
+        self,
+        tenant_id: str = None,
+        size: int = 500,
+        max_concurrency: int = 8,
+    ):
+        """
+        Fetch every identity across all groups.
+
+        Reads page 0 to learn the total, then fetches the remaining pages
+        concurrently (bounded by max_concurrency).
+
+        Returns:
+            Dict with 'data' (all identities) and 'totalCount'
+        """
+        rows, total = await fetch_all_pages(
+            self._identity_page_fetcher(tenant_id),
+            first_page=0,
+            page_size=size,
+            max_concurrency=max_concurrency,
+        )
+        return {'data': rows, 'totalCount': total}
+
+    def iter_identities(
+        self,
+        tenant_id: str = None,
+        size: int = 500,
+        max_concurrency: int = 8,
+    ):
+        """Async iterator over every identity, yielded as pages arrive."""
+        return iter_rows(
+            self._identity_page_fetcher(tenant_id),
+            first_page=0,
+            page_size=size,
+            max_concurrency=max_concurrency,
+        )
+
+    def _identity_page_fetcher(self, tenant_id):
+        async def fetch_page(page, page_size):
+            return await self.get_all_identities(tenant_id=tenant_id, page=page, size=page_size)
+        return fetch_page
+
     async def query_identities(
         self,
         tenant_id: str = None,
@@ -322,14 +366,14 @@ class IdentityService:
         }
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/identities/query",
                 payload=body,
                 params=params,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/identities/query",
                 payload=body,
                 params=params
@@ -361,13 +405,13 @@ class IdentityService:
         }
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/identityGroups/{group_id}/identities",
                 params=params,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/identityGroups/{group_id}/identities",
                 params=params
             )
@@ -391,12 +435,12 @@ class IdentityService:
             Identity details
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/identityGroups/{group_id}/identities/{identity_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/identityGroups/{group_id}/identities/{identity_id}"
             )
         return self.client.safe_json(response)
@@ -443,13 +487,13 @@ class IdentityService:
         logger.info(f"🔍 DEBUG IDENTITY API - create_identity payload: {payload}")
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/identityGroups/{group_id}/identities",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/identityGroups/{group_id}/identities",
                 payload=payload
             )
@@ -499,13 +543,13 @@ class IdentityService:
         logger.info(f"🔍 DEBUG IDENTITY API - update_identity payload: {payload}")
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.patch(
+            response = await self.client.apatch(
                 f"/identityGroups/{group_id}/identities/{identity_id}",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.patch(
+            response = await self.client.apatch(
                 f"/identityGroups/{group_id}/identities/{identity_id}",
                 payload=payload
             )
@@ -536,13 +580,13 @@ class IdentityService:
         payload = [identity_id]
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/identityGroups/{group_id}/identities",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/identityGroups/{group_id}/identities",
                 payload=payload
             )
@@ -591,13 +635,13 @@ class IdentityService:
             This operation returns 202 Accepted and must be polled for completion
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/identityGroups/{group_id}/identities",
                 payload=identity_ids,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/identityGroups/{group_id}/identities",
                 payload=identity_ids
             )
@@ -642,12 +686,12 @@ class IdentityService:
             Response from API
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/identityGroups/{group_id}/policySets/{policy_set_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/identityGroups/{group_id}/policySets/{policy_set_id}"
             )
 
@@ -673,12 +717,12 @@ class IdentityService:
             Response from API
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/identityGroups/{group_id}/policySets/{policy_set_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/identityGroups/{group_id}/policySets/{policy_set_id}"
             )
 
@@ -704,12 +748,12 @@ class IdentityService:
             Response from API
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/identityGroups/{group_id}/dpskPools/{dpsk_pool_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/identityGroups/{group_id}/dpskPools/{dpsk_pool_id}"
             )
 
@@ -735,12 +779,12 @@ class IdentityService:
             Response from API
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/identityGroups/{group_id}/macRegistrationPools/{pool_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/identityGroups/{group_id}/macRegistrationPools/{pool_id}"
             )
 
@@ -782,14 +826,14 @@ class IdentityService:
         }
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/venues/{venue_id}/units/identities/query",
                 payload=body,
                 params=params,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/venues/{venue_id}/units/identities/query",
                 payload=body,
                 params=params
@@ -816,12 +860,12 @@ class IdentityService:
             Response from API
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/units/{unit_id}/identities/{identity_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/units/{unit_id}/identities/{identity_id}"
             )
 
@@ -849,12 +893,12 @@ class IdentityService:
             Response from API
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/venues/{venue_id}/units/{unit_id}/identities/{identity_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/venues/{venue_id}/units/{unit_id}/identities/{identity_id}"
             )
 
@@ -888,13 +932,13 @@ class IdentityService:
         }
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/identityGroups/{group_id}/identities/{identity_id}/venues/{venue_id}/ethernetPorts",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/identityGroups/{group_id}/identities/{identity_id}/venues/{venue_id}/ethernetPorts",
                 payload=payload
             )
@@ -919,12 +963,12 @@ class IdentityService:
             Response from API
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/identityGroups/{group_id}/identities/{identity_id}/vnis",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/identityGroups/{group_id}/identities/{identity_id}/vnis"
             )
 
@@ -964,14 +1008,14 @@ class IdentityService:
         }
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/externalIdentities/query",
                 payload=body,
                 params=params,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/externalIdentities/query",
                 payload=body,
                 params=params
@@ -17,7 +17,7 @@ class MspService:
             'sortOrder': 'ASC',
             'filters': {'tenantType': ['MSP_EC']}
         }
-        return self.client.post("/mspecs/query", payload=body).json()
+        return (await self.client.apost("/mspecs/query", payload=body)).json()
 
     async def get_msp_tech_partners(self):
         if self.client.ec_type != "MSP":
@@ -28,13 +28,13 @@ class MspService:
             'sortOrder': 'ASC',
             'filters': {'tenantType': ['MSP_INSTALLER', 'MSP_INTEGRATOR']}
         }
-        return self.client.post("/techpartners/mspecs/query", payload=body).json()
+        return (await self.client.apost("/techpartners/mspecs/query", payload=body)).json()
 
     async def get_msp_labels(self):
         if self.client.ec_type != "MSP":
             return {"success": False, "error": "Unavailable for non-MSP clients."}
         logger.debug("Fetching MSP labels")
-        response = self.client.get("/mspLabels")
+        response = await self.client.aget("/mspLabels")
         logger.debug(f"MSP labels response: {response.status_code}")
 
         if response.ok:
@@ -50,22 +50,22 @@ class MspService:
     async def get_entitlements(self): #, r1_client: R1Client = None):
         if self.client.ec_type != "MSP":
             return {"success": False, "error": "Unavailable for non-MSP clients."}
-        return self.client.get("/entitlements").json()
+        return (await self.client.aget("/entitlements")).json()
 
     async def get_msp_entitlements(self): #, r1_client: R1Client = None):
         if self.client.ec_type != "MSP":
             return {"success": False, "error": "Unavailable for non-MSP clients."}
-        return self.client.get("/mspEntitlements").json()
+        return (await self.client.aget("/mspEntitlements")).json()
 
     async def get_msp_admins(self): #, r1_client: R1Client = None):
         if self.client.ec_type != "MSP":
             return {"success": False, "error": "Unavailable for non-MSP clients."}
-        return self.client.get("/admins").json()
+        return (await self.client.aget("/admins")).json()
 
     async def get_msp_customer_admins(self, tenant_id: str): #, r1_client: R1Client = None):
         if self.client.ec_type != "MSP":
             return {"success": False, "error": "Unavailable for non-MSP clients."}
-        return self.client.get(f"/mspCustomers/{tenant_id}/admins", override_tenant_id=tenant_id).json()
+        return (await self.client.aget(f"/mspCustomers/{tenant_id}/admins", override_tenant_id=tenant_id)).json()
 
     def get_inventory_summary(self, page_size: int = 1000, max_pages: int = 200):
         """
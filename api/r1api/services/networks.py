@@ -6,6 +6,7 @@ from r1api.constants import (
     SECURITY_TYPE_MAP,
     R1StatusCode
 )
+from r1api.pagination import fetch_all_pages
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +41,8 @@ class NetworksService:
         Get all WiFi networks for a tenant, handling pagination automatically.
 
         The query endpoint has pagination that may limit results. This method
-        fetches all pages and returns the complete list.
+        fetches all pages (concurrently after the first) and returns the
+        complete list.
         """
         fields = [
             "check-all",
@@ -65,46 +67,25 @@ class NetworksService:
             "securityProtocol",
             ]
 
-        # Fetch first page to get totalCount
-        body = {
+        # First page learns totalCount; remaining pages are fetched concurrently
+        base_body = {
             'fields': fields,
             'sortField': 'name',
             'sortOrder': 'ASC',
-            'page': 1,
-            'pageSize': 500
         }
 
-        # Use override_tenant_id only for MSP accounts
-        if self.client.ec_type == "MSP" and tenant_id:
-            first_response = self.client.post("/wifiNetworks/query", payload=body, override_tenant_id=tenant_id).json()
-        else:
-            first_response = self.client.post("/wifiNetworks/query", payload=body).json()
-
-        all_networks = first_response.get('data', [])
-        total_count = first_response.get('totalCount', len(all_networks))
-
-        logger.debug(f"WiFi Networks: first page returned {len(all_networks)}, total count: {total_count}")
-
-        # If there are more pages, fetch them
-        if total_count > len(all_networks):
-            page_size = len(all_networks) or 100  # Actual page size returned
-            pages_needed = (total_count + page_size - 1) // page_size
-
-            logger.debug(f"WiFi Networks pagination: page_size={page_size}, pages_needed={pages_needed}")
-
-            for page_num in range(2, pages_needed + 1):
-                body['page'] = page_num
-                if self.client.ec_type == "MSP" and tenant_id:
-                    page_response = self.client.post("/wifiNetworks/query", payload=body, override_tenant_id=tenant_id).json()
-                else:
-                    page_response = self.client.post("/wifiNetworks/query", payload=body).json()
-                page_data = page_response.get('data', [])
-
-                logger.debug(f"WiFi Networks page {page_num} returned: {len(page_data)} networks")
+        async def fetch_page(page, page_size):
+            body = {**base_body, 'page': page, 'pageSize': page_size}
+            # Use override_tenant_id only for MSP accounts
+            if self.client.ec_type == "MSP" and tenant_id:
+                response = await self.client.apost("/wifiNetworks/query", payload=body, override_tenant_id=tenant_id)
+            else:
+                response = await self.client.apost("/wifiNetworks/query", payload=body)
+            return response.json()
 
-                all_networks.extend(page_data)
+        all_networks, total_count = await fetch_all_pages(fetch_page, first_page=1, page_size=500)
 
-        logger.debug(f"Total WiFi Networks fetched: {len(all_networks)}")
+        logger.debug(f"Total WiFi Networks fetched: {len(all_networks)} (total count: {total_count})")
 
         return {'data': all_networks, 'totalCount': total_count}
 
@@ -116,9 +97,9 @@ class NetworksService:
         If you need venue/AP group info, use query_wifi_network_by_id() instead.
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            return self.client.get(f"/wifiNetworks/{network_id}", override_tenant_id=tenant_id).json()
+            return (await self.client.aget(f"/wifiNetworks/{network_id}", override_tenant_id=tenant_id)).json()
         else:
-            return self.client.get(f"/wifiNetworks/{network_id}").json()
+            return (await self.client.aget(f"/wifiNetworks/{network_id}")).json()
 
     async def query_wifi_network_by_id(self, network_id: str, tenant_id: str = None):
         """
@@ -137,9 +118,9 @@ class NetworksService:
             'pageSize': 1,
         }
         if self.client.ec_type == "MSP" and tenant_id:
-            resp = self.client.post("/wifiNetworks/query", payload=body, override_tenant_id=tenant_id)
+            resp = await self.client.apost("/wifiNetworks/query", payload=body, override_tenant_id=tenant_id)
         else:
-            resp = self.client.post("/wifiNetworks/query", payload=body)
+            resp = await self.client.apost("/wifiNetworks/query", payload=body)
 
         data = resp.json() if resp.status_code == 200 else {}
         networks = data.get('data', [])
@@ -192,12 +173,12 @@ class NetworksService:
             )
 
             if self.client.ec_type == "MSP" and tenant_id:
-                response = self.client.delete(
+                response = await self.client.adelete(
                     f"/venues/{venue_id}/wifiNetworks/{network_id}",
                     override_tenant_id=tenant_id,
                 )
             else:
-                response = self.client.delete(
+                response = await self.client.adelete(
                     f"/venues/{venue_id}/wifiNetworks/{network_id}",
                 )
 
@@ -252,9 +233,9 @@ class NetworksService:
             Deletion response (includes requestId if wait_for_completion=False)
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(f"/wifiNetworks/{network_id}", override_tenant_id=tenant_id)
+            response = await self.client.adelete(f"/wifiNetworks/{network_id}", override_tenant_id=tenant_id)
         else:
-            response = self.client.delete(f"/wifiNetworks/{network_id}")
+            response = await self.client.adelete(f"/wifiNetworks/{network_id}")
 
         if response.status_code == R1StatusCode.ACCEPTED:
             result = response.json() if response.content else {"status": "accepted"}
@@ -287,9 +268,9 @@ class NetworksService:
         }
 
         if self.client.ec_type == "MSP":
-            response = self.client.post("/wifiNetworks/query", payload=body, override_tenant_id=tenant_id).json()
+            response = (await self.client.apost("/wifiNetworks/query", payload=body, override_tenant_id=tenant_id)).json()
         else:
-            response = self.client.post("/wifiNetworks/query", payload=body).json()
+            response = (await self.client.apost("/wifiNetworks/query", payload=body)).json()
 
         # Response format: {"data": [...], "totalCount": N}
         networks = response.get('data', [])
@@ -323,9 +304,9 @@ class NetworksService:
         }
 
         if self.client.ec_type == "MSP":
-            response = self.client.post("/wifiNetworks/query", payload=body, override_tenant_id=tenant_id).json()
+            response = (await self.client.apost("/wifiNetworks/query", payload=body, override_tenant_id=tenant_id)).json()
         else:
-            response = self.client.post("/wifiNetworks/query", payload=body).json()
+            response = (await self.client.apost("/wifiNetworks/query", payload=body)).json()
 
         # Response format: {"data": [...], "totalCount": N}
         networks = response.get('data', [])
@@ -408,13 +389,13 @@ class NetworksService:
 
         # Make API call
         if self.client.ec_type == "MSP":
-            response = self.client.post(
+            response = await self.client.apost(
                 "/wifiNetworks",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/wifiNetworks",
                 payload=payload
             )
@@ -490,9 +471,9 @@ class NetworksService:
             payload["description"] = description
 
         if self.client.ec_type == "MSP":
-            response = self.client.post("/wifiNetworks", payload=payload, override_tenant_id=tenant_id)
+            response = await self.client.apost("/wifiNetworks", payload=payload, override_tenant_id=tenant_id)
         else:
-            response = self.client.post("/wifiNetworks", payload=payload)
+            response = await self.client.apost("/wifiNetworks", payload=payload)
 
         if response.status_code in [R1StatusCode.OK, R1StatusCode.CREATED, R1StatusCode.ACCEPTED]:
             result = response.json() if response.content else {"status": "accepted"}
@@ -566,9 +547,9 @@ class NetworksService:
             payload["description"] = description
 
         if self.client.ec_type == "MSP":
-            response = self.client.post("/wifiNetworks", payload=payload, override_tenant_id=tenant_id)
+            response = await self.client.apost("/wifiNetworks", payload=payload, override_tenant_id=tenant_id)
         else:
-            response = self.client.post("/wifiNetworks", payload=payload)
+            response = await self.client.apost("/wifiNetworks", payload=payload)
 
         if response.status_code in [R1StatusCode.OK, R1StatusCode.CREATED, R1StatusCode.ACCEPTED]:
             result = response.json() if response.content else {"status": "accepted"}
@@ -613,13 +594,13 @@ class NetworksService:
             dict with requestId (if 202) or the response body
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/wifiNetworks/{network_id}",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/wifiNetworks/{network_id}",
                 payload=payload
             )
@@ -671,13 +652,13 @@ class NetworksService:
 
         # PUT the updated network object
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/wifiNetworks/{network_id}",
                 payload=current_network,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/wifiNetworks/{network_id}",
                 payload=current_network
             )
@@ -793,13 +774,13 @@ class NetworksService:
 
         # PUT the updated network object
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/wifiNetworks/{network_id}",
                 payload=current_network,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/wifiNetworks/{network_id}",
                 payload=current_network
             )
@@ -884,13 +865,13 @@ class NetworksService:
 
         # Make API call
         if self.client.ec_type == "MSP":
-            response = self.client.post(
+            response = await self.client.apost(
                 "/wifiNetworks",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/wifiNetworks",
                 payload=payload
             )
@@ -948,13 +929,13 @@ class NetworksService:
 
         # Make API call - PUT with empty body to link the service
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/wifiNetworks/{network_id}/dpskServices/{dpsk_service_id}",
                 payload={},
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/wifiNetworks/{network_id}/dpskServices/{dpsk_service_id}",
                 payload={}
             )
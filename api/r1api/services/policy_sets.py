@@ -53,13 +53,13 @@ class PolicySetService:
             body["searchString"] = search_string
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/policySets/query",
                 payload=body,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/policySets/query",
                 payload=body
             )
@@ -81,12 +81,12 @@ class PolicySetService:
             Policy set details
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policySets/{policy_set_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policySets/{policy_set_id}"
             )
         return self.client.safe_json(response)
@@ -116,13 +116,13 @@ class PolicySetService:
             payload["description"] = description
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/policySets",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/policySets",
                 payload=payload
             )
@@ -156,13 +156,13 @@ class PolicySetService:
             payload["description"] = description
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.patch(
+            response = await self.client.apatch(
                 f"/policySets/{policy_set_id}",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.patch(
+            response = await self.client.apatch(
                 f"/policySets/{policy_set_id}",
                 payload=payload
             )
@@ -185,12 +185,12 @@ class PolicySetService:
             Deletion response
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/policySets/{policy_set_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/policySets/{policy_set_id}"
             )
 
@@ -216,12 +216,12 @@ class PolicySetService:
             List of assignments
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policySets/{policy_set_id}/assignments",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policySets/{policy_set_id}/assignments"
             )
         return self.client.safe_json(response)
@@ -256,13 +256,13 @@ class PolicySetService:
             body["filters"] = filters
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/policySets/{policy_set_id}/assignments/query",
                 payload=body,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/policySets/{policy_set_id}/assignments/query",
                 payload=body
             )
@@ -286,12 +286,12 @@ class PolicySetService:
             Assignment details
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policySets/{policy_set_id}/assignments/{assignment_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policySets/{policy_set_id}/assignments/{assignment_id}"
             )
         return self.client.safe_json(response)
@@ -314,12 +314,12 @@ class PolicySetService:
             List of prioritized policies
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policySets/{policy_set_id}/prioritizedPolicies",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policySets/{policy_set_id}/prioritizedPolicies"
             )
         return self.client.safe_json(response)
@@ -342,12 +342,12 @@ class PolicySetService:
             Policy details with priority
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policySets/{policy_set_id}/prioritizedPolicies/{policy_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policySets/{policy_set_id}/prioritizedPolicies/{policy_id}"
             )
         return self.client.safe_json(response)
@@ -377,13 +377,13 @@ class PolicySetService:
             payload["priority"] = priority
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/policySets/{policy_set_id}/prioritizedPolicies/{policy_id}",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/policySets/{policy_set_id}/prioritizedPolicies/{policy_id}",
                 payload=payload
             )
@@ -410,12 +410,12 @@ class PolicySetService:
             Response from API
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/policySets/{policy_set_id}/prioritizedPolicies/{policy_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/policySets/{policy_set_id}/prioritizedPolicies/{policy_id}"
             )
 
@@ -445,13 +445,13 @@ class PolicySetService:
         payload = criteria
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/policySets/{policy_set_id}/evaluationReports",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/policySets/{policy_set_id}/evaluationReports",
                 payload=payload
             )
@@ -488,13 +488,13 @@ class PolicySetService:
             body["filters"] = filters
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/policyTemplates/query",
                 payload=body,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/policyTemplates/query",
                 payload=body
             )
@@ -516,12 +516,12 @@ class PolicySetService:
             Policy template details
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policyTemplates/{template_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policyTemplates/{template_id}"
             )
         return self.client.safe_json(response)
@@ -542,12 +542,12 @@ class PolicySetService:
             List of template attributes
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policyTemplates/{template_id}/attributes",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policyTemplates/{template_id}/attributes"
             )
         return self.client.safe_json(response)
@@ -582,13 +582,13 @@ class PolicySetService:
             body["filters"] = filters
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/policyTemplates/{template_id}/attributes/query",
                 payload=body,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/policyTemplates/{template_id}/attributes/query",
                 payload=body
             )
@@ -612,12 +612,12 @@ class PolicySetService:
             Attribute details
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policyTemplates/{template_id}/attributes/{attribute_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policyTemplates/{template_id}/attributes/{attribute_id}"
             )
         return self.client.safe_json(response)
@@ -640,12 +640,12 @@ class PolicySetService:
             List of policies
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policyTemplates/{template_id}/policies",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policyTemplates/{template_id}/policies"
             )
         return self.client.safe_json(response)
@@ -680,13 +680,13 @@ class PolicySetService:
             body["filters"] = filters
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/policyTemplates/{template_id}/policies/query",
                 payload=body,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/policyTemplates/{template_id}/policies/query",
                 payload=body
             )
@@ -710,13 +710,13 @@ class PolicySetService:
             Created policy response
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/policyTemplates/{template_id}/policies",
                 payload=policy_data,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/policyTemplates/{template_id}/policies",
                 payload=policy_data
             )
@@ -769,12 +769,12 @@ class PolicySetService:
                 sleep_interval = 2.0
 
             if self.client.ec_type == "MSP" and tenant_id:
-                response = self.client.get(
+                response = await self.client.aget(
                     f"/policyTemplates/{template_id}/policies/{policy_id}",
                     override_tenant_id=tenant_id
                 )
             else:
-                response = self.client.get(
+                response = await self.client.aget(
                     f"/policyTemplates/{template_id}/policies/{policy_id}"
                 )
 
@@ -810,12 +810,12 @@ class PolicySetService:
             Policy details
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policyTemplates/{template_id}/policies/{policy_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policyTemplates/{template_id}/policies/{policy_id}"
             )
         return self.client.safe_json(response)
@@ -840,13 +840,13 @@ class PolicySetService:
             Updated policy response
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.patch(
+            response = await self.client.apatch(
                 f"/policyTemplates/{template_id}/policies/{policy_id}",
                 payload=policy_data,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.patch(
+            response = await self.client.apatch(
                 f"/policyTemplates/{template_id}/policies/{policy_id}",
                 payload=policy_data
             )
@@ -871,12 +871,12 @@ class PolicySetService:
             Deletion response
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/policyTemplates/{template_id}/policies/{policy_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/policyTemplates/{template_id}/policies/{policy_id}"
             )
 
@@ -904,12 +904,12 @@ class PolicySetService:
             List of policy conditions
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policyTemplates/{template_id}/policies/{policy_id}/conditions",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policyTemplates/{template_id}/policies/{policy_id}/conditions"
             )
         result = self.client.safe_json(response)
@@ -936,12 +936,12 @@ class PolicySetService:
             Condition details
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policyTemplates/{template_id}/policies/{policy_id}/conditions/{condition_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.get(
+            response = await self.client.aget(
                 f"/policyTemplates/{template_id}/policies/{policy_id}/conditions/{condition_id}"
             )
         return self.client.safe_json(response)
@@ -977,13 +977,13 @@ class PolicySetService:
             Created condition response
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/policyTemplates/{template_id}/policies/{policy_id}/conditions",
                 payload=condition_data,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/policyTemplates/{template_id}/policies/{policy_id}/conditions",
                 payload=condition_data
             )
@@ -1068,13 +1068,13 @@ class PolicySetService:
             Updated condition response
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.patch(
+            response = await self.client.apatch(
                 f"/policyTemplates/{template_id}/policies/{policy_id}/conditions/{condition_id}",
                 payload=condition_data,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.patch(
+            response = await self.client.apatch(
                 f"/policyTemplates/{template_id}/policies/{policy_id}/conditions/{condition_id}",
                 payload=condition_data
             )
@@ -1101,12 +1101,12 @@ class PolicySetService:
             Deletion response
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/policyTemplates/{template_id}/policies/{policy_id}/conditions/{condition_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/policyTemplates/{template_id}/policies/{policy_id}/conditions/{condition_id}"
             )
 
@@ -1150,13 +1150,13 @@ class PolicySetService:
             body["searchString"] = search_string
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/policyTemplates/policies/query",
                 payload=body,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/policyTemplates/policies/query",
                 payload=body
             )
@@ -44,12 +44,12 @@ class RadiusAttributeService:
             List of available RADIUS attributes
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            return self.client.get(
+            return (await self.client.aget(
                 "/radiusAttributes",
                 override_tenant_id=tenant_id
-            ).json()
+            )).json()
         else:
-            return self.client.get("/radiusAttributes").json()
+            return (await self.client.aget("/radiusAttributes")).json()
 
     async def query_radius_attributes(
         self,
@@ -83,16 +83,16 @@ class RadiusAttributeService:
             body["searchString"] = search_string
 
         if self.client.ec_type == "MSP" and tenant_id:
-            return self.client.post(
+            return (await self.client.apost(
                 "/radiusAttributes/query",
                 payload=body,
                 override_tenant_id=tenant_id
-            ).json()
+            )).json()
         else:
-            return self.client.post(
+            return (await self.client.apost(
                 "/radiusAttributes/query",
                 payload=body
-            ).json()
+            )).json()
 
     async def get_radius_attribute(
         self,
@@ -110,14 +110,14 @@ class RadiusAttributeService:
             RADIUS attribute details
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            return self.client.get(
+            return (await self.client.aget(
                 f"/radiusAttributes/{attribute_id}",
                 override_tenant_id=tenant_id
-            ).json()
+            )).json()
         else:
-            return self.client.get(
+            return (await self.client.aget(
                 f"/radiusAttributes/{attribute_id}"
-            ).json()
+            )).json()
 
     async def get_radius_attribute_vendors(
         self,
@@ -133,12 +133,12 @@ class RadiusAttributeService:
             List of vendor names/IDs
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            return self.client.get(
+            return (await self.client.aget(
                 "/radiusAttributes/vendors",
                 override_tenant_id=tenant_id
-            ).json()
+            )).json()
         else:
-            return self.client.get("/radiusAttributes/vendors").json()
+            return (await self.client.aget("/radiusAttributes/vendors")).json()
 
     # ========== RADIUS Attribute Groups ==========
 
@@ -156,12 +156,12 @@ class RadiusAttributeService:
             List of RADIUS attribute groups
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            return self.client.get(
+            return (await self.client.aget(
                 "/radiusAttributeGroups",
                 override_tenant_id=tenant_id
-            ).json()
+            )).json()
         else:
-            return self.client.get("/radiusAttributeGroups").json()
+            return (await self.client.aget("/radiusAttributeGroups")).json()
 
     async def query_radius_attribute_groups(
         self,
@@ -195,16 +195,16 @@ class RadiusAttributeService:
             body["searchString"] = search_string
 
         if self.client.ec_type == "MSP" and tenant_id:
-            return self.client.post(
+            return (await self.client.apost(
                 "/radiusAttributeGroups/query",
                 payload=body,
                 override_tenant_id=tenant_id
-            ).json()
+            )).json()
         else:
-            return self.client.post(
+            return (await self.client.apost(
                 "/radiusAttributeGroups/query",
                 payload=body
-            ).json()
+            )).json()
 
     async def get_radius_attribute_group(
         self,
@@ -222,14 +222,14 @@ class RadiusAttributeService:
             RADIUS attribute group details
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            return self.client.get(
+            return (await self.client.aget(
                 f"/radiusAttributeGroups/{group_id}",
                 override_tenant_id=tenant_id
-            ).json()
+            )).json()
         else:
-            return self.client.get(
+            return (await self.client.aget(
                 f"/radiusAttributeGroups/{group_id}"
-            ).json()
+            )).json()
 
     async def create_radius_attribute_group(
         self,
@@ -268,13 +268,13 @@ class RadiusAttributeService:
             payload["description"] = description
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/radiusAttributeGroups",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/radiusAttributeGroups",
                 payload=payload
             )
@@ -362,13 +362,13 @@ class RadiusAttributeService:
             payload["description"] = description
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.patch(
+            response = await self.client.apatch(
                 f"/radiusAttributeGroups/{group_id}",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.patch(
+            response = await self.client.apatch(
                 f"/radiusAttributeGroups/{group_id}",
                 payload=payload
             )
@@ -391,12 +391,12 @@ class RadiusAttributeService:
             Deletion response
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/radiusAttributeGroups/{group_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/radiusAttributeGroups/{group_id}"
             )
 
@@ -421,14 +421,14 @@ class RadiusAttributeService:
             List of assignments (policies, DPSK pools, etc.)
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            return self.client.get(
+            return (await self.client.aget(
                 f"/radiusAttributeGroups/{group_id}/assignments",
                 override_tenant_id=tenant_id
-            ).json()
+            )).json()
         else:
-            return self.client.get(
+            return (await self.client.aget(
                 f"/radiusAttributeGroups/{group_id}/assignments"
-            ).json()
+            )).json()
 
     async def get_group_assignment(
         self,
@@ -448,14 +448,14 @@ class RadiusAttributeService:
             Assignment details
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            return self.client.get(
+            return (await self.client.aget(
                 f"/radiusAttributeGroups/{group_id}/assignments/{assignment_id}",
                 override_tenant_id=tenant_id
-            ).json()
+            )).json()
         else:
-            return self.client.get(
+            return (await self.client.aget(
                 f"/radiusAttributeGroups/{group_id}/assignments/{assignment_id}"
-            ).json()
+            )).json()
 
     async def create_group_assignment(
         self,
@@ -475,13 +475,13 @@ class RadiusAttributeService:
             Created assignment
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/radiusAttributeGroups/{group_id}/assignments",
                 payload=assignment_data,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/radiusAttributeGroups/{group_id}/assignments",
                 payload=assignment_data
             )
@@ -506,12 +506,12 @@ class RadiusAttributeService:
             Deletion response
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/radiusAttributeGroups/{group_id}/assignments/{assignment_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/radiusAttributeGroups/{group_id}/assignments/{assignment_id}"
             )
 
@@ -25,7 +25,7 @@ class RadiusProfileService:
     def __init__(self, client):
         self.client = client
 
-    def get_radius_profiles(
+    async def get_radius_profiles(
         self,
         tenant_id: str = None,
     ) -> List[Dict[str, Any]]:
@@ -39,9 +39,9 @@ class RadiusProfileService:
             List of RADIUS profile dicts
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get("/radiusServerProfiles", override_tenant_id=tenant_id)
+            response = await self.client.aget("/radiusServerProfiles", override_tenant_id=tenant_id)
         else:
-            response = self.client.get("/radiusServerProfiles")
+            response = await self.client.aget("/radiusServerProfiles")
 
         data = response.json()
         # GET returns a plain list
@@ -49,7 +49,7 @@ class RadiusProfileService:
             return data
         return data.get("data", [])
 
-    def find_radius_profile_by_name(
+    async def find_radius_profile_by_name(
         self,
         tenant_id: str,
         name: str,
@@ -64,7 +64,7 @@ class RadiusProfileService:
         Returns:
             Profile dict if found, None otherwise
         """
-        profiles = self.get_radius_profiles(tenant_id)
+        profiles = await self.get_radius_profiles(tenant_id)
         for p in profiles:
             if p.get("name") == name:
                 return p
@@ -121,13 +121,13 @@ class RadiusProfileService:
             }
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/radiusServerProfiles",
                 payload=payload,
                 override_tenant_id=tenant_id,
             )
         else:
-            response = self.client.post("/radiusServerProfiles", payload=payload)
+            response = await self.client.apost("/radiusServerProfiles", payload=payload)
 
         if response.status_code in [R1StatusCode.OK, R1StatusCode.CREATED, R1StatusCode.ACCEPTED]:
             result = response.json() if response.content else {"status": "accepted"}
@@ -139,7 +139,7 @@ class RadiusProfileService:
                         request_id, override_tenant_id=tenant_id
                     )
                     # Fetch created profile by name
-                    created = self.find_radius_profile_by_name(tenant_id, name)
+                    created = await self.find_radius_profile_by_name(tenant_id, name)
                     if created:
                         return created
                     logger.warning(f"Task completed but could not find created RADIUS profile '{name}'")
@@ -172,7 +172,7 @@ class RadiusProfileService:
         Returns:
             Profile dict with 'id' field
         """
-        existing = self.find_radius_profile_by_name(tenant_id, name)
+        existing = await self.find_radius_profile_by_name(tenant_id, name)
         if existing:
             logger.info(f"Found existing RADIUS profile '{name}' (id={existing.get('id')})")
             return existing
@@ -213,9 +213,9 @@ class RadiusProfileService:
         endpoint = f"/wifiNetworks/{network_id}/radiusServerProfiles/{radius_profile_id}"
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.put(endpoint, payload={}, override_tenant_id=tenant_id)
+            response = await self.client.aput(endpoint, payload={}, override_tenant_id=tenant_id)
         else:
-            response = self.client.put(endpoint, payload={})
+            response = await self.client.aput(endpoint, payload={})
 
         if response.status_code in [R1StatusCode.OK, R1StatusCode.ACCEPTED]:
             result = response.json() if response.content else {"status": "accepted"}
@@ -254,9 +254,9 @@ class RadiusProfileService:
         endpoint = f"/wifiNetworks/{network_id}/radiusServerProfiles/{radius_profile_id}"
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(endpoint, override_tenant_id=tenant_id)
+            response = await self.client.adelete(endpoint, override_tenant_id=tenant_id)
         else:
-            response = self.client.delete(endpoint)
+            response = await self.client.adelete(endpoint)
 
         if response.status_code in [R1StatusCode.OK, R1StatusCode.ACCEPTED]:
             result = response.json() if response.content else {"status": "accepted"}
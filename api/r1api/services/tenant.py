@@ -11,22 +11,22 @@ class TenantService:
         """
         Get tenant self information
         """
-        return self.client.safe_json(self.client.get("/tenants/self"))
+        return self.client.safe_json(await self.client.aget("/tenants/self"))
 
     async def get_tenant_user_profiles(self):
         """
         Get all user profiles for a tenant
         """
-        return self.client.safe_json(self.client.get("/tenants/userProfiles"))
+        return self.client.safe_json(await self.client.aget("/tenants/userProfiles"))
 
     async def get_tenant_venues(self, tenant_id: str):
         """
         Get all venues for a tenant
         """
         if self.client.ec_type == "MSP":
-            return self.client.safe_json(self.client.get("/venues", override_tenant_id=tenant_id))
+            return self.client.safe_json(await self.client.aget("/venues", override_tenant_id=tenant_id))
         else:
-            return self.client.safe_json(self.client.get("/venues"))
+            return self.client.safe_json(await self.client.aget("/venues"))
 
     async def get_tenant_aps(self, tenant_id: str):
         """
@@ -38,7 +38,7 @@ class TenantService:
             'sortOrder': 'ASC',
         }
         if self.client.ec_type == "MSP":
-            return self.client.safe_json(self.client.post("/venues/aps/query", payload=body, override_tenant_id=tenant_id))
+            return self.client.safe_json(await self.client.apost("/venues/aps/query", payload=body, override_tenant_id=tenant_id))
         else:
-            return self.client.safe_json(self.client.post("/venues/aps/query", payload=body))
+            return self.client.safe_json(await self.client.apost("/venues/aps/query", payload=body))
 
@@ -3,6 +3,8 @@ import csv
 import io
 import logging
 
+from r1api.pagination import fetch_all_pages, iter_rows
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,10 +17,10 @@ class VenueService:
         Get all venues for a tenant
         """
         if self.client.ec_type == "MSP":
-            resp = self.client.get("/venues", override_tenant_id=tenant_id).json()
+            resp = (await self.client.aget("/venues", override_tenant_id=tenant_id)).json()
             return resp
         else:
-            resp = self.client.get("/venues").json()
+            resp = (await self.client.aget("/venues")).json()
             return resp
 
     async def get_venue(self, tenant_id: str, venue_id: str):
@@ -33,9 +35,9 @@ class VenueService:
             Venue details object
         """
         if self.client.ec_type == "MSP":
-            return self.client.get(f"/venues/{venue_id}", override_tenant_id=tenant_id).json()
+            return (await self.client.aget(f"/venues/{venue_id}", override_tenant_id=tenant_id)).json()
         else:
-            return self.client.get(f"/venues/{venue_id}").json()
+            return (await self.client.aget(f"/venues/{venue_id}")).json()
 
     def query_all_aps_by_tenant(
         self,
@@ -143,9 +145,9 @@ class VenueService:
 
         # Fetch first page
         if self.client.ec_type == "MSP":
-            first_response = self.client.post(f"/venues/aps/query", payload=body, override_tenant_id=tenant_id).json()
+            first_response = (await self.client.apost(f"/venues/aps/query", payload=body, override_tenant_id=tenant_id)).json()
         else:
-            first_response = self.client.post(f"/venues/aps/query", payload=body).json()
+            first_response = (await self.client.apost(f"/venues/aps/query", payload=body)).json()
 
         all_aps = first_response.get('data', [])
         total_count = first_response.get('totalCount', len(all_aps))
@@ -187,9 +189,9 @@ class VenueService:
         #     }
         # }
         if self.client.ec_type == "MSP":
-            return self.client.post(f"/venues/{venue_id}/aps/{serial_number}", override_tenant_id=tenant_id).json()
+            return (await self.client.apost(f"/venues/{venue_id}/aps/{serial_number}", override_tenant_id=tenant_id)).json()
         else:
-            return self.client.post(f"/venues/{venue_id}/aps/{serial_number}").json()
+            return (await self.client.apost(f"/venues/{venue_id}/aps/{serial_number}")).json()
 
     async def update_ap(
         self,
@@ -235,13 +237,13 @@ class VenueService:
         logger.info(f"Updating AP {serial_number}: {payload}")
 
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/aps/{serial_number}",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/aps/{serial_number}",
                 payload=payload
             )
@@ -270,9 +272,9 @@ class VenueService:
         logger.debug(f"get_ap_groups called - tenant_id: {tenant_id}, ec_type: {self.client.ec_type}")
 
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.get("/venues/apGroups", override_tenant_id=tenant_id).json()
+            response = (await self.client.aget("/venues/apGroups", override_tenant_id=tenant_id)).json()
         else:
-            response = self.client.get("/venues/apGroups").json()
+            response = (await self.client.aget("/venues/apGroups")).json()
 
         logger.debug(f"AP Groups Response Type: {type(response)}")
 
@@ -298,9 +300,9 @@ class VenueService:
             AP Group details object
         """
         if self.client.ec_type == "MSP":
-            return self.client.get(f"/venues/{venue_id}/apGroups/{ap_group_id}", override_tenant_id=tenant_id).json()
+            return (await self.client.aget(f"/venues/{venue_id}/apGroups/{ap_group_id}", override_tenant_id=tenant_id)).json()
         else:
-            return self.client.get(f"/venues/{venue_id}/apGroups/{ap_group_id}").json()
+            return (await self.client.aget(f"/venues/{venue_id}/apGroups/{ap_group_id}")).json()
 
     async def query_ap_groups(self, tenant_id: str, venue_id: str = None, fields: list = None, filters: dict = None, page: int = None, limit: int = None):
         """
@@ -349,9 +351,64 @@ class VenueService:
             body['filters'] = {'venueId': [venue_id]}
 
         if self.client.ec_type == "MSP":
-            return self.client.post("/venues/apGroups/query", payload=body, override_tenant_id=tenant_id).json()
+            return (await self.client.apost("/venues/apGroups/query", payload=body, override_tenant_id=tenant_id)).json()
         else:
-            return self.client.post("/venues/apGroups/query", payload=body).json()
+            return (await self.client.apost("/venues/apGroups/query", payload=body)).json()
+
+    async def query_all_ap_groups(
+        self,
+        tenant_id: str,
+        venue_id: str = None,
+        fields: list = None,
+        filters: dict = None,
+        page_size: int = 100,
+        max_concurrency: int = 8,
+    ):
+        """
+        Fetch every AP group matching the query (see query_ap_groups).
+
+        Reads page 1 to learn totalCount, then fetches the remaining pages
+        concurrently (bounded by max_concurrency).
+
+        Returns:
+            Dict with 'data' (all AP groups) and 'totalCount'
+        """
+        rows, total = await fetch_all_pages(
+            self._ap_group_page_fetcher(tenant_id, venue_id, fields, filters),
+            first_page=1,
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+        )
+        return {'data': rows, 'totalCount': total}
+
+    def iter_ap_groups(
+        self,
+        tenant_id: str,
+        venue_id: str = None,
+        fields: list = None,
+        filters: dict = None,
+        page_size: int = 100,
+        max_concurrency: int = 8,
+    ):
+        """Async iterator over every matching AP group, yielded as pages arrive."""
+        return iter_rows(
+            self._ap_group_page_fetcher(tenant_id, venue_id, fields, filters),
+            first_page=1,
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+        )
+
+    def _ap_group_page_fetcher(self, tenant_id, venue_id, fields, filters):
+        async def fetch_page(page, page_size):
+            return await self.query_ap_groups(
+                tenant_id=tenant_id,
+                venue_id=venue_id,
+                fields=fields,
+                filters=filters,
+                page=page,
+                limit=page_size,
+            )
+        return fetch_page
 
     async def delete_ap_group(
         self,
@@ -374,12 +431,12 @@ class VenueService:
             Deletion response (includes requestId if wait_for_completion=False)
         """
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/venues/{venue_id}/apGroups/{ap_group_id}",
                 override_tenant_id=tenant_id,
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/venues/{venue_id}/apGroups/{ap_group_id}"
             )
 
@@ -399,72 +456,72 @@ class VenueService:
         Get AP load balancing settings for a venue
         """
         if self.client.ec_type == "MSP":
-            return self.client.get(f"/venues/{venue_id}/apLoadBalancingSettings", override_tenant_id=tenant_id).json()
+            return (await self.client.aget(f"/venues/{venue_id}/apLoadBalancingSettings", override_tenant_id=tenant_id)).json()
         else:
-            return self.client.get(f"/venues/{venue_id}/apLoadBalancingSettings").json()
+            return (await self.client.aget(f"/venues/{venue_id}/apLoadBalancingSettings")).json()
 
     async def get_ap_radio_settings(self, tenant_id: str, venue_id: str):
         """
         Get AP radio settings for a venue
         """
         if self.client.ec_type == "MSP":
-            return self.client.get(f"/venues/{venue_id}/apRadioSettings", override_tenant_id=tenant_id).json()
+            return (await self.client.aget(f"/venues/{venue_id}/apRadioSettings", override_tenant_id=tenant_id)).json()
         else:
-            return self.client.get(f"/venues/{venue_id}/apRadioSettings").json()
+            return (await self.client.aget(f"/venues/{venue_id}/apRadioSettings")).json()
 
     async def get_wifi_available_channels(self, tenant_id: str, venue_id: str):
         """
         Get WiFi available channels for a venue
         """
         if self.client.ec_type == "MSP":
-            return self.client.get(f"/venues/{venue_id}/wifiAvailableChannels", override_tenant_id=tenant_id).json()
+            return (await self.client.aget(f"/venues/{venue_id}/wifiAvailableChannels", override_tenant_id=tenant_id)).json()
         else:
-            return self.client.get(f"/venues/{venue_id}/wifiAvailableChannels").json()
+            return (await self.client.aget(f"/venues/{venue_id}/wifiAvailableChannels")).json()
 
     async def get_ap_model_band_mode_settings(self, tenant_id: str, venue_id: str):
         """
         Get AP model band mode settings for a venue
         """
         if self.client.ec_type == "MSP":
-            return self.client.get(f"/venues/{venue_id}/apModelBandModeSettings", override_tenant_id=tenant_id).json()
+            return (await self.client.aget(f"/venues/{venue_id}/apModelBandModeSettings", override_tenant_id=tenant_id)).json()
         else:
-            return self.client.get(f"/venues/{venue_id}/apModelBandModeSettings").json()
+            return (await self.client.aget(f"/venues/{venue_id}/apModelBandModeSettings")).json()
 
     async def get_ap_model_external_antenna_settings(self, tenant_id: str, venue_id: str):
         """
         Get AP model external antenna settings for a venue
         """
         if self.client.ec_type == "MSP":
-            return self.client.get(f"/venues/{venue_id}/apModelExternalAntennaSettings", override_tenant_id=tenant_id).json()
+            return (await self.client.aget(f"/venues/{venue_id}/apModelExternalAntennaSettings", override_tenant_id=tenant_id)).json()
         else:
-            return self.client.get(f"/venues/{venue_id}/apModelExternalAntennaSettings").json()
+            return (await self.client.aget(f"/venues/{venue_id}/apModelExternalAntennaSettings")).json()
 
     async def get_ap_client_admission_control_settings(self, tenant_id: str, venue_id: str):
         """
         Get AP client admission control settings for a venue
         """
         if self.client.ec_type == "MSP":
-            return self.client.get(f"/venues/{venue_id}/apClientAdmissionControlSettings", override_tenant_id=tenant_id).json()
+            return (await self.client.aget(f"/venues/{venue_id}/apClientAdmissionControlSettings", override_tenant_id=tenant_id)).json()
         else:
-            return self.client.get(f"/venues/{venue_id}/apClientAdmissionControlSettings").json()
+            return (await self.client.aget(f"/venues/{venue_id}/apClientAdmissionControlSettings")).json()
 
     async def get_ap_model_capabilities(self, tenant_id: str, venue_id: str):
         """
         Get AP model capabilities for a venue
         """
         if self.client.ec_type == "MSP":
-            return self.client.get(f"/venues/{venue_id}/apModelCapabilities", override_tenant_id=tenant_id).json()
+            return (await self.client.aget(f"/venues/{venue_id}/apModelCapabilities", override_tenant_id=tenant_id)).json()
         else:
-            return self.client.get(f"/venues/{venue_id}/apModelCapabilities").json()
+            return (await self.client.aget(f"/venues/{venue_id}/apModelCapabilities")).json()
 
     async def get_ap_model_antenna_type_settings(self, tenant_id: str, venue_id: str):
         """
         Get AP model antenna type settings for a venue
         """
         if self.client.ec_type == "MSP":
-            return self.client.get(f"/venues/{venue_id}/apModelAntennaTypeSettings", override_tenant_id=tenant_id).json()
+            return (await self.client.aget(f"/venues/{venue_id}/apModelAntennaTypeSettings", override_tenant_id=tenant_id)).json()
         else:
-            return self.client.get(f"/venues/{venue_id}/apModelAntennaTypeSettings").json()
+            return (await self.client.aget(f"/venues/{venue_id}/apModelAntennaTypeSettings")).json()
 
     async def add_ap_to_venue(
         self,
@@ -519,13 +576,13 @@ class VenueService:
 
         # Make API call
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/venues/{venue_id}/aps",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/venues/{venue_id}/aps",
                 payload=payload
             )
@@ -608,13 +665,13 @@ class VenueService:
 
         # Make API call with multipart form data
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post_multipart(
+            response = await self.client.apost_multipart(
                 f"/venues/{venue_id}/aps",
                 files=files,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post_multipart(
+            response = await self.client.apost_multipart(
                 f"/venues/{venue_id}/aps",
                 files=files
             )
@@ -693,13 +750,13 @@ class VenueService:
         # Make API call with multipart form data
         # Endpoint: POST /venues/{venue_id}/switches/importRequests
         if self.client.ec_type == "MSP" and tenant_id:
-            response = self.client.post_multipart(
+            response = await self.client.apost_multipart(
                 f"/venues/{venue_id}/switches/importRequests",
                 files=files,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post_multipart(
+            response = await self.client.apost_multipart(
                 f"/venues/{venue_id}/switches/importRequests",
                 files=files
             )
@@ -748,9 +805,9 @@ class VenueService:
         }
 
         if self.client.ec_type == "MSP":
-            response = self.client.post("/venues/apGroups/query", payload=body, override_tenant_id=tenant_id).json()
+            response = (await self.client.apost("/venues/apGroups/query", payload=body, override_tenant_id=tenant_id)).json()
         else:
-            response = self.client.post("/venues/apGroups/query", payload=body).json()
+            response = (await self.client.apost("/venues/apGroups/query", payload=body)).json()
 
         # Response format: {"data": [...], "totalCount": N}
         groups = response.get('data', [])
@@ -790,13 +847,13 @@ class VenueService:
 
         # Make API call
         if self.client.ec_type == "MSP":
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/venues/{venue_id}/apGroups",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 f"/venues/{venue_id}/apGroups",
                 payload=payload
             )
@@ -849,12 +906,12 @@ class VenueService:
 
         # Make API call - PUT with no body
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/apGroups/{ap_group_id}/aps/{ap_serial_number}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/apGroups/{ap_group_id}/aps/{ap_serial_number}"
             )
 
@@ -925,13 +982,13 @@ class VenueService:
             logger.info(f"[activate_ssid_on_venue] DPSK mode - including dpskServiceProfileId: {dpsk_service_id}")
 
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}",
                 payload=payload
             )
@@ -1019,13 +1076,13 @@ class VenueService:
         }
 
         if self.client.ec_type == "MSP":
-            response = self.client.post(
+            response = await self.client.apost(
                 "/networkActivations",
                 payload=payload,
                 override_tenant_id=tenant_id,
             )
         else:
-            response = self.client.post(
+            response = await self.client.apost(
                 "/networkActivations",
                 payload=payload,
             )
@@ -1079,12 +1136,12 @@ class VenueService:
         )
 
         if self.client.ec_type == "MSP":
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.delete(
+            response = await self.client.adelete(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}"
             )
 
@@ -1161,13 +1218,13 @@ class VenueService:
 
         # Make API call - PUT with activation payload
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}/apGroups/{ap_group_id}",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}/apGroups/{ap_group_id}",
                 payload=payload
             )
@@ -1251,13 +1308,13 @@ class VenueService:
         }
 
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}/settings",
                 payload=settings_payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}/settings",
                 payload=settings_payload
             )
@@ -1277,12 +1334,12 @@ class VenueService:
         # Step 2: Bind AP Group to the network (no payload)
         logger.info(f"[Step 2/3] PUT /venues/{venue_id}/wifiNetworks/{wifi_network_id}/apGroups/{ap_group_id}")
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}/apGroups/{ap_group_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}/apGroups/{ap_group_id}"
             )
 
@@ -1309,13 +1366,13 @@ class VenueService:
             ap_group_settings_payload["vlanId"] = int(vlan_id) if isinstance(vlan_id, str) else vlan_id
 
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}/apGroups/{ap_group_id}/settings",
                 payload=ap_group_settings_payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}/apGroups/{ap_group_id}/settings",
                 payload=ap_group_settings_payload
             )
@@ -1418,13 +1475,13 @@ class VenueService:
             settings_payload["apGroups"][0]["vlanId"] = int(vlan_id) if isinstance(vlan_id, str) else vlan_id
 
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}/settings",
                 payload=settings_payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}/settings",
                 payload=settings_payload
             )
@@ -1453,12 +1510,12 @@ class VenueService:
         # Step 2: Activate AP Group on the SSID
         logger.info(f"[Step 2/3] PUT /venues/{venue_id}/wifiNetworks/{wifi_network_id}/apGroups/{ap_group_id}")
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}/apGroups/{ap_group_id}",
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}/apGroups/{ap_group_id}"
             )
 
@@ -1494,13 +1551,13 @@ class VenueService:
             ap_group_settings_payload["vlanId"] = int(vlan_id) if isinstance(vlan_id, str) else vlan_id
 
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}/apGroups/{ap_group_id}/settings",
                 payload=ap_group_settings_payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/wifiNetworks/{wifi_network_id}/apGroups/{ap_group_id}/settings",
                 payload=ap_group_settings_payload
             )
@@ -1939,12 +1996,12 @@ class VenueService:
         try:
             logger.info(f"Fetching venue LAN port settings for venue {venue_id}")
             if self.client.ec_type == "MSP":
-                response = self.client.get(
+                response = await self.client.aget(
                     f"/templates/venues/{venue_id}/apModelLanPortSettings",
                     override_tenant_id=tenant_id
                 )
             else:
-                response = self.client.get(
+                response = await self.client.aget(
                     f"/templates/venues/{venue_id}/apModelLanPortSettings"
                 )
 
@@ -1988,12 +2045,12 @@ class VenueService:
         """
         try:
             if self.client.ec_type == "MSP":
-                response = self.client.get(
+                response = await self.client.aget(
                     f"/venues/{venue_id}/aps/{serial_number}/lanPortSpecificSettings",
                     override_tenant_id=tenant_id
                 )
             else:
-                response = self.client.get(
+                response = await self.client.aget(
                     f"/venues/{venue_id}/aps/{serial_number}/lanPortSpecificSettings"
                 )
 
@@ -2033,12 +2090,12 @@ class VenueService:
                 port_number = port_id
 
             if self.client.ec_type == "MSP":
-                response = self.client.get(
+                response = await self.client.aget(
                     f"/venues/{venue_id}/aps/{serial_number}/lanPorts/{port_number}/settings",
                     override_tenant_id=tenant_id
                 )
             else:
-                response = self.client.get(
+                response = await self.client.aget(
                     f"/venues/{venue_id}/aps/{serial_number}/lanPorts/{port_number}/settings"
                 )
 
@@ -2168,13 +2225,13 @@ class VenueService:
         logger.debug(f"Setting AP {serial_number} LAN port specific settings: useVenueSettings={use_venue_settings}")
 
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/aps/{serial_number}/lanPortSpecificSettings",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/aps/{serial_number}/lanPortSpecificSettings",
                 payload=payload
             )
@@ -2244,13 +2301,13 @@ class VenueService:
         logger.debug(f"Setting AP {serial_number} port {port_id} VLAN: {untagged_vlan}")
 
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/aps/{serial_number}/lanPorts/{port_number}/settings",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/aps/{serial_number}/lanPorts/{port_number}/settings",
                 payload=payload
             )
@@ -2306,13 +2363,13 @@ class VenueService:
         logger.debug(f"Setting AP {serial_number} port {port_id} enabled: {enabled}")
 
         if self.client.ec_type == "MSP":
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/aps/{serial_number}/lanPorts/{port_number}/settings",
                 payload=payload,
                 override_tenant_id=tenant_id
             )
         else:
-            response = self.client.put(
+            response = await self.client.aput(
                 f"/venues/{venue_id}/aps/{serial_number}/lanPorts/{port_number}/settings",
                 payload=payload
             )
@@ -2338,9 +2395,9 @@ class VenueService:
         try:
             url = f"/venues/{venue_id}/aps/{serial_number}/{setting_path}"
             if self.client.ec_type == "MSP":
-                response = self.client.get(url, override_tenant_id=tenant_id)
+                response = await self.client.aget(url, override_tenant_id=tenant_id)
             else:
-                response = self.client.get(url)
+                response = await self.client.aget(url)
 
             if response.status_code == 200:
                 return response.json()
@@ -2356,9 +2413,9 @@ class VenueService:
         """Generic PUT for an AP-level setting endpoint. Handles 202 async tasks."""
         url = f"/venues/{venue_id}/aps/{serial_number}/{setting_path}"
         if self.client.ec_type == "MSP":
-            response = self.client.put(url, payload=payload, override_tenant_id=tenant_id)
+            response = await self.client.aput(url, payload=payload, override_tenant_id=tenant_id)
         else:
-            response = self.client.put(url, payload=payload)
+            response = await self.client.aput(url, payload=payload)
 
         if response.status_code in [200, 201, 202]:
             result = response.json() if response.content else {"status": "accepted"}
@@ -2472,9 +2529,9 @@ class VenueService:
         """Provision a new AP into RuckusONE by serial number."""
         payload = {"serialNumbers": [serial_number]}
         if self.client.ec_type == "MSP":
-            response = self.client.post("/deviceProvisions/aps", payload=payload, override_tenant_id=tenant_id)
+            response = await self.client.apost("/deviceProvisions/aps", payload=payload, override_tenant_id=tenant_id)
         else:
-            response = self.client.post("/deviceProvisions/aps", payload=payload)
+            response = await self.client.apost("/deviceProvisions/aps", payload=payload)
 
         if response.status_code in [200, 201, 202]:
             return response.json() if response.content else {"status": "accepted"}
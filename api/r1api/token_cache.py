@@ -1,26 +1,224 @@
+"""
+Shared R1 OAuth token cache.
+
+Tokens are cached in two layers:
+  - a process-local dict (fast path, no I/O), and
+  - Redis, so every uvicorn worker, the scheduler and short-lived scripts
+    reuse one token per tenant/region/client instead of each hitting
+    /oauth2/token on R1Client construction.
+
+Refreshes are single-flight: refresh_lock() takes a process lock plus a
+Redis SET NX lock, so only one worker re-authenticates while the rest wait
+and pick up the new token from Redis.
+
+Redis is best-effort here. If it is unreachable the cache degrades to the
+process-local layer and R1Client keeps working.
+"""
+
+import hashlib
+import json
 import logging
 import time
+import uuid
+from contextlib import contextmanager
 from threading import Lock
+from typing import Optional, Tuple
+
+from r1api.redis_sync import get_sync_redis, redis_failed
 
 logger = logging.getLogger(__name__)
 
+# Tokens are treated as unusable this close to expiry
+EXPIRY_SAFETY_MARGIN = 60
+# ...and are refreshed proactively once inside this window
+REFRESH_MARGIN = 300
+
+REDIS_KEY_PREFIX = "r1:token"
+REFRESH_LOCK_TTL = 30          # seconds; auth should never take this long
+REFRESH_LOCK_WAIT = 10.0       # max seconds to wait for another worker's refresh
+
 _token_cache = {}
 _lock = Lock()
+_refresh_locks = {}
+
+# Delete the refresh lock only if this holder still owns it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
 
-def get_cached_token(tenant_id):
+def token_key(tenant_id: str, host: str = None, client_id: str = None) -> str:
+    """Cache key for a tenant/region/client_id triple (client_id is hashed)."""
+    parts = [host or "default", tenant_id or "none"]
+    if client_id:
+        parts.append(hashlib.sha256(client_id.encode()).hexdigest()[:16])
+    return ":".join(parts)
+
+
+def _encrypt(token: str) -> str:
+    try:
+        from utils.encryption import encrypt_value
+    except (ImportError, ValueError):
+        return token
+    return encrypt_value(token)
+
+
+def _decrypt(value: str) -> Optional[str]:
+    try:
+        from utils.encryption import decrypt_value
+    except (ImportError, ValueError):
+        return value
+    try:
+        return decrypt_value(value)
+    except Exception:
+        return None
+
+
+def get_cached_entry(key: str) -> Tuple[Optional[str], Optional[float]]:
+    """
+    Return (token, expires_at) for a usable token, or (None, None).
+
+    Checks the process-local cache first, then Redis (populating the local
+    cache on a hit). A local token inside the refresh window still falls
+    through to Redis, in case another worker has already refreshed it.
+    """
+    now = time.time()
+    local = (None, None)
     with _lock:
-        entry = _token_cache.get(tenant_id)
+        entry = _token_cache.get(key)
         if entry:
-            token, expiry = entry
-            if expiry is None or expiry > time.time():
-                logger.debug(f"Token found in cache for tenant {tenant_id}")
-                return token
+            token, expires_at = entry
+            if expires_at is None or expires_at - EXPIRY_SAFETY_MARGIN > now:
+                if not needs_refresh(expires_at):
+                    return token, expires_at
+                local = (token, expires_at)
+
+    client = get_sync_redis()
+    if client is not None:
+        try:
+            raw = client.get(f"{REDIS_KEY_PREFIX}:{key}")
+        except Exception as e:
+            redis_failed(e)
+            raw = None
+        if raw:
+            try:
+                data = json.loads(raw)
+                token = _decrypt(data["token"])
+                expires_at = float(data["expires_at"])
+            except (ValueError, KeyError, TypeError):
+                token, expires_at = None, None
+            if token and expires_at - EXPIRY_SAFETY_MARGIN > now and (
+                local[1] is None or expires_at > local[1]
+            ):
+                with _lock:
+                    _token_cache[key] = (token, expires_at)
+                logger.debug(f"Token found in shared cache for {key}")
+                return token, expires_at
+
+    if local[0]:
+        return local
     logger.debug('No cached token found')
-    return None
+    return None, None
+
+
+def get_cached_token(key: str) -> Optional[str]:
+    return get_cached_entry(key)[0]
+
+
+def needs_refresh(expires_at: Optional[float]) -> bool:
+    """True once a token is inside the proactive refresh window."""
+    return expires_at is not None and time.time() >= expires_at - REFRESH_MARGIN
+
+
+def store_token(key: str, token: str, expires_in: int = 3600) -> float:
+    """Cache a token locally and in Redis. Returns its absolute expiry."""
+    expires_at = time.time() + expires_in
+    with _lock:
+        _token_cache[key] = (token, expires_at)
+
+    client = get_sync_redis()
+    if client is not None:
+        try:
+            client.set(
+                f"{REDIS_KEY_PREFIX}:{key}",
+                json.dumps({"token": _encrypt(token), "expires_at": expires_at}),
+                ex=max(int(expires_in), 1),
+            )
+        except Exception as e:
+            redis_failed(e)
+
+    logger.debug(f"Token cached for {key}")
+    return expires_at
+
+
+def invalidate_token(key: str, token: str = None):
+    """
+    Drop a cached token (e.g. after R1 rejected it with 401).
+
+    If `token` is given, only drop the entry when it still holds that token,
+    so a worker reporting a stale 401 doesn't evict a freshly refreshed one.
+    """
+    with _lock:
+        entry = _token_cache.get(key)
+        if entry and (token is None or entry[0] == token):
+            del _token_cache[key]
+
+    client = get_sync_redis()
+    if client is None:
+        return
+    try:
+        redis_key = f"{REDIS_KEY_PREFIX}:{key}"
+        if token is None:
+            client.delete(redis_key)
+            return
+        raw = client.get(redis_key)
+        if raw and _decrypt(json.loads(raw).get("token", "")) == token:
+            client.delete(redis_key)
+    except Exception as e:
+        redis_failed(e)
+
+
+@contextmanager
+def refresh_lock(key: str):
+    """
+    Single-flight guard around a token refresh.
 
-def store_token(tenant_id, token, expires_in=3600):
+    Serialises refreshes within the process and, when Redis is available,
+    across workers. Waiting for another worker's lock is bounded by
+    REFRESH_LOCK_WAIT; after that the caller refreshes anyway rather than
+    failing the request. Callers should re-check the cache once inside.
+    """
     with _lock:
-        expiry = time.time() + expires_in - 60  # 1 min safety margin
-        _token_cache[tenant_id] = (token, expiry)
-        logger.debug(f"Token cached for tenant {tenant_id}")
+        local = _refresh_locks.setdefault(key, Lock())
 
+    with local:
+        client = get_sync_redis()
+        lock_key = f"{REDIS_KEY_PREFIX}:lock:{key}"
+        holder = uuid.uuid4().hex
+        acquired = False
+        if client is not None:
+            deadline = time.time() + REFRESH_LOCK_WAIT
+            try:
+                while True:
+                    if client.set(lock_key, holder, nx=True, ex=REFRESH_LOCK_TTL):
+                        acquired = True
+                        break
+                    if time.time() >= deadline:
+                        logger.warning(f"Timed out waiting for token refresh lock {key}")
+                        break
+                    time.sleep(0.1)
+            except Exception as e:
+                redis_failed(e)
+        try:
+            yield
+        finally:
+            if acquired:
+                try:
+                    # A refresh that outlived REFRESH_LOCK_TTL must not drop
+                    # a lock another worker has since taken
+                    client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, holder)
+                except Exception as e:
+                    redis_failed(e)
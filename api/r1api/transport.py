@@ -0,0 +1,127 @@
+"""
+Async HTTP transport for the RuckusONE API.
+
+R1Client's plain verbs (get/post/put/...) run on a blocking requests.Session.
+That is fine for sync helpers called through asyncio.to_thread, but every
+`async def` service method that used them stalled the uvicorn event loop for
+the full round trip. The awaitable verbs (aget/apost/...) go through here
+instead: one pooled httpx.AsyncClient per event loop, shared by every
+R1Client in the process, negotiating HTTP/2 when the `h2` package is present.
+
+httpx clients are bound to the loop that first used them, so the pool is
+keyed by the running loop (the app loop, the scheduler loop and any
+asyncio.run() in a worker thread each get their own).
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import weakref
+from typing import Optional
+
+import httpx
+import requests
+
+logger = logging.getLogger(__name__)
+
+# httpx negotiates HTTP/2 only when the h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Pool sizing. 200 concurrent R1 calls is the upper bound we see from a
+# single worker (brain phase tasks + activity polling + dashboard fan-out).
+MAX_CONNECTIONS = int(os.getenv("R1_HTTP_MAX_CONNECTIONS", "200"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("R1_HTTP_MAX_KEEPALIVE", "50"))
+REQUEST_TIMEOUT = float(os.getenv("R1_HTTP_TIMEOUT", "60"))
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def async_transport_enabled() -> bool:
+    """
+    Whether the awaitable verbs use the native httpx transport.
+
+    Set R1_ASYNC_TRANSPORT=0 to route them through the sync requests.Session
+    in a worker thread instead (same behaviour, no new HTTP stack).
+    """
+    return os.environ.get('R1_ASYNC_TRANSPORT', '1').lower() not in ('0', 'false', 'no')
+
+
+class R1Response:
+    """
+    requests.Response-compatible view of an httpx.Response.
+
+    Service code was written against requests (`.ok`, `.reason`,
+    `raise_for_status()` raising requests.HTTPError), so async responses are
+    wrapped to keep those call sites unchanged.
+    """
+
+    __slots__ = ("_response",)
+
+    def __init__(self, response: httpx.Response):
+        self._response = response
+
+    @property
+    def ok(self) -> bool:
+        return self._response.status_code < 400
+
+    @property
+    def reason(self) -> str:
+        return self._response.reason_phrase
+
+    @property
+    def url(self) -> str:
+        return str(self._response.url)
+
+    def json(self, **kwargs):
+        return self._response.json(**kwargs)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(
+                f"{self.status_code} Error: {self.reason} for url: {self.url}",
+                response=self,
+            )
+
+    def __getattr__(self, name):
+        # status_code, text, content, headers, http_version, ...
+        return getattr(self._response, name)
+
+    def __bool__(self):
+        return self.ok
+
+    def __repr__(self):
+        return f"<R1Response [{self._response.status_code}]>"
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Return the shared httpx.AsyncClient for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            verify=True,
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        _clients[loop] = client
+        logger.debug(
+            f"Created async R1 HTTP client (http2={HTTP2_AVAILABLE}, "
+            f"max_connections={MAX_CONNECTIONS})"
+        )
+    return client
+
+
+async def close_async_http_client() -> None:
+    """Close the shared client for the running loop (application shutdown)."""
+    loop = asyncio.get_running_loop()
+    client: Optional[httpx.AsyncClient] = _clients.pop(loop, None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+        logger.info("Async R1 HTTP client closed")
@@ -0,0 +1,103 @@
+"""
+DPSK Orchestrator Mapping Index.
+
+An orchestrator's PassphraseMapping rows, loaded with one query and
+indexed for the full sync diff.
+
+The diff used to look up the mapping of every site-wide passphrase missing
+from the sources with its own query, and flagged removals and orphans with
+a commit per row - thousands of round trips and commits on a site-wide pool
+with thousands of orphans. With the index every lookup is a dict hit, and
+status changes are applied with bulk UPDATEs (bulk_set_status) that the
+caller commits once.
+
+Usage:
+    mappings = MappingIndex.load(db, orchestrator_id)
+    mapping = mappings.by_target(site_pp['id'])
+    bulk_set_status(db, [m.id for m in flagged], "flagged_removal", flagged_at=now)
+    db.commit()
+"""
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from models.orchestrator import PassphraseMapping
+
+logger = logging.getLogger(__name__)
+
+BULK_UPDATE_CHUNK = 500  # IDs per UPDATE ... WHERE id IN (...)
+
+
+class MappingIndex:
+    """All mappings of one orchestrator, indexed by target and source passphrase ID."""
+
+    def __init__(self, mappings: Iterable[PassphraseMapping]):
+        self.mappings: List[PassphraseMapping] = []
+        self._by_target: Dict[str, PassphraseMapping] = {}
+        self._by_source: Dict[str, PassphraseMapping] = {}
+        for mapping in mappings:
+            self.add(mapping)
+
+    @classmethod
+    def load(cls, db: Session, orchestrator_id: int) -> "MappingIndex":
+        """Load every mapping of the orchestrator (one query, ordered by ID)."""
+        return cls(
+            db.query(PassphraseMapping)
+            .filter(PassphraseMapping.orchestrator_id == orchestrator_id)
+            .order_by(PassphraseMapping.id)
+            .all()
+        )
+
+    def add(self, mapping: PassphraseMapping) -> None:
+        """Index a mapping (the first mapping seen for an ID wins, like .first())."""
+        self.mappings.append(mapping)
+        if mapping.target_passphrase_id:
+            self._by_target.setdefault(mapping.target_passphrase_id, mapping)
+        if mapping.source_passphrase_id:
+            self._by_source.setdefault(mapping.source_passphrase_id, mapping)
+
+    def by_target(self, target_passphrase_id: Optional[str]) -> Optional[PassphraseMapping]:
+        return self._by_target.get(target_passphrase_id) if target_passphrase_id else None
+
+    def by_source(self, source_passphrase_id: Optional[str]) -> Optional[PassphraseMapping]:
+        return self._by_source.get(source_passphrase_id) if source_passphrase_id else None
+
+    def source_pool_by_vlan(self) -> Dict[int, str]:
+        """VLAN -> source pool of the first synced mapping on that VLAN."""
+        pools: Dict[int, str] = {}
+        for m in self.mappings:
+            if m.sync_status == "synced" and m.vlan_id is not None:
+                pools.setdefault(m.vlan_id, m.source_pool_id)
+        return pools
+
+
+def bulk_set_status(
+    db: Session,
+    mapping_ids: List[int],
+    sync_status: str,
+    flagged_at: Optional[datetime] = None
+) -> int:
+    """
+    Set sync_status (and flagged_at) on many mappings with bulk UPDATEs.
+
+    Loaded mappings in the session are updated in place; nothing is
+    committed.
+
+    Returns:
+        Number of mappings updated
+    """
+    values = {"sync_status": sync_status}
+    if flagged_at is not None:
+        values["flagged_at"] = flagged_at
+
+    for start in range(0, len(mapping_ids), BULK_UPDATE_CHUNK):
+        db.execute(
+            update(PassphraseMapping)
+            .where(PassphraseMapping.id.in_(mapping_ids[start:start + BULK_UPDATE_CHUNK]))
+            .values(**values)
+            .execution_options(synchronize_session="evaluate")
+        )
+    return len(mapping_ids)
@@ -0,0 +1,287 @@
+"""
+DPSK Pool Reader.
+
+Reads every passphrase in DPSK pools for the orchestrator sync paths.
+
+Pool reads used to be a single query_passphrases(page=1, limit=1000) per
+pool (silently truncating larger pools) or a serial page walk, one pool
+after another. The reader:
+
+- paginates each pool to completion, with the pages after the first
+  fetched concurrently (r1api.pagination.iter_pages)
+- reads many pools at once, bounded by POOL_READ_CONCURRENCY, while still
+  handing them to the caller in the order requested
+- streams rows, so a caller building its own index (e.g. the site-wide
+  diff map) never needs a second full list of the pool
+- routes every page request through the caller's rate limiter (e.g.
+  SyncEngine._rate_limited)
+- raises PoolReadError instead of returning a partial pool, so a failed
+  read can never look like deleted passphrases
+- looks up specific passphrase IDs (webhook syncs) with whichever of
+  concurrent per-ID GETs or one pool pull filtered locally needs fewer R1
+  calls (the passphrase query has no ID filter), reporting IDs that are
+  no longer in the pool
+
+Usage:
+    reader = PoolReader(r1_client, tenant_id, rate_limited=engine._rate_limited)
+    async for pp in reader.iter_pool(site_wide_pool_id):
+        ...
+    async for pool_id, passphrases, error in reader.iter_pools(source_pool_ids):
+        ...
+    lookup = await reader.fetch_by_ids(pool_id, passphrase_ids, pool_size_hint=count)
+"""
+import asyncio
+import logging
+import math
+import os
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from r1api.client import R1Client
+from r1api.pagination import iter_pages
+
+logger = logging.getLogger(__name__)
+
+POOL_PAGE_SIZE = 500          # R1 clamps larger pageSize values
+POOL_PAGE_CONCURRENCY = 4     # pages in flight per pool after the first
+POOL_READ_CONCURRENCY = int(os.getenv("ORCHESTRATOR_POOL_READ_CONCURRENCY", "8"))
+PASSPHRASE_GET_CONCURRENCY = int(os.getenv("ORCHESTRATOR_PASSPHRASE_GET_CONCURRENCY", "10"))
+
+RateLimiter = Callable[[Awaitable[Any]], Awaitable[Any]]
+
+
+class PoolReadError(Exception):
+    """A pool could not be read completely."""
+
+    def __init__(self, pool_id: str, cause: Exception):
+        self.pool_id = pool_id
+        self.cause = cause
+        super().__init__(f"Failed to read passphrases from pool {pool_id}: {cause}")
+
+
+@dataclass
+class PassphraseLookup:
+    """Result of PoolReader.fetch_by_ids."""
+    strategy: str                                   # "get" (per ID) or "pull" (whole pool)
+    passphrases: List[Dict[str, Any]] = field(default_factory=list)  # in requested order
+    missing: List[str] = field(default_factory=list)  # not in the pool (e.g. deleted since)
+    errors: List[str] = field(default_factory=list)   # IDs that could not be fetched
+
+
+def lookup_cost(id_count: int, pool_size: int, page_size: int = POOL_PAGE_SIZE) -> Tuple[int, int]:
+    """
+    R1 calls needed to look up id_count passphrases in a pool of pool_size.
+
+    Returns:
+        (per-ID GET calls, pool pull calls)
+    """
+    return id_count, max(1, math.ceil(max(pool_size, 0) / page_size))
+
+
+def _is_not_found(error: Exception) -> bool:
+    # R1Client.safe_json raises "R1 API error (404): ..."
+    return "(404)" in str(error)
+
+
+class PoolReader:
+    """Complete, concurrent passphrase reads for DPSK pools."""
+
+    def __init__(
+        self,
+        r1_client: R1Client,
+        tenant_id: Optional[str],
+        rate_limited: Optional[RateLimiter] = None,
+        page_size: int = POOL_PAGE_SIZE,
+        page_concurrency: int = POOL_PAGE_CONCURRENCY,
+    ):
+        self.r1_client = r1_client
+        self.tenant_id = tenant_id
+        self.rate_limited = rate_limited
+        self.page_size = page_size
+        self.page_concurrency = page_concurrency
+
+    def _page_fetcher(self, pool_id: str):
+        async def fetch_page(page: int, page_size: int) -> Dict[str, Any]:
+            request = self.r1_client.dpsk.query_passphrases(
+                pool_id=pool_id,
+                tenant_id=self.tenant_id,
+                page=page,
+                limit=page_size
+            )
+            if self.rate_limited:
+                return await self.rate_limited(request)
+            return await request
+        return fetch_page
+
+    async def iter_pool(self, pool_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield every passphrase in a pool, page by page as pages arrive.
+
+        Raises:
+            PoolReadError: if any page fails (rows already yielded are
+                           then incomplete and must not be treated as the pool)
+        """
+        count = 0
+        total = 0
+        try:
+            async for _, rows, total in iter_pages(
+                self._page_fetcher(pool_id),
+                first_page=1,
+                page_size=self.page_size,
+                max_concurrency=self.page_concurrency,
+            ):
+                for row in rows:
+                    count += 1
+                    yield row
+        except Exception as e:
+            raise PoolReadError(pool_id, e) from e
+
+        if count < total:
+            # Rows deleted mid-read; what we saw is still a consistent snapshot
+            logger.debug(f"Pool {pool_id}: read {count} of {total} reported passphrases")
+
+    async def read_pool(self, pool_id: str) -> List[Dict[str, Any]]:
+        """Every passphrase in a pool (raises PoolReadError)."""
+        return [pp async for pp in self.iter_pool(pool_id)]
+
+    async def iter_pools(
+        self,
+        pool_ids: List[str],
+        max_concurrency: int = POOL_READ_CONCURRENCY,
+    ) -> AsyncIterator[Tuple[str, List[Dict[str, Any]], Optional[PoolReadError]]]:
+        """
+        Read many pools concurrently, yielding (pool_id, passphrases, error)
+        in pool_ids order.
+
+        At most max_concurrency pools are read (or waiting to be consumed)
+        at once. A failed pool yields ([], PoolReadError) and the rest
+        continue.
+        """
+        async def read(pool_id: str):
+            try:
+                return await self.read_pool(pool_id), None
+            except PoolReadError as e:
+                return [], e
+
+        in_flight: Dict[int, asyncio.Task] = {}
+        next_index = 0
+
+        def schedule():
+            nonlocal next_index
+            while next_index < len(pool_ids) and len(in_flight) < max(1, max_concurrency):
+                in_flight[next_index] = asyncio.create_task(read(pool_ids[next_index]))
+                next_index += 1
+
+        try:
+            schedule()
+            for index, pool_id in enumerate(pool_ids):
+                passphrases, error = await in_flight.pop(index)
+                schedule()
+                yield pool_id, passphrases, error
+        finally:
+            for task in in_flight.values():
+                task.cancel()
+
+    async def fetch_by_ids(
+        self,
+        pool_id: str,
+        passphrase_ids: List[str],
+        pool_size_hint: Optional[int] = None,
+        max_concurrency: int = PASSPHRASE_GET_CONCURRENCY,
+    ) -> PassphraseLookup:
+        """
+        Fetch specific passphrases from a pool.
+
+        Uses concurrent per-ID GETs or a pool pull filtered locally,
+        whichever lookup_cost says needs fewer R1 calls. The pool size is
+        pool_size_hint plus the looked-up IDs (a create activity grows the
+        pool after its last recorded size). Without a hint it is read from
+        a one-row query, when more than two IDs make a pull worth pricing.
+        A failed pull falls back to GETs.
+
+        Args:
+            pool_id: DPSK pool ID
+            passphrase_ids: IDs to fetch (duplicates ignored)
+            pool_size_hint: Last known pool size (e.g. OrchestratorSourcePool.passphrase_count);
+                            None or 0 means unknown
+            max_concurrency: GETs in flight at once
+
+        Returns:
+            PassphraseLookup with the found passphrases, missing IDs, and errors
+        """
+        wanted = list(dict.fromkeys(pp_id for pp_id in passphrase_ids if pp_id))
+
+        pool_size = None
+        if pool_size_hint:
+            pool_size = pool_size_hint + len(wanted)
+        elif len(wanted) > 2:
+            # A probe plus one page already costs two calls
+            pool_size = await self._probe_size(pool_id)
+
+        get_calls, pull_calls = lookup_cost(len(wanted), pool_size or 0, self.page_size)
+        if pool_size is not None and pull_calls < get_calls:
+            logger.debug(
+                f"Pool {pool_id}: pulling pool for {len(wanted)} passphrase IDs "
+                f"(~{pull_calls} calls vs {get_calls} GETs)"
+            )
+            try:
+                return await self._pull_by_ids(pool_id, wanted)
+            except PoolReadError as e:
+                logger.warning(f"{e} - falling back to per-ID lookups")
+
+        return await self._get_by_ids(pool_id, wanted, max_concurrency)
+
+    async def _probe_size(self, pool_id: str) -> Optional[int]:
+        """Pool size from a one-row query (None if it fails)."""
+        try:
+            response = await self._page_fetcher(pool_id)(1, 1)
+            return int(response.get('totalCount') or 0)
+        except Exception as e:
+            logger.debug(f"Pool {pool_id}: size probe failed, using per-ID lookups: {e}")
+            return None
+
+    async def _pull_by_ids(self, pool_id: str, wanted: List[str]) -> PassphraseLookup:
+        found: Dict[str, Dict[str, Any]] = {}
+        remaining = set(wanted)
+        async with aclosing(self.iter_pool(pool_id)) as passphrases:
+            async for pp in passphrases:
+                pp_id = pp.get('id')
+                if pp_id in remaining:
+                    found[pp_id] = pp
+                    remaining.discard(pp_id)
+                    if not remaining:
+                        break
+        return PassphraseLookup(
+            strategy="pull",
+            passphrases=[found[pp_id] for pp_id in wanted if pp_id in found],
+            missing=[pp_id for pp_id in wanted if pp_id not in found],
+        )
+
+    async def _get_by_ids(self, pool_id: str, wanted: List[str], max_concurrency: int) -> PassphraseLookup:
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def get(pp_id: str):
+            async with semaphore:
+                request = self.r1_client.dpsk.get_passphrase(
+                    pool_id=pool_id,
+                    passphrase_id=pp_id,
+                    tenant_id=self.tenant_id
+                )
+                return await (self.rate_limited(request) if self.rate_limited else request)
+
+        responses = await asyncio.gather(*(get(pp_id) for pp_id in wanted), return_exceptions=True)
+
+        lookup = PassphraseLookup(strategy="get")
+        for pp_id, response in zip(wanted, responses):
+            if isinstance(response, Exception):
+                if _is_not_found(response):
+                    lookup.missing.append(pp_id)
+                else:
+                    logger.warning(f"Failed to fetch passphrase {pp_id}: {response}")
+                    lookup.errors.append(f"Failed to fetch passphrase {pp_id}: {response}")
+            elif response:
+                lookup.passphrases.append(response)
+            else:
+                lookup.missing.append(pp_id)
+        return lookup
@@ -11,6 +11,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from database import SessionLocal
@@ -23,6 +24,9 @@ from models.orchestrator import (
 )
 from clients.r1_client import create_r1_client_from_controller
 from r1api.client import R1Client
+from routers.orchestrator.mapping_index import MappingIndex, bulk_set_status
+from routers.orchestrator.pool_reader import PoolReader
+from routers.orchestrator.sync_executor import SyncExecutor
 from routers.orchestrator.sync_pool import (
     sync_single_pool,
     add_passphrase_to_sitewide,
@@ -82,6 +86,7 @@ class SyncEngine:
         self.orchestrator: Optional[DPSKOrchestrator] = None
         self.r1_client: Optional[R1Client] = None
         self._rate_limiter = asyncio.Semaphore(120)  # Max concurrent requests
+        self.pool_reader: Optional[PoolReader] = None
 
     async def __aenter__(self):
         await self.initialize()
@@ -104,6 +109,13 @@ class SyncEngine:
             self.db
         )
 
+        # Complete, concurrent pool reads through this engine's rate limiter
+        self.pool_reader = PoolReader(
+            self.r1_client,
+            self.orchestrator.tenant_id,
+            rate_limited=self._rate_limited
+        )
+
     async def _rate_limited(self, coro):
         """Execute a coroutine with rate limiting."""
         async with self._rate_limiter:
@@ -124,7 +136,7 @@ class SyncEngine:
         sync_event = self._create_sync_event(event_type)
 
         try:
-            # ========== PHASE 1: Gather Data ==========
+            # ========== PHASE 1: Gather Data & Build Maps ==========
             logger.info(f"=== Starting sync for orchestrator '{self.orchestrator.name}' ===")
 
             # 1. Validate pool compatibility (passphrase length, etc.)
@@ -132,103 +144,118 @@ class SyncEngine:
             if compatibility_warnings:
                 result.warnings.extend(compatibility_warnings)
 
-            # 2. Fetch all passphrases from site-wide pool FIRST (baseline)
-            site_wide_passphrases = await self._fetch_site_wide_passphrases()
-            result.site_wide_initial_count = len(site_wide_passphrases)
+            # 2. Read the site-wide pool FIRST (baseline), streamed straight into
+            #    the diff map so large pools are never held twice. A failed read
+            #    aborts the sync - an incomplete baseline would re-add everything.
+            # Key: (passphrase, vlan_id) - the actual passphrase + VLAN is the unique identifier
+            # Note: userName is NOT unique, but the passphrase string itself is
+            site_wide_map = {}
+            site_wide_ids = set()
+            async for pp in self.pool_reader.iter_pool(self.orchestrator.site_wide_pool_id):
+                result.site_wide_initial_count += 1
+                if pp.get('id'):
+                    site_wide_ids.add(pp.get('id'))
+                if pp.get('passphrase'):
+                    site_wide_map[(pp.get('passphrase'), self._normalize_vlan(pp.get('vlanId')))] = pp
+
+            # 3. Read all source pools concurrently (in pool order) and build the
+            #    source map, detecting duplicates: same passphrase+VLAN in multiple
+            #    source pools
+            source_pools = list(self.orchestrator.source_pools)
+            result.source_pool_count = len(source_pools)
+            pool_names = {sp.pool_id: sp.pool_name for sp in source_pools}
+            pools_by_id = {sp.pool_id: sp for sp in source_pools}
+            pool_counts = {}
+            failed_pool_ids = set()
+            source_map = {}
+            duplicate_keys = set()
+
+            async for pool_id, passphrases, error in self.pool_reader.iter_pools(
+                [sp.pool_id for sp in source_pools]
+            ):
+                if error:
+                    # Skip the pool rather than treating its passphrases as deleted
+                    failed_pool_ids.add(pool_id)
+                    result.errors.append(str(error))
+                    logger.error(str(error))
+                    continue
 
-            # 3. Fetch all passphrases from all source pools
-            source_passphrases = await self._fetch_all_source_passphrases()
-            result.source_pool_count = len(self.orchestrator.source_pools)
-            result.source_passphrase_count = len(source_passphrases)
+                pool_name = pool_names.get(pool_id)
+                pool_counts[pool_name or 'Unknown'] = pool_counts.get(pool_name or 'Unknown', 0) + len(passphrases)
+                result.source_passphrase_count += len(passphrases)
+                # Pool size sizes webhook ID lookups (PoolReader.fetch_by_ids)
+                pools_by_id[pool_id].passphrase_count = len(passphrases)
+
+                for pp in passphrases:
+                    # Tag each passphrase with its source pool
+                    pp['_source_pool_id'] = pool_id
+                    pp['_source_pool_name'] = pool_name
+
+                    passphrase_str = pp.get('passphrase', '')
+                    if not passphrase_str:
+                        continue
+
+                    key = (passphrase_str, self._normalize_vlan(pp.get('vlanId')))
+                    if key in source_map:
+                        # Duplicate found!
+                        existing_pool = source_map[key].get('_source_pool_name', 'Unknown')
+
+                        if key not in duplicate_keys:
+                            # First time seeing this duplicate
+                            duplicate_keys.add(key)
+                            result.duplicates += 1
+                            warning = (
+                                f"Duplicate passphrase found: '{passphrase_str[:8]}...' (VLAN {key[1]}) "
+                                f"exists in both '{existing_pool}' and '{pool_name or 'Unknown'}'. "
+                                f"Only the first occurrence will be synced."
+                            )
+                            result.warnings.append(warning)
+                            logger.warning(warning)
+                    else:
+                        source_map[key] = pp
 
             # ========== PHASE 2: Verify Existing Mappings ==========
             # Check that existing mappings still have valid targets in site-wide pool
             # This catches cases where passphrases were deleted externally
-            site_wide_ids = {pp.get('id') for pp in site_wide_passphrases if pp.get('id')}
+            # All of the orchestrator's mappings are loaded once and indexed for the diff
+            mappings = MappingIndex.load(self.db, self.orchestrator_id)
 
-            existing_mappings = self.db.query(PassphraseMapping).filter(
-                PassphraseMapping.orchestrator_id == self.orchestrator_id,
-                PassphraseMapping.target_passphrase_id.isnot(None),
-                PassphraseMapping.sync_status.in_(["synced", "flagged_removal"])
-            ).all()
-
-            stale_mappings = []
-            for mapping in existing_mappings:
-                if mapping.target_passphrase_id not in site_wide_ids:
-                    stale_mappings.append(mapping)
+            stale_mappings = [
+                mapping for mapping in mappings.mappings
+                if mapping.target_passphrase_id
+                and mapping.sync_status in ("synced", "flagged_removal")
+                and mapping.target_passphrase_id not in site_wide_ids
+            ]
 
             if stale_mappings:
                 logger.info(f"--- Cleaning up {len(stale_mappings)} stale mapping(s) ---")
                 for mapping in stale_mappings:
-                    old_status = mapping.sync_status
-                    mapping.sync_status = "target_missing"
-                    mapping.flagged_at = datetime.utcnow()
-                    result.stale_cleaned += 1
                     logger.warning(
                         f"Marked mapping as target_missing: {mapping.source_username} "
-                        f"(was {old_status}, target {mapping.target_passphrase_id} no longer exists)"
+                        f"(was {mapping.sync_status}, target {mapping.target_passphrase_id} no longer exists)"
                     )
-                self.db.commit()
+                # Committed with the sync's next write - a commit here would expire
+                # every loaded mapping and reload them one by one in the diff
+                result.stale_cleaned = bulk_set_status(
+                    self.db, [m.id for m in stale_mappings], "target_missing", flagged_at=datetime.utcnow()
+                )
 
             # ========== PHASE 3: Summary Logging ==========
-            # Build per-pool breakdown
-            pool_counts = {}
-            for pp in source_passphrases:
-                pool_name = pp.get('_source_pool_name', 'Unknown')
-                pool_counts[pool_name] = pool_counts.get(pool_name, 0) + 1
-
             logger.info(f"--- Initial State ---")
             logger.info(f"  Site-wide pool: {result.site_wide_initial_count} passphrases")
             logger.info(f"  Source pools: {result.source_pool_count} pools, {result.source_passphrase_count} total passphrases")
             for pool_name, count in sorted(pool_counts.items()):
                 logger.info(f"    - {pool_name}: {count} passphrases")
+            if failed_pool_ids:
+                logger.warning(f"  Source pools not read: {len(failed_pool_ids)} (skipped for flagging)")
             if result.stale_cleaned > 0:
                 logger.info(f"  Stale mappings cleaned: {result.stale_cleaned}")
 
-            # ========== PHASE 4: Build Maps & Detect Duplicates ==========
-            # Key: (passphrase, vlan_id) - the actual passphrase + VLAN is the unique identifier
-            # Note: userName is NOT unique, but the passphrase string itself is
-
-            # Detect duplicates: same passphrase+VLAN in multiple source pools
-            source_map = {}
-            duplicate_keys = set()
-            for pp in source_passphrases:
-                passphrase_str = pp.get('passphrase', '')
-                if not passphrase_str:
-                    continue
-
-                key = (passphrase_str, self._normalize_vlan(pp.get('vlanId')))
-                if key in source_map:
-                    # Duplicate found!
-                    existing_pp = source_map[key]
-                    existing_pool = existing_pp.get('_source_pool_name', 'Unknown')
-                    new_pool = pp.get('_source_pool_name', 'Unknown')
-
-                    if key not in duplicate_keys:
-                        # First time seeing this duplicate
-                        duplicate_keys.add(key)
-                        result.duplicates += 1
-                        warning = (
-                            f"Duplicate passphrase found: '{passphrase_str[:8]}...' (VLAN {key[1]}) "
-                            f"exists in both '{existing_pool}' and '{new_pool}'. "
-                            f"Only the first occurrence will be synced."
-                        )
-                        result.warnings.append(warning)
-                        logger.warning(warning)
-                else:
-                    source_map[key] = pp
-
-            site_wide_map = {
-                (p.get('passphrase', ''), self._normalize_vlan(p.get('vlanId'))): p
-                for p in site_wide_passphrases
-                if p.get('passphrase')
-            }
-
             # Log duplicate summary if any
             if result.duplicates > 0:
                 logger.warning(f"--- Duplicates: {result.duplicates} passphrase(s) exist in multiple source pools ---")
 
-            # ========== PHASE 5: Calculate Diff ==========
+            # ========== PHASE 4: Calculate Diff ==========
             to_add = []
             to_update = []
             to_flag = []
@@ -248,12 +275,14 @@ class SyncEngine:
                         already_synced += 1
 
             # Find passphrases to FLAG or mark as ORPHAN
+            # (a source pool that could not be read says nothing about removals)
             for key, site_pp in site_wide_map.items():
                 if key not in source_map:
-                    mapping = self._get_mapping_by_target(site_pp.get('id'))
+                    mapping = mappings.by_target(site_pp.get('id'))
                     if mapping:
-                        to_flag.append((site_pp, mapping))
-                    else:
+                        if mapping.source_pool_id not in failed_pool_ids:
+                            to_flag.append((site_pp, mapping))
+                    elif not failed_pool_ids:
                         to_orphan.append(site_pp)
 
             result.skipped = already_synced
@@ -267,30 +296,49 @@ class SyncEngine:
             if result.warnings:
                 logger.info(f"  Warnings: {len(result.warnings)}")
 
-            # ========== PHASE 6: Execute Sync ==========
+            # ========== PHASE 5: Execute Sync ==========
             logger.info(f"--- Executing Sync ---")
 
-            # ADD new passphrases
-            for source_pp in to_add:
-                if await self._sync_passphrase_add(source_pp, result.errors):
-                    result.added += 1
+            # ADD new passphrases and UPDATE existing ones - batched, concurrent,
+            # with progress written to the sync event as mappings are committed
+            executor = SyncExecutor(
+                self.db,
+                self.r1_client,
+                self.orchestrator,
+                mappings,
+                sync_event=sync_event,
+                rate_limited=self._rate_limited
+            )
+            await executor.apply_adds(to_add, site_wide_map, result)
+            await executor.apply_updates(to_update, result)
 
-            # UPDATE existing passphrases
-            for source_pp, site_pp in to_update:
-                if await self._sync_passphrase_update(source_pp, site_pp):
-                    result.updated += 1
+            # The executor's commits expired the loaded mappings - refresh them
+            # all with one query rather than one per access below
+            if to_add or to_update:
+                mappings = MappingIndex.load(self.db, self.orchestrator_id)
 
-            # FLAG removed passphrases
+            # FLAG removed passphrases (don't auto-delete) - one bulk UPDATE,
+            # committed with the orphans and the sync event below
             for site_pp, mapping in to_flag:
-                await self._flag_passphrase_removal(mapping)
-                result.flagged += 1
+                logger.warning(
+                    f"Flagged passphrase {mapping.source_username} for removal "
+                    f"(source: {mapping.source_passphrase_id}, target: {mapping.target_passphrase_id})"
+                )
+            result.flagged = bulk_set_status(
+                self.db, [mapping.id for _, mapping in to_flag], "flagged_removal", flagged_at=datetime.utcnow()
+            )
 
-            # Mark orphans
+            # Mark orphans (one multi-row INSERT)
+            vlan_pools = mappings.source_pool_by_vlan()
+            orphan_rows = []
             for site_pp in to_orphan:
-                await self._flag_orphan(site_pp)
-                result.orphans += 1
+                orphan_rows.append(self._orphan_mapping(site_pp, vlan_pools))
+                logger.warning(f"Found orphan passphrase: {self._get_username(site_pp)} (VLAN: {site_pp.get('vlanId')})")
+            if orphan_rows:
+                self.db.execute(insert(PassphraseMapping), orphan_rows)
+            result.orphans = len(orphan_rows)
 
-            # ========== PHASE 7: Finalize ==========
+            # ========== PHASE 6: Finalize ==========
             sync_event.status = "success" if not result.errors else "partial"
             sync_event.added_count = result.added
             sync_event.updated_count = result.updated
@@ -465,40 +513,6 @@ class SyncEngine:
         self.db.refresh(self.orchestrator)
         return event
 
-    async def _fetch_all_source_passphrases(self) -> List[Dict[str, Any]]:
-        """Fetch passphrases from all source pools."""
-        all_passphrases = []
-
-        for source_pool in self.orchestrator.source_pools:
-            passphrases = await self._fetch_pool_passphrases(source_pool.pool_id)
-            # Tag each passphrase with its source pool
-            for pp in passphrases:
-                pp['_source_pool_id'] = source_pool.pool_id
-                pp['_source_pool_name'] = source_pool.pool_name
-            all_passphrases.extend(passphrases)
-
-        return all_passphrases
-
-    async def _fetch_pool_passphrases(self, pool_id: str) -> List[Dict[str, Any]]:
-        """Fetch all passphrases from a single pool."""
-        try:
-            result = await self._rate_limited(
-                self.r1_client.dpsk.query_passphrases(
-                    pool_id=pool_id,
-                    tenant_id=self.orchestrator.tenant_id,
-                    page=1,
-                    limit=1000
-                )
-            )
-            return result.get('data', [])
-        except Exception as e:
-            logger.error(f"Failed to fetch passphrases from pool {pool_id}: {e}")
-            return []
-
-    async def _fetch_site_wide_passphrases(self) -> List[Dict[str, Any]]:
-        """Fetch all passphrases from site-wide pool."""
-        return await self._fetch_pool_passphrases(self.orchestrator.site_wide_pool_id)
-
     def _normalize_vlan(self, vlan_id) -> Optional[int]:
         """Normalize VLAN ID. Delegates to unified function."""
         return normalize_vlan(vlan_id)
@@ -613,54 +627,24 @@ class SyncEngine:
             target_passphrase_id=target_passphrase_id
         ).first()
 
-    async def _flag_passphrase_removal(self, mapping: PassphraseMapping):
-        """Flag a passphrase for removal (don't auto-delete)."""
-        mapping.sync_status = "flagged_removal"
-        mapping.flagged_at = datetime.utcnow()
-        self.db.commit()
-
-        logger.warning(
-            f"Flagged passphrase {mapping.source_username} for removal "
-            f"(source: {mapping.source_passphrase_id}, target: {mapping.target_passphrase_id})"
-        )
-
-    async def _flag_orphan(self, site_pp: Dict):
-        """Flag an orphan passphrase (exists in site-wide but not synced by us)."""
-        # Try to suggest a source pool based on VLAN
-        suggested_pool_id = self._suggest_source_pool(site_pp)
+    def _orphan_mapping(self, site_pp: Dict, vlan_pools: Dict[int, str]) -> Dict[str, Any]:
+        """
+        Mapping row for an orphan passphrase (exists in site-wide but not synced by us).
 
-        mapping = PassphraseMapping(
+        Suggests a source pool where we've synced passphrases with the same VLAN
+        (vlan_pools from MappingIndex.source_pool_by_vlan).
+        """
+        vlan_id = self._normalize_vlan(site_pp.get('vlanId'))
+        return dict(
             orchestrator_id=self.orchestrator_id,
             source_pool_id="",
             target_passphrase_id=site_pp.get('id'),
             source_username=self._get_username(site_pp),
             sync_status="orphan",
-            suggested_source_pool_id=suggested_pool_id,
-            vlan_id=self._normalize_vlan(site_pp.get('vlanId')),
+            suggested_source_pool_id=vlan_pools.get(vlan_id) if vlan_id is not None else None,
+            vlan_id=vlan_id,
             passphrase_preview=site_pp.get('passphrase', '')[:4] + '****' if site_pp.get('passphrase') else None
         )
-        self.db.add(mapping)
-        self.db.commit()
-
-        logger.warning(f"Found orphan passphrase: {self._get_username(site_pp)} (VLAN: {site_pp.get('vlanId')})")
-
-    def _suggest_source_pool(self, orphan_pp: Dict) -> Optional[str]:
-        """Guess which source pool an orphan might belong to based on VLAN."""
-        vlan_id = orphan_pp.get('vlanId')
-        if not vlan_id:
-            return None
-
-        # Look for a source pool where we've synced passphrases with the same VLAN
-        mapping = self.db.query(PassphraseMapping).filter_by(
-            orchestrator_id=self.orchestrator_id,
-            vlan_id=vlan_id,
-            sync_status="synced"
-        ).first()
-
-        if mapping:
-            return mapping.source_pool_id
-
-        return None
 
     def _matches_patterns(self, name: str, patterns: List[str]) -> bool:
         """Check if a name matches any of the glob patterns."""
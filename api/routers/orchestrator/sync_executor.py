@@ -0,0 +1,229 @@
+"""
+DPSK Orchestrator Sync Executor.
+
+Applies the adds and updates planned by SyncEngine.full_sync.
+
+Full sync used to apply its plan one passphrase at a time: an R1 create,
+its activity wait and a DB commit per add, so the first sync of a large
+property (20k+ unit passphrases) took hours. The executor:
+
+- creates adds with bounded concurrent single creates through the
+  engine's rate limiter; their activity waits share the client's
+  coalesced activity poller
+- runs updates concurrently the same way; mappings are looked up in the
+  sync's MappingIndex rather than queried
+- writes PassphraseMapping rows in batches, one commit per batch, and
+  updates the sync event's added/updated counts at each batch so a
+  running sync reports its progress
+
+Bulk creation through R1's CSV import (/passphrases/csvFiles) is deferred:
+its column template is not documented in the R1 specs we have, so adds are
+not sent through it until that is verified.
+
+Usage:
+    executor = SyncExecutor(db, r1_client, orchestrator, mappings, sync_event, rate_limited=engine._rate_limited)
+    await executor.apply_adds(to_add, site_wide_map, result)
+    await executor.apply_updates(to_update, result)
+"""
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from models.orchestrator import (
+    DPSKOrchestrator,
+    OrchestratorSourcePool,
+    OrchestratorSyncEvent,
+    PassphraseMapping
+)
+from r1api.client import R1Client
+from routers.orchestrator.mapping_index import MappingIndex
+from routers.orchestrator.sync_pool import (
+    build_mapping,
+    create_sitewide_passphrase,
+    get_username,
+    normalize_vlan
+)
+
+logger = logging.getLogger(__name__)
+
+SYNC_WRITE_CONCURRENCY = int(os.getenv("ORCHESTRATOR_SYNC_WRITE_CONCURRENCY", "20"))
+MAPPING_BATCH_SIZE = 200      # mappings per DB commit / progress update
+
+RateLimiter = Callable[[Awaitable[Any]], Awaitable[Any]]
+SitewideKey = Tuple[str, Optional[int]]
+
+
+class SyncExecutor:
+    """Batched, concurrent execution of a full sync's adds and updates."""
+
+    def __init__(
+        self,
+        db: Session,
+        r1_client: R1Client,
+        orchestrator: DPSKOrchestrator,
+        mappings: MappingIndex,
+        sync_event: Optional[OrchestratorSyncEvent] = None,
+        rate_limited: Optional[RateLimiter] = None,
+        concurrency: int = SYNC_WRITE_CONCURRENCY,
+    ):
+        self.db = db
+        self.r1_client = r1_client
+        self.orchestrator = orchestrator
+        self.mappings = mappings
+        self.sync_event = sync_event
+        self.rate_limited = rate_limited
+        self.concurrency = max(1, concurrency)
+        self._pending_mappings: List[PassphraseMapping] = []
+        self._source_pools = {sp.pool_id: sp for sp in orchestrator.source_pools}
+
+    # ========== Adds ==========
+
+    async def apply_adds(
+        self,
+        to_add: List[Dict[str, Any]],
+        site_wide_map: Dict[SitewideKey, Dict[str, Any]],
+        result
+    ) -> None:
+        """
+        Add source passphrases to the site-wide pool and record their mappings.
+
+        Args:
+            to_add: Source passphrases (tagged with _source_pool_id/_source_pool_name)
+            site_wide_map: The sync's (passphrase, VLAN) index of the site-wide
+                           pool; kept up to date with the passphrases added
+            result: SyncResult - added and errors are updated
+        """
+        if not to_add:
+            return
+
+        pending = []
+        for source_pp in to_add:
+            # Same guard as add_passphrase_to_sitewide
+            existing_mapping = self.mappings.by_source(source_pp.get('id'))
+            if existing_mapping and existing_mapping.sync_status == "synced":
+                logger.debug(f"Passphrase {get_username(source_pp)} already mapped, skipping")
+            elif source_pp.get('passphrase'):
+                pending.append(source_pp)
+
+        if pending:
+            logger.info(f"Creating {len(pending)} passphrase(s) individually (concurrency={self.concurrency})")
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def add_one(source_pp: Dict[str, Any]) -> None:
+                source_pool = self._source_pool(source_pp)
+                async with semaphore:
+                    try:
+                        target = await self._limited(create_sitewide_passphrase(
+                            self.r1_client, self.orchestrator, source_pool, source_pp
+                        ))
+                    except Exception as e:
+                        error_msg = f"Failed to add {get_username(source_pp)} to site-wide: {e}"
+                        logger.error(error_msg)
+                        result.errors.append(error_msg)
+                        return
+                site_wide_map[self._key(source_pp)] = target
+                self._record_add(source_pool, source_pp, target, result)
+
+            await asyncio.gather(*(add_one(pp) for pp in pending))
+
+        self._flush(result)
+
+    # ========== Updates ==========
+
+    async def apply_updates(
+        self,
+        to_update: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        result
+    ) -> None:
+        """
+        Update site-wide passphrases from their sources, concurrently.
+
+        Args:
+            to_update: (source_pp, site_pp) pairs
+            result: SyncResult - updated and errors are updated
+        """
+        if not to_update:
+            return
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        updated: Dict[str, Dict[str, Any]] = {}  # target id -> source_pp
+
+        async def update_one(source_pp: Dict[str, Any], site_pp: Dict[str, Any]) -> None:
+            async with semaphore:
+                try:
+                    await self._limited(self.r1_client.dpsk.update_passphrase(
+                        pool_id=self.orchestrator.site_wide_pool_id,
+                        passphrase_id=site_pp.get('id'),
+                        tenant_id=self.orchestrator.tenant_id,
+                        passphrase=source_pp.get('passphrase'),
+                        vlan_id=source_pp.get('vlanId'),
+                        max_devices=source_pp.get('maxDevices')
+                    ))
+                except Exception as e:
+                    error_msg = f"Failed to update passphrase {get_username(source_pp)}: {e}"
+                    logger.error(error_msg)
+                    result.errors.append(error_msg)
+                    return
+            logger.debug(f"Updated passphrase {get_username(source_pp)} in site-wide pool")
+            updated[site_pp.get('id')] = source_pp
+            result.updated += 1
+
+        await asyncio.gather(*(update_one(source_pp, site_pp) for source_pp, site_pp in to_update))
+
+        # Refresh the mappings of everything updated (flushed as one batched UPDATE)
+        now = datetime.utcnow()
+        for target_id, source_pp in updated.items():
+            mapping = self.mappings.by_target(target_id)
+            if mapping:
+                mapping.last_synced_at = now
+                mapping.vlan_id = normalize_vlan(source_pp.get('vlanId'))
+        self._report_progress(result)
+        self.db.commit()
+
+    # ========== Helpers ==========
+
+    async def _limited(self, coro):
+        if self.rate_limited:
+            return await self.rate_limited(coro)
+        return await coro
+
+    def _key(self, pp: Dict[str, Any]) -> SitewideKey:
+        return (pp.get('passphrase', ''), normalize_vlan(pp.get('vlanId')))
+
+    def _source_pool(self, source_pp: Dict[str, Any]) -> OrchestratorSourcePool:
+        source_pool_id = source_pp.get('_source_pool_id', '')
+        source_pool = self._source_pools.get(source_pool_id)
+        if not source_pool:
+            # Minimal pool object for passphrases with pool info embedded but no ORM row
+            source_pool = OrchestratorSourcePool(
+                orchestrator_id=self.orchestrator.id,
+                pool_id=source_pool_id,
+                pool_name=source_pp.get('_source_pool_name', '')
+            )
+        return source_pool
+
+    def _record_add(self, source_pool, source_pp, target, result) -> None:
+        mapping = build_mapping(self.orchestrator, source_pool, source_pp, target)
+        self._pending_mappings.append(mapping)
+        self.mappings.add(mapping)
+        result.added += 1
+        if len(self._pending_mappings) >= MAPPING_BATCH_SIZE:
+            self._flush(result)
+
+    def _flush(self, result) -> None:
+        """Write pending mappings and progress in one commit."""
+        if self._pending_mappings:
+            self.db.add_all(self._pending_mappings)
+            self._pending_mappings = []
+        self._report_progress(result)
+        self.db.commit()
+        logger.info(f"Sync progress: {result.added} added, {result.updated} updated")
+
+    def _report_progress(self, result) -> None:
+        if self.sync_event is not None:
+            self.sync_event.added_count = result.added
+            self.sync_event.updated_count = result.updated
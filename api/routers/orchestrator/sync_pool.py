@@ -14,7 +14,7 @@ import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -25,9 +25,13 @@ from models.orchestrator import (
     PassphraseMapping
 )
 from r1api.client import R1Client
+from routers.orchestrator.pool_reader import PoolReader
 
 logger = logging.getLogger(__name__)
 
+# (passphrase, normalized VLAN) -> site-wide passphrase
+SitewideIndex = Dict[Tuple[str, Optional[int]], Dict[str, Any]]
+
 
 @dataclass
 class PoolSyncResult:
@@ -39,6 +43,7 @@ class PoolSyncResult:
     flagged: int = 0  # Passphrases deleted from source, flagged for review
     skipped: int = 0  # Already synced, no changes needed
     errors: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)  # Requested IDs no longer in the source pool
     source_count: int = 0  # Total passphrases in source pool
 
 
@@ -102,20 +107,21 @@ async def sync_single_pool(
 
         # 1. Fetch passphrases from source pool
         if specific_passphrase_ids:
-            # Fetch specific passphrases by ID (webhook scenario with known IDs)
-            source_passphrases = []
-            for pp_id in specific_passphrase_ids:
-                try:
-                    pp = await r1_client.dpsk.get_passphrase(
-                        pool_id=source_pool.pool_id,
-                        passphrase_id=pp_id,
-                        tenant_id=orchestrator.tenant_id
-                    )
-                    if pp:
-                        source_passphrases.append(pp)
-                except Exception as e:
-                    logger.warning(f"Failed to fetch passphrase {pp_id}: {e}")
-                    result.errors.append(f"Failed to fetch passphrase {pp_id}: {e}")
+            # Fetch specific passphrases by ID (webhook scenario with known IDs):
+            # concurrent GETs, or one pool pull when that takes fewer calls
+            lookup = await PoolReader(r1_client, orchestrator.tenant_id).fetch_by_ids(
+                source_pool.pool_id,
+                specific_passphrase_ids,
+                pool_size_hint=source_pool.passphrase_count
+            )
+            source_passphrases = lookup.passphrases
+            result.errors.extend(lookup.errors)
+            result.missing = lookup.missing
+            if lookup.missing:
+                logger.info(
+                    f"{len(lookup.missing)} requested passphrases no longer in "
+                    f"{source_pool.pool_name}: {lookup.missing[:10]}"
+                )
         else:
             # Fetch all passphrases from source pool (full scan)
             source_passphrases = await _fetch_pool_passphrases(
@@ -135,6 +141,19 @@ async def sync_single_pool(
         # Track which source passphrases we've seen (for deletion detection)
         seen_source_ids: Set[str] = set()
 
+        # Full scans read the site-wide pool once (on the first add) instead of
+        # searching it for every new passphrase
+        sitewide_index: Optional[SitewideIndex] = None
+
+        async def add(pp: Dict[str, Any]) -> bool:
+            nonlocal sitewide_index
+            if sitewide_index is None and not specific_passphrase_ids:
+                sitewide_index = await _read_sitewide_index(r1_client, orchestrator)
+            return await add_passphrase_to_sitewide(
+                db, r1_client, orchestrator, source_pool, pp, result.errors,
+                sitewide_index=sitewide_index
+            )
+
         # 3. Process each source passphrase
         for pp in source_passphrases:
             pp_id = pp.get('id')
@@ -156,9 +175,7 @@ async def sync_single_pool(
                         result.skipped += 1
                 elif mapping.sync_status == "target_missing":
                     # Target was deleted externally - re-create it
-                    if await add_passphrase_to_sitewide(
-                        db, r1_client, orchestrator, source_pool, pp, result.errors
-                    ):
+                    if await add(pp):
                         result.added += 1
                         # Remove old mapping with target_missing status
                         db.delete(mapping)
@@ -166,9 +183,7 @@ async def sync_single_pool(
                     result.skipped += 1  # Other status (flagged, orphan)
             else:
                 # New passphrase - add to site-wide
-                if await add_passphrase_to_sitewide(
-                    db, r1_client, orchestrator, source_pool, pp, result.errors
-                ):
+                if await add(pp):
                     result.added += 1
 
         # 4. Detect deletions (only if we did a full scan, not specific IDs)
@@ -185,7 +200,9 @@ async def sync_single_pool(
 
         # 5. Update source pool tracking
         source_pool.last_sync_at = datetime.utcnow()
-        source_pool.passphrase_count = result.source_count
+        if not specific_passphrase_ids:
+            # Only a full scan knows the pool size (it also sizes ID lookups)
+            source_pool.passphrase_count = result.source_count
 
         # 6. Update sync event if provided
         if sync_event:
@@ -224,7 +241,8 @@ async def add_passphrase_to_sitewide(
     orchestrator: DPSKOrchestrator,
     source_pool: OrchestratorSourcePool,
     source_pp: Dict[str, Any],
-    errors: List[str]
+    errors: List[str],
+    sitewide_index: Optional[SitewideIndex] = None
 ) -> bool:
     """
     Add a single passphrase from source pool to site-wide pool.
@@ -244,6 +262,9 @@ async def add_passphrase_to_sitewide(
         source_pool: The source pool this passphrase came from
         source_pp: The source passphrase dict from R1 API
         errors: List to append any errors to
+        sitewide_index: Site-wide passphrases keyed by (passphrase, VLAN), if the
+                        caller already read the pool. Kept up to date with the
+                        passphrase added here. If None, the pool is searched.
 
     Returns:
         True if added successfully, False otherwise
@@ -252,7 +273,6 @@ async def add_passphrase_to_sitewide(
     passphrase_str = source_pp.get('passphrase', '')
     original_username = get_username(source_pp)
     vlan_id = normalize_vlan(source_pp.get('vlanId'))
-    pool_name = source_pool.pool_name or source_pool.pool_id[:8]
 
     # Check if we already have a mapping for this source passphrase
     existing_mapping = db.query(PassphraseMapping).filter_by(
@@ -265,102 +285,31 @@ async def add_passphrase_to_sitewide(
         return False
 
     # Check if same passphrase+VLAN already exists in site-wide (manual entry case)
-    existing_in_sitewide = await _find_passphrase_in_pool(
-        r1_client, orchestrator.site_wide_pool_id, orchestrator.tenant_id,
-        passphrase_str, vlan_id
-    )
+    if sitewide_index is not None:
+        existing_in_sitewide = sitewide_index.get((passphrase_str, vlan_id)) if passphrase_str else None
+    else:
+        existing_in_sitewide = await _find_passphrase_in_pool(
+            r1_client, orchestrator.site_wide_pool_id, orchestrator.tenant_id,
+            passphrase_str, vlan_id
+        )
 
     if existing_in_sitewide:
         logger.info(f"Passphrase {original_username} already exists in site-wide, creating mapping only")
-        mapping = PassphraseMapping(
-            orchestrator_id=orchestrator.id,
-            source_pool_id=source_pool.pool_id,
-            source_pool_name=pool_name,
-            source_passphrase_id=source_pp_id,
-            source_username=original_username,
-            source_identity_id=source_pp.get('identityId'),
-            target_passphrase_id=existing_in_sitewide.get('id'),
-            target_identity_id=existing_in_sitewide.get('identityId'),
-            sync_status="synced",
-            vlan_id=vlan_id,
-            passphrase_preview=passphrase_str[:4] + "****" if passphrase_str else None,
-            last_synced_at=datetime.utcnow()
-        )
-        db.add(mapping)
+        db.add(build_mapping(orchestrator, source_pool, source_pp, existing_in_sitewide))
         db.commit()
         return True
 
-    # Build unique username: "OriginalUsername [SourcePool]"
-    if original_username:
-        unique_username = f"{original_username} [{pool_name}]"
-    else:
-        unique_username = f"[{pool_name}]"
-
     try:
-        # 1. Create passphrase in site-wide pool
-        result = await r1_client.dpsk.create_passphrase(
-            pool_id=orchestrator.site_wide_pool_id,
-            tenant_id=orchestrator.tenant_id,
-            user_name=unique_username,
-            user_email=source_pp.get('userEmail') or source_pp.get('email'),
-            passphrase=passphrase_str,
-            vlan_id=source_pp.get('vlanId'),  # Pass original value for API
-            max_devices=source_pp.get('maxDevices') or source_pp.get('numberOfDevices', 5),
-            expiration_date=source_pp.get('expirationDate')
-        )
-
-        if not result or not result.get('id'):
-            error_msg = f"No ID returned for passphrase {unique_username}"
-            logger.error(error_msg)
-            errors.append(error_msg)
-            return False
-
-        target_pp_id = result.get('id')
-        target_identity_id = result.get('identityId')
-
-        # 2. Update the auto-generated identity with proper details
-        if target_identity_id and orchestrator.site_wide_identity_group_id:
-            try:
-                # Build descriptive identity info
-                if original_username:
-                    identity_display_name = f"{original_username} (from {pool_name})"
-                else:
-                    identity_display_name = f"(from {pool_name})"
-                identity_description = f"Synced from {pool_name}"
-
-                await r1_client.identity.update_identity(
-                    group_id=orchestrator.site_wide_identity_group_id,
-                    identity_id=target_identity_id,
-                    tenant_id=orchestrator.tenant_id,
-                    name=unique_username,
-                    display_name=identity_display_name,
-                    description=identity_description,
-                    vlan=vlan_id
-                )
-                logger.debug(f"Updated identity {target_identity_id}: name={unique_username}")
-            except Exception as e:
-                # Non-fatal: passphrase was created, identity update failed
-                logger.warning(f"Failed to update identity {target_identity_id}: {e}")
+        # 1-2. Create passphrase in site-wide pool and fix up its identity
+        target = await create_sitewide_passphrase(r1_client, orchestrator, source_pool, source_pp)
+        if sitewide_index is not None and passphrase_str:
+            sitewide_index[(passphrase_str, vlan_id)] = target
 
         # 3. Create mapping record
-        mapping = PassphraseMapping(
-            orchestrator_id=orchestrator.id,
-            source_pool_id=source_pool.pool_id,
-            source_pool_name=pool_name,
-            source_passphrase_id=source_pp_id,
-            source_username=original_username,  # Store original, not unique
-            source_identity_id=source_pp.get('identityId'),
-            target_passphrase_id=target_pp_id,
-            target_identity_id=target_identity_id,
-            sync_status="synced",
-            vlan_id=vlan_id,
-            passphrase_preview=passphrase_str[:4] + "****" if passphrase_str else None,
-            last_synced_at=datetime.utcnow()
-        )
-        db.add(mapping)
+        db.add(build_mapping(orchestrator, source_pool, source_pp, target))
         db.commit()
 
-        logger.info(f"Added passphrase to site-wide: {unique_username} (VLAN: {vlan_id})")
+        logger.info(f"Added passphrase to site-wide: {sitewide_username(source_pp, source_pool)} (VLAN: {vlan_id})")
         return True
 
     except Exception as e:
@@ -370,40 +319,140 @@ async def add_passphrase_to_sitewide(
         return False
 
 
+def sitewide_username(source_pp: Dict[str, Any], source_pool: OrchestratorSourcePool) -> str:
+    """Unique site-wide username: "OriginalUsername [SourcePool]"."""
+    pool_name = source_pool.pool_name or source_pool.pool_id[:8]
+    original_username = get_username(source_pp)
+    if original_username:
+        return f"{original_username} [{pool_name}]"
+    return f"[{pool_name}]"
+
+
+async def create_sitewide_passphrase(
+    r1_client: R1Client,
+    orchestrator: DPSKOrchestrator,
+    source_pool: OrchestratorSourcePool,
+    source_pp: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Create a source passphrase in the site-wide pool and update its identity.
+
+    No database changes - the caller records the mapping (build_mapping).
+
+    Returns:
+        The created site-wide passphrase (with id and identityId)
+
+    Raises:
+        Exception: if the create fails or returns no ID
+    """
+    unique_username = sitewide_username(source_pp, source_pool)
+
+    result = await r1_client.dpsk.create_passphrase(
+        pool_id=orchestrator.site_wide_pool_id,
+        tenant_id=orchestrator.tenant_id,
+        user_name=unique_username,
+        user_email=source_pp.get('userEmail') or source_pp.get('email'),
+        passphrase=source_pp.get('passphrase', ''),
+        vlan_id=source_pp.get('vlanId'),  # Pass original value for API
+        max_devices=source_pp.get('maxDevices') or source_pp.get('numberOfDevices', 5),
+        expiration_date=source_pp.get('expirationDate')
+    )
+
+    if not result or not result.get('id'):
+        raise ValueError(f"No ID returned for passphrase {unique_username}")
+
+    await update_sitewide_identity(r1_client, orchestrator, source_pool, source_pp, result.get('identityId'))
+    return result
+
+
+async def update_sitewide_identity(
+    r1_client: R1Client,
+    orchestrator: DPSKOrchestrator,
+    source_pool: OrchestratorSourcePool,
+    source_pp: Dict[str, Any],
+    target_identity_id: Optional[str]
+) -> None:
+    """Give the auto-generated site-wide identity the synced name/description (non-fatal)."""
+    if not target_identity_id or not orchestrator.site_wide_identity_group_id:
+        return
+
+    pool_name = source_pool.pool_name or source_pool.pool_id[:8]
+    original_username = get_username(source_pp)
+    unique_username = sitewide_username(source_pp, source_pool)
+
+    try:
+        # Build descriptive identity info
+        if original_username:
+            identity_display_name = f"{original_username} (from {pool_name})"
+        else:
+            identity_display_name = f"(from {pool_name})"
+        identity_description = f"Synced from {pool_name}"
+
+        await r1_client.identity.update_identity(
+            group_id=orchestrator.site_wide_identity_group_id,
+            identity_id=target_identity_id,
+            tenant_id=orchestrator.tenant_id,
+            name=unique_username,
+            display_name=identity_display_name,
+            description=identity_description,
+            vlan=normalize_vlan(source_pp.get('vlanId'))
+        )
+        logger.debug(f"Updated identity {target_identity_id}: name={unique_username}")
+    except Exception as e:
+        # Non-fatal: passphrase was created, identity update failed
+        logger.warning(f"Failed to update identity {target_identity_id}: {e}")
+
+
+def build_mapping(
+    orchestrator: DPSKOrchestrator,
+    source_pool: OrchestratorSourcePool,
+    source_pp: Dict[str, Any],
+    target: Dict[str, Any]
+) -> PassphraseMapping:
+    """Synced mapping record from a source passphrase to its site-wide copy."""
+    passphrase_str = source_pp.get('passphrase', '')
+    return PassphraseMapping(
+        orchestrator_id=orchestrator.id,
+        source_pool_id=source_pool.pool_id,
+        source_pool_name=source_pool.pool_name or source_pool.pool_id[:8],
+        source_passphrase_id=source_pp.get('id'),
+        source_username=get_username(source_pp),  # Store original, not unique
+        source_identity_id=source_pp.get('identityId'),
+        target_passphrase_id=target.get('id'),
+        target_identity_id=target.get('identityId'),
+        sync_status="synced",
+        vlan_id=normalize_vlan(source_pp.get('vlanId')),
+        passphrase_preview=passphrase_str[:4] + "****" if passphrase_str else None,
+        last_synced_at=datetime.utcnow()
+    )
+
+
 async def _fetch_pool_passphrases(
     r1_client: R1Client,
     pool_id: str,
     tenant_id: str
 ) -> List[Dict[str, Any]]:
-    """Fetch all passphrases from a pool with pagination."""
-    all_passphrases = []
-    page = 1
-
-    while True:
-        try:
-            result = await r1_client.dpsk.query_passphrases(
-                pool_id=pool_id,
-                tenant_id=tenant_id,
-                page=page,
-                limit=500
-            )
-            passphrases = result.get('data', [])
-            if not passphrases:
-                break
-
-            all_passphrases.extend(passphrases)
-
-            total_count = result.get('totalCount', len(passphrases))
-            if len(all_passphrases) >= total_count:
-                break
+    """
+    Fetch all passphrases from a pool (every page, fetched concurrently).
 
-            page += 1
+    Raises:
+        PoolReadError: if the pool could not be read completely - a partial
+                       list would make unread passphrases look deleted
+    """
+    return await PoolReader(r1_client, tenant_id).read_pool(pool_id)
 
-        except Exception as e:
-            logger.error(f"Failed to fetch passphrases from pool {pool_id}: {e}")
-            break
 
-    return all_passphrases
+async def _read_sitewide_index(
+    r1_client: R1Client,
+    orchestrator: DPSKOrchestrator
+) -> SitewideIndex:
+    """Read the site-wide pool into a (passphrase, VLAN) lookup."""
+    index: SitewideIndex = {}
+    reader = PoolReader(r1_client, orchestrator.tenant_id)
+    async for pp in reader.iter_pool(orchestrator.site_wide_pool_id):
+        if pp.get('passphrase'):
+            index[(pp.get('passphrase'), normalize_vlan(pp.get('vlanId')))] = pp
+    return index
 
 
 async def _find_passphrase_in_pool(
@@ -416,6 +465,9 @@ async def _find_passphrase_in_pool(
     """
     Find a passphrase in a pool by its passphrase string and VLAN.
 
+    Filters on the passphrase server-side, so this is one query however
+    large the pool is; the VLAN is matched on the (few) rows returned.
+
     Returns:
         Passphrase dict if found, None otherwise
     """
@@ -426,8 +478,9 @@ async def _find_passphrase_in_pool(
         result = await r1_client.dpsk.query_passphrases(
             pool_id=pool_id,
             tenant_id=tenant_id,
+            filters={"passphrase": [passphrase_str]},
             page=1,
-            limit=500
+            limit=100
         )
 
         for pp in result.get('data', []):
@@ -0,0 +1,249 @@
+"""
+DPSK Orchestrator Webhook Coalescer.
+
+Cross-worker de-duplication of R1 activity webhooks, and a per-pool
+debounce queue for the incremental syncs they trigger.
+
+Activity tracking used to live in a process-local set. With several uvicorn
+workers, every duplicate delivery of an activity was tracked (and polled
+with await_task_completion) by each worker that received it, and every
+completed activity ran its own sync_pool_by_id. A bulk persona import fires
+hundreds of webhooks for one pool, and each one started a sync of that pool.
+Now:
+
+- an activity is claimed with SET NX in Redis when its first webhook
+  arrives, and duplicates on any worker are acknowledged without tracking.
+  The claim outlives the activity (ACTIVITY_CLAIM_TTL_SECONDS) so late
+  redeliveries are dropped too. It is released if tracking fails, so a
+  redelivery can retry.
+- a completed activity only queues its pool. Its passphrase IDs go into a
+  Redis set per (orchestrator, pool). If the IDs are unknown (deletes, or
+  activities without IDs), a full-scan flag is set instead.
+- the worker that queues into an idle pool becomes its leader (SET NX).
+  The leader waits DEBOUNCE_SECONDS, drains the queue, and runs one sync
+  with the union of the IDs. Entries queued while it syncs are picked up
+  in a further window, so at most one webhook sync per pool runs at a time.
+- if Redis is unavailable, claims fall back to a process-local set and
+  syncs run immediately (the old behaviour).
+
+Redis keys:
+- orchestrator:webhook:activity:{activity_id}            → claimed activity (TTL ACTIVITY_CLAIM_TTL_SECONDS)
+- orchestrator:webhook:pool:{orch_id}:{pool_id}:ids      → queued passphrase IDs
+- orchestrator:webhook:pool:{orch_id}:{pool_id}:full     → "1" if the next sync must scan the pool
+- orchestrator:webhook:pool:{orch_id}:{pool_id}:leader   → worker draining the queue (TTL LEADER_TTL_SECONDS)
+
+Usage:
+    if not await claim_activity(activity_id):
+        return  # another delivery (on any worker) is tracking it
+    ...
+    await queue_pool_sync(orchestrator_id, pool_id, passphrase_ids, run_sync)
+"""
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from typing import Awaitable, Callable, Iterable, List, Optional, Set, Tuple
+
+from redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+ACTIVITY_CLAIM_TTL_SECONDS = 30 * 60  # Longer than await_task_completion polls an activity
+DEBOUNCE_SECONDS = float(os.getenv("ORCHESTRATOR_WEBHOOK_DEBOUNCE_SECONDS", "10"))
+QUEUE_TTL_SECONDS = 60 * 60  # Queued IDs left by a crashed leader go to the next leader
+LEADER_TTL_SECONDS = 60
+LEADER_RENEW_INTERVAL = 20
+
+KEY_PREFIX = "orchestrator:webhook"
+
+# Identifies this process as a pool leader
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# Runs one incremental sync: (orchestrator_id, pool_id, passphrase_ids or None for a full scan)
+PoolSyncRunner = Callable[[int, str, Optional[List[str]]], Awaitable[None]]
+
+# Fallback when Redis is down: activities claimed by this process only
+_local_activities: Set[str] = set()
+
+# Leader key updates that only apply while this worker still holds the key
+_RENEW_LEADER_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_LEADER_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+# ========== Activity de-duplication ==========
+
+def _activity_key(activity_id: str) -> str:
+    return f"{KEY_PREFIX}:activity:{activity_id}"
+
+
+async def claim_activity(activity_id: str) -> bool:
+    """
+    Claim an activity for tracking.
+
+    Returns:
+        True if this webhook should track the activity, False if it is
+        already claimed (by any worker) or activity_id is empty
+    """
+    if not activity_id:
+        return False
+    try:
+        redis = await get_redis_client()
+        return bool(await redis.set(
+            _activity_key(activity_id), WORKER_ID, nx=True, ex=ACTIVITY_CLAIM_TTL_SECONDS
+        ))
+    except Exception as e:
+        logger.warning(f"Activity claim via Redis failed, de-duplicating locally: {e}")
+        if activity_id in _local_activities:
+            return False
+        _local_activities.add(activity_id)
+        return True
+
+
+async def release_activity(activity_id: str) -> None:
+    """Drop a claim so a redelivery of the activity is tracked again."""
+    if not activity_id:
+        return
+    _local_activities.discard(activity_id)
+    try:
+        redis = await get_redis_client()
+        await redis.delete(_activity_key(activity_id))
+    except Exception as e:
+        logger.debug(f"Failed to release activity claim {activity_id}: {e}")
+
+
+def finish_local_activity(activity_id: str) -> None:
+    """Forget a locally claimed activity (Redis claims expire on their own)."""
+    _local_activities.discard(activity_id)
+
+
+# ========== Per-pool debounce queue ==========
+
+class _PoolQueue:
+    """Redis keys of one (orchestrator, pool) webhook queue."""
+
+    def __init__(self, orchestrator_id: int, pool_id: str):
+        prefix = f"{KEY_PREFIX}:pool:{orchestrator_id}:{pool_id}"
+        self.ids = f"{prefix}:ids"
+        self.full = f"{prefix}:full"
+        self.leader = f"{prefix}:leader"
+
+
+async def queue_pool_sync(
+    orchestrator_id: int,
+    pool_id: str,
+    passphrase_ids: Optional[Iterable[str]],
+    run_sync: PoolSyncRunner
+) -> None:
+    """
+    Queue an incremental sync of a source pool.
+
+    If no leader is draining the pool's queue, this call becomes the leader
+    and only returns once the queue is empty. It runs one sync per debounce
+    window. Otherwise it returns right away, and the current leader syncs
+    the queued IDs.
+
+    Args:
+        orchestrator_id: Orchestrator ID
+        pool_id: Source pool ID (the canonical OrchestratorSourcePool.pool_id)
+        passphrase_ids: Affected passphrase IDs, or None/empty for a full scan
+        run_sync: Runs the sync for the drained queue
+    """
+    passphrase_ids = [pp_id for pp_id in (passphrase_ids or []) if pp_id]
+    queue = _PoolQueue(orchestrator_id, pool_id)
+
+    try:
+        redis = await get_redis_client()
+        pipe = redis.pipeline(transaction=False)
+        if passphrase_ids:
+            pipe.sadd(queue.ids, *passphrase_ids)
+            pipe.expire(queue.ids, QUEUE_TTL_SECONDS)
+        else:
+            pipe.set(queue.full, "1", ex=QUEUE_TTL_SECONDS)
+        pipe.set(queue.leader, WORKER_ID, nx=True, ex=LEADER_TTL_SECONDS)
+        is_leader = (await pipe.execute())[-1]
+    except Exception as e:
+        logger.warning(f"Webhook queue unavailable for pool {pool_id}, syncing immediately: {e}")
+        await run_sync(orchestrator_id, pool_id, passphrase_ids or None)
+        return
+
+    if not is_leader:
+        logger.debug(f"Queued {len(passphrase_ids) or 'full scan'} for pool {pool_id}; leader already scheduled")
+        return
+
+    await _lead(redis, queue, orchestrator_id, pool_id, run_sync)
+
+
+async def _lead(redis, queue: _PoolQueue, orchestrator_id: int, pool_id: str, run_sync: PoolSyncRunner) -> None:
+    """Drain a pool queue once per debounce window until it stays empty."""
+    while True:
+        renew_task = asyncio.create_task(_renew_leader(redis, queue.leader))
+        try:
+            await asyncio.sleep(DEBOUNCE_SECONDS)
+            passphrase_ids, full_scan = await _drain(redis, queue)
+            if passphrase_ids or full_scan:
+                logger.info(
+                    f"Coalesced webhook sync for pool {pool_id}: "
+                    f"{'full scan' if full_scan else f'{len(passphrase_ids)} passphrase IDs'}"
+                )
+                try:
+                    await run_sync(orchestrator_id, pool_id, None if full_scan else sorted(passphrase_ids))
+                except Exception as e:
+                    logger.error(f"Coalesced webhook sync failed for pool {pool_id}: {e}")
+        finally:
+            renew_task.cancel()
+            await asyncio.gather(renew_task, return_exceptions=True)
+            await _release_leader(redis, queue.leader)
+
+        # Release first, then check: anything queued after the check finds
+        # no leader and takes over itself, so no entry is left behind
+        try:
+            if not await redis.exists(queue.ids, queue.full):
+                return
+            if not await redis.set(queue.leader, WORKER_ID, nx=True, ex=LEADER_TTL_SECONDS):
+                return  # A newer webhook took over the queue
+        except Exception as e:
+            logger.warning(f"Could not re-check webhook queue for pool {pool_id}: {e}")
+            return
+
+
+async def _drain(redis, queue: _PoolQueue) -> Tuple[Set[str], bool]:
+    """Atomically take the queued passphrase IDs and full-scan flag."""
+    pipe = redis.pipeline(transaction=True)
+    pipe.smembers(queue.ids)
+    pipe.get(queue.full)
+    pipe.delete(queue.ids, queue.full)
+    passphrase_ids, full, _ = await pipe.execute()
+    return set(passphrase_ids or ()), bool(full)
+
+
+async def _renew_leader(redis, key: str) -> None:
+    while True:
+        await asyncio.sleep(LEADER_RENEW_INTERVAL)
+        try:
+            renewed = await redis.eval(_RENEW_LEADER_SCRIPT, 1, key, WORKER_ID, LEADER_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Failed to renew webhook queue leader {key}: {e}")
+            continue
+        if not renewed:
+            # Stalled past LEADER_TTL_SECONDS and another worker took over;
+            # never extend its key
+            logger.warning(f"Lost webhook queue leadership for {key}")
+            return
+
+
+async def _release_leader(redis, key: str) -> None:
+    try:
+        await redis.eval(_RELEASE_LEADER_SCRIPT, 1, key, WORKER_ID)
+    except Exception as e:
+        logger.debug(f"Failed to release webhook queue leader {key}: {e}")
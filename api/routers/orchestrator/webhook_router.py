@@ -15,13 +15,21 @@ Orchestrator identification is done via the webhook secret in the header.
 **Activity tracking approach**: When a webhook arrives with an activity_id, we track
 the activity via /activities/{id} polling ourselves rather than relying on webhook
 status. This handles R1's quirk where entityId changes between IN_PROGRESS and SUCCESS.
+
+Every activity webhook is also relayed over Redis pub/sub to workflow
+ActivityTrackers, so workflow phases waiting on a requestId finish as soon as
+R1 reports it instead of on their next poll.
+
+**Coalescing**: Activities are de-duplicated in Redis across all workers, and
+completed activities queue their pool instead of syncing it directly. One
+sync per pool runs per debounce window, carrying the union of the queued
+passphrase IDs (see webhook_coalescer).
 """
 import asyncio
 import json
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set
-import threading
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from starlette.requests import ClientDisconnect
@@ -34,6 +42,12 @@ from routers.orchestrator.orchestrator_router import can_access_orchestrator
 from redis_client import get_redis_client
 from models.orchestrator import DPSKOrchestrator, OrchestratorSourcePool, PassphraseMapping, OrchestratorSyncEvent
 from routers.orchestrator.sync_engine import SyncEngine
+from routers.orchestrator.webhook_coalescer import (
+    claim_activity,
+    release_activity,
+    finish_local_activity,
+    queue_pool_sync,
+)
 from routers.orchestrator.sync_pool import (
     sync_single_pool,
     sync_pool_by_id,
@@ -41,6 +55,7 @@ from routers.orchestrator.sync_pool import (
     PoolSyncResult
 )
 from clients.r1_client import create_r1_client_from_controller
+from workflow.v2.state_manager import RedisStateManagerV2
 
 logger = logging.getLogger(__name__)
 
@@ -52,13 +67,12 @@ WEBHOOK_SECRET_HEADERS = ["Authorization", "X-Webhook-Secret"]
 
 
 # ========== Activity Tracker ==========
-# Tracks which activity_ids we're already monitoring to avoid duplicate processing.
-# When a webhook arrives, we poll /activities/{id} ourselves to determine success
-# and extract entity info, rather than relying on webhook status/entityId.
+# Activities are claimed in Redis (webhook_coalescer.claim_activity) so each is
+# tracked once across all workers. When a webhook arrives, we poll
+# /activities/{id} ourselves to determine success and extract entity info,
+# rather than relying on webhook status/entityId.
 
-_tracked_activities: Set[str] = set()  # activity_ids currently being monitored
-_activity_lock = threading.Lock()
-_ACTIVITY_TTL_MINUTES = 30  # How long to keep tracking an activity
+_tracked_activities: Set[str] = set()  # activity_ids this worker is polling (load logging only)
 
 # Redis key prefix for webhook pause tracking
 WEBHOOK_PAUSE_KEY_PREFIX = "webhook_pause:"
@@ -69,35 +83,41 @@ _orchestrator_cache: Dict[str, tuple] = {}  # secret -> (orchestrator_id, name,
 _CACHE_TTL_SECONDS = 60  # Cache for 1 minute
 
 
-def is_activity_tracked(activity_id: str) -> bool:
-    """Check if we're already tracking this activity."""
-    if not activity_id:
-        return False
-    with _activity_lock:
-        return activity_id in _tracked_activities
-
+# ========== Workflow Activity Relay ==========
 
-def track_activity(activity_id: str) -> bool:
+async def relay_activity_webhook(data: dict) -> None:
     """
-    Start tracking an activity. Returns True if newly tracked, False if already tracked.
+    Publish an R1 activity webhook for workflow ActivityTrackers.
+
+    Trackers live on whichever worker runs the job, so the payload goes out
+    on Redis pub/sub. Best-effort: trackers fall back to polling.
     """
-    if not activity_id:
-        return False
-    with _activity_lock:
-        if activity_id in _tracked_activities:
-            return False
-        _tracked_activities.add(activity_id)
-        logger.debug(f"Started tracking activity {activity_id}")
-        return True
+    if data.get("type") == "test":
+        return
+    payload = data.get("payload")
+    if not isinstance(payload, dict) or not (payload.get("requestId") or payload.get("id")):
+        return
+    try:
+        redis = await get_redis_client()
+        await RedisStateManagerV2(redis).publish_activity_update(
+            payload, tenant_id=data.get("tenantId")
+        )
+    except Exception as e:
+        logger.debug(f"Failed to relay activity webhook to workflow trackers: {e}")
 
 
-def untrack_activity(activity_id: str) -> None:
-    """Stop tracking an activity (after completion or timeout)."""
-    if not activity_id:
-        return
-    with _activity_lock:
-        _tracked_activities.discard(activity_id)
-        logger.debug(f"Stopped tracking activity {activity_id}")
+async def _relay_paused_webhook(request: Request) -> None:
+    """
+    Relay the webhook body for a paused orchestrator.
+
+    Bulk workflows pause DPSK sync while they run, but they are usually the
+    ones waiting on these activities, so the relay still happens.
+    """
+    try:
+        body = await request.body()
+        await relay_activity_webhook(json.loads(body) if body else {})
+    except Exception as e:
+        logger.debug(f"Could not relay paused webhook: {e!r}")
 
 
 # ========== Webhook Pause Tracking ==========
@@ -295,6 +315,10 @@ async def track_and_process_activity(
     webhook status (which can be unreliable), we poll the activity endpoint
     ourselves to determine success and extract entity info.
 
+    The caller has already claimed the activity (claim_activity). The claim
+    is kept once the activity reaches a handler, so later duplicates are
+    dropped, and released otherwise so a redelivery can retry.
+
     Args:
         orchestrator_id: ID of the orchestrator
         activity_id: RuckusONE activity ID to track
@@ -303,13 +327,10 @@ async def track_and_process_activity(
     """
     from database import SessionLocal
     db = SessionLocal()
+    handled = False
+    _tracked_activities.add(activity_id)
 
     try:
-        # Check if already tracking this activity
-        if not track_activity(activity_id):
-            logger.debug(f"Activity {activity_id} already being tracked, skipping")
-            return
-
         orchestrator = db.query(DPSKOrchestrator).filter_by(id=orchestrator_id).first()
         if not orchestrator or not orchestrator.enabled:
             logger.warning(f"Orchestrator {orchestrator_id} not found or disabled")
@@ -356,6 +377,7 @@ async def track_and_process_activity(
         # Close db session before calling handlers (they create their own)
         db.close()
         db = None
+        handled = True
 
         if use_case in create_cases:
             await process_webhook_create(
@@ -382,7 +404,11 @@ async def track_and_process_activity(
     except Exception as e:
         logger.error(f"Error tracking activity {activity_id}: {e}")
     finally:
-        untrack_activity(activity_id)
+        _tracked_activities.discard(activity_id)
+        if handled:
+            finish_local_activity(activity_id)
+        else:
+            await release_activity(activity_id)
         if db:
             db.close()
 
@@ -448,12 +474,9 @@ async def process_webhook_create(
     """
     Process a CREATE/BULK_CREATE webhook - add specific passphrases to site-wide.
 
-    Uses the unified sync_pool_by_id() function which handles:
-    - Source pool lookup (with UUID normalization)
-    - Sync event creation
-    - Passphrase fetching and creation
-    - Identity updates
-    - Mapping records
+    Queues the passphrase IDs for the pool's coalesced webhook sync, which
+    runs the unified sync_pool_by_id() function (source pool lookup, sync
+    event, passphrase creation, identity updates, mapping records).
 
     Args:
         orchestrator_id: ID of the orchestrator
@@ -502,27 +525,8 @@ async def process_webhook_create(
         else:
             logger.info("No passphrase IDs in activity - will scan for new passphrases")
 
-        # Use unified sync function - handles everything
-        try:
-            result = await sync_pool_by_id(
-                db=db,
-                r1_client=r1_client,
-                orchestrator=orchestrator,
-                pool_id=entity_id,
-                specific_passphrase_ids=passphrase_ids if passphrase_ids else None,
-                create_sync_event=True,
-                event_type="webhook"
-            )
-
-            logger.info(
-                f"Webhook CREATE processed for {result.pool_name}: "
-                f"+{result.added} added, ~{result.updated} updated, ={result.skipped} unchanged"
-            )
-
-        except ValueError as e:
-            # Pool not found in source pools
-            logger.warning(str(e))
-            return
+        # Queue the pool - one coalesced sync covers every webhook in the window
+        await _queue_webhook_sync(db, orchestrator, entity_id, passphrase_ids)
 
     except Exception as e:
         logger.error(f"Webhook CREATE processing failed: {e}")
@@ -539,8 +543,8 @@ async def process_webhook_delete(
     """
     Process a DELETE/BULK_DELETE webhook - flag affected mappings.
 
-    Uses the unified sync_pool_by_id() function which handles deletion
-    detection by comparing current source pool state against our mappings.
+    Queues a full scan for the pool's coalesced webhook sync, which detects
+    deletions by comparing current source pool state against our mappings.
 
     Args:
         orchestrator_id: ID of the orchestrator
@@ -562,39 +566,12 @@ async def process_webhook_delete(
             logger.info(f"Passphrase deleted from site-wide pool - no action needed (manual deletion)")
             return
 
-        # Get R1 client
-        controller = db.query(Controller).filter_by(id=orchestrator.controller_id).first()
-        if not controller:
-            logger.error(f"Controller not found for orchestrator {orchestrator_id}")
-            return
-
-        r1_client = create_r1_client_from_controller(controller.id, db)
-
         logger.info(f"Processing DELETE webhook for entity {entity_id}")
 
-        # For delete webhooks, we do a full pool scan to detect what's missing
+        # For delete webhooks, we queue a full pool scan to detect what's missing
         # This is more reliable than trying to extract specific IDs from activity
         # (which may already be deleted from R1)
-        try:
-            result = await sync_pool_by_id(
-                db=db,
-                r1_client=r1_client,
-                orchestrator=orchestrator,
-                pool_id=entity_id,
-                specific_passphrase_ids=None,  # Full scan to detect deletions
-                create_sync_event=True,
-                event_type="webhook"
-            )
-
-            logger.info(
-                f"Webhook DELETE processed for {result.pool_name}: "
-                f"-{result.flagged} flagged for removal"
-            )
-
-        except ValueError as e:
-            # Pool not found in source pools
-            logger.warning(str(e))
-            return
+        await _queue_webhook_sync(db, orchestrator, entity_id, None)
 
     except Exception as e:
         logger.error(f"Webhook DELETE processing failed: {e}")
@@ -611,8 +588,9 @@ async def process_webhook_update(
     """
     Process an UPDATE webhook - update specific passphrase in site-wide.
 
-    Uses the unified sync_pool_by_id() function which handles update detection
-    by comparing source passphrase state against our synced mappings.
+    Queues the passphrase IDs for the pool's coalesced webhook sync, which
+    detects updates by comparing source passphrase state against our synced
+    mappings.
 
     Args:
         orchestrator_id: ID of the orchestrator
@@ -653,36 +631,103 @@ async def process_webhook_update(
         else:
             logger.info("No passphrase IDs in activity - will scan for changes")
 
-        # Use unified sync function - it handles update detection
+        # Queue the pool - the coalesced sync handles update detection
+        await _queue_webhook_sync(db, orchestrator, entity_id, passphrase_ids)
+
+    except Exception as e:
+        logger.error(f"Webhook UPDATE processing failed: {e}")
+    finally:
+        db.close()
+
+
+# ========== Helper Functions ==========
+
+async def _queue_webhook_sync(
+    db: Session,
+    orchestrator: DPSKOrchestrator,
+    entity_id: str,
+    passphrase_ids: Optional[List[str]]
+) -> None:
+    """
+    Queue a coalesced incremental sync of the source pool behind entity_id.
+
+    Closes db first: the call may lead the pool's queue, waiting out the
+    debounce window and the sync (which opens its own session).
+
+    Args:
+        db: Handler's database session (closed here)
+        orchestrator: The orchestrator config
+        entity_id: Entity ID from the activity (pool or identity group)
+        passphrase_ids: Affected passphrase IDs, or None/empty for a full scan
+    """
+    source_pool = find_matching_source_pool(orchestrator, entity_id)
+    if not source_pool:
+        logger.warning(
+            f"Pool {entity_id} is not a source pool for orchestrator {orchestrator.id}. "
+            f"Configured pools: {[p.pool_id for p in orchestrator.source_pools]}"
+        )
+        return
+
+    orchestrator_id = orchestrator.id
+    pool_id = source_pool.pool_id
+    db.close()
+
+    await queue_pool_sync(orchestrator_id, pool_id, passphrase_ids, _run_webhook_pool_sync)
+
+
+async def _run_webhook_pool_sync(
+    orchestrator_id: int,
+    pool_id: str,
+    passphrase_ids: Optional[List[str]]
+) -> None:
+    """
+    Run one coalesced webhook sync of a source pool.
+
+    Args:
+        orchestrator_id: ID of the orchestrator
+        pool_id: Source pool ID
+        passphrase_ids: Union of the queued passphrase IDs, or None for a full scan
+    """
+    from database import SessionLocal
+    db = SessionLocal()
+
+    try:
+        orchestrator = db.query(DPSKOrchestrator).filter_by(id=orchestrator_id).first()
+        if not orchestrator or not orchestrator.enabled:
+            logger.warning(f"Orchestrator {orchestrator_id} not found or disabled")
+            return
+
+        controller = db.query(Controller).filter_by(id=orchestrator.controller_id).first()
+        if not controller:
+            logger.error(f"Controller not found for orchestrator {orchestrator_id}")
+            return
+
+        r1_client = create_r1_client_from_controller(controller.id, db)
+
         try:
             result = await sync_pool_by_id(
                 db=db,
                 r1_client=r1_client,
                 orchestrator=orchestrator,
-                pool_id=entity_id,
-                specific_passphrase_ids=passphrase_ids if passphrase_ids else None,
+                pool_id=pool_id,
+                specific_passphrase_ids=passphrase_ids,
                 create_sync_event=True,
                 event_type="webhook"
             )
-
-            logger.info(
-                f"Webhook UPDATE processed for {result.pool_name}: "
-                f"~{result.updated} updated, +{result.added} added"
-            )
-
         except ValueError as e:
-            # Pool not found in source pools
+            # Pool removed from the orchestrator while queued
             logger.warning(str(e))
             return
 
-    except Exception as e:
-        logger.error(f"Webhook UPDATE processing failed: {e}")
+        logger.info(
+            f"Webhook sync processed for {result.pool_name}: "
+            f"+{result.added} added, ~{result.updated} updated, "
+            f"-{result.flagged} flagged, ={result.skipped} unchanged"
+        )
     finally:
         db.close()
 
 
-# ========== Helper Functions ==========
-
 async def _extract_passphrase_ids_from_activity(
     r1_client,
     activity_id: str,
@@ -703,9 +748,9 @@ async def _extract_passphrase_ids_from_activity(
     try:
         # Fetch activity details
         if r1_client.ec_type == "MSP" and tenant_id:
-            response = r1_client.get(f"/activities/{activity_id}", override_tenant_id=tenant_id)
+            response = await r1_client.aget(f"/activities/{activity_id}", override_tenant_id=tenant_id)
         else:
-            response = r1_client.get(f"/activities/{activity_id}")
+            response = await r1_client.aget(f"/activities/{activity_id}")
 
         if not response.ok:
             logger.debug(f"Could not fetch activity {activity_id}: {response.status_code}")
@@ -806,6 +851,7 @@ async def receive_webhook(
         paused, pause_reason = is_webhook_paused(cached.id)
         if paused:
             logger.debug(f"Webhook for paused orchestrator {cached.name} ({pause_reason}) - skipping")
+            await _relay_paused_webhook(request)
             return {"status": "acknowledged", "reason": f"orchestrator_paused:{pause_reason}"}
 
     # 3. Find orchestrator by secret (DB lookup - also updates cache)
@@ -827,7 +873,8 @@ async def receive_webhook(
     if not cached:
         paused, pause_reason = is_webhook_paused(orchestrator.id)
         if paused:
-            logger.debug(f"Webhook for paused orchestrator {orchestrator.name} ({pause_reason}) - skipping body read")
+            logger.debug(f"Webhook for paused orchestrator {orchestrator.name} ({pause_reason}) - skipping sync")
+            await _relay_paused_webhook(request)
             return {"status": "acknowledged", "reason": f"orchestrator_paused:{pause_reason}"}
 
     # 4. Read body once and parse JSON (only if enabled and not paused)
@@ -850,6 +897,9 @@ async def receive_webhook(
     # Log webhook receipt
     logger.debug(f"Webhook for orchestrator {orchestrator.name}: {body[:200].decode('utf-8', errors='replace') if body else '(empty)'}...")
 
+    # Hand the activity to workflow trackers before the DPSK useCase filter
+    await relay_activity_webhook(data)
+
     # 5. Extract relevant fields
     payload = data.get("payload", {})
     webhook_type = data.get("type", "")
@@ -888,13 +938,12 @@ async def receive_webhook(
         return {"status": "ignored", "reason": "No activity_id to track"}
 
     # Log active tracking count for debugging webhook floods
-    with _activity_lock:
-        active_count = len(_tracked_activities)
+    active_count = len(_tracked_activities)
     if active_count > 10:
-        logger.warning(f"High webhook load: {active_count} activities being tracked")
+        logger.warning(f"High webhook load: {active_count} activities being tracked by this worker")
 
-    # 7b. Check if already tracking this activity (multiple webhooks for same activity)
-    if is_activity_tracked(activity_id):
+    # 7b. Claim the activity - duplicate deliveries (to any worker) are acknowledged only
+    if not await claim_activity(activity_id):
         logger.info(f"Activity {activity_id} already being tracked, acknowledging duplicate webhook")
         return {
             "status": "acknowledged",
@@ -930,7 +979,7 @@ async def receive_webhook(
         "orchestrator_name": orchestrator.name,
         "activity_id": activity_id,
         "use_case": use_case,
-        "note": "Tracking activity via /activities polling. Sync will trigger on completion."
+        "note": "Tracking activity via /activities polling. Pool sync is queued on completion."
     }
 
 
@@ -0,0 +1,179 @@
+"""
+Audit Checkpoints
+
+Lets an async SZ audit job survive an API worker restart.
+
+Phase outputs are already saved on the job record after every phase
+(global_phase_results), so a resumed job skips completed phases and feeds
+their stored outputs to the rest. Inside audit_zones - the phase that runs
+for hours on large controllers - each zone is checkpointed once its audit
+is in the zone cache, and a resumed run loads those zones from the cache
+instead of auditing them again.
+
+A running job holds a short lease that its runner renews; a job marked
+RUNNING whose lease has expired was interrupted and can be resumed (by the
+resume endpoint or automatically on startup). A runner whose lease expired
+anyway (a stall, a Redis outage) finds out at its next renewal and must
+stop without touching the job again: another worker may own it by then.
+
+Redis keys:
+- sz_audit:checkpoint:{job_id}:zones → set of zone IDs audited and cached by this job
+- sz_audit:checkpoint:{job_id}:lease → owner of the running job (TTL LEASE_TTL_SECONDS)
+- sz_audit:checkpoint:active        → set of job IDs with a live checkpoint
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from typing import Iterable, List, Optional, Set
+
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_TTL_SECONDS = 60 * 60 * 24  # 24 hours, same as audit results
+LEASE_TTL_SECONDS = 60
+LEASE_RENEW_INTERVAL = 20
+
+ACTIVE_CHECKPOINTS_KEY = "sz_audit:checkpoint:active"
+
+# Identifies this process as a lease owner
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# Lease updates that only apply while this worker still holds the lease
+_RENEW_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class LeaseLost(Exception):
+    """The run lease expired and may belong to another worker now."""
+
+
+class AuditCheckpoint:
+    """Completed-zone checkpoint and run lease for one audit job."""
+
+    def __init__(self, redis_client: redis.Redis, job_id: str):
+        """
+        Args:
+            redis_client: Async Redis client
+            job_id: Audit job ID
+        """
+        self.redis = redis_client
+        self.job_id = job_id
+        self.prefix = f"sz_audit:checkpoint:{job_id}"
+        self._renew_task: Optional[asyncio.Task] = None
+        self.lost = False  # Set once a renewal finds the lease gone
+
+    def _zones_key(self) -> str:
+        return f"{self.prefix}:zones"
+
+    def _lease_key(self) -> str:
+        return f"{self.prefix}:lease"
+
+    # ----- completed zones -----
+
+    async def add_zones(self, zone_ids: Iterable[str]) -> None:
+        """Record zones whose audit is safely in the zone cache."""
+        zone_ids = [zid for zid in zone_ids if zid]
+        if not zone_ids:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.sadd(self._zones_key(), *zone_ids)
+        pipe.expire(self._zones_key(), CHECKPOINT_TTL_SECONDS)
+        await pipe.execute()
+
+    async def completed_zones(self) -> Set[str]:
+        """Zone IDs completed by earlier runs of this job."""
+        return set(await self.redis.smembers(self._zones_key()))
+
+    async def clear(self) -> None:
+        """Drop the checkpoint (job finished or cancelled - nothing to resume)."""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.delete(self._zones_key())
+        pipe.srem(ACTIVE_CHECKPOINTS_KEY, self.job_id)
+        await pipe.execute()
+
+    # ----- run lease -----
+
+    async def acquire(self) -> bool:
+        """
+        Take the run lease for this process and start renewing it.
+
+        Returns:
+            False if another worker holds the lease (the job is running there)
+        """
+        acquired = await self.redis.set(
+            self._lease_key(), WORKER_ID, nx=True, ex=LEASE_TTL_SECONDS
+        )
+        if not acquired:
+            return False
+        self.lost = False
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.sadd(ACTIVE_CHECKPOINTS_KEY, self.job_id)
+        pipe.expire(ACTIVE_CHECKPOINTS_KEY, CHECKPOINT_TTL_SECONDS)
+        await pipe.execute()
+        self._renew_task = asyncio.create_task(self._renew())
+        return True
+
+    async def release(self) -> None:
+        """Stop renewing and drop the lease if this process still holds it."""
+        if self._renew_task:
+            self._renew_task.cancel()
+            await asyncio.gather(self._renew_task, return_exceptions=True)
+            self._renew_task = None
+        try:
+            await self.redis.eval(_RELEASE_LEASE_SCRIPT, 1, self._lease_key(), WORKER_ID)
+        except Exception as e:
+            logger.debug(f"Failed to release audit lease for {self.job_id}: {e}")
+
+    def ensure_held(self) -> None:
+        """
+        Raise LeaseLost if a renewal found the lease gone.
+
+        Runners call this before saving the job or doing more work.
+        """
+        if self.lost:
+            raise LeaseLost(f"Audit lease for {self.job_id} was lost")
+
+    async def is_running(self) -> bool:
+        """True while some worker holds the lease."""
+        return bool(await self.redis.exists(self._lease_key()))
+
+    async def _renew(self) -> None:
+        while True:
+            await asyncio.sleep(LEASE_RENEW_INTERVAL)
+            try:
+                renewed = await self.redis.eval(
+                    _RENEW_LEASE_SCRIPT, 1, self._lease_key(), WORKER_ID, LEASE_TTL_SECONDS
+                )
+            except Exception as e:
+                logger.warning(f"Failed to renew audit lease for {self.job_id}: {e}")
+                continue
+            if not renewed:
+                # Expired and possibly taken over; never extend another
+                # worker's lease
+                logger.warning(f"Lost audit lease for {self.job_id} - stopping this run")
+                self.lost = True
+                return
+
+
+async def list_checkpointed_jobs(redis_client: redis.Redis) -> List[str]:
+    """Job IDs that have a live checkpoint (running, or interrupted)."""
+    return list(await redis_client.smembers(ACTIVE_CHECKPOINTS_KEY))
+
+
+async def forget_checkpointed_job(redis_client: redis.Redis, job_id: str) -> None:
+    """Remove a job from the active index (its job record is gone or finished)."""
+    await redis_client.srem(ACTIVE_CHECKPOINTS_KEY, job_id)
@@ -0,0 +1,320 @@
+"""
+SZ Audit Export
+
+Streams audit export rows (one per zone) as CSV or NDJSON, optionally
+gzip-compressed.
+
+Rows come either from a finished SZAuditResult or straight from the zone
+cache, walked a chunk of zones at a time via ZoneCacheManager, so the
+export never holds a whole controller's zones or the whole document in
+memory and the first bytes go out as soon as the first chunk is decoded.
+
+Usage:
+    rows = cached_zone_rows(zone_cache, controller.name, controller.sz_host, mappings)
+    body = gzip_chunks(csv_chunks(rows))
+    return StreamingResponse(body, media_type="text/csv", ...)
+"""
+
+import csv
+import io
+import json
+import logging
+import zlib
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from schemas.sz_audit import SZAuditResult, SwitchGroupSummary, ZoneAudit
+from routers.sz.zone_cache import ZoneCacheManager
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FLUSH_ROWS = 200  # rows encoded per yielded chunk
+EXPORT_GZIP_LEVEL = 6
+
+EXPORT_COLUMNS = [
+    "Controller Name",
+    "Controller Host",
+    "Controller Firmware",
+    "Domain Name",
+    "Zone Name",
+    "Zone ID",
+    # AP counts
+    "APs Total",
+    "APs Online",
+    "APs Offline",
+    "APs Flagged",
+    "AP Groups",
+    # AP models - top 3 + count
+    "AP Model 1",
+    "AP Model 1 Count",
+    "AP Model 2",
+    "AP Model 2 Count",
+    "AP Model 3",
+    "AP Model 3 Count",
+    "AP Models Other",
+    # AP firmware - top 3 + count
+    "AP Firmware 1",
+    "AP Firmware 1 Count",
+    "AP Firmware 2",
+    "AP Firmware 2 Count",
+    "AP Firmware 3",
+    "AP Firmware 3 Count",
+    "AP Firmware Other",
+    # External IPs
+    "External IP Count",
+    "External IPs",
+    # WLANs
+    "WLAN Count",
+    "WLAN Group Count",
+    # WLAN types
+    "WLANs Open",
+    "WLANs WPA2-PSK",
+    "WLANs WPA2-Enterprise",
+    "WLANs WPA3-SAE",
+    "WLANs WPA3-Enterprise",
+    "WLANs DPSK",
+    "WLANs Other",
+    # Switches (domain level)
+    "Domain Switch Count",
+    "Domain Switch Groups",
+    # Mapped Switch Group (from manual mapping)
+    "Mapped Switch Group",
+    "Mapped Switch Group ID",
+    "Mapped Switches Total",
+    "Mapped Switches Online",
+    "Mapped Switches Offline",
+    "Mapped Switch Firmware 1",
+    "Mapped Switch Firmware 1 Count",
+    "Mapped Switch Firmware 2",
+    "Mapped Switch Firmware 2 Count",
+    "Mapped Switch Firmware Other",
+]
+
+_KNOWN_WLAN_TYPES = {
+    "Open", "Open + Portal", "WPA2-PSK", "WPA2-Enterprise",
+    "WPA3-SAE", "WPA3", "WPA3-Enterprise", "DPSK",
+}
+
+
+class ExportContext:
+    """Per-controller lookups shared by every zone row."""
+
+    def __init__(
+        self,
+        controller_name: str,
+        host: str,
+        controller_firmware: Optional[str],
+        zone_mappings: Dict[str, str]
+    ):
+        self.controller_name = controller_name
+        self.host = host
+        self.controller_firmware = controller_firmware or ""
+        self.zone_mappings = zone_mappings
+        self.domain_switch_counts: Dict[str, int] = {}
+        self.domain_switch_groups: Dict[str, int] = {}
+        self.switch_groups: Dict[str, SwitchGroupSummary] = {}
+
+    @classmethod
+    def from_result(cls, result: SZAuditResult, zone_mappings: Dict[str, str]) -> "ExportContext":
+        context = cls(result.controller_name, result.host, result.controller_firmware, zone_mappings)
+
+        def collect_switch_groups(domains):
+            for domain in domains:
+                context.domain_switch_counts[domain.domain_id] = domain.total_switches
+                context.domain_switch_groups[domain.domain_id] = len(domain.switch_groups)
+                for sg in domain.switch_groups:
+                    context.switch_groups[sg.id] = sg
+                if domain.children:
+                    collect_switch_groups(domain.children)
+
+        collect_switch_groups(result.domains)
+        return context
+
+    def add_cached_switch_groups(self, cached_sg_data: Optional[Dict[str, Any]]) -> None:
+        """
+        Domain switch counts and mapped-group lookup from the switch group cache.
+
+        Audits cache their groups under one "_all_" key plus per-domain
+        totals; older caches keyed by domain are counted per key.
+        """
+        if not cached_sg_data:
+            return
+        domains = cached_sg_data.get('domains')
+        for domain_id, totals in (domains or {}).items():
+            self.domain_switch_counts[domain_id] = totals.get('total_switches', 0)
+            self.domain_switch_groups[domain_id] = totals.get('switch_groups', 0)
+        for domain_id, groups in cached_sg_data.get('switch_groups', {}).items():
+            if domains is None and domain_id != "_all_":
+                self.domain_switch_counts[domain_id] = sum(sg.get('switch_count', 0) for sg in groups)
+                self.domain_switch_groups[domain_id] = len(groups)
+            for sg in groups:
+                if sg.get('id'):
+                    self.switch_groups[sg['id']] = SwitchGroupSummary.model_validate(sg)
+
+
+def error_row(controller_name: str, host: str, error: str) -> List[Any]:
+    """Row for a controller that could not be exported."""
+    row = [controller_name, host, f"ERROR: {error}"]
+    return row + [""] * (len(EXPORT_COLUMNS) - len(row))
+
+
+def _top3(items: list, label: str) -> List[Any]:
+    """[name1, count1, name2, count2, name3, count3, other] by count."""
+    ranked = sorted(items, key=lambda x: x.count, reverse=True)
+    cells = []
+    for i in range(3):
+        if len(ranked) > i:
+            cells.extend([getattr(ranked[i], label), ranked[i].count])
+        else:
+            cells.extend(["", ""])
+    cells.append(sum(x.count for x in ranked[3:]) if len(ranked) > 3 else "")
+    return cells
+
+
+def zone_row(context: ExportContext, zone: ZoneAudit) -> List[Any]:
+    """Export row for one zone."""
+    # WLAN type counts
+    wlan_types = zone.wlan_type_breakdown
+    wlans_open = wlan_types.get("Open", 0) + wlan_types.get("Open + Portal", 0)
+    wlans_wpa3_sae = wlan_types.get("WPA3-SAE", 0) + wlan_types.get("WPA3", 0)
+    wlans_other = sum(v for k, v in wlan_types.items() if k not in _KNOWN_WLAN_TYPES)
+
+    # Mapped switch group for this zone
+    mapped_sg_id = context.zone_mappings.get(zone.zone_id, "")
+    mapped_sg = context.switch_groups.get(mapped_sg_id) if mapped_sg_id else None
+    firmware = mapped_sg.firmware_versions if mapped_sg else []
+
+    return [
+        context.controller_name,
+        context.host,
+        context.controller_firmware,
+        zone.domain_name,
+        zone.zone_name,
+        zone.zone_id,
+        # AP counts
+        zone.ap_status.total,
+        zone.ap_status.online,
+        zone.ap_status.offline,
+        zone.ap_status.flagged,
+        len(zone.ap_groups),
+        # AP models and firmware
+        *_top3(zone.ap_model_distribution, "model"),
+        *_top3(zone.ap_firmware_distribution, "version"),
+        # External IPs
+        len(zone.external_ips),
+        "; ".join(zone.external_ips) if zone.external_ips else "",
+        # WLANs
+        zone.wlan_count,
+        len(zone.wlan_groups),
+        # WLAN types
+        wlans_open or "",
+        wlan_types.get("WPA2-PSK", 0) or "",
+        wlan_types.get("WPA2-Enterprise", 0) or "",
+        wlans_wpa3_sae or "",
+        wlan_types.get("WPA3-Enterprise", 0) or "",
+        wlan_types.get("DPSK", 0) or "",
+        wlans_other or "",
+        # Switches (domain level)
+        context.domain_switch_counts.get(zone.domain_id, 0) or "",
+        context.domain_switch_groups.get(zone.domain_id, 0) or "",
+        # Mapped Switch Group
+        mapped_sg.name if mapped_sg else "",
+        mapped_sg_id,
+        mapped_sg.switch_count if mapped_sg else "",
+        mapped_sg.switches_online if mapped_sg else "",
+        mapped_sg.switches_offline if mapped_sg else "",
+        # Mapped Switch Firmware (stored order, not re-ranked)
+        firmware[0].version if len(firmware) > 0 else "",
+        firmware[0].count if len(firmware) > 0 else "",
+        firmware[1].version if len(firmware) > 1 else "",
+        firmware[1].count if len(firmware) > 1 else "",
+        sum(fv.count for fv in firmware[2:]) if len(firmware) > 2 else "",
+    ]
+
+
+def result_rows(result: SZAuditResult, zone_mappings: Dict[str, str]) -> Iterable[List[Any]]:
+    """Rows for a finished audit result (an error row if the audit failed)."""
+    if result.error:
+        yield error_row(result.controller_name, result.host, result.error)
+        return
+    context = ExportContext.from_result(result, zone_mappings)
+    for zone in result.zones:
+        yield zone_row(context, zone)
+
+
+async def cached_zone_rows(
+    zone_cache: ZoneCacheManager,
+    controller_name: str,
+    host: str,
+    zone_mappings: Dict[str, str]
+) -> AsyncIterator[List[Any]]:
+    """
+    Rows for a controller's cached zones, decoded a chunk at a time.
+
+    Args:
+        zone_cache: Zone cache for the controller
+        controller_name: Controller display name
+        host: Controller host
+        zone_mappings: zone_id -> switch group ID (manual mappings)
+    """
+    meta = await zone_cache.get_cache_meta()
+    if not meta or not meta.get('zone_ids'):
+        yield error_row(controller_name, host, "No cached audit for this controller. Run an audit first.")
+        return
+
+    context = ExportContext(controller_name, host, meta.get('controller_firmware'), zone_mappings)
+    context.add_cached_switch_groups(await zone_cache.get_cached_switch_groups())
+
+    exported = 0
+    async for zones in zone_cache.iter_cached_zones(meta['zone_ids']):
+        for zone_data in zones:
+            try:
+                zone = ZoneAudit.model_validate(zone_data)
+            except Exception as e:
+                logger.warning(f"Export: skipping unreadable cached zone {zone_data.get('zone_id')}: {e}")
+                continue
+            exported += 1
+            yield zone_row(context, zone)
+    logger.info(f"Export: {exported} cached zones for controller {zone_cache.controller_id}")
+
+
+# =============================================================================
+# Encoders
+# =============================================================================
+
+async def csv_chunks(rows: AsyncIterator[List[Any]]) -> AsyncIterator[str]:
+    """Header then rows as CSV text, EXPORT_FLUSH_ROWS rows per chunk."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    pending = 0
+    async for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= EXPORT_FLUSH_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue()
+
+
+async def ndjson_chunks(rows: AsyncIterator[List[Any]]) -> AsyncIterator[str]:
+    """One JSON object per row keyed by column name, EXPORT_FLUSH_ROWS rows per chunk."""
+    lines = []
+    async for row in rows:
+        lines.append(json.dumps(dict(zip(EXPORT_COLUMNS, row)), default=str))
+        if len(lines) >= EXPORT_FLUSH_ROWS:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+async def gzip_chunks(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Gzip a text stream incrementally (a single gzip member)."""
+    compressor = zlib.compressobj(EXPORT_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
@@ -7,16 +7,16 @@ Collects data on domains, zones, APs, WLANs, switches, and firmware.
 Supports both sync (blocking) and async (background job) audit modes.
 """
 import asyncio
-import csv
-import io
+import json
 import logging
 import uuid
 from collections import Counter
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -49,9 +49,19 @@ from workflow.v2.models import WorkflowJobV2, JobStatus, PhaseStatus, PhaseDefin
 from workflow.v2.state_manager import RedisStateManagerV2
 from workflow.events import WorkflowEventPublisher
 from routers.sz.audit_workflow_definition import get_workflow_definition
+from routers.sz import audit_export
 from routers.sz.phases import initialize, fetch_switches, audit_zones, finalize
-from routers.sz.phases.finalize import get_match_candidates
+from routers.sz.phases.finalize import SwitchGroupIndex, get_match_candidates
 from routers.sz.zone_cache import ZoneCacheManager, RefreshMode
+from routers.sz.fleet_scheduler import FleetZoneScheduler, FLEET_MAX_WORKERS
+from routers.sz.audit_checkpoint import (
+    LEASE_RENEW_INTERVAL,
+    LEASE_TTL_SECONDS,
+    AuditCheckpoint,
+    LeaseLost,
+    forget_checkpointed_job,
+    list_checkpointed_jobs,
+)
 import re
 
 logger = logging.getLogger(__name__)
@@ -275,13 +285,19 @@ class AuditHistoryResponse(BaseModel):
 async def run_audit_workflow_background(
     job: WorkflowJobV2,
     controller_id: int,
-    db: Session
+    db: Session,
+    checkpoint: Optional[AuditCheckpoint] = None
 ):
     """
     Background task to run audit workflow.
 
     Uses a simplified execution model (not full WorkflowEngine) since audit
     doesn't need task-level parallelism or retries - just sequential phases.
+
+    Also runs resumed jobs: phases already COMPLETED on the job are skipped
+    and their stored outputs passed to later phases, and audit_zones reuses
+    zones in the job's checkpoint. A resume passes the checkpoint whose
+    lease it already holds; otherwise the lease is taken here.
     """
     redis_client = None
     state_manager = None
@@ -294,6 +310,14 @@ async def run_audit_workflow_background(
         state_manager = RedisStateManagerV2(redis_client)
         event_publisher = WorkflowEventPublisher(redis_client)
 
+        # Only one worker may run a job; the lease also marks it as alive
+        if checkpoint is None:
+            checkpoint = AuditCheckpoint(redis_client, job.id)
+            if not await checkpoint.acquire():
+                logger.info(f"Audit job {job.id} is already running on another worker")
+                checkpoint = None
+                return
+
         # Update job status to running
         job.status = JobStatus.RUNNING
         await state_manager.save_job(job)
@@ -331,12 +355,20 @@ async def run_audit_workflow_background(
             ('finalize', finalize.execute),
         ]
 
-        # Shared context for all phases (results from previous phases)
-        phase_results = {}
+        # Shared context for all phases (results from previous phases).
+        # A resumed job starts with the outputs of the phases it completed.
+        phase_results = {
+            phase_id: job.global_phase_results.get(phase_id, {}).get('output', {})
+            for phase_id, _ in phases_config
+            if job.global_phase_status.get(phase_id) == PhaseStatus.COMPLETED
+        }
+        if phase_results:
+            logger.info(f"Resuming audit job {job.id} after phases: {', '.join(phase_results)}")
 
         # Helper to update activity message (callable from phases)
         async def update_activity(message: str):
             """Update the current activity message for frontend display."""
+            checkpoint.ensure_held()
             job.options['current_activity'] = message
             # Also update API stats while we're at it
             job.options['api_stats'] = sz_client.get_api_stats()
@@ -356,6 +388,7 @@ async def run_audit_workflow_background(
 
         try:
             for phase_id, executor_func in phases_config:
+                checkpoint.ensure_held()
                 # Check for cancellation before each phase
                 if await state_manager.is_cancelled(job.id):
                     logger.info(f"🛑 Audit job {job.id} cancelled - stopping before phase {phase_id}")
@@ -363,8 +396,12 @@ async def run_audit_workflow_background(
                     job.errors.append("Audit cancelled by user")
                     job.options['current_activity'] = "Cancelled"
                     await state_manager.save_job(job)
+                    await checkpoint.clear()
                     return
 
+                if phase_id in phase_results:
+                    continue  # Completed before the job was interrupted
+
                 # Find phase definition
                 phase_def = job.get_phase_definition(phase_id)
                 phase_name = phase_def.name if phase_def else phase_id
@@ -403,6 +440,7 @@ async def run_audit_workflow_background(
                         'force_refresh_zones': force_refresh_zones,  # Zone IDs to always refresh
                         'job': job,  # For updating cache stats
                         'state_manager': state_manager,  # For saving job updates
+                        'checkpoint': checkpoint,  # Completed-zone checkpoint
                     }
 
                     # Execute phase
@@ -435,6 +473,8 @@ async def run_audit_workflow_background(
 
                     logger.info(f"✅ Phase {phase_id} completed")
 
+                except LeaseLost:
+                    raise
                 except Exception as e:
                     logger.exception(f"Phase {phase_id} failed: {str(e)}")
                     job.global_phase_status[phase_id] = PhaseStatus.FAILED
@@ -448,10 +488,12 @@ async def run_audit_workflow_background(
                         raise  # Stop workflow on critical phase failure
 
             # Workflow complete
+            checkpoint.ensure_held()
             job.status = JobStatus.COMPLETED
             job.completed_at = datetime.utcnow()
             job.options['current_phase_id'] = None
             await state_manager.save_job(job)
+            await checkpoint.clear()
 
             if event_publisher:
                 await event_publisher.job_completed(job)
@@ -466,6 +508,10 @@ async def run_audit_workflow_background(
             except Exception:
                 pass  # Ignore cleanup errors
 
+    except LeaseLost as e:
+        # Another worker may be running the job now; leave its record alone
+        logger.warning(f"Audit workflow {job.id} stopped: {e}")
+
     except ValueError as e:
         # Handle expected errors (connection issues, API errors) without noisy traceback
         error_msg = str(e)
@@ -491,6 +537,11 @@ async def run_audit_workflow_background(
         except Exception as save_error:
             logger.error(f"Failed to save error state: {save_error}")
 
+    finally:
+        # Failed/interrupted jobs keep their checkpoint so they can resume
+        if checkpoint:
+            await checkpoint.release()
+
 
 # ============================================================================
 # Async Audit Endpoints
@@ -715,6 +766,191 @@ async def cancel_audit_job(
     }
 
 
+# Job states a resume can pick up: interrupted (RUNNING/PENDING with no live
+# lease) or FAILED partway (e.g. the controller went away)
+RESUMABLE_STATUSES = (JobStatus.RUNNING, JobStatus.PENDING, JobStatus.FAILED)
+
+# Background resume tasks started at startup (kept so they aren't collected)
+_resume_tasks: set = set()
+
+
+async def _prepare_resume(job: WorkflowJobV2, state_manager: RedisStateManagerV2) -> None:
+    """
+    Reset interrupted/failed phases so the runner executes them again.
+
+    Only call while holding the job's lease (AuditCheckpoint.acquire), so a
+    stale copy never overwrites a job another worker is running.
+    """
+    for phase_id, status in list(job.global_phase_status.items()):
+        if status in (PhaseStatus.RUNNING, PhaseStatus.FAILED):
+            job.global_phase_status[phase_id] = PhaseStatus.PENDING
+    job.status = JobStatus.RUNNING
+    job.completed_at = None
+    job.options['resume_count'] = job.options.get('resume_count', 0) + 1
+    job.options['current_activity'] = "Resuming audit..."
+    await state_manager.save_job(job)
+
+
+@router.post("/audit/jobs/{job_id}/resume", response_model=AsyncAuditResponse)
+async def resume_audit_job(
+    job_id: str,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> AsyncAuditResponse:
+    """
+    Resume an interrupted or failed audit job.
+
+    Completed phases are not re-run, and zones the job already audited are
+    loaded from the zone cache; only the remaining zones hit the controller.
+    """
+    redis_client = await get_redis_client()
+    state_manager = RedisStateManagerV2(redis_client)
+
+    job = await state_manager.get_job(job_id)
+    if not job or job.workflow_name != "sz_audit":
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    # Verify user owns this job
+    if job.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    if job.status not in RESUMABLE_STATUSES or await state_manager.is_cancelled(job_id):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot resume job in {job.status} state"
+        )
+
+    controller_id = job.input_data.get('controller_id')
+    validate_controller_access(controller_id, current_user, db)
+
+    # Take the lease before touching the job; the runner keeps it
+    checkpoint = AuditCheckpoint(redis_client, job_id)
+    if not await checkpoint.acquire():
+        raise HTTPException(status_code=409, detail="Audit job is still running")
+
+    try:
+        # Re-read under the lease: the previous run may have finished meanwhile
+        job = await state_manager.get_job(job_id)
+        if not job or job.status not in RESUMABLE_STATUSES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot resume job in {job.status if job else 'unknown'} state"
+            )
+        completed_zones = len(await checkpoint.completed_zones())
+        await _prepare_resume(job, state_manager)
+    except BaseException:
+        await checkpoint.release()
+        raise
+
+    logger.info(
+        f"Audit job {job_id} resume requested by user {current_user.id} "
+        f"({completed_zones} zones already completed)"
+    )
+
+    background_tasks.add_task(
+        run_audit_workflow_background,
+        job,
+        controller_id,
+        db,
+        checkpoint
+    )
+
+    return AsyncAuditResponse(
+        job_id=job_id,
+        status="RUNNING",
+        message=(
+            f"Audit resumed with {completed_zones} zones already completed. "
+            f"Poll /audit/jobs/{job_id}/status for progress."
+        )
+    )
+
+
+async def _run_resumed_audit(job: WorkflowJobV2, checkpoint: AuditCheckpoint) -> None:
+    """Run a resumed job with its own DB session (no request to borrow one from)."""
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        await run_audit_workflow_background(job, job.input_data.get('controller_id'), db, checkpoint)
+    finally:
+        db.close()
+
+
+async def resume_interrupted_audits() -> int:
+    """
+    Resume audit jobs that were running when the API last stopped.
+
+    A job counts as interrupted when it is still RUNNING but nobody holds
+    its lease. Leases of a worker that just died stay valid for up to
+    LEASE_TTL_SECONDS, so jobs that still look alive are checked again once
+    that has passed.
+
+    Returns:
+        Number of jobs resumed
+    """
+    redis_client = await get_redis_client()
+    state_manager = RedisStateManagerV2(redis_client)
+
+    async def try_resume(job_id: str) -> Optional[bool]:
+        """True = resumed, None = still leased (check later), False = skip."""
+        job = await state_manager.get_job(job_id)
+        if not job or job.status in (JobStatus.COMPLETED, JobStatus.CANCELLED):
+            await forget_checkpointed_job(redis_client, job_id)
+            return False
+        if job.status not in (JobStatus.RUNNING, JobStatus.PENDING):
+            return False  # Failed jobs resume on request only
+
+        # Take the lease before touching the job (other workers start up too)
+        checkpoint = AuditCheckpoint(redis_client, job_id)
+        if not await checkpoint.acquire():
+            return None
+        try:
+            # Re-read under the lease: the job may have moved on meanwhile
+            job = await state_manager.get_job(job_id)
+            if (not job or job.status not in (JobStatus.RUNNING, JobStatus.PENDING)
+                    or await state_manager.is_cancelled(job_id)):
+                await checkpoint.release()
+                return False
+            await _prepare_resume(job, state_manager)
+        except BaseException:
+            await checkpoint.release()
+            raise
+
+        task = asyncio.create_task(_run_resumed_audit(job, checkpoint))
+        _resume_tasks.add(task)
+        task.add_done_callback(_resume_tasks.discard)
+        logger.info(f"Resuming interrupted audit job {job_id}")
+        return True
+
+    resumed = 0
+    leased = []
+    for job_id in await list_checkpointed_jobs(redis_client):
+        outcome = await try_resume(job_id)
+        if outcome is None:
+            leased.append(job_id)
+        elif outcome:
+            resumed += 1
+
+    if leased:
+        await asyncio.sleep(LEASE_TTL_SECONDS + LEASE_RENEW_INTERVAL)
+        for job_id in leased:
+            if await try_resume(job_id):
+                resumed += 1
+
+    if resumed:
+        logger.info(f"Resumed {resumed} interrupted audit job(s)")
+    return resumed
+
+
+def schedule_interrupted_audit_resume() -> asyncio.Task:
+    """Start resume_interrupted_audits in the background (app startup)."""
+    task = asyncio.create_task(resume_interrupted_audits())
+    _resume_tasks.add(task)
+    task.add_done_callback(_resume_tasks.discard)
+    return task
+
+
 class CacheStatusResponse(BaseModel):
     """Cache status for a controller"""
     controller_id: int
@@ -759,12 +995,12 @@ async def get_cache_status(
     zones_with_switch_matches = 0
     total_switch_groups_matched = 0
     if meta and meta.get('zone_ids'):
-        cached_zones = await zone_cache.get_cached_zones(meta['zone_ids'])
-        for zone_data in cached_zones.values():
-            matches = zone_data.get('matched_switch_groups', [])
+        summaries = await zone_cache.get_zone_summaries(meta['zone_ids'])
+        for summary in summaries.values():
+            matches = summary.get('switch_group_matches', 0)
             if matches:
                 zones_with_switch_matches += 1
-                total_switch_groups_matched += len(matches)
+                total_switch_groups_matched += matches
 
     return CacheStatusResponse(
         controller_id=controller_id,
@@ -885,6 +1121,7 @@ async def get_audit_result_from_cache(
     for zone_id, zone_data in cached_zones.items():
         # Remove cache metadata before converting
         zone_data.pop('_cached_at', None)
+        zone_data.pop('_fingerprint', None)
         try:
             all_zones_audit.append(ZoneAudit(**zone_data))
         except Exception as e:
@@ -1200,7 +1437,8 @@ async def get_zone_match_candidates(
                 "switches_offline": sg.get("switches_offline", 0)
             })
 
-    # Get candidates for each zone
+    # Get candidates for each zone (index the switch groups once)
+    sg_index = SwitchGroupIndex(all_switch_groups)
     zones_with_candidates = []
 
     for zone_id, zone_data in cached_zones.items():
@@ -1231,7 +1469,8 @@ async def get_zone_match_candidates(
             zone_domain_id=zone_domain_id,
             all_switch_groups=all_switch_groups,
             top_n=top_n,
-            min_score=min_score
+            min_score=min_score,
+            index=sg_index
         )
 
         zones_with_candidates.append(ZoneMatchCandidates(
@@ -1775,7 +2014,8 @@ async def audit_domain(
 
 async def perform_audit(
     controller: Controller,
-    sz_client: SZClient
+    sz_client: SZClient,
+    zone_scheduler: Optional[FleetZoneScheduler] = None
 ) -> SZAuditResult:
     """
     Perform a complete audit of a SmartZone controller.
@@ -1783,10 +2023,70 @@ async def perform_audit(
     Args:
         controller: Controller database record
         sz_client: Authenticated SmartZone client
+        zone_scheduler: Fleet scheduler to run zone audits through (fleet
+                        mode); zones are audited one by one without it
 
     Returns:
         SZAuditResult with all audit data
     """
+    discovery = await discover_controller(sz_client)
+    partial_errors = discovery['partial_errors']
+
+    zone_items = discovery['zone_items']
+    scheduler_key = str(controller.id)
+
+    async def run_zone(zone: Dict[str, Any], domain_id: str, domain_name: str):
+        try:
+            return await audit_zone(sz_client, zone, domain_id, domain_name)
+        except Exception as e:
+            partial_errors.append(f"Zone {zone.get('name', '')}: Audit failed: {str(e)}")
+            return None
+
+    if zone_scheduler is not None:
+        zone_scheduler.add_controller(scheduler_key, audit_zones.zone_worker_count(sz_client))
+        zone_results = await asyncio.gather(*(
+            zone_scheduler.submit(
+                scheduler_key,
+                lambda z=zone, d=domain_id, n=domain_name: run_zone(z, d, n)
+            )
+            for zone, domain_id, domain_name in zone_items
+        ))
+    else:
+        zone_results = [
+            await run_zone(zone, domain_id, domain_name)
+            for zone, domain_id, domain_name in zone_items
+        ]
+
+    all_zones_audit = []
+    for result in zone_results:
+        if result is None:
+            continue
+        zone_audit, zone_errors = result
+        all_zones_audit.append(zone_audit)
+        partial_errors.extend(zone_errors)
+        logger.info(
+            f"Audit: Completed zone {len(all_zones_audit)}: '{zone_audit.zone_name}' "
+            f"({zone_audit.ap_status.total} APs, {zone_audit.wlan_count} WLANs)"
+        )
+
+    logger.info(f"Audit: Zone collection complete - {len(all_zones_audit)} zones processed")
+
+    return await assemble_audit_result(controller, sz_client, discovery, all_zones_audit)
+
+
+async def discover_controller(sz_client: SZClient) -> Dict[str, Any]:
+    """
+    Collect everything an audit needs before zone audits: system info,
+    domains, switch groups, switches and the (deduplicated) zone list.
+
+    Args:
+        sz_client: Authenticated SmartZone client
+
+    Returns:
+        Dict with partial_errors, cluster_ip, controller_firmware,
+        domains_raw, all_switches, all_switch_groups and zone_items
+        [(zone, domain_id, domain_name), ...]
+    """
     partial_errors = []
     cluster_ip = None
     controller_firmware = None
@@ -1873,10 +2173,8 @@ async def perform_audit(
         logger.info(f"Total switch groups found across all domains: {total_groups}")
 
     # Get all zones with domain info - deduplicate by zone_id
-    all_zones_audit = []
-    all_zone_data = []
-    seen_zone_ids = set()  # Track which zones we've already processed
-    total_zones_processed = 0
+    zone_items = []
+    seen_zone_ids = set()  # Track which zones we've already seen
 
     logger.info(f"Audit: Starting zone collection across {len(domains_raw)} domains")
     for domain in domains_raw:
@@ -1885,35 +2183,61 @@ async def perform_audit(
 
         try:
             zones = await sz_client.zones.get_zones(domain_id=domain_id)
+        except Exception as e:
+            partial_errors.append(f"Failed to get zones for domain {domain_name}: {str(e)}")
+            continue
+
+        for zone in zones:
+            zone_id = zone.get("id")
+            zone_name = zone.get("name", "")
+
+            # Skip "Staging Zone" - SmartZone system zone that doesn't support queries
+            if zone_name.lower() == "staging zone":
+                logger.debug(f"Skipping system zone: {zone_name} ({zone_id})")
+                continue
 
-            # Audit each zone (could parallelize for performance)
-            for zone in zones:
-                zone_id = zone.get("id")
-                zone_name = zone.get("name", "")
+            # Skip if we've already seen this zone (avoid duplicates)
+            if zone_id in seen_zone_ids:
+                logger.debug(f"Skipping duplicate zone {zone_id} ({zone_name}) - already processed")
+                continue
 
-                # Skip "Staging Zone" - SmartZone system zone that doesn't support queries
-                if zone_name.lower() == "staging zone":
-                    logger.debug(f"Skipping system zone: {zone_name} ({zone_id})")
-                    continue
+            seen_zone_ids.add(zone_id)
+            zone_items.append((zone, domain_id, domain_name))
 
-                # Skip if we've already processed this zone (avoid duplicates)
-                if zone_id in seen_zone_ids:
-                    logger.debug(f"Skipping duplicate zone {zone_id} ({zone_name}) - already processed")
-                    continue
+    return {
+        'partial_errors': partial_errors,
+        'cluster_ip': cluster_ip,
+        'controller_firmware': controller_firmware,
+        'domains_raw': domains_raw,
+        'all_switches': all_switches,
+        'all_switch_groups': all_switch_groups,
+        'zone_items': zone_items,
+    }
 
-                seen_zone_ids.add(zone_id)
 
-                zone_audit, zone_errors = await audit_zone(sz_client, zone, domain_id, domain_name)
-                all_zones_audit.append(zone_audit)
-                partial_errors.extend(zone_errors)
-                all_zone_data.append({"zone": zone, "domain_id": domain_id, "domain_name": domain_name})
-                total_zones_processed += 1
-                logger.info(f"Audit: Completed zone {total_zones_processed}: '{zone_name}' ({zone_audit.ap_status.total} APs, {zone_audit.wlan_count} WLANs)")
+async def assemble_audit_result(
+    controller: Controller,
+    sz_client: SZClient,
+    discovery: Dict[str, Any],
+    all_zones_audit: List[ZoneAudit]
+) -> SZAuditResult:
+    """
+    Build the SZAuditResult from discovery data and zone audits: domain
+    roll-ups, switch-group-to-zone matching and fleet-wide aggregates.
 
-        except Exception as e:
-            partial_errors.append(f"Failed to get zones for domain {domain_name}: {str(e)}")
+    Args:
+        controller: Controller database record
+        sz_client: Authenticated SmartZone client
+        discovery: Output of discover_controller
+        all_zones_audit: Audited zones
 
-    logger.info(f"Audit: Zone collection complete - {len(all_zones_audit)} zones processed")
+    Returns:
+        SZAuditResult with all audit data
+    """
+    partial_errors = discovery['partial_errors']
+    domains_raw = discovery['domains_raw']
+    all_switches = discovery['all_switches']
+    all_switch_groups = discovery['all_switch_groups']
 
     # Audit domains (pass pre-fetched switches and switch groups)
     domains_audit = []
@@ -1999,8 +2323,8 @@ async def perform_audit(
         controller_name=controller.name,
         host=controller.sz_host,
         timestamp=datetime.utcnow(),
-        cluster_ip=cluster_ip,
-        controller_firmware=controller_firmware,
+        cluster_ip=discovery['cluster_ip'],
+        controller_firmware=discovery['controller_firmware'],
         domains=root_domains,
         zones=all_zones_audit,
         total_domains=len(domains_audit),
@@ -2156,350 +2480,355 @@ async def audit_single_controller(
         )
 
 
-@router.post("/audit/batch", response_model=BatchAuditResponse)
-async def audit_multiple_controllers(
-    request: BatchAuditRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-) -> BatchAuditResponse:
-    """
-    Audit multiple SmartZone controllers in parallel.
+def _failed_audit_result(
+    controller_id: int,
+    error: str,
+    controller_name: Optional[str] = None,
+    host: str = ""
+) -> SZAuditResult:
+    """Empty SZAuditResult carrying an error (batch/fleet audits never raise)."""
+    return SZAuditResult(
+        controller_id=controller_id,
+        controller_name=controller_name or f"Controller {controller_id}",
+        host=host,
+        timestamp=datetime.utcnow(),
+        error=error,
+        domains=[],
+        zones=[],
+        total_domains=0,
+        total_zones=0,
+        total_aps=0,
+        total_wlans=0,
+        total_switches=0,
+        ap_model_summary=[],
+        ap_firmware_summary=[],
+        switch_firmware_summary=[],
+        wlan_type_summary={}
+    )
 
-    Each controller audit is independent - failures don't affect others.
-    Returns results for all requested controllers, with errors noted
-    for any that failed.
+
+def prepare_fleet_audit(
+    controller_ids: List[int],
+    current_user: User,
+    db: Session
+) -> List[Dict[str, Any]]:
     """
-    results = []
-    successful = 0
-    failed = 0
+    Validate access and build SZ clients for a fleet audit up front, so the
+    audit itself needs no database access. iter_fleet_audit closes the
+    clients; callers that may never iterate it call close_fleet_clients.
 
-    async def audit_one(controller_id: int) -> SZAuditResult:
-        """Audit a single controller, catching all exceptions."""
+    Returns:
+        One entry per requested controller: {controller_id, controller,
+        sz_client} or {controller_id, error_result}
+    """
+    prepared = []
+    for controller_id in controller_ids:
         try:
             # Validate access
             controller = validate_controller_access(controller_id, current_user, db)
 
             if controller.controller_type != "SmartZone":
-                return SZAuditResult(
-                    controller_id=controller_id,
-                    controller_name=controller.name,
-                    host=controller.sz_host or "",
-                    timestamp=datetime.utcnow(),
-                    error=f"Not a SmartZone controller: {controller.controller_type}",
-                    domains=[],
-                    zones=[],
-                    total_domains=0,
-                    total_zones=0,
-                    total_aps=0,
-                    total_wlans=0,
-                    total_switches=0,
-                    ap_model_summary=[],
-                    ap_firmware_summary=[],
-                    switch_firmware_summary=[],
-                    wlan_type_summary={}
-                )
-
-            sz_client = create_sz_client_from_controller(controller_id, db)
-
-            async with sz_client:
-                return await perform_audit(controller, sz_client)
+                prepared.append({
+                    'controller_id': controller_id,
+                    'error_result': _failed_audit_result(
+                        controller_id,
+                        f"Not a SmartZone controller: {controller.controller_type}",
+                        controller.name,
+                        controller.sz_host or ""
+                    ),
+                })
+                continue
 
+            prepared.append({
+                'controller_id': controller_id,
+                'controller': controller,
+                'sz_client': create_sz_client_from_controller(controller_id, db),
+            })
         except HTTPException as e:
-            return SZAuditResult(
-                controller_id=controller_id,
-                controller_name=f"Controller {controller_id}",
-                host="",
-                timestamp=datetime.utcnow(),
-                error=e.detail,
-                domains=[],
-                zones=[],
-                total_domains=0,
-                total_zones=0,
-                total_aps=0,
-                total_wlans=0,
-                total_switches=0,
-                ap_model_summary=[],
-                ap_firmware_summary=[],
-                switch_firmware_summary=[],
-                wlan_type_summary={}
-            )
+            prepared.append({
+                'controller_id': controller_id,
+                'error_result': _failed_audit_result(controller_id, e.detail),
+            })
         except Exception as e:
             logger.exception(f"Batch audit failed for controller {controller_id}")
-            return SZAuditResult(
-                controller_id=controller_id,
-                controller_name=f"Controller {controller_id}",
-                host="",
-                timestamp=datetime.utcnow(),
-                error=f"Audit failed: {str(e)}",
-                domains=[],
-                zones=[],
-                total_domains=0,
-                total_zones=0,
-                total_aps=0,
-                total_wlans=0,
-                total_switches=0,
-                ap_model_summary=[],
-                ap_firmware_summary=[],
-                switch_firmware_summary=[],
-                wlan_type_summary={}
+            prepared.append({
+                'controller_id': controller_id,
+                'error_result': _failed_audit_result(controller_id, f"Audit failed: {str(e)}"),
+            })
+    return prepared
+
+
+async def close_fleet_clients(prepared: List[Dict[str, Any]]) -> None:
+    """Close the SZ clients built by prepare_fleet_audit (safe to repeat)."""
+    for entry in prepared:
+        sz_client = entry.get('sz_client')
+        if sz_client is None:
+            continue
+        try:
+            await sz_client.client.aclose()
+        except Exception as e:
+            logger.debug(f"Failed to close SZ client for controller {entry['controller_id']}: {e}")
+
+
+async def iter_fleet_audit(
+    prepared: List[Dict[str, Any]],
+    max_workers: int = FLEET_MAX_WORKERS
+) -> AsyncIterator[tuple[int, SZAuditResult]]:
+    """
+    Audit many controllers as one bounded job, yielding (position, result)
+    for each controller as soon as it finishes.
+
+    Discovery (domains, switches, zone lists) runs per controller; zone
+    audits from every controller go through one FleetZoneScheduler, which
+    caps total concurrency at max_workers and each controller at its own
+    rate budget. Each controller's result is assembled (including
+    switch-group matching) as soon as its last zone finishes.
+    """
+    scheduler = FleetZoneScheduler(max_workers=max_workers)
+    scheduler.start()
+    finished: asyncio.Queue = asyncio.Queue()
+
+    async def audit_one(position: int, entry: Dict[str, Any]):
+        """Audit a single controller, catching all exceptions."""
+        controller_id = entry['controller_id']
+        try:
+            if entry.get('error_result') is not None:
+                result = entry['error_result']
+            else:
+                async with entry['sz_client'] as sz_client:
+                    result = await perform_audit(entry['controller'], sz_client, scheduler)
+        except ValueError as e:
+            result = _failed_audit_result(controller_id, str(e))
+        except Exception as e:
+            logger.exception(f"Batch audit failed for controller {controller_id}")
+            result = _failed_audit_result(controller_id, f"Audit failed: {str(e)}")
+        await finished.put((position, result))
+
+    tasks = [
+        asyncio.create_task(audit_one(position, entry))
+        for position, entry in enumerate(prepared)
+    ]
+    completed = 0
+    try:
+        while completed < len(tasks):
+            position, result = await finished.get()
+            completed += 1
+            logger.info(
+                f"Fleet audit: controller {result.controller_id} finished "
+                f"({completed}/{len(tasks)})"
             )
+            yield position, result
+    finally:
+        if completed < len(tasks):
+            # Consumer went away (client disconnect) - stop everything
+            for task in tasks:
+                task.cancel()
+            await scheduler.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        else:
+            await scheduler.close()
+        # Audits close their own clients; this covers tasks cancelled first
+        await close_fleet_clients(prepared)
 
-    # Run all audits in parallel
-    results = await asyncio.gather(
-        *[audit_one(cid) for cid in request.controller_ids]
-    )
+
+@router.post("/audit/batch", response_model=BatchAuditResponse)
+async def audit_multiple_controllers(
+    request: BatchAuditRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> BatchAuditResponse:
+    """
+    Audit multiple SmartZone controllers in parallel.
+
+    Each controller audit is independent - failures don't affect others.
+    Zone audits from all controllers share one bounded fleet scheduler.
+    Returns results for all requested controllers, with errors noted
+    for any that failed.
+    """
+    prepared = prepare_fleet_audit(request.controller_ids, current_user, db)
+
+    results: List[Optional[SZAuditResult]] = [None] * len(prepared)
+    async for position, result in iter_fleet_audit(prepared):
+        results[position] = result
 
     # Count successes and failures
-    for result in results:
-        if result.error:
-            failed += 1
-        else:
-            successful += 1
+    failed = sum(1 for result in results if result.error)
 
     return BatchAuditResponse(
-        results=list(results),
+        results=results,
         total_requested=len(request.controller_ids),
-        successful=successful,
+        successful=len(results) - failed,
         failed=failed
     )
 
 
-@router.post("/audit/export-csv")
-async def export_audit_csv(
-    request: ExportAuditRequest,
+@router.post("/audit/fleet")
+async def audit_fleet(
+    request: BatchAuditRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ) -> StreamingResponse:
     """
-    Export audit data as CSV with one row per zone.
+    Audit many SmartZone controllers as one bounded fleet job, streaming
+    results as NDJSON.
+
+    One line per controller as soon as it finishes:
+        {"type": "controller", "index": <request position>, "result": SZAuditResult}
+    then a final line:
+        {"type": "summary", "total_requested", "successful", "failed",
+         "elapsed_seconds"}
+    """
+    prepared = prepare_fleet_audit(request.controller_ids, current_user, db)
+
+    async def stream():
+        started = datetime.utcnow()
+        failed = 0
+        fleet = iter_fleet_audit(prepared)
+        async for position, result in fleet:
+            if result.error:
+                failed += 1
+            yield json.dumps({
+                "type": "controller",
+                "index": position,
+                "result": result.model_dump(mode="json"),
+            }) + "\n"
+        yield json.dumps({
+            "type": "summary",
+            "total_requested": len(request.controller_ids),
+            "successful": len(prepared) - failed,
+            "failed": failed,
+            "elapsed_seconds": round((datetime.utcnow() - started).total_seconds(), 1),
+        }) + "\n"
 
-    Columns include: Controller, Domain, Zone, AP counts, AP models,
-    AP firmware, External IPs, WLAN counts, WLAN types, and mapped switch groups.
+    return StreamingResponse(
+        stream(),
+        media_type="application/x-ndjson",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Disable nginx buffering
+        },
+        # The stream may never be iterated (e.g. the client went away first)
+        background=BackgroundTask(close_fleet_clients, prepared)
+    )
 
-    Accepts optional switch_group_mappings to include manually mapped switch groups.
+
+async def _export_rows(
+    request: ExportAuditRequest,
+    current_user: User,
+    db: Session
+) -> tuple[AsyncIterator[List[Any]], BackgroundTask]:
     """
-    # First run the audit
-    batch_request = BatchAuditRequest(controller_ids=request.controller_ids)
-    batch_response = await audit_multiple_controllers(batch_request, current_user, db)
+    Export rows for the requested controllers, one per zone, and the
+    cleanup task for the response (closes the live audits' SZ clients).
 
+    Access checks and SZ client setup happen before the first row, so the
+    stream itself needs no database session. Cached controllers are
+    streamed from the zone cache in request order; the rest are audited
+    live as one fleet job and streamed as each controller finishes.
+    """
     # Build lookup for switch group mappings: controller_id -> {zone_id -> switch_group_id}
     sg_mappings: Dict[int, Dict[str, str]] = {}
     for mapping in request.switch_group_mappings:
         sg_mappings[mapping.controller_id] = mapping.mappings
 
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    headers = [
-        "Controller Name",
-        "Controller Host",
-        "Controller Firmware",
-        "Domain Name",
-        "Zone Name",
-        "Zone ID",
-        # AP counts
-        "APs Total",
-        "APs Online",
-        "APs Offline",
-        "APs Flagged",
-        "AP Groups",
-        # AP models - top 3 + count
-        "AP Model 1",
-        "AP Model 1 Count",
-        "AP Model 2",
-        "AP Model 2 Count",
-        "AP Model 3",
-        "AP Model 3 Count",
-        "AP Models Other",
-        # AP firmware - top 3 + count
-        "AP Firmware 1",
-        "AP Firmware 1 Count",
-        "AP Firmware 2",
-        "AP Firmware 2 Count",
-        "AP Firmware 3",
-        "AP Firmware 3 Count",
-        "AP Firmware Other",
-        # External IPs
-        "External IP Count",
-        "External IPs",
-        # WLANs
-        "WLAN Count",
-        "WLAN Group Count",
-        # WLAN types
-        "WLANs Open",
-        "WLANs WPA2-PSK",
-        "WLANs WPA2-Enterprise",
-        "WLANs WPA3-SAE",
-        "WLANs WPA3-Enterprise",
-        "WLANs DPSK",
-        "WLANs Other",
-        # Switches (domain level)
-        "Domain Switch Count",
-        "Domain Switch Groups",
-        # Mapped Switch Group (from manual mapping)
-        "Mapped Switch Group",
-        "Mapped Switch Group ID",
-        "Mapped Switches Total",
-        "Mapped Switches Online",
-        "Mapped Switches Offline",
-        "Mapped Switch Firmware 1",
-        "Mapped Switch Firmware 1 Count",
-        "Mapped Switch Firmware 2",
-        "Mapped Switch Firmware 2 Count",
-        "Mapped Switch Firmware Other",
-    ]
-    writer.writerow(headers)
-
-    # Write data rows - one per zone
-    for result in batch_response.results:
-        if result.error:
-            # Write error row
-            writer.writerow([
-                result.controller_name,
-                result.host,
-                f"ERROR: {result.error}",
-                "", "", "", "", "", "", "", "",
-                "", "", "", "", "", "", "",
-                "", "", "", "", "", "", "",
-                "", "",
-                "", "",
-                "", "", "", "", "", "", "",
-                "", ""
-            ])
-            continue
+    redis_client = await get_redis_client()
+    cached: List[tuple[Controller, ZoneCacheManager]] = []
+    live_ids: List[int] = []
+    for controller_id in request.controller_ids:
+        if request.use_cache:
+            try:
+                controller = validate_controller_access(controller_id, current_user, db)
+            except HTTPException:
+                live_ids.append(controller_id)  # reported by prepare_fleet_audit
+                continue
+            zone_cache = ZoneCacheManager(redis_client, controller_id)
+            meta = await zone_cache.get_cache_meta()
+            if controller.controller_type == "SmartZone" and meta and meta.get('zone_ids'):
+                cached.append((controller, zone_cache))
+                continue
+        live_ids.append(controller_id)
+    prepared = prepare_fleet_audit(live_ids, current_user, db)
 
-        # Build domain -> switch count mapping
-        domain_switch_counts = {}
-        domain_switch_groups = {}
-        # Build switch group lookup by ID
-        all_switch_groups: Dict[str, SwitchGroupSummary] = {}
-
-        def collect_switch_groups(domains):
-            for domain in domains:
-                domain_switch_counts[domain.domain_id] = domain.total_switches
-                domain_switch_groups[domain.domain_id] = len(domain.switch_groups)
-                for sg in domain.switch_groups:
-                    all_switch_groups[sg.id] = sg
-                if domain.children:
-                    collect_switch_groups(domain.children)
-
-        collect_switch_groups(result.domains)
-
-        # Get manual mappings for this controller
-        controller_mappings = sg_mappings.get(result.controller_id, {})
-
-        for zone in result.zones:
-            # AP models - get top 3
-            ap_models = sorted(
-                zone.ap_model_distribution,
-                key=lambda x: x.count,
-                reverse=True
-            )
-            model_1 = ap_models[0].model if len(ap_models) > 0 else ""
-            model_1_count = ap_models[0].count if len(ap_models) > 0 else ""
-            model_2 = ap_models[1].model if len(ap_models) > 1 else ""
-            model_2_count = ap_models[1].count if len(ap_models) > 1 else ""
-            model_3 = ap_models[2].model if len(ap_models) > 2 else ""
-            model_3_count = ap_models[2].count if len(ap_models) > 2 else ""
-            models_other = sum(m.count for m in ap_models[3:]) if len(ap_models) > 3 else ""
-
-            # AP firmware - get top 3
-            ap_firmware = sorted(
-                zone.ap_firmware_distribution,
-                key=lambda x: x.count,
-                reverse=True
-            )
-            fw_1 = ap_firmware[0].version if len(ap_firmware) > 0 else ""
-            fw_1_count = ap_firmware[0].count if len(ap_firmware) > 0 else ""
-            fw_2 = ap_firmware[1].version if len(ap_firmware) > 1 else ""
-            fw_2_count = ap_firmware[1].count if len(ap_firmware) > 1 else ""
-            fw_3 = ap_firmware[2].version if len(ap_firmware) > 2 else ""
-            fw_3_count = ap_firmware[2].count if len(ap_firmware) > 2 else ""
-            fw_other = sum(f.count for f in ap_firmware[3:]) if len(ap_firmware) > 3 else ""
-
-            # WLAN type counts
-            wlan_types = zone.wlan_type_breakdown
-            wlans_open = wlan_types.get("Open", 0) + wlan_types.get("Open + Portal", 0)
-            wlans_wpa2_psk = wlan_types.get("WPA2-PSK", 0)
-            wlans_wpa2_ent = wlan_types.get("WPA2-Enterprise", 0)
-            wlans_wpa3_sae = wlan_types.get("WPA3-SAE", 0) + wlan_types.get("WPA3", 0)
-            wlans_wpa3_ent = wlan_types.get("WPA3-Enterprise", 0)
-            wlans_dpsk = wlan_types.get("DPSK", 0)
-            # Other = everything else
-            known_types = {"Open", "Open + Portal", "WPA2-PSK", "WPA2-Enterprise",
-                          "WPA3-SAE", "WPA3", "WPA3-Enterprise", "DPSK"}
-            wlans_other = sum(v for k, v in wlan_types.items() if k not in known_types)
-
-            # Get mapped switch group for this zone
-            mapped_sg_id = controller_mappings.get(zone.zone_id, "")
-            mapped_sg = all_switch_groups.get(mapped_sg_id) if mapped_sg_id else None
-
-            row = [
-                result.controller_name,
-                result.host,
-                result.controller_firmware or "",
-                zone.domain_name,
-                zone.zone_name,
-                zone.zone_id,
-                # AP counts
-                zone.ap_status.total,
-                zone.ap_status.online,
-                zone.ap_status.offline,
-                zone.ap_status.flagged,
-                len(zone.ap_groups),
-                # AP models
-                model_1, model_1_count,
-                model_2, model_2_count,
-                model_3, model_3_count,
-                models_other,
-                # AP firmware
-                fw_1, fw_1_count,
-                fw_2, fw_2_count,
-                fw_3, fw_3_count,
-                fw_other,
-                # External IPs
-                len(zone.external_ips),
-                "; ".join(zone.external_ips) if zone.external_ips else "",
-                # WLANs
-                zone.wlan_count,
-                len(zone.wlan_groups),
-                # WLAN types
-                wlans_open or "",
-                wlans_wpa2_psk or "",
-                wlans_wpa2_ent or "",
-                wlans_wpa3_sae or "",
-                wlans_wpa3_ent or "",
-                wlans_dpsk or "",
-                wlans_other or "",
-                # Switches (domain level)
-                domain_switch_counts.get(zone.domain_id, 0) or "",
-                domain_switch_groups.get(zone.domain_id, 0) or "",
-                # Mapped Switch Group
-                mapped_sg.name if mapped_sg else "",
-                mapped_sg_id,
-                mapped_sg.switch_count if mapped_sg else "",
-                mapped_sg.switches_online if mapped_sg else "",
-                mapped_sg.switches_offline if mapped_sg else "",
-                # Mapped Switch Firmware
-                mapped_sg.firmware_versions[0].version if mapped_sg and len(mapped_sg.firmware_versions) > 0 else "",
-                mapped_sg.firmware_versions[0].count if mapped_sg and len(mapped_sg.firmware_versions) > 0 else "",
-                mapped_sg.firmware_versions[1].version if mapped_sg and len(mapped_sg.firmware_versions) > 1 else "",
-                mapped_sg.firmware_versions[1].count if mapped_sg and len(mapped_sg.firmware_versions) > 1 else "",
-                sum(fv.count for fv in mapped_sg.firmware_versions[2:]) if mapped_sg and len(mapped_sg.firmware_versions) > 2 else "",
-            ]
-            writer.writerow(row)
+    logger.info(
+        f"Export: {len(cached)} controllers from cache, {len(prepared)} audited live"
+    )
 
-    # Prepare response
-    output.seek(0)
+    async def rows() -> AsyncIterator[List[Any]]:
+        for controller, zone_cache in cached:
+            async for row in audit_export.cached_zone_rows(
+                zone_cache,
+                controller.name,
+                controller.sz_host or "",
+                sg_mappings.get(controller.id, {})
+            ):
+                yield row
+        if prepared:
+            async for _, result in iter_fleet_audit(prepared):
+                for row in audit_export.result_rows(result, sg_mappings.get(result.controller_id, {})):
+                    yield row
+
+    return rows(), BackgroundTask(close_fleet_clients, prepared)
+
+
+def _export_response(
+    chunks: AsyncIterator[str],
+    media_type: str,
+    extension: str,
+    gzip: bool,
+    background: BackgroundTask
+) -> StreamingResponse:
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    filename = f"sz_audit_{timestamp}.csv"
+    filename = f"sz_audit_{timestamp}.{extension}"
+    body = chunks
+    if gzip:
+        body = audit_export.gzip_chunks(chunks)
+        filename += ".gz"
+        media_type = "application/gzip"
 
     return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
+        body,
+        media_type=media_type,
         headers={
-            "Content-Disposition": f"attachment; filename={filename}"
-        }
+            "Content-Disposition": f"attachment; filename={filename}",
+            "X-Accel-Buffering": "no"  # Disable nginx buffering
+        },
+        background=background
+    )
+
+
+@router.post("/audit/export-csv")
+async def export_audit_csv(
+    request: ExportAuditRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Export audit data as CSV with one row per zone.
+
+    Columns include: Controller, Domain, Zone, AP counts, AP models,
+    AP firmware, External IPs, WLAN counts, WLAN types, and mapped switch groups.
+
+    Accepts optional switch_group_mappings to include manually mapped switch groups.
+    Controllers are audited live and their rows streamed as each finishes.
+    With use_cache, controllers with a cached audit are exported from the
+    zone cache a chunk of zones at a time instead.
+    Set gzip to receive a .csv.gz stream.
+    """
+    rows, cleanup = await _export_rows(request, current_user, db)
+    return _export_response(audit_export.csv_chunks(rows), "text/csv", "csv", request.gzip, cleanup)
+
+
+@router.post("/audit/export-ndjson")
+async def export_audit_ndjson(
+    request: ExportAuditRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Export the same rows as /audit/export-csv as NDJSON: one JSON object
+    per zone, keyed by the CSV column names.
+    """
+    rows, cleanup = await _export_rows(request, current_user, db)
+    return _export_response(
+        audit_export.ndjson_chunks(rows), "application/x-ndjson", "ndjson", request.gzip, cleanup
     )
@@ -0,0 +1,167 @@
+"""
+Fleet Zone Scheduler
+
+Schedules zone audits from many SmartZone controllers through one bounded
+worker pool.
+
+Batch audits used to run one independent audit per controller, each walking
+its zones on its own, so a fleet audit was N unbounded jobs racing each
+other. Instead every controller submits its zones here:
+
+- A single pool of `max_workers` workers bounds the whole fleet job.
+- Each controller has its own concurrency budget (from its SZClient rate
+  limit), so no controller is driven past its own API budget even when the
+  pool has idle workers.
+- Workers always pick the controller with the most outstanding work per
+  unit of budget (its estimated time to finish), so large controllers
+  start early and the fleet finishes together instead of one big
+  controller running alone at the end. Zones within a controller run in
+  submission order.
+
+Usage:
+    scheduler = FleetZoneScheduler(max_workers=32)
+    scheduler.add_controller("ctl-1", budget=12)
+    scheduler.start()
+    result = await scheduler.submit("ctl-1", lambda: audit_zone(...))
+    ...
+    await scheduler.close()
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FLEET_MAX_WORKERS = int(os.getenv("SZ_FLEET_MAX_WORKERS", "32"))
+
+ZoneJob = Callable[[], Awaitable[Any]]
+
+
+class _ControllerQueue:
+    __slots__ = ("key", "budget", "pending", "in_flight", "completed")
+
+    def __init__(self, key: str, budget: int):
+        self.key = key
+        self.budget = max(1, budget)
+        self.pending: Deque[Tuple[ZoneJob, asyncio.Future]] = deque()
+        self.in_flight = 0
+        self.completed = 0
+
+    @property
+    def load(self) -> float:
+        """Outstanding work per unit of budget - the controller's time to finish."""
+        return (len(self.pending) + self.in_flight) / self.budget
+
+
+class FleetZoneScheduler:
+    """Global, budget-aware zone work queue across controllers."""
+
+    def __init__(self, max_workers: int = FLEET_MAX_WORKERS):
+        self.max_workers = max(1, max_workers)
+        self._controllers: Dict[str, _ControllerQueue] = {}
+        self._cond = asyncio.Condition()
+        self._workers: List[asyncio.Task] = []
+        self._closed = False
+
+    def add_controller(self, key: str, budget: int) -> None:
+        """Register a controller and its concurrent zone budget."""
+        if key not in self._controllers:
+            self._controllers[key] = _ControllerQueue(key, budget)
+
+    def start(self) -> None:
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self.max_workers)
+            ]
+
+    async def submit(self, key: str, job: ZoneJob) -> Any:
+        """Queue a zone job for a controller and wait for its result."""
+        future = asyncio.get_running_loop().create_future()
+        async with self._cond:
+            self._controllers[key].pending.append((job, future))
+            self._cond.notify()
+        return await future
+
+    async def close(self) -> None:
+        """Let workers drain outstanding jobs, then stop them."""
+        async with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+
+    async def cancel(self) -> None:
+        """Stop workers and fail anything not yet started."""
+        for task in self._workers:
+            task.cancel()
+        for ctl in self._controllers.values():
+            while ctl.pending:
+                _, future = ctl.pending.popleft()
+                if not future.done():
+                    future.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "controllers": {
+                key: {
+                    "budget": ctl.budget,
+                    "pending": len(ctl.pending),
+                    "in_flight": ctl.in_flight,
+                    "completed": ctl.completed,
+                }
+                for key, ctl in self._controllers.items()
+            },
+        }
+
+    # ----- internals -----
+
+    def _pick(self) -> Optional[_ControllerQueue]:
+        """Controller with free budget and the highest load (O(controllers))."""
+        best = None
+        for ctl in self._controllers.values():
+            if not ctl.pending or ctl.in_flight >= ctl.budget:
+                continue
+            if best is None or ctl.load > best.load:
+                best = ctl
+        return best
+
+    def _idle(self) -> bool:
+        return all(not ctl.pending for ctl in self._controllers.values())
+
+    async def _worker(self) -> None:
+        while True:
+            async with self._cond:
+                while True:
+                    ctl = self._pick()
+                    if ctl is not None:
+                        break
+                    if self._closed and self._idle():
+                        return
+                    await self._cond.wait()
+                job, future = ctl.pending.popleft()
+                ctl.in_flight += 1
+
+            try:
+                if not future.cancelled():
+                    try:
+                        result = await job()
+                        if not future.done():
+                            future.set_result(result)
+                    except asyncio.CancelledError:
+                        if not future.done():
+                            future.cancel()
+                        raise
+                    except Exception as e:
+                        if not future.done():
+                            future.set_exception(e)
+            finally:
+                async with self._cond:
+                    ctl.in_flight -= 1
+                    ctl.completed += 1
+                    # Budget freed (and possibly the last job done)
+                    self._cond.notify_all()
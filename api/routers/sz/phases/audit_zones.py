@@ -3,14 +3,28 @@ Audit Zones Phase
 
 Audits each zone to collect AP, WLAN, and group information.
 Supports zone-level caching for incremental audits.
+
+Zones are audited concurrently by a worker pool sized from the controller's
+SZClient rate limit (the token bucket does the actual throttling). Progress
+and cancellation checks are coalesced rather than issued per zone.
+
+When the job has an AuditCheckpoint, every zone written to the cache is
+checkpointed, and a resumed run of the job loads checkpointed zones from
+the cache instead of auditing them again.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
+import os
+import time
 from collections import Counter
+from datetime import datetime
 from typing import Dict, Any, List, Optional
 
 from workflow.v2.models import Task, TaskStatus
+from szapi.client import rate_budget_concurrency
 from szapi.services.wlans import WlanService
 from schemas.sz_audit import (
     ZoneAudit,
@@ -25,6 +39,29 @@ from routers.sz.zone_cache import RefreshMode
 
 logger = logging.getLogger(__name__)
 
+# Zone-level fan-out. A zone audit is a few sequential list calls plus a
+# burst of WLAN detail calls, so one worker uses only a slice of the
+# SZClient rate budget; size the pool so the workers together can fill it.
+REQUESTS_PER_ZONE_WORKER = 8    # req/s one zone worker sustains, roughly
+MAX_ZONE_WORKERS = 16
+ZONE_WORKERS_OVERRIDE = int(os.getenv("SZ_AUDIT_ZONE_WORKERS", "0"))
+
+PROGRESS_FLUSH_INTERVAL = 2.0   # seconds between coalesced job saves
+CANCEL_CHECK_INTERVAL = 2.0     # seconds between Redis cancellation checks
+CACHE_WRITE_BATCH = 25          # audited zones per pipelined cache write
+
+# Incremental mode re-audits a cached zone older than this even if its
+# fingerprint matches: the fingerprint can't see per-AP firmware, models or
+# external IPs, or WLAN settings missing from the WLAN list
+INCREMENTAL_MAX_ZONE_AGE_SECONDS = int(os.getenv("SZ_AUDIT_INCREMENTAL_MAX_AGE_HOURS", "24")) * 60 * 60
+
+
+def zone_worker_count(sz_client) -> int:
+    """Number of concurrent zone audits for a controller, from its rate budget."""
+    if ZONE_WORKERS_OVERRIDE > 0:
+        return ZONE_WORKERS_OVERRIDE
+    return rate_budget_concurrency(sz_client, REQUESTS_PER_ZONE_WORKER, MAX_ZONE_WORKERS)
+
 
 async def execute(context: Dict[str, Any]) -> List[Task]:
     """
@@ -32,7 +69,9 @@ async def execute(context: Dict[str, Any]) -> List[Task]:
 
     Supports caching modes:
     - full: Refresh all zones, update cache
-    - incremental: Use cached zones if fresh, only audit new/stale zones
+    - incremental: Use cached zones whose change fingerprint is unchanged
+      and that are younger than INCREMENTAL_MAX_ZONE_AGE_SECONDS, only
+      audit new/changed/aged zones
     - cached_only: Return only cached data, no API calls
 
     Args:
@@ -54,6 +93,7 @@ async def execute(context: Dict[str, Any]) -> List[Task]:
     job = context.get('job')
     state_manager = context.get('state_manager')
     job_id = context.get('job_id')
+    checkpoint = context.get('checkpoint')  # AuditCheckpoint (resumable jobs)
 
     # Helper to check if job has been cancelled
     async def is_cancelled() -> bool:
@@ -90,30 +130,39 @@ async def execute(context: Dict[str, Any]) -> List[Task]:
     # Cache statistics
     zones_from_cache = 0
     zones_refreshed = 0
+    zones_resumed = 0  # Completed by an earlier run of this job
 
     # Zone progress tracking
     total_zones_expected = 0  # Set when we know how many zones to process
 
-    # Helper to update zone progress in job summary (for progress bar)
-    async def update_zone_progress(completed: int, total: int):
-        if job and state_manager:
-            job.summary['zone_progress'] = {
+    # Helper to record zone progress on the job (for progress bar). The
+    # status endpoint reads it from options; summary is kept for consumers
+    # of the job record.
+    def set_zone_progress(completed: int, total: int):
+        if job:
+            zone_progress = {
                 'completed': completed,
                 'total': total
             }
-            await state_manager.save_job(job)
+            job.summary['zone_progress'] = zone_progress
+            job.options['zone_progress'] = zone_progress
 
-    # Helper to update cache stats in job summary
-    async def update_cache_stats():
-        if job and state_manager:
+    # Helper to record cache stats in job summary
+    def set_cache_stats():
+        if job:
             total = zones_from_cache + zones_refreshed
             hit_rate = (zones_from_cache / total * 100) if total > 0 else 0
             job.summary['cache_stats'] = {
                 'refresh_mode': refresh_mode.value if hasattr(refresh_mode, 'value') else str(refresh_mode),
                 'zones_from_cache': zones_from_cache,
                 'zones_refreshed': zones_refreshed,
+                'zones_resumed': zones_resumed,
                 'cache_hit_rate': round(hit_rate, 1)
             }
+
+    async def update_cache_stats():
+        if job and state_manager:
+            set_cache_stats()
             await state_manager.save_job(job)
 
     # Handle cached_only and switches_only modes - use cached zone data
@@ -131,6 +180,7 @@ async def execute(context: Dict[str, Any]) -> List[Task]:
             for zone_id, zone_data in cached_zones.items():
                 # Remove cache metadata before returning
                 zone_data.pop('_cached_at', None)
+                zone_data.pop('_fingerprint', None)
                 # For switches_only mode, clear cached switch matches so they're re-computed
                 if refresh_mode == RefreshMode.SWITCHES_ONLY:
                     zone_data.pop('matched_switch_groups', None)
@@ -159,7 +209,8 @@ async def execute(context: Dict[str, Any]) -> List[Task]:
         )
         return [task]
 
-    # For incremental mode, pre-fetch all cached zones to check freshness
+    # For incremental mode, pre-fetch cached zone summaries (fingerprints);
+    # zone bodies are only read for zones verified unchanged
     cached_zone_data = {}
     if refresh_mode == RefreshMode.INCREMENTAL and zone_cache:
         logger.info("Audit: incremental mode - checking for cached zones")
@@ -168,233 +219,273 @@ async def execute(context: Dict[str, Any]) -> List[Task]:
 
         cache_meta = await zone_cache.get_cache_meta()
         if cache_meta and cache_meta.get('zone_ids'):
-            cached_zone_data = await zone_cache.get_cached_zones(cache_meta['zone_ids'])
+            cached_zone_data = await zone_cache.get_zone_summaries(cache_meta['zone_ids'])
             logger.info(f"Audit: Found {len(cached_zone_data)} zones in cache")
 
+    # Zones this job already audited before it was interrupted
+    resumed_zone_ids = set()
+    if checkpoint and zone_cache:
+        resumed_zone_ids = await checkpoint.completed_zones()
+        if resumed_zone_ids:
+            logger.info(f"Audit: Resuming - {len(resumed_zone_ids)} zones already completed by this job")
+
     # Track if audit was cancelled (for cache metadata update)
     was_cancelled = False
+    last_cancel_check = 0.0
 
-    # Check if we have prefetched zones (from fallback in initialize phase)
-    if prefetched_zones:
-        total_zones_expected = len(prefetched_zones)
-        logger.info(f"Audit: Using {total_zones_expected} prefetched zones (fallback mode)")
-        await update_zone_progress(0, total_zones_expected)
-        if update_activity:
-            await update_activity(f"Auditing {total_zones_expected} zones...")
+    async def check_cancelled() -> bool:
+        """Cancellation check for the worker pool, hitting Redis at most every CANCEL_CHECK_INTERVAL."""
+        nonlocal was_cancelled, last_cancel_check
+        if checkpoint:
+            checkpoint.ensure_held()  # Another worker may own the job now
+        if was_cancelled:
+            return True
+        now = time.monotonic()
+        if now - last_cancel_check < CANCEL_CHECK_INTERVAL:
+            return False
+        last_cancel_check = now
+        if await is_cancelled():
+            logger.info("Audit: Cancellation detected, stopping zone processing")
+            partial_errors.append("Audit cancelled by user")
+            was_cancelled = True
+        return was_cancelled
+
+    # Progress is coalesced: workers record it in memory and the job is
+    # saved at most every PROGRESS_FLUSH_INTERVAL (one save carries the
+    # zone counter, cache stats and latest activity message)
+    latest_activity: Optional[str] = None
+    last_flush = 0.0
+
+    async def flush_progress(force: bool = False):
+        nonlocal last_flush, latest_activity
+        if checkpoint:
+            checkpoint.ensure_held()
+        now = time.monotonic()
+        if not force and now - last_flush < PROGRESS_FLUSH_INTERVAL:
+            return
+        last_flush = now
+        # Bound the work a restart can lose to one flush interval
+        if checkpoint:
+            await flush_cache_writes()
+        set_zone_progress(total_zones_processed, total_zones_expected)
+        set_cache_stats()
+        if update_activity and latest_activity:
+            message, latest_activity = latest_activity, None
+            await update_activity(message)  # saves the job
+        elif job and state_manager:
+            await state_manager.save_job(job)
 
-        for zone in prefetched_zones:
-            # Check for cancellation
-            if await is_cancelled():
-                logger.info("Audit: Cancellation detected, stopping zone processing")
-                partial_errors.append("Audit cancelled by user")
-                was_cancelled = True
-                break
+    # Zones are audited by a pool of workers in discovery order; results go
+    # into per-zone slots so all_zones_audit keeps that order
+    zone_slots: List[Optional[Dict[str, Any]]] = []
+    zone_queue: asyncio.Queue = asyncio.Queue()
+
+    # Audited zones are cached in pipelined batches rather than one
+    # round trip per zone; a zone is checkpointed only once it is cached
+    pending_cache_writes: Dict[str, Dict[str, Any]] = {}
+    pending_checkpoint_ids: List[str] = []
+
+    async def flush_cache_writes():
+        nonlocal pending_cache_writes, pending_checkpoint_ids
+        if zone_cache and pending_cache_writes:
+            batch, pending_cache_writes = pending_cache_writes, {}
+            await zone_cache.cache_zones_bulk(batch)
+            pending_checkpoint_ids.extend(batch)
+        if checkpoint and pending_checkpoint_ids:
+            done, pending_checkpoint_ids = pending_checkpoint_ids, []
+            await checkpoint.add_zones(done)
+
+    def enqueue_zone(zone: Dict[str, Any], domain_id: str, domain_name: str):
+        zone_id = zone.get("id")
+        zone_name = zone.get("name", "")
+
+        # Skip system zones
+        if zone_name.lower() == "staging zone":
+            logger.debug(f"Skipping system zone: {zone_name}")
+            return
+
+        # Skip duplicates
+        if zone_id in seen_zone_ids:
+            return
+
+        seen_zone_ids.add(zone_id)
+
+        # Incremental mode: a cached zone is re-used only if its change
+        # fingerprint still matches (checked by a worker; entries cached
+        # without a fingerprint, or too long ago, are treated as changed)
+        cached_fingerprint = None
+        if refresh_mode == RefreshMode.INCREMENTAL and zone_id in cached_zone_data and zone_id not in force_refresh_zones:
+            cached_fingerprint = cached_zone_data[zone_id].get('fingerprint')
+            if not cached_fingerprint:
+                logger.debug(f"Audit: Cached zone '{zone_name}' has no fingerprint - re-auditing")
+            elif _cache_age_seconds(cached_zone_data[zone_id].get('cached_at')) > INCREMENTAL_MAX_ZONE_AGE_SECONDS:
+                logger.debug(f"Audit: Cached zone '{zone_name}' is past the incremental max age - re-auditing")
+                cached_fingerprint = None
+
+        # Check if this is a force-refresh zone
+        if zone_id in force_refresh_zones:
+            logger.info(f"Audit: Force-refreshing zone '{zone_name}' (user requested)")
+
+        zone_slots.append(None)
+        zone_queue.put_nowait((
+            len(zone_slots) - 1, zone, domain_id, domain_name, cached_fingerprint,
+            zone_id in resumed_zone_ids
+        ))
+
+    async def zone_worker():
+        nonlocal zones_refreshed, zones_from_cache, zones_resumed, total_zones_processed, latest_activity
+        while True:
+            item = await zone_queue.get()
+            if item is None:
+                return
+            slot, zone, domain_id, domain_name, cached_fingerprint, resumed = item
+            if await check_cancelled():
+                continue  # Drain remaining zones without auditing them
 
             zone_id = zone.get("id")
             zone_name = zone.get("name", "")
 
-            # Skip system zones
-            if zone_name.lower() == "staging zone":
-                logger.debug(f"Skipping system zone: {zone_name}")
-                continue
-
-            # Skip duplicates
-            if zone_id in seen_zone_ids:
-                continue
-
-            seen_zone_ids.add(zone_id)
-
-            # Use domain info from zone if available, otherwise use placeholder
-            domain_id = zone.get("domainId") or "_prefetched_"
-            domain_name = zone.get("domainName") or "Accessible Domain"
-
-            # Check cache for incremental mode (unless zone is in force_refresh list)
-            if refresh_mode == RefreshMode.INCREMENTAL and zone_id in cached_zone_data and zone_id not in force_refresh_zones:
-                cached = cached_zone_data[zone_id]
-                cached.pop('_cached_at', None)  # Remove cache metadata
-                all_zones_audit.append(cached)
-                zones_from_cache += 1
-                total_zones_processed += 1
+            if resumed:
+                cached = await zone_cache.get_cached_zone(zone_id)
+                if cached is not None:
+                    cached.pop('_cached_at', None)  # Remove cache metadata
+                    cached.pop('_fingerprint', None)
+                    zone_slots[slot] = cached
+                    zones_resumed += 1
+                    total_zones_processed += 1
+                    latest_activity = f"Zone {total_zones_processed}/{total_zones_expected}: {zone_name} (resumed)"
+                    await flush_progress()
+                    continue
+                logger.info(f"Audit: Checkpointed zone '{zone_name}' is no longer cached - re-auditing")
+
+            if cached_fingerprint:
+                fingerprint = await _fetch_zone_fingerprint(sz_client, zone_id)
+                cached = None
+                if fingerprint and fingerprint == cached_fingerprint:
+                    cached = await zone_cache.get_cached_zone(zone_id)
+                if cached is not None:
+                    cached.pop('_cached_at', None)  # Remove cache metadata
+                    cached.pop('_fingerprint', None)
+                    zone_slots[slot] = cached
+                    pending_checkpoint_ids.append(zone_id)
+                    zones_from_cache += 1
+                    total_zones_processed += 1
+                    latest_activity = f"Zone {total_zones_processed}/{total_zones_expected}: {zone_name} (unchanged)"
+                    logger.debug(f"Audit: Zone '{zone_name}' fingerprint unchanged - using cached data")
+                    if len(pending_checkpoint_ids) >= CACHE_WRITE_BATCH:
+                        await flush_cache_writes()
+                    await flush_progress()
+                    continue
+                logger.info(f"Audit: Zone '{zone_name}' changed since last audit - re-auditing")
 
-                if update_activity:
-                    await update_activity(
-                        f"Zone {total_zones_processed}/{len(prefetched_zones)}: {zone_name} (cached)"
-                    )
-                logger.debug(f"Audit: Using cached data for zone '{zone_name}'")
+            try:
+                zone_audit, zone_errors, fingerprint = await _audit_zone(
+                    sz_client, zone, domain_id, domain_name
+                )
+            except Exception as e:
+                partial_errors.append(f"Zone {zone_name}: Audit failed: {str(e)}")
                 continue
 
-            # Check if this is a force-refresh zone
-            is_force_refresh = zone_id in force_refresh_zones
-            if is_force_refresh:
-                logger.info(f"Audit: Force-refreshing zone '{zone_name}' (user requested)")
-
-            # Update progress before auditing
-            if update_activity:
-                suffix = " (force refresh)" if is_force_refresh else ""
-                await update_activity(f"Auditing zone {total_zones_processed + 1}/{len(prefetched_zones)}: {zone_name}{suffix}")
-
-            # Audit this zone
-            zone_audit, zone_errors = await _audit_zone(
-                sz_client, zone, domain_id, domain_name
-            )
             zone_audit_dict = zone_audit.model_dump()
-            all_zones_audit.append(zone_audit_dict)
+            zone_slots[slot] = zone_audit_dict
             partial_errors.extend(zone_errors)
             zones_refreshed += 1
 
             # Cache the zone data
             if zone_cache:
-                await zone_cache.cache_zone(zone_id, zone_audit_dict.copy())
+                cache_entry = zone_audit_dict.copy()
+                if fingerprint:
+                    cache_entry['_fingerprint'] = fingerprint
+                pending_cache_writes[zone_id] = cache_entry
+                if len(pending_cache_writes) >= CACHE_WRITE_BATCH:
+                    await flush_cache_writes()
 
             total_zones_processed += 1
-
-            # Update with result summary
-            if update_activity:
-                await update_activity(
-                    f"Zone {total_zones_processed}/{len(prefetched_zones)}: {zone_name} - "
-                    f"{zone_audit.ap_status.total} APs, {zone_audit.wlan_count} WLANs"
-                )
-
+            latest_activity = (
+                f"Zone {total_zones_processed}/{total_zones_expected}: {zone_name} - "
+                f"{zone_audit.ap_status.total} APs, {zone_audit.wlan_count} WLANs"
+            )
             logger.info(
                 f"Audit: Completed zone {total_zones_processed}: '{zone_name}' "
                 f"({zone_audit.ap_status.total} APs, {zone_audit.wlan_count} WLANs)"
             )
+            await flush_progress()
 
-            # Update progress after each zone
-            await update_zone_progress(total_zones_processed, total_zones_expected)
-
-            # Update cache stats periodically
-            if total_zones_processed % 10 == 0:
-                await update_cache_stats()
-    else:
-        # Normal path: fetch zones per domain
-        logger.info(f"Audit: Starting zone collection across {len(domains_raw)} domains")
+    worker_count = zone_worker_count(sz_client)
+    workers = [asyncio.create_task(zone_worker()) for _ in range(worker_count)]
+    logger.info(f"Audit: Auditing zones with {worker_count} concurrent workers")
 
-        if update_activity:
-            await update_activity("Discovering zones...")
-
-        # For normal path, we'll track zones as we discover them
-        zones_discovered = 0
-        await update_zone_progress(0, 0)
-
-        cancelled = False
-        for domain in domains_raw:
-            if cancelled:
-                break
-
-            # Check for cancellation before each domain
-            if await is_cancelled():
-                logger.info("Audit: Cancellation detected, stopping domain processing")
-                partial_errors.append("Audit cancelled by user")
-                was_cancelled = True
-                break
-
-            domain_id = domain.get("id")
-            domain_name = domain.get("name", "Unknown")
+    try:
+        # Check if we have prefetched zones (from fallback in initialize phase)
+        if prefetched_zones:
+            total_zones_expected = len(prefetched_zones)
+            logger.info(f"Audit: Using {total_zones_expected} prefetched zones (fallback mode)")
+            latest_activity = f"Auditing {total_zones_expected} zones..."
+            await flush_progress(force=True)
+
+            for zone in prefetched_zones:
+                if await check_cancelled():
+                    break
+                # Use domain info from zone if available, otherwise use placeholder
+                domain_id = zone.get("domainId") or "_prefetched_"
+                domain_name = zone.get("domainName") or "Accessible Domain"
+                enqueue_zone(zone, domain_id, domain_name)
+        else:
+            # Normal path: fetch zones per domain; workers start on each
+            # domain's zones while later domains are still being listed
+            logger.info(f"Audit: Starting zone collection across {len(domains_raw)} domains")
+            latest_activity = "Discovering zones..."
+            await flush_progress(force=True)
+
+            for domain in domains_raw:
+                # Check for cancellation before each domain
+                if await check_cancelled():
+                    break
+
+                domain_id = domain.get("id")
+                domain_name = domain.get("name", "Unknown")
+
+                try:
+                    zones = await sz_client.zones.get_zones(domain_id=domain_id)
+                except Exception as e:
+                    partial_errors.append(f"Failed to get zones for domain {domain_name}: {str(e)}")
+                    continue
 
-            try:
-                zones = await sz_client.zones.get_zones(domain_id=domain_id)
                 # Update discovered count (excluding system zones)
-                non_system_zones = [z for z in zones if z.get("name", "").lower() != "staging zone"]
-                zones_discovered += len(non_system_zones)
-                await update_zone_progress(total_zones_processed, zones_discovered)
-
+                total_zones_expected += sum(
+                    1 for z in zones if z.get("name", "").lower() != "staging zone"
+                )
                 for zone in zones:
-                    # Check for cancellation before each zone
-                    if await is_cancelled():
-                        logger.info("Audit: Cancellation detected, stopping zone processing")
-                        partial_errors.append("Audit cancelled by user")
-                        cancelled = True
-                        was_cancelled = True
-                        break
-
-                    zone_id = zone.get("id")
-                    zone_name = zone.get("name", "")
-
-                    # Skip system zones
-                    if zone_name.lower() == "staging zone":
-                        logger.debug(f"Skipping system zone: {zone_name}")
-                        continue
-
-                    # Skip duplicates
-                    if zone_id in seen_zone_ids:
-                        continue
-
-                    seen_zone_ids.add(zone_id)
-
-                    # Check cache for incremental mode (unless zone is in force_refresh list)
-                    if refresh_mode == RefreshMode.INCREMENTAL and zone_id in cached_zone_data and zone_id not in force_refresh_zones:
-                        cached = cached_zone_data[zone_id]
-                        cached.pop('_cached_at', None)  # Remove cache metadata
-                        all_zones_audit.append(cached)
-                        zones_from_cache += 1
-                        total_zones_processed += 1
-
-                        if update_activity:
-                            await update_activity(
-                                f"Zone {total_zones_processed}: {zone_name} (cached)"
-                            )
-                        logger.debug(f"Audit: Using cached data for zone '{zone_name}'")
-                        continue
-
-                    # Check if this is a force-refresh zone
-                    is_force_refresh = zone_id in force_refresh_zones
-                    if is_force_refresh:
-                        logger.info(f"Audit: Force-refreshing zone '{zone_name}' (user requested)")
-
-                    # Update progress before auditing
-                    if update_activity:
-                        suffix = " (force refresh)" if is_force_refresh else ""
-                        await update_activity(f"Auditing zone {total_zones_processed + 1}: {zone_name}{suffix}")
-
-                    # Audit this zone
-                    zone_audit, zone_errors = await _audit_zone(
-                        sz_client, zone, domain_id, domain_name
-                    )
-                    zone_audit_dict = zone_audit.model_dump()
-                    all_zones_audit.append(zone_audit_dict)
-                    partial_errors.extend(zone_errors)
-                    zones_refreshed += 1
-
-                    # Cache the zone data
-                    if zone_cache:
-                        await zone_cache.cache_zone(zone_id, zone_audit_dict.copy())
+                    enqueue_zone(zone, domain_id, domain_name)
+                await flush_progress()
 
-                    total_zones_processed += 1
-
-                    # Update with result summary
-                    if update_activity:
-                        await update_activity(
-                            f"Zone {total_zones_processed}: {zone_name} - "
-                            f"{zone_audit.ap_status.total} APs, {zone_audit.wlan_count} WLANs"
-                        )
-
-                    logger.info(
-                        f"Audit: Completed zone {total_zones_processed}: '{zone_name}' "
-                        f"({zone_audit.ap_status.total} APs, {zone_audit.wlan_count} WLANs)"
-                    )
-
-                    # Update progress after each zone
-                    await update_zone_progress(total_zones_processed, zones_discovered)
-
-                    # Update cache stats periodically
-                    if total_zones_processed % 10 == 0:
-                        await update_cache_stats()
+        for _ in workers:
+            zone_queue.put_nowait(None)
+        await asyncio.gather(*workers)
+    finally:
+        for worker in workers:
+            if not worker.done():
+                worker.cancel()
 
-            except Exception as e:
-                partial_errors.append(f"Failed to get zones for domain {domain_name}: {str(e)}")
+    all_zones_audit = [z for z in zone_slots if z is not None]
+    await flush_cache_writes()
+    await flush_progress(force=True)
 
     logger.info(f"Audit: Zone collection complete - {len(all_zones_audit)} zones processed")
-    logger.info(f"Audit: Cache stats - {zones_from_cache} from cache, {zones_refreshed} refreshed")
+    logger.info(
+        f"Audit: Cache stats - {zones_from_cache} from cache, {zones_refreshed} refreshed, "
+        f"{zones_resumed} resumed"
+    )
 
     # Update cache metadata
     # Mark as partial if incremental mode OR if cancelled (to preserve existing cached zones)
-    if zone_cache and zones_refreshed > 0:
+    if zone_cache and (zones_refreshed or zones_resumed):
         zone_ids = [z.get('zone_id') for z in all_zones_audit if z.get('zone_id')]
         is_partial = (refresh_mode == RefreshMode.INCREMENTAL) or was_cancelled
         await zone_cache.update_cache_meta(
             zone_ids=zone_ids,
-            partial=is_partial
+            partial=is_partial,
+            controller_firmware=init_data.get('controller_firmware')
         )
         if was_cancelled:
             logger.info(f"Audit cancelled - cached {zones_refreshed} zones that completed")
@@ -413,7 +504,8 @@ async def execute(context: Dict[str, Any]) -> List[Task]:
             'partial_errors': partial_errors,
             'cache_stats': {
                 'zones_from_cache': zones_from_cache,
-                'zones_refreshed': zones_refreshed
+                'zones_refreshed': zones_refreshed,
+                'zones_resumed': zones_resumed
             }
         }
     )
@@ -421,17 +513,116 @@ async def execute(context: Dict[str, Any]) -> List[Task]:
     return [task]
 
 
+def _cache_age_seconds(cached_at: Optional[str]) -> float:
+    """Age of a cache entry from its cached_at (infinite if unknown)."""
+    if not cached_at:
+        return float("inf")
+    try:
+        return (datetime.utcnow() - datetime.fromisoformat(cached_at)).total_seconds()
+    except (TypeError, ValueError):
+        return float("inf")
+
+
+def _zone_fingerprint(
+    zone_details: Dict[str, Any],
+    ap_total: int,
+    ap_online: int,
+    wlans: List[Dict[str, Any]],
+    ap_groups: List[Dict[str, Any]],
+    wlan_groups: List[Dict[str, Any]]
+) -> str:
+    """
+    Change fingerprint for a zone.
+
+    Covers the zone's own configuration (including its AP firmware version),
+    the AP total and online counts, the WLAN list entries as SZ returns
+    them (including any auth/encryption fields listed there), and AP group /
+    WLAN group membership by ID and name. A full audit and
+    _fetch_zone_fingerprint must feed it the same inputs. Per-AP firmware,
+    models and external IPs are not covered; INCREMENTAL_MAX_ZONE_AGE_SECONDS
+    bounds how long those can go stale.
+    """
+    def members(items):
+        return sorted((i.get("id", ""), i.get("name", "")) for i in items)
+
+    material = {
+        "zone": zone_details,
+        "ap_total": ap_total,
+        "ap_online": ap_online,
+        "wlans": sorted(json.dumps(w, sort_keys=True, default=str) for w in wlans),
+        "ap_groups": members(ap_groups),
+        "wlan_groups": members(wlan_groups),
+    }
+    encoded = json.dumps(material, sort_keys=True, default=str).encode()
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def _ap_total(aps_result: Any) -> int:
+    """AP count from a get_aps_by_zone response (totalCount when present)."""
+    if isinstance(aps_result, dict):
+        total = aps_result.get("totalCount")
+        if isinstance(total, int):
+            return total
+        return len(aps_result.get("list", []))
+    return len(aps_result or [])
+
+
+async def _fetch_zone_fingerprint(sz_client, zone_id: str) -> Optional[str]:
+    """
+    Take a zone's fingerprint with lightweight calls: zone details, one-row
+    AP queries (for the total and online totalCount) and the WLAN / group
+    lists, instead of the full AP list and one detail call per WLAN.
+
+    Returns None if any call fails (caller re-audits the zone).
+    """
+    try:
+        zone_details, aps_result, ap_online, wlans, ap_groups, wlan_groups = await asyncio.gather(
+            sz_client.zones.get_zone_details(zone_id),
+            sz_client.aps.get_aps_by_zone(zone_id, limit=1),
+            sz_client.aps.count_aps_by_zone(zone_id, status="Online"),
+            sz_client.wlans.get_wlans_by_zone(zone_id),
+            sz_client.apgroups.get_ap_groups_by_zone(zone_id),
+            sz_client.wlans.get_wlan_groups_by_zone(zone_id),
+        )
+    except Exception as e:
+        logger.debug(f"Fingerprint for zone {zone_id} failed: {e}")
+        return None
+    return _zone_fingerprint(
+        zone_details, _ap_total(aps_result), ap_online, wlans, ap_groups, wlan_groups
+    )
+
+
 async def _audit_zone(
     sz_client,
     zone: Dict[str, Any],
     domain_id: str,
     domain_name: str
-) -> tuple[ZoneAudit, List[str]]:
-    """Audit a single zone and return ZoneAudit data."""
+) -> tuple[ZoneAudit, List[str], Optional[str]]:
+    """
+    Audit a single zone.
+
+    Returns:
+        (ZoneAudit, partial errors, change fingerprint). The fingerprint is
+        None if any part of the audit failed, so the zone is re-audited next
+        time rather than trusted from cache.
+    """
     zone_id = zone.get("id")
     zone_name = zone.get("name", "Unknown")
     partial_errors = []
 
+    # Zone configuration and the online AP count feed the change
+    # fingerprint; the count comes from the same query
+    # _fetch_zone_fingerprint uses, so both sides agree on "online"
+    zone_details = None
+    ap_online = None
+    try:
+        zone_details, ap_online = await asyncio.gather(
+            sz_client.zones.get_zone_details(zone_id),
+            sz_client.aps.count_aps_by_zone(zone_id, status="Online"),
+        )
+    except Exception as e:
+        logger.debug(f"Zone {zone_name}: Failed to fetch fingerprint inputs: {e}")
+
     # Initialize defaults
     ap_status = ApStatusBreakdown(online=0, offline=0, flagged=0, total=0)
     ap_model_distribution = []
@@ -444,9 +635,15 @@ async def _audit_zone(
 
     # Fetch APs
     aps = []
+    ap_total = 0
+    ap_groups_raw = []
+    wlans_list = []
+    wlan_details_complete = False
+    wlan_groups_raw = []
     try:
         aps_result = await sz_client.aps.get_aps_by_zone(zone_id)
         aps = aps_result.get("list", []) if isinstance(aps_result, dict) else aps_result
+        ap_total = _ap_total(aps_result)
         logger.info(f"Zone '{zone_name}': Fetched {len(aps)} APs")
 
         online = 0
@@ -596,6 +793,7 @@ async def _audit_zone(
                 wlan_type_counter["Unknown"] += 1
 
         wlan_type_breakdown = dict(wlan_type_counter)
+        wlan_details_complete = all(r["success"] for r in wlan_results)
 
     except Exception as e:
         partial_errors.append(f"Zone {zone_name}: Failed to fetch WLANs: {str(e)}")
@@ -630,4 +828,10 @@ async def _audit_zone(
         wlan_type_breakdown=wlan_type_breakdown
     )
 
-    return zone_audit, partial_errors
+    fingerprint = None
+    if zone_details is not None and ap_online is not None and not partial_errors and wlan_details_complete:
+        fingerprint = _zone_fingerprint(
+            zone_details, ap_total, ap_online, wlans_list, ap_groups_raw, wlan_groups_raw
+        )
+
+    return zone_audit, partial_errors, fingerprint
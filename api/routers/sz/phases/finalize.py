@@ -7,7 +7,7 @@ Aggregates stats, matches switch groups to zones, and stores final result in Red
 import logging
 import json
 import re
-from collections import Counter
+from collections import Counter, defaultdict
 from datetime import datetime
 from typing import Dict, Any, List
 
@@ -128,9 +128,14 @@ async def execute(context: Dict[str, Any]) -> List[Task]:
         zones_with_matches = [z for z in all_zones_audit if z.matched_switch_groups]
         if zones_with_matches:
             logger.info(f"Persisting {len(zones_with_matches)} zone matches to cache")
+            # One pipelined read and one pipelined write for all zones
+            cached_zones = await zone_cache.get_cached_zones(
+                [zone.zone_id for zone in zones_with_matches]
+            )
+            updated_zones = {}
             for zone in zones_with_matches:
                 # Update cached zone with matched_switch_groups
-                cached = await zone_cache.get_cached_zone(zone.zone_id)
+                cached = cached_zones.get(zone.zone_id)
                 if cached:
                     # Preserve user_set_mapping flag if it exists (never overwrite user selections)
                     # Only update matches if this is NOT a user-set zone
@@ -147,7 +152,8 @@ async def execute(context: Dict[str, Any]) -> List[Task]:
                     # Preserve the user_set_mapping flag from the zone
                     if zone.user_set_mapping:
                         cached['user_set_mapping'] = True
-                    await zone_cache.cache_zone(zone.zone_id, cached)
+                    updated_zones[zone.zone_id] = cached
+            await zone_cache.cache_zones_bulk(updated_zones)
 
     # Cache all switch groups (with switch counts) for retrieval by cache endpoint
     # Use all_switch_groups_flat which is enriched from actual switch data
@@ -167,8 +173,14 @@ async def execute(context: Dict[str, Any]) -> List[Task]:
             }
             for sg in all_switch_groups_flat
         ]}
+        # "_all_" loses which domain a group is in, so per-domain totals
+        # (used by cached exports) are cached alongside
+        domain_totals = {
+            d.domain_id: {"total_switches": d.total_switches, "switch_groups": len(d.switch_groups)}
+            for d in domains_audit
+        }
         # Don't pass switches again - counts are already computed in all_switch_groups_flat
-        await zone_cache.cache_switch_groups(sg_dict, None)
+        await zone_cache.cache_switch_groups(sg_dict, None, domains=domain_totals)
 
     # Build domain hierarchy
     domain_map = {d.domain_id: d for d in domains_audit}
@@ -496,79 +508,208 @@ _STOP_WORDS = {
 }
 
 
-def score_switch_group_match(
-    zone_name: str,
-    zone_domain_id: str,
-    sg_name: str,
-    sg_domain_id: str
-) -> tuple[int, str, str]:
-    """
-    Score how well a switch group matches a zone.
+# Normalized prefix length that earns a prefix score; switch groups are
+# bucketed by this many leading normalized characters
+_MIN_PREFIX_LEN = 6
 
-    Returns:
-        tuple of (score, match_type, match_reason)
-        - score: 0-100+ (higher is better match)
-        - match_type: "exact", "normalized", "contains", "word-overlap", "prefix", "none"
-        - match_reason: Human-readable explanation
-    """
-    # Normalize inputs
-    zone_lower = zone_name.lower()
-    sg_lower = sg_name.lower()
-    zone_normalized = _normalize_name(zone_name)
-    sg_normalized = _normalize_name(sg_name)
-    zone_words = set(_extract_words(zone_name))
-    sg_words = set(_extract_words(sg_name))
-    zone_significant = zone_words - _STOP_WORDS
-    sg_significant = sg_words - _STOP_WORDS
-
-    # Domain bonus
-    domain_bonus = 10 if zone_domain_id == sg_domain_id else 0
+
+class _NameFeatures:
+    """Name forms used for matching, computed once per zone/switch group."""
+
+    __slots__ = ("name", "lower", "normalized", "significant")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.lower = name.lower()
+        self.normalized = _normalize_name(name)
+        self.significant = frozenset(_extract_words(name)) - _STOP_WORDS
+
+
+def _score_features(
+    zone: _NameFeatures,
+    sg: _NameFeatures,
+    same_domain: bool
+) -> tuple[int, str, str]:
+    """score_switch_group_match on precomputed name features."""
+    domain_bonus = 10 if same_domain else 0
 
     # Priority 1: Exact name match (100 points)
-    if zone_lower == sg_lower:
-        return (100 + domain_bonus, "exact", f"Exact name match: '{zone_name}'")
+    if zone.lower == sg.lower:
+        return (100 + domain_bonus, "exact", f"Exact name match: '{zone.name}'")
 
     # Priority 2: Normalized name match (85 points)
-    if zone_normalized and sg_normalized and zone_normalized == sg_normalized:
-        return (85 + domain_bonus, "normalized", f"Names match after normalization: '{zone_normalized}'")
+    if zone.normalized and sg.normalized and zone.normalized == sg.normalized:
+        return (85 + domain_bonus, "normalized", f"Names match after normalization: '{zone.normalized}'")
 
     # Priority 3: Contains match
-    if len(zone_lower) >= 3 and len(sg_lower) >= 3:
-        if zone_lower in sg_lower:
-            return (70 + domain_bonus, "contains", f"Zone name '{zone_name}' found in '{sg_name}'")
-        if sg_lower in zone_lower:
-            return (65 + domain_bonus, "contains", f"Switch group name '{sg_name}' found in '{zone_name}'")
+    if len(zone.lower) >= 3 and len(sg.lower) >= 3:
+        if zone.lower in sg.lower:
+            return (70 + domain_bonus, "contains", f"Zone name '{zone.name}' found in '{sg.name}'")
+        if sg.lower in zone.lower:
+            return (65 + domain_bonus, "contains", f"Switch group name '{sg.name}' found in '{zone.name}'")
 
     # Priority 4: Word overlap
-    if zone_significant and sg_significant:
-        common = zone_significant & sg_significant
+    if zone.significant and sg.significant:
+        common = zone.significant & sg.significant
         if len(common) >= 3:
             return (60 + domain_bonus, "word-overlap", f"3+ common words: {', '.join(sorted(common)[:5])}")
         if len(common) == 2:
             return (50 + domain_bonus, "word-overlap", f"2 common words: {', '.join(sorted(common))}")
         if len(common) == 1:
-            word = list(common)[0]
+            word = next(iter(common))
             if len(word) >= 5:
                 return (40 + domain_bonus, "word-overlap", f"Significant common word: '{word}'")
 
     # Priority 5: Common prefix
-    if len(zone_normalized) >= 6 and len(sg_normalized) >= 6:
-        prefix = _longest_common_prefix(zone_normalized, sg_normalized)
+    if len(zone.normalized) >= _MIN_PREFIX_LEN and len(sg.normalized) >= _MIN_PREFIX_LEN:
+        prefix = _longest_common_prefix(zone.normalized, sg.normalized)
         if len(prefix) >= 8:
             return (35 + domain_bonus, "prefix", f"Common prefix (8+ chars): '{prefix}'")
-        if len(prefix) >= 6:
+        if len(prefix) >= _MIN_PREFIX_LEN:
             return (25 + domain_bonus, "prefix", f"Common prefix (6+ chars): '{prefix}'")
 
     # No significant match
     return (0, "none", "No significant match")
 
 
+def score_switch_group_match(
+    zone_name: str,
+    zone_domain_id: str,
+    sg_name: str,
+    sg_domain_id: str
+) -> tuple[int, str, str]:
+    """
+    Score how well a switch group matches a zone.
+
+    Returns:
+        tuple of (score, match_type, match_reason)
+        - score: 0-100+ (higher is better match)
+        - match_type: "exact", "normalized", "contains", "word-overlap", "prefix", "none"
+        - match_reason: Human-readable explanation
+    """
+    return _score_features(
+        _NameFeatures(zone_name),
+        _NameFeatures(sg_name),
+        zone_domain_id == sg_domain_id
+    )
+
+
+class SwitchGroupIndex:
+    """
+    Precomputed switch group names for matching many zones.
+
+    Scoring every zone against every switch group is O(zones x groups) with
+    normalization and word extraction redone per pair. The index computes
+    each group's name features once and keeps lookups that return, per
+    match tier, exactly the groups that can score in that tier:
+
+    - exact / normalized: dicts keyed by lowercase and normalized name
+    - contains: a trigram index over lowercase names (zone inside group -
+      scan the zone's rarest trigram, then verify) plus the exact-name dict
+      for every 3+ char substring of the zone (group inside zone)
+    - word-overlap: inverted index from significant word to groups
+    - prefix: groups bucketed by their first 6 normalized characters (the
+      shortest prefix that scores)
+
+    Positions returned are indexes into `groups`, in list order, so callers
+    that take the first hit behave exactly like a linear scan.
+    """
+
+    def __init__(self, switch_groups: List[Dict[str, Any]]):
+        self.groups = switch_groups
+        self.features = [_NameFeatures(sg.get("name", "")) for sg in switch_groups]
+
+        self._by_lower: Dict[str, List[int]] = defaultdict(list)
+        self._by_normalized: Dict[str, List[int]] = defaultdict(list)
+        self._by_word: Dict[str, List[int]] = defaultdict(list)
+        self._by_prefix: Dict[str, List[int]] = defaultdict(list)
+        self._by_trigram: Dict[str, List[int]] = defaultdict(list)
+
+        for pos, f in enumerate(self.features):
+            self._by_lower[f.lower].append(pos)
+            if f.normalized:
+                self._by_normalized[f.normalized].append(pos)
+            for word in f.significant:
+                self._by_word[word].append(pos)
+            if len(f.normalized) >= _MIN_PREFIX_LEN:
+                self._by_prefix[f.normalized[:_MIN_PREFIX_LEN]].append(pos)
+            if len(f.lower) >= 3:
+                for trigram in {f.lower[i:i + 3] for i in range(len(f.lower) - 2)}:
+                    self._by_trigram[trigram].append(pos)
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    # ----- per-tier candidates (positions, ascending) -----
+
+    def exact(self, zone: _NameFeatures) -> List[int]:
+        return self._by_lower.get(zone.lower, [])
+
+    def normalized(self, zone: _NameFeatures) -> List[int]:
+        if not zone.normalized:
+            return []
+        return self._by_normalized.get(zone.normalized, [])
+
+    def contains(self, zone: _NameFeatures) -> List[int]:
+        name = zone.lower
+        if len(name) < 3:
+            return []
+        found = set()
+
+        # Zone name inside a group name: every zone trigram must appear
+        postings = [self._by_trigram.get(name[i:i + 3]) for i in range(len(name) - 2)]
+        if all(postings):
+            rarest = min(postings, key=len)
+            found.update(pos for pos in rarest if name in self.features[pos].lower)
+
+        # Group name inside the zone name
+        for start in range(len(name) - 2):
+            for end in range(start + 3, len(name) + 1):
+                found.update(self._by_lower.get(name[start:end], ()))
+
+        return sorted(found)
+
+    def word_overlap(self, zone: _NameFeatures) -> List[int]:
+        found = set()
+        for word in zone.significant:
+            found.update(self._by_word.get(word, ()))
+        return sorted(
+            pos for pos in found
+            if _has_word_overlap(zone.significant, self.features[pos].significant)
+        )
+
+    def prefix(self, zone: _NameFeatures) -> List[int]:
+        if len(zone.normalized) < _MIN_PREFIX_LEN:
+            return []
+        return self._by_prefix.get(zone.normalized[:_MIN_PREFIX_LEN], [])
+
+    def candidates(self, zone: _NameFeatures) -> List[int]:
+        """Every position that can score above zero for the zone."""
+        found = set(self.exact(zone))
+        found.update(self.normalized(zone))
+        found.update(self.contains(zone))
+        found.update(self.word_overlap(zone))
+        found.update(self.prefix(zone))
+        return sorted(found)
+
+
+def _has_word_overlap(zone_significant: frozenset, sg_significant: frozenset) -> bool:
+    """2+ significant words in common, or 1 word of 5+ chars."""
+    common = zone_significant & sg_significant
+    if len(common) >= 2:
+        return True
+    if len(common) == 1:
+        return len(next(iter(common))) >= 5
+    return False
+
+
 def get_match_candidates(
     zone_name: str,
     zone_domain_id: str,
     all_switch_groups: list,
     top_n: int = 3,
-    min_score: int = 20
+    min_score: int = 20,
+    index: SwitchGroupIndex = None
 ) -> list:
     """
     Get top N match candidates for a zone.
@@ -579,25 +720,31 @@ def get_match_candidates(
         all_switch_groups: List of dicts with 'id', 'name', 'domain_id', etc.
         top_n: Number of top candidates to return
         min_score: Minimum score to include (filters out weak matches)
+        index: SwitchGroupIndex over all_switch_groups; build one once when
+            ranking many zones against the same groups
 
     Returns:
         List of candidate dicts sorted by score descending
     """
-    candidates = []
+    zone = _NameFeatures(zone_name)
+    if index is None:
+        index = SwitchGroupIndex(all_switch_groups)
 
-    for sg in all_switch_groups:
-        sg_id = sg.get("id", "")
-        sg_name = sg.get("name", "")
-        sg_domain_id = sg.get("domain_id", "")
+    # Only groups the index returns can score above zero
+    positions = index.candidates(zone) if min_score > 0 else range(len(index))
 
-        score, match_type, match_reason = score_switch_group_match(
-            zone_name, zone_domain_id, sg_name, sg_domain_id
+    candidates = []
+    for pos in positions:
+        sg = index.groups[pos]
+        sg_domain_id = sg.get("domain_id", "")
+        score, match_type, match_reason = _score_features(
+            zone, index.features[pos], zone_domain_id == sg_domain_id
         )
 
         if score >= min_score:
             candidates.append({
-                "switch_group_id": sg_id,
-                "switch_group_name": sg_name,
+                "switch_group_id": sg.get("id", ""),
+                "switch_group_name": sg.get("name", ""),
                 "switch_count": sg.get("switch_count", 0),
                 "switches_online": sg.get("switches_online", 0),
                 "switches_offline": sg.get("switches_offline", 0),
@@ -626,9 +773,12 @@ def _match_switch_groups_to_zones(
     2. Normalized name match (strips prefixes/suffixes)
     3. Contains match (one name contains the other)
     4. Word overlap (2+ significant words in common)
+    5. Common prefix (6+ chars of the normalized names)
 
     Within each priority level, same-domain matches are preferred but
     cross-domain matches are allowed if no same-domain match exists.
+    Candidates for each level come from a SwitchGroupIndex, so each zone
+    only looks at groups that can match instead of every switch group.
     """
     sg_counts_map = {sg.id: sg for sg in switch_groups_with_counts}
 
@@ -636,16 +786,13 @@ def _match_switch_groups_to_zones(
     for domain_id, sgs in switch_groups_raw.items():
         for sg in sgs:
             sg_id = sg.get("id")
-            sg_name = sg.get("name", "")
             all_switch_groups.append({
                 "id": sg_id,
-                "name": sg_name,
+                "name": sg.get("name", ""),
                 "domain_id": domain_id,
-                "normalized": _normalize_name(sg_name),
-                "name_lower": sg_name.lower(),
-                "words": _extract_words(sg_name),  # camelCase-aware word extraction
                 "summary": sg_counts_map.get(sg_id)
             })
+    index = SwitchGroupIndex(all_switch_groups)
 
     matched_sg_ids = set()
 
@@ -682,36 +829,47 @@ def _match_switch_groups_to_zones(
             switches_offline=0
         )
 
-    def find_match(zone, match_fn, match_type: str):
+    def find_match(zone, positions: List[int], match_type: str):
         """
-        Find a matching switch group using the given match function.
+        Take the first unmatched switch group among the tier's candidates.
         Prefers same-domain matches, falls back to cross-domain.
         Returns True if a match was found.
         """
         zone_domain_id = zone.domain_id
 
         # First pass: same-domain matches
-        for sg in all_switch_groups:
+        for pos in positions:
+            sg = all_switch_groups[pos]
             if sg["id"] in matched_sg_ids:
                 continue
-            if sg["domain_id"] == zone_domain_id and match_fn(sg):
+            if sg["domain_id"] == zone_domain_id:
                 zone.matched_switch_groups.append(get_sg_summary(sg))
                 matched_sg_ids.add(sg["id"])
                 logger.debug(f"Zone '{zone.zone_name}': Matched '{sg['name']}' ({match_type}, same domain)")
                 return True
 
         # Second pass: cross-domain matches
-        for sg in all_switch_groups:
+        for pos in positions:
+            sg = all_switch_groups[pos]
             if sg["id"] in matched_sg_ids:
                 continue
-            if match_fn(sg):
-                zone.matched_switch_groups.append(get_sg_summary(sg))
-                matched_sg_ids.add(sg["id"])
-                logger.debug(f"Zone '{zone.zone_name}': Matched '{sg['name']}' ({match_type}, cross-domain)")
-                return True
+            zone.matched_switch_groups.append(get_sg_summary(sg))
+            matched_sg_ids.add(sg["id"])
+            logger.debug(f"Zone '{zone.zone_name}': Matched '{sg['name']}' ({match_type}, cross-domain)")
+            return True
 
         return False
 
+    tiers = (
+        (index.exact, "exact"),
+        (index.normalized, "normalized"),
+        (index.contains, "contains"),
+        # 2+ significant words in common, OR 1 word if 5+ chars, e.g.
+        # "MigrateMe" and "MigrateThis" share "migrate" (7 chars)
+        (index.word_overlap, "word-overlap"),
+        (index.prefix, "common-prefix"),
+    )
+
     for zone in zones:
         # Skip zones with user-set mappings (never override manual selections)
         if zone.user_set_mapping:
@@ -723,71 +881,10 @@ def _match_switch_groups_to_zones(
             logger.debug(f"Zone '{zone.zone_name}': Using {len(zone.matched_switch_groups)} cached matches")
             continue
 
-        zone_name = zone.zone_name
-        zone_name_lower = zone_name.lower()
-        zone_normalized = _normalize_name(zone_name)
-        zone_words = _extract_words(zone_name)  # camelCase-aware extraction
-        zone_words_set = set(zone_words)
-        # Stop words: common articles/prepositions + common naming suffixes that cause false matches
-        stop_words = {
-            # Articles and prepositions
-            "the", "a", "an", "and", "or", "of", "in", "on", "at", "to", "for",
-            # Common naming patterns that appear in many zone/switch group names
-            "staging", "stg", "sg", "new", "old", "test", "testing",
-            "apartments", "apts", "apartment", "apt",
-            "village", "place", "station", "center", "phase",
-            "ii", "iii", "iv", "north", "south", "east", "west"
-        }
-        zone_significant = zone_words_set - stop_words
-
-        # Priority 1: Exact name match
-        if find_match(zone, lambda sg: sg["name_lower"] == zone_name_lower, "exact"):
-            continue
-
-        # Priority 2: Normalized name match
-        if zone_normalized and find_match(
-            zone,
-            lambda sg: sg["normalized"] == zone_normalized,
-            "normalized"
-        ):
-            continue
-
-        # Priority 3: Contains match (one name contains the other, min 3 chars)
-        if len(zone_name_lower) >= 3:
-            if find_match(
-                zone,
-                lambda sg: (len(sg["name_lower"]) >= 3 and
-                           (zone_name_lower in sg["name_lower"] or sg["name_lower"] in zone_name_lower)),
-                "contains"
-            ):
-                continue
-
-        # Priority 4: Word overlap (2+ significant words in common, OR 1 word if 5+ chars)
-        # e.g., "MigrateMe" and "MigrateThis" share "migrate" (7 chars)
-        # This prevents short generic words from causing false matches
-        if zone_significant:
-            def word_overlap_match(sg):
-                sg_words_set = set(sg["words"])
-                sg_significant = sg_words_set - stop_words
-                common = zone_significant & sg_significant
-                if len(common) >= 2:
-                    return True
-                # Single word match only if the word is 5+ chars (more specific)
-                if len(common) == 1:
-                    word = list(common)[0]
-                    return len(word) >= 5
-                return False
-            if find_match(zone, word_overlap_match, "word-overlap"):
-                continue
-
-        # Priority 5: Common prefix match (6+ char prefix in normalized form)
-        if len(zone_normalized) >= 6:
-            def prefix_match(sg):
-                if len(sg["normalized"]) < 6:
-                    return False
-                prefix = _longest_common_prefix(zone_normalized, sg["normalized"])
-                return len(prefix) >= 6
-            find_match(zone, prefix_match, "common-prefix")
+        zone_features = _NameFeatures(zone.zone_name)
+        for lookup, match_type in tiers:
+            if find_match(zone, lookup(zone_features), match_type):
+                break
 
     total_matched = len(matched_sg_ids)
     total_sgs = len(all_switch_groups)
@@ -54,9 +54,9 @@ async def execute(context: Dict[str, Any]) -> List[Task]:
         cache_meta = await zone_cache.get_cache_meta()
         if cache_meta and cache_meta.get('zone_ids'):
             zone_ids = cache_meta['zone_ids']
-            cached_zones = await zone_cache.get_cached_zones(zone_ids)
+            cached_zones = await zone_cache.get_zone_summaries(zone_ids)
 
-            # Derive real domain IDs from cached zones
+            # Derive real domain IDs from cached zone summaries
             domain_map = {}
             for zone_data in cached_zones.values():
                 domain_id = zone_data.get('domain_id')
@@ -7,10 +7,15 @@ including AP inventory queries and migration support.
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
-from typing import List, Dict, Any
+from fastapi.responses import PlainTextResponse
+from typing import List, Dict, Any, Optional
 import httpx
+from sqlalchemy.orm import Session
+from dependencies import get_db, get_current_user
+from models.user import User
 from szapi.client import SZClient
-from clients.sz_client_deps import get_dynamic_sz_client
+from szapi.stats import get_controller_stats, render_prometheus
+from clients.sz_client_deps import get_dynamic_sz_client, validate_controller_access
 
 logger = logging.getLogger(__name__)
 
@@ -130,6 +135,7 @@ async def get_zone_aps(
 
 @router.get("/aps")
 async def get_all_aps(
+    fields: Optional[str] = None,
     sz_client: SZClient = Depends(get_dynamic_sz_client)
 ) -> Dict[str, Any]:
     """
@@ -137,12 +143,17 @@ async def get_all_aps(
     This is useful for migration workflows where you need to see
     all available APs.
 
+    Args:
+        fields: Optional comma-separated AP attributes to return
+                (e.g. "apMac,serial,status"); zoneId/zoneName are always included
+
     Returns:
         Dictionary with all APs list
     """
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
     try:
         async with sz_client:
-            aps = await sz_client.aps.get_all_aps()
+            aps = await sz_client.aps.get_all_aps(fields=field_list)
             return {
                 "status": "success",
                 "data": aps,
@@ -392,3 +403,60 @@ async def get_switchgroup_switches(
         raise HTTPException(status_code=status_code, detail=f"SmartZone API error: {status_code} - {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch switch group switches: {str(e)}")
+
+
+# ============================================================================
+# API Stats Endpoints
+# ============================================================================
+
+def _stats_controller_key(controller_id: int, user: User, db: Session) -> str:
+    """
+    host:port the controller's SZClients record their stats under.
+
+    Reads the controller record only - no credentials are decrypted and no
+    client is built.
+    """
+    controller = validate_controller_access(controller_id, user, db)
+    if controller.controller_type != "SmartZone":
+        raise HTTPException(status_code=400, detail=f"Controller {controller_id} is not a SmartZone controller")
+    if not controller.sz_host:
+        raise HTTPException(status_code=400, detail="SmartZone host not configured for this controller")
+    # Same port default as create_sz_client_from_controller
+    return f"{controller.sz_host}:{controller.sz_port or 8443}"
+
+
+@router.get("/api-stats")
+async def get_controller_api_stats(
+    controller_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> Dict[str, Any]:
+    """
+    Get SmartZone API statistics for this controller across all clients
+    in this process: call rate, error rates and per-endpoint latency
+    percentiles (p50/p95/p99).
+
+    No SmartZone calls are made.
+    """
+    controller = _stats_controller_key(controller_id, current_user, db)
+    return {
+        "status": "success",
+        "controller": controller,
+        "data": get_controller_stats(controller).snapshot()
+    }
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_controller_metrics(
+    controller_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> str:
+    """
+    SmartZone API statistics for this controller in the Prometheus text
+    exposition format (request/error counters, latency histograms, rate).
+
+    No SmartZone calls are made.
+    """
+    controller = _stats_controller_key(controller_id, current_user, db)
+    return render_prometheus([controller])
@@ -5,14 +5,18 @@ Handles zone-level caching for SmartZone audits.
 Allows incremental refreshes and fast retrieval of previously audited zones.
 
 Cache Structure:
-- sz_audit:cache:{controller_id}:zone:{zone_id} → ZoneAudit JSON (TTL: configurable)
-- sz_audit:cache:{controller_id}:meta → {last_audit_time, zone_ids[], version}
+- sz_audit:cache:{controller_id}:zone:{zone_id} → hash {v, summary, body} (TTL: configurable)
+  body is the compressed ZoneAudit; summary holds _cached_at, the change
+  fingerprint used by incremental audits, and list/status counts
+- sz_audit:cache:{controller_id}:meta → {last_audit_time, zone_ids[], controller_firmware, version}
 """
 
+import base64
 import json
 import logging
+import zlib
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 from enum import Enum
 
 import redis.asyncio as redis
@@ -22,12 +26,63 @@ logger = logging.getLogger(__name__)
 # Cache TTL settings
 ZONE_CACHE_TTL_SECONDS = 60 * 60 * 24 * 7  # 7 days
 CACHE_META_TTL_SECONDS = 60 * 60 * 24 * 7  # 7 days for metadata
+ZONE_READ_CHUNK_SIZE = 100  # zones decoded per round trip when walking the cache
+
+
+# Zone entry encoding. v2 entries are hashes:
+#   v       → CACHE_FORMAT_VERSION
+#   summary → small JSON (names, counts, fingerprint) for list/status views
+#   body    → base64(zlib(JSON ZoneAudit)), decoded only when the zone is used
+# Text-safe (base64) because the shared Redis client uses decode_responses.
+# Pre-v2 entries are plain JSON strings; they are still read and are
+# replaced on the next write.
+CACHE_FORMAT_VERSION = 2
+ZONE_BODY_COMPRESSION_LEVEL = 6
+_ENTRY_META_KEYS = ('_cached_at', '_fingerprint')
+
+
+def zone_summary(zone_id: str, zone_audit: Dict[str, Any]) -> Dict[str, Any]:
+    """Summary fields served without decoding the zone body."""
+    ap_status = zone_audit.get('ap_status')
+    return {
+        'zone_id': zone_id,
+        'zone_name': zone_audit.get('zone_name', 'Unknown'),
+        'domain_id': zone_audit.get('domain_id'),
+        'domain_name': zone_audit.get('domain_name', 'Unknown'),
+        'cached_at': zone_audit.get('_cached_at'),
+        'fingerprint': zone_audit.get('_fingerprint'),
+        'ap_count': ap_status.get('total', 0) if isinstance(ap_status, dict) else 0,
+        'wlan_count': zone_audit.get('wlan_count', 0),
+        'switch_group_matches': len(zone_audit.get('matched_switch_groups') or []),
+    }
+
+
+def encode_zone_entry(zone_id: str, zone_audit: Dict[str, Any]) -> Dict[str, str]:
+    """Encode a ZoneAudit dict into v2 hash fields."""
+    body = {k: v for k, v in zone_audit.items() if k not in _ENTRY_META_KEYS}
+    raw = json.dumps(body, separators=(',', ':'), default=str).encode()
+    return {
+        'v': str(CACHE_FORMAT_VERSION),
+        'summary': json.dumps(zone_summary(zone_id, zone_audit)),
+        'body': base64.b64encode(zlib.compress(raw, ZONE_BODY_COMPRESSION_LEVEL)).decode('ascii'),
+    }
+
+
+def decode_zone_entry(summary_raw: Optional[str], body: str) -> Dict[str, Any]:
+    """Decode v2 hash fields back into a ZoneAudit dict with cache metadata."""
+    zone_audit = json.loads(zlib.decompress(base64.b64decode(body)))
+    summary = json.loads(summary_raw) if summary_raw else {}
+    if summary.get('cached_at'):
+        zone_audit['_cached_at'] = summary['cached_at']
+    if summary.get('fingerprint'):
+        zone_audit['_fingerprint'] = summary['fingerprint']
+    return zone_audit
 
 
 class RefreshMode(str, Enum):
     """Audit refresh modes"""
     FULL = "full"  # Force refresh everything
-    INCREMENTAL = "incremental"  # Use cached zones if fresh, only audit stale/new
+    INCREMENTAL = "incremental"  # Use recent cached zones whose fingerprint is unchanged, audit changed/new
     CACHED_ONLY = "cached_only"  # Return cached data immediately, no API calls
     SWITCHES_ONLY = "switches_only"  # Use cached zones, but refresh switches
 
@@ -63,36 +118,125 @@ class ZoneCacheManager:
             zone_id: Zone ID to retrieve
 
         Returns:
-            ZoneAudit dict or None if not cached/expired
+            ZoneAudit dict (with _cached_at / _fingerprint) or None if not cached/expired
         """
-        key = self._zone_key(zone_id)
-        data = await self.redis.get(key)
+        cached = await self.get_cached_zones([zone_id], log_hits=False)
+        return cached.get(zone_id)
 
-        if not data:
-            return None
+    async def get_cached_zones(
+        self,
+        zone_ids: List[str],
+        log_hits: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get multiple cached zones in a single round trip (pipelined HMGET)
 
-        try:
-            return json.loads(data)
-        except Exception as e:
-            logger.warning(f"Failed to parse cached zone {zone_id}: {e}")
-            return None
+        Args:
+            zone_ids: List of zone IDs to retrieve
+            log_hits: Log the hit ratio (off for single-zone lookups)
 
-    async def get_cached_zones(self, zone_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        Returns:
+            Dict of zone_id -> ZoneAudit dict (only includes found zones)
         """
-        Get multiple cached zones in a single operation (MGET)
+        if not zone_ids:
+            return {}
+
+        pipe = self.redis.pipeline(transaction=False)
+        for zone_id in zone_ids:
+            pipe.hmget(self._zone_key(zone_id), ["summary", "body"])
+        results = await pipe.execute(raise_on_error=False)
+
+        cached = {}
+        legacy_ids = []
+        for zone_id, result in zip(zone_ids, results):
+            if isinstance(result, Exception):
+                legacy_ids.append(zone_id)  # WRONGTYPE: pre-v2 JSON string entry
+                continue
+            summary_raw, body = result
+            if not body:
+                continue
+            try:
+                cached[zone_id] = decode_zone_entry(summary_raw, body)
+            except Exception as e:
+                logger.debug(f"Failed to decode cached zone {zone_id}: {e}")
+
+        if legacy_ids:
+            cached.update(await self._get_legacy_zones(legacy_ids))
+
+        if log_hits:
+            logger.info(f"Cache hit: {len(cached)}/{len(zone_ids)} zones")
+        return cached
+
+    async def get_zone_summaries(self, zone_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get zone summaries without decoding zone bodies
+
+        Summaries carry zone_id, zone_name, domain_id, domain_name,
+        cached_at, fingerprint, ap_count, wlan_count and switch_group_matches.
 
         Args:
             zone_ids: List of zone IDs to retrieve
 
         Returns:
-            Dict of zone_id -> ZoneAudit dict (only includes found zones)
+            Dict of zone_id -> summary dict (only includes found zones)
         """
         if not zone_ids:
             return {}
 
-        keys = [self._zone_key(zid) for zid in zone_ids]
-        results = await self.redis.mget(keys)
+        pipe = self.redis.pipeline(transaction=False)
+        for zone_id in zone_ids:
+            pipe.hget(self._zone_key(zone_id), "summary")
+        results = await pipe.execute(raise_on_error=False)
+
+        summaries = {}
+        legacy_ids = []
+        for zone_id, result in zip(zone_ids, results):
+            if isinstance(result, Exception):
+                legacy_ids.append(zone_id)
+                continue
+            if not result:
+                continue
+            try:
+                summaries[zone_id] = json.loads(result)
+            except Exception as e:
+                logger.debug(f"Failed to parse cached zone summary {zone_id}: {e}")
+
+        if legacy_ids:
+            for zone_id, zone_audit in (await self._get_legacy_zones(legacy_ids)).items():
+                summaries[zone_id] = zone_summary(zone_id, zone_audit)
+
+        return summaries
+
+    async def iter_cached_zones(
+        self,
+        zone_ids: Optional[List[str]] = None,
+        chunk_size: int = ZONE_READ_CHUNK_SIZE
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Walk cached zones a chunk at a time, so callers never hold every
+        decoded zone at once
 
+        Args:
+            zone_ids: Zone IDs to walk (default: all zones in cache meta)
+            chunk_size: Zones fetched and decoded per round trip
+
+        Yields:
+            Lists of ZoneAudit dicts, in zone_ids order (missing zones skipped)
+        """
+        if zone_ids is None:
+            meta = await self.get_cache_meta()
+            zone_ids = meta.get('zone_ids', []) if meta else []
+
+        for start in range(0, len(zone_ids), chunk_size):
+            chunk_ids = zone_ids[start:start + chunk_size]
+            cached = await self.get_cached_zones(chunk_ids, log_hits=False)
+            zones = [cached[zid] for zid in chunk_ids if zid in cached]
+            if zones:
+                yield zones
+
+    async def _get_legacy_zones(self, zone_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Read pre-v2 plain JSON entries (rewritten in v2 format on next cache)."""
+        results = await self.redis.mget([self._zone_key(zid) for zid in zone_ids])
         cached = {}
         for zone_id, data in zip(zone_ids, results):
             if data:
@@ -100,15 +244,20 @@ class ZoneCacheManager:
                     cached[zone_id] = json.loads(data)
                 except Exception as e:
                     logger.debug(f"Failed to parse cached zone {zone_id}: {e}")
-
-        logger.info(f"Cache hit: {len(cached)}/{len(zone_ids)} zones")
         return cached
 
+    def _queue_zone_write(self, pipe, zone_id: str, zone_audit: Dict[str, Any], ttl: int) -> None:
+        key = self._zone_key(zone_id)
+        pipe.delete(key)  # Replaces pre-v2 string entries too
+        pipe.hset(key, mapping=encode_zone_entry(zone_id, zone_audit))
+        pipe.expire(key, ttl)
+
     async def cache_zone(
         self,
         zone_id: str,
         zone_audit: Dict[str, Any],
-        ttl: int = ZONE_CACHE_TTL_SECONDS
+        ttl: int = ZONE_CACHE_TTL_SECONDS,
+        fingerprint: Optional[str] = None
     ) -> bool:
         """
         Cache a zone audit result
@@ -117,17 +266,23 @@ class ZoneCacheManager:
             zone_id: Zone ID
             zone_audit: ZoneAudit dict to cache
             ttl: Cache TTL in seconds
+            fingerprint: Zone change fingerprint taken with this audit
+                         (None keeps any _fingerprint already in zone_audit;
+                         entries without one are always re-audited in
+                         incremental mode)
 
         Returns:
             True if cached successfully
         """
-        key = self._zone_key(zone_id)
-
         # Add cache metadata
         zone_audit['_cached_at'] = datetime.utcnow().isoformat()
+        if fingerprint:
+            zone_audit['_fingerprint'] = fingerprint
 
         try:
-            await self.redis.setex(key, ttl, json.dumps(zone_audit))
+            pipe = self.redis.pipeline()
+            self._queue_zone_write(pipe, zone_id, zone_audit, ttl)
+            await pipe.execute()
             return True
         except Exception as e:
             logger.warning(f"Failed to cache zone {zone_id}: {e}")
@@ -142,7 +297,8 @@ class ZoneCacheManager:
         Cache multiple zones in a pipeline
 
         Args:
-            zones: Dict of zone_id -> ZoneAudit dict
+            zones: Dict of zone_id -> ZoneAudit dict (a _fingerprint key,
+                   if present, is stored with the entry)
             ttl: Cache TTL in seconds
 
         Returns:
@@ -155,9 +311,8 @@ class ZoneCacheManager:
         pipe = self.redis.pipeline()
 
         for zone_id, zone_audit in zones.items():
-            key = self._zone_key(zone_id)
             zone_audit['_cached_at'] = cached_at
-            pipe.setex(key, ttl, json.dumps(zone_audit))
+            self._queue_zone_write(pipe, zone_id, zone_audit, ttl)
 
         try:
             await pipe.execute()
@@ -188,7 +343,8 @@ class ZoneCacheManager:
     async def update_cache_meta(
         self,
         zone_ids: List[str],
-        partial: bool = False
+        partial: bool = False,
+        controller_firmware: Optional[str] = None
     ) -> bool:
         """
         Update cache metadata after an audit
@@ -198,6 +354,8 @@ class ZoneCacheManager:
             partial: True if this was an incremental/partial update
                      When partial, merges with existing zone IDs to preserve
                      zones from previous audits that weren't processed this time
+            controller_firmware: Controller firmware seen by the audit (kept
+                     from the previous meta when not given)
 
         Returns:
             True if updated successfully
@@ -208,8 +366,12 @@ class ZoneCacheManager:
         # zones that were cached previously but not processed in this run
         # (e.g., when audit is cancelled partway through)
         final_zone_ids = zone_ids
-        if partial:
+        existing_meta = None
+        if partial or controller_firmware is None:
             existing_meta = await self.get_cache_meta()
+        if controller_firmware is None and existing_meta:
+            controller_firmware = existing_meta.get('controller_firmware')
+        if partial:
             if existing_meta and existing_meta.get('zone_ids'):
                 # Merge: keep existing zones, add/update new ones
                 existing_set = set(existing_meta['zone_ids'])
@@ -223,6 +385,7 @@ class ZoneCacheManager:
             'zone_count': len(final_zone_ids),
             'zone_ids': final_zone_ids,
             'partial_update': partial,
+            'controller_firmware': controller_firmware,
             'version': 1  # For future schema changes
         }
 
@@ -297,11 +460,11 @@ class ZoneCacheManager:
         Returns:
             Age in seconds or None if not cached
         """
-        cached = await self.get_cached_zone(zone_id)
-        if not cached:
+        summary = (await self.get_zone_summaries([zone_id])).get(zone_id)
+        if not summary:
             return None
 
-        cached_at = cached.get('_cached_at')
+        cached_at = summary.get('cached_at')
         if not cached_at:
             return None
 
@@ -323,18 +486,18 @@ class ZoneCacheManager:
         if not meta or not meta.get('zone_ids'):
             return []
 
-        zone_ids = meta['zone_ids']
-        cached_zones = await self.get_cached_zones(zone_ids)
+        # Summaries only - zone bodies are not decoded
+        summaries = await self.get_zone_summaries(meta['zone_ids'])
 
         zones_list = []
-        for zone_id, zone_data in cached_zones.items():
+        for zone_id, summary in summaries.items():
             zones_list.append({
                 'zone_id': zone_id,
-                'zone_name': zone_data.get('zone_name', 'Unknown'),
-                'domain_name': zone_data.get('domain_name', 'Unknown'),
-                'cached_at': zone_data.get('_cached_at'),
-                'ap_count': zone_data.get('ap_status', {}).get('total', 0) if isinstance(zone_data.get('ap_status'), dict) else 0,
-                'wlan_count': zone_data.get('wlan_count', 0)
+                'zone_name': summary.get('zone_name') or 'Unknown',
+                'domain_name': summary.get('domain_name') or 'Unknown',
+                'cached_at': summary.get('cached_at'),
+                'ap_count': summary.get('ap_count', 0),
+                'wlan_count': summary.get('wlan_count', 0)
             })
 
         # Sort by zone name
@@ -352,7 +515,8 @@ class ZoneCacheManager:
     async def cache_switch_groups(
         self,
         switch_groups: Dict[str, List[Dict[str, Any]]],
-        switches: List[Dict[str, Any]] = None
+        switches: List[Dict[str, Any]] = None,
+        domains: Dict[str, Dict[str, int]] = None
     ) -> None:
         """
         Cache all switch groups with their switch data.
@@ -360,6 +524,8 @@ class ZoneCacheManager:
         Args:
             switch_groups: Dict of domain_id -> list of switch group dicts
             switches: Optional list of all switches (to compute counts per group)
+            domains: Optional dict of domain_id -> {"total_switches", "switch_groups"}
+                     (per-domain totals, for when switch_groups isn't keyed by domain)
         """
         # Build switch count per group from switches if provided
         switch_counts = {}  # sg_id -> {total, online, offline, firmware_versions}
@@ -439,6 +605,8 @@ class ZoneCacheManager:
             "total_switches": total_switches,
             "_cached_at": datetime.utcnow().isoformat()
         }
+        if domains:
+            cache_data["domains"] = domains
 
         await self.redis.set(
             key,
@@ -458,7 +626,8 @@ class ZoneCacheManager:
 
         Returns:
             Dict with 'switch_groups' (domain_id -> list of switch group dicts),
-            'total_switches', and '_cached_at', or None if not cached
+            'total_switches', '_cached_at' and, when cached by an audit,
+            'domains' (domain_id -> per-domain totals), or None if not cached
         """
         key = self._switch_groups_key()
         data = await self.redis.get(key)
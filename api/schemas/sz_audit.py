@@ -211,6 +211,14 @@ class ExportAuditRequest(BaseModel):
         default_factory=list,
         description="Optional manual zone-to-switch-group mappings per controller"
     )
+    use_cache: bool = Field(
+        default=False,
+        description=(
+            "Export cached zones from the last audit (up to 7 days old) instead of auditing live; "
+            "controllers with no cache are audited live"
+        )
+    )
+    gzip: bool = Field(default=False, description="Gzip-compress the export stream")
 
 
 class BatchAuditResponse(BaseModel):
@@ -0,0 +1,266 @@
+"""
+Benchmark: WorkflowBrain scheduling overhead at 1k and 5k units.
+
+Drives a synthetic job (the per_unit_psk phase DAG plus a trailing global
+phase that waits on every unit) to completion with instant phases, and times
+only the scheduling work:
+
+  - full-scan: what the brain did before the ready-queue scheduler - on
+    every pass rebuild ready work for every unit, scan every unit for every
+    per-unit phase to find ready global phases, and re-check completion
+    across all units. The old loop also ran this every 250 ms while idle.
+  - ready-queue: PhaseScheduler, which only touches the unit whose task
+    finished.
+
+Tasks complete in batches of MAX_CONCURRENT_PHASE_TASKS, matching the
+brain's phase semaphore, so both schedulers see the same event sequence.
+No Redis or R1 access is needed.
+
+Usage:
+    docker compose exec backend python scripts/bench_brain_scheduler.py [units ...]
+
+Example:
+    docker compose exec backend python scripts/bench_brain_scheduler.py 1000 5000
+"""
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+# Add project root to path (same pattern as other scripts/ entries)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.safe_eval import safe_eval
+from workflow.v2.brain import HOUSEKEEPING_INTERVAL, MAX_CONCURRENT_PHASE_TASKS
+from workflow.v2.graph import DependencyGraph
+from workflow.v2.models import (
+    PhaseDefinitionV2,
+    PhaseStatus,
+    UnitMapping,
+    UnitStatus,
+    WorkflowJobV2,
+)
+from workflow.v2.scheduler import PhaseScheduler
+
+LEGACY_SCHEDULE_INTERVAL = 0.25
+
+
+def build_job(unit_count: int) -> WorkflowJobV2:
+    def phase(pid, depends_on, per_unit=True, skip_if=None):
+        return PhaseDefinitionV2(
+            id=pid, name=pid, depends_on=depends_on, per_unit=per_unit,
+            skip_if=skip_if, executor=f"bench.{pid}",
+        )
+
+    phases = [
+        phase("validate", [], per_unit=False),
+        phase("create_ap_group", ["validate"]),
+        phase("create_psk_network", ["validate"]),
+        phase("activate_network", ["create_ap_group", "create_psk_network"]),
+        phase("assign_aps", ["create_ap_group"]),
+        phase(
+            "configure_lan_ports", ["assign_aps"],
+            skip_if="not options.get('configure_lan_ports', False)",
+        ),
+        phase("summarize", ["activate_network", "configure_lan_ports"], per_unit=False),
+    ]
+    units = {
+        f"unit_{i}": UnitMapping(unit_id=f"unit_{i}", unit_number=str(i))
+        for i in range(unit_count)
+    }
+    return WorkflowJobV2(
+        id="bench",
+        workflow_name="bench",
+        options={"configure_lan_ports": True},
+        units=units,
+        phase_definitions=phases,
+        global_phase_status={"validate": PhaseStatus.COMPLETED},
+    )
+
+
+# -----------------------------------------------------------------------------
+# Full-scan scheduler (pre ready-queue brain logic, kept here for comparison)
+# -----------------------------------------------------------------------------
+
+def full_scan_ready_work(job, graph):
+    ready = []
+    global_completed = {
+        pid for pid, status in job.global_phase_status.items()
+        if status == PhaseStatus.COMPLETED
+    }
+    for unit_id, unit in job.units.items():
+        if unit.status == UnitStatus.FAILED or unit.current_phase is not None:
+            continue
+        completed_set = set(unit.completed_phases)
+        failed_set = set(unit.failed_phases)
+        for phase_id in graph.get_ready_work_for_unit(
+            completed_set, unit.current_phase, global_completed
+        ):
+            if phase_id not in completed_set and phase_id not in failed_set:
+                ready.append((unit_id, phase_id))
+    return ready
+
+
+def full_scan_ready_globals(job):
+    global_completed = {
+        pid for pid, status in job.global_phase_status.items()
+        if status == PhaseStatus.COMPLETED
+    }
+    per_unit_completed_all = {
+        p.id for p in job.phase_definitions
+        if p.per_unit and all(p.id in u.completed_phases for u in job.units.values())
+    }
+    return [
+        p.id for p in job.phase_definitions
+        if not p.per_unit
+        and p.id not in job.global_phase_status
+        and all(d in global_completed or d in per_unit_completed_all for d in p.depends_on)
+    ]
+
+
+def full_scan_complete(job, graph):
+    per_unit_ids = {p.id for p in job.phase_definitions if p.per_unit}
+    global_completed = {
+        pid for pid, status in job.global_phase_status.items()
+        if status == PhaseStatus.COMPLETED
+    }
+    for unit in job.units.values():
+        if unit.status == UnitStatus.FAILED:
+            continue
+        done = set(unit.completed_phases) | set(unit.failed_phases)
+        for p in job.phase_definitions:
+            if p.skip_if and p.per_unit and safe_eval(p.skip_if, {"options": job.options}):
+                done.add(p.id)
+        for pid in per_unit_ids - done:
+            if graph.get_dependencies(pid) <= done | global_completed:
+                return False
+    return all(
+        job.global_phase_status.get(p.id) in (PhaseStatus.COMPLETED, PhaseStatus.FAILED)
+        for p in job.phase_definitions if not p.per_unit
+    )
+
+
+# -----------------------------------------------------------------------------
+# Simulation
+# -----------------------------------------------------------------------------
+
+def finish(job, key):
+    unit_id, phase_id = key
+    if unit_id is None:
+        job.global_phase_status[phase_id] = PhaseStatus.COMPLETED
+    else:
+        unit = job.units[unit_id]
+        unit.current_phase = None
+        unit.completed_phases.append(phase_id)
+
+
+def start(job, key):
+    unit_id, phase_id = key
+    if unit_id is not None:
+        job.units[unit_id].current_phase = phase_id
+        job.units[unit_id].status = UnitStatus.RUNNING
+
+
+def run_full_scan(unit_count):
+    job = build_job(unit_count)
+    graph = DependencyGraph(job.phase_definitions)
+    running, in_flight = deque(), set()
+    passes, sched = 0, 0.0
+    while True:
+        t0 = time.perf_counter()
+        complete = full_scan_complete(job, graph)
+        if not complete:
+            ready = [k for k in full_scan_ready_work(job, graph) if k not in in_flight]
+            ready += [(None, p) for p in full_scan_ready_globals(job) if (None, p) not in in_flight]
+        sched += time.perf_counter() - t0
+        passes += 1
+        if complete:
+            break
+        for key in ready:
+            in_flight.add(key)
+            start(job, key)
+            running.append(key)
+        for _ in range(min(MAX_CONCURRENT_PHASE_TASKS, len(running))):
+            key = running.popleft()
+            in_flight.discard(key)
+            finish(job, key)
+    return sched, passes
+
+
+def run_ready_queue(unit_count):
+    job = build_job(unit_count)
+    graph = DependencyGraph(job.phase_definitions)
+    running = deque()
+    passes, sched = 0, 0.0
+
+    t0 = time.perf_counter()
+    scheduler = PhaseScheduler(job, graph)
+    scheduler.start()
+    sched += time.perf_counter() - t0
+
+    while True:
+        t0 = time.perf_counter()
+        complete = scheduler.is_complete()
+        if not complete:
+            ready = scheduler.pop_ready() + [(None, p) for p in scheduler.pop_ready_global()]
+        sched += time.perf_counter() - t0
+        passes += 1
+        if complete:
+            break
+        for key in ready:
+            start(job, key)
+            running.append(key)
+        batch = [running.popleft() for _ in range(min(MAX_CONCURRENT_PHASE_TASKS, len(running)))]
+        for key in batch:
+            finish(job, key)
+        t0 = time.perf_counter()
+        for unit_id, phase_id in batch:
+            if unit_id is None:
+                scheduler.global_finished(phase_id)
+            else:
+                scheduler.unit_finished(unit_id, phase_id)
+        sched += time.perf_counter() - t0
+    return sched, passes
+
+
+def idle_pass_cost(unit_count):
+    """One full-scan pass with every unit mid-phase (nothing finishes)."""
+    job = build_job(unit_count)
+    graph = DependencyGraph(job.phase_definitions)
+    for unit in job.units.values():
+        unit.completed_phases = ["create_ap_group", "create_psk_network"]
+        unit.current_phase = "activate_network"
+    t0 = time.perf_counter()
+    full_scan_complete(job, graph)
+    full_scan_ready_work(job, graph)
+    full_scan_ready_globals(job)
+    return time.perf_counter() - t0
+
+
+def main(unit_counts):
+    print(
+        f"batch={MAX_CONCURRENT_PHASE_TASKS} tasks/pass, legacy tick "
+        f"{LEGACY_SCHEDULE_INTERVAL * 1000:.0f}ms, housekeeping "
+        f"{HOUSEKEEPING_INTERVAL:.1f}s"
+    )
+    for units in unit_counts:
+        full_time, full_passes = run_full_scan(units)
+        rq_time, rq_passes = run_ready_queue(units)
+        idle = idle_pass_cost(units)
+        print(
+            f"units={units:5d}  full-scan: {full_time:7.2f}s over {full_passes} passes "
+            f"({full_time / full_passes * 1000:6.2f}ms/pass)   "
+            f"ready-queue: {rq_time * 1000:7.1f}ms over {rq_passes} passes "
+            f"({rq_time / rq_passes * 1000:6.3f}ms/pass)   "
+            f"speedup {full_time / rq_time:6.0f}x"
+        )
+        print(
+            f"{'':12}idle full-scan pass {idle * 1000:.1f}ms -> "
+            f"{idle / LEGACY_SCHEDULE_INTERVAL * 100:.1f}% of a core while "
+            f"waiting on long phases (ready-queue: 0%)"
+        )
+
+
+if __name__ == "__main__":
+    counts = [int(a) for a in sys.argv[1:]] or [1000, 5000]
+    main(counts)
@@ -0,0 +1,257 @@
+"""
+Benchmark: orchestrator full-sync diff writes at 10k passphrases.
+
+Seeds a scratch SQLite database with one orchestrator whose site-wide pool
+holds N passphrases: some still in the source pools, some whose source was
+deleted (mapped -> flagged for removal), some never synced (orphans), plus
+mappings whose target is gone (stale -> target_missing). Then compares:
+
+  - per-row: what full_sync did before MappingIndex - one
+    _get_mapping_by_target query per site-wide passphrase missing from the
+    sources, a commit per flagged mapping, and a source-pool suggestion
+    query plus a commit per orphan.
+  - indexed: SyncEngine.full_sync with MappingIndex - one mapping query,
+    bulk UPDATEs, one multi-row INSERT for orphans, and a single commit.
+
+Both start from identical databases and must leave identical mapping
+states; the script exits non-zero if they differ. R1 is replaced by an
+in-memory pool so only database work is timed. SQL statements are counted
+with a cursor-execute listener.
+
+Usage:
+    docker compose exec backend python scripts/bench_orchestrator_diff.py [--passphrases N]
+
+Example:
+    docker compose exec backend python scripts/bench_orchestrator_diff.py --passphrases 10000
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path (same pattern as other scripts/ entries)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models.orchestrator import (
+    DPSKOrchestrator,
+    OrchestratorSourcePool,
+    OrchestratorSyncEvent,
+    PassphraseMapping,
+)
+from routers.orchestrator.pool_reader import PoolReader
+from routers.orchestrator.sync_engine import SyncEngine
+from routers.orchestrator.sync_pool import get_username, normalize_vlan
+
+TABLES = [m.__table__ for m in (DPSKOrchestrator, OrchestratorSourcePool, OrchestratorSyncEvent, PassphraseMapping)]
+SOURCE_POOLS = 50
+
+# Both paths log a warning per flagged mapping / orphan
+logging.getLogger("routers.orchestrator").setLevel(logging.ERROR)
+
+
+class FakeDpsk:
+    """Instant in-memory stand-in for r1_client.dpsk (reads only)."""
+
+    def __init__(self, pools):
+        self.pools = pools
+
+    async def query_passphrases(self, pool_id, tenant_id=None, page=1, limit=100, **kwargs):
+        rows = self.pools.get(pool_id, [])
+        return {"data": rows[(page - 1) * limit:page * limit], "totalCount": len(rows)}
+
+    async def get_dpsk_pool(self, pool_id, tenant_id=None):
+        return {"id": pool_id, "name": pool_id, "passphraseLength": 8}
+
+
+class FakeR1Client:
+    def __init__(self, pools):
+        self.dpsk = FakeDpsk(pools)
+
+
+def seed(db_url: str, count: int):
+    """Create and fill a scratch database; returns (session factory, engine, pools)."""
+    engine = create_engine(db_url)
+    Base.metadata.create_all(engine, tables=TABLES)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+
+    orchestrator = DPSKOrchestrator(
+        name="bench", controller_id=1, tenant_id="bench-tenant", site_wide_pool_id="site-wide",
+    )
+    db.add(orchestrator)
+    db.flush()
+    for p in range(SOURCE_POOLS):
+        db.add(OrchestratorSourcePool(orchestrator_id=orchestrator.id, pool_id=f"unit-{p}", pool_name=f"Unit{p}"))
+
+    pools = {f"unit-{p}": [] for p in range(SOURCE_POOLS)}
+    site_wide = []
+    mappings = []
+    for i in range(count):
+        vlan = 100 + i % 200
+        pool = f"unit-{i % SOURCE_POOLS}"
+        site_pp = {"id": f"sw-{i}", "passphrase": f"pass-{i:06d}", "vlanId": vlan, "username": f"user{i} [Unit]"}
+        site_wide.append(site_pp)
+        kind = i % 4
+        if kind == 0:
+            # Still in its source pool - already synced
+            pools[pool].append({"id": f"src-{i}", "passphrase": site_pp["passphrase"], "vlanId": vlan, "username": f"user{i}"})
+        if kind in (0, 1):
+            # kind 1: source deleted -> flagged for removal
+            mappings.append(dict(
+                orchestrator_id=orchestrator.id, source_pool_id=pool, source_passphrase_id=f"src-{i}",
+                source_username=f"user{i}", target_passphrase_id=site_pp["id"], sync_status="synced", vlan_id=vlan,
+            ))
+        # kind 2/3: never synced -> orphan
+    # Mappings whose site-wide passphrase was deleted externally
+    for i in range(count // 20):
+        mappings.append(dict(
+            orchestrator_id=orchestrator.id, source_pool_id="unit-0", source_passphrase_id=f"gone-src-{i}",
+            source_username=f"gone{i}", target_passphrase_id=f"gone-{i}", sync_status="synced", vlan_id=100,
+        ))
+    pools["site-wide"] = site_wide
+    db.bulk_insert_mappings(PassphraseMapping, mappings)
+    db.commit()
+    db.close()
+    return Session, engine, pools
+
+
+class StatementCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+
+def mapping_state(Session):
+    db = Session()
+    try:
+        return sorted(
+            (m.target_passphrase_id or "", m.source_passphrase_id or "", m.sync_status, m.suggested_source_pool_id or "")
+            for m in db.query(PassphraseMapping).all()
+        )
+    finally:
+        db.close()
+
+
+# -----------------------------------------------------------------------------
+# Per-row diff writes (pre MappingIndex full_sync logic, kept here for comparison)
+# -----------------------------------------------------------------------------
+
+def per_row_diff(db, orchestrator, pools):
+    site_wide = pools["site-wide"]
+    site_wide_ids = {pp["id"] for pp in site_wide}
+    source_keys = {
+        (pp["passphrase"], normalize_vlan(pp.get("vlanId")))
+        for sp in orchestrator.source_pools for pp in pools[sp.pool_id]
+    }
+
+    existing_mappings = db.query(PassphraseMapping).filter(
+        PassphraseMapping.orchestrator_id == orchestrator.id,
+        PassphraseMapping.target_passphrase_id.isnot(None),
+        PassphraseMapping.sync_status.in_(["synced", "flagged_removal"])
+    ).all()
+    stale = [m for m in existing_mappings if m.target_passphrase_id not in site_wide_ids]
+    for mapping in stale:
+        mapping.sync_status = "target_missing"
+        mapping.flagged_at = datetime.utcnow()
+    db.commit()
+
+    to_flag, to_orphan = [], []
+    for site_pp in site_wide:
+        if (site_pp["passphrase"], normalize_vlan(site_pp.get("vlanId"))) in source_keys:
+            continue
+        mapping = db.query(PassphraseMapping).filter_by(
+            orchestrator_id=orchestrator.id, target_passphrase_id=site_pp["id"]
+        ).first()
+        if mapping:
+            to_flag.append(mapping)
+        else:
+            to_orphan.append(site_pp)
+
+    for mapping in to_flag:
+        mapping.sync_status = "flagged_removal"
+        mapping.flagged_at = datetime.utcnow()
+        db.commit()
+
+    for site_pp in to_orphan:
+        suggestion = db.query(PassphraseMapping).filter_by(
+            orchestrator_id=orchestrator.id, vlan_id=site_pp["vlanId"], sync_status="synced"
+        ).first()
+        db.add(PassphraseMapping(
+            orchestrator_id=orchestrator.id,
+            source_pool_id="",
+            target_passphrase_id=site_pp["id"],
+            source_username=get_username(site_pp) or "unknown",
+            sync_status="orphan",
+            suggested_source_pool_id=suggestion.source_pool_id if suggestion else None,
+            vlan_id=normalize_vlan(site_pp.get("vlanId")),
+            passphrase_preview=site_pp["passphrase"][:4] + "****",
+        ))
+        db.commit()
+    return len(to_flag), len(to_orphan)
+
+
+async def indexed_diff(db, orchestrator_id, pools):
+    engine = SyncEngine(orchestrator_id, db)
+    engine.orchestrator = db.get(DPSKOrchestrator, orchestrator_id)
+    engine.r1_client = FakeR1Client(pools)
+    engine.pool_reader = PoolReader(engine.r1_client, engine.orchestrator.tenant_id, rate_limited=engine._rate_limited)
+    result = await engine.full_sync("manual")
+    if result.errors:
+        raise RuntimeError(f"full_sync failed: {result.errors}")
+    return result.flagged, result.orphans
+
+
+# -----------------------------------------------------------------------------
+# Benchmark
+# -----------------------------------------------------------------------------
+
+def main(count):
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_session, legacy_engine, pools = seed(f"sqlite:///{tmp}/per_row.db", count)
+        index_session, index_engine, _ = seed(f"sqlite:///{tmp}/indexed.db", count)
+        print(f"passphrases={count} source_pools={SOURCE_POOLS} (SQLite, {tmp})")
+
+        counter = StatementCounter(legacy_engine)
+        db = legacy_session()
+        orchestrator = db.query(DPSKOrchestrator).first()
+        t0 = time.perf_counter()
+        legacy_counts = per_row_diff(db, orchestrator, pools)
+        legacy_time = time.perf_counter() - t0
+        legacy_statements = counter.count
+        db.close()
+
+        counter = StatementCounter(index_engine)
+        db = index_session()
+        orchestrator_id = db.query(DPSKOrchestrator).first().id
+        t0 = time.perf_counter()
+        index_counts = asyncio.run(indexed_diff(db, orchestrator_id, pools))
+        index_time = time.perf_counter() - t0
+        index_statements = counter.count
+        db.close()
+
+        if legacy_counts != index_counts or mapping_state(legacy_session) != mapping_state(index_session):
+            print(f"MISMATCH: per-row flagged/orphans={legacy_counts}, indexed={index_counts}")
+            sys.exit(1)
+
+        print(f"flagged={index_counts[0]} orphans={index_counts[1]}   mapping states identical")
+        print(f"per-row: {legacy_time:8.2f}s  {legacy_statements:7d} SQL statements")
+        print(f"indexed: {index_time:8.2f}s  {index_statements:7d} SQL statements (whole full_sync)")
+        print(f"speedup {legacy_time / index_time:6.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--passphrases", type=int, default=10000)
+    args = parser.parse_args()
+    main(args.passphrases)
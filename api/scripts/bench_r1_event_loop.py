@@ -0,0 +1,123 @@
+"""
+Benchmark: event-loop latency while R1 calls are in flight.
+
+Starts a local stub HTTP server that answers every request after a fixed
+delay, points an R1Client at it, and fires N concurrent calls from
+coroutines - first through the blocking verbs (what every async service
+method did before the async transport), then through the awaitable verbs.
+A ticker task sleeps 10 ms in a loop and records how late it wakes up; that
+lateness is what SSE streams, the workflow brain and webhook handlers see.
+
+No R1 credentials or network access are needed.
+
+Usage:
+    docker compose exec backend python scripts/bench_r1_event_loop.py [concurrency] [delay_ms]
+
+Example:
+    docker compose exec backend python scripts/bench_r1_event_loop.py 200 50
+"""
+import asyncio
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add project root to path (same pattern as other scripts/ entries)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from r1api.client import R1Client
+from r1api.token_cache import store_token, token_key
+from r1api.transport import close_async_http_client
+
+TICK_SECONDS = 0.010
+
+
+def start_stub_server(delay_seconds: float) -> ThreadingHTTPServer:
+    body = json.dumps({"data": [], "totalCount": 0}).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            time.sleep(delay_seconds)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST = _reply
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 1024
+
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def measure(label: str, make_call, concurrency: int):
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            before = time.perf_counter()
+            await asyncio.sleep(TICK_SECONDS)
+            lags.append(time.perf_counter() - before - TICK_SECONDS)
+
+    tick_task = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK_SECONDS * 3)  # let the ticker settle
+
+    start = time.perf_counter()
+    responses = await asyncio.gather(*(make_call() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    done.set()
+    await tick_task
+
+    ok = sum(1 for r in responses if r.ok)
+    lags_ms = sorted(l * 1000 for l in lags) or [0.0]
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(
+        f"{label:<28} wall={elapsed:6.2f}s ok={ok}/{concurrency} "
+        f"ticks={len(lags_ms):4d} lag p50={statistics.median(lags_ms):7.1f}ms "
+        f"p99={p99:7.1f}ms max={lags_ms[-1]:7.1f}ms"
+    )
+
+
+async def main(concurrency: int, delay_ms: int):
+    server = start_stub_server(delay_ms / 1000)
+    port = server.server_address[1]
+
+    store_token(token_key("bench-tenant", "api.ruckus.cloud", "bench-client"), "bench-token", 3600)
+    r1 = R1Client("bench-tenant", "bench-client", "bench-secret")
+    r1.base_url = f"http://127.0.0.1:{port}"
+
+    print(f"{concurrency} concurrent POSTs, stub delay {delay_ms}ms, tick {TICK_SECONDS * 1000:.0f}ms")
+
+    async def blocking_call():
+        return r1.post("/venues/query", payload={"page": 1})
+
+    async def async_call():
+        return await r1.apost("/venues/query", payload={"page": 1})
+
+    await measure("before (blocking session)", blocking_call, concurrency)
+    await measure("after (async transport)", async_call, concurrency)
+
+    await close_async_http_client()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    delay_ms = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    asyncio.run(main(concurrency, delay_ms))
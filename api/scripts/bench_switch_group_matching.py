@@ -0,0 +1,268 @@
+"""
+Benchmark: switch group matching at 5k zones x 5k switch groups.
+
+Compares the audit finalize matching paths on synthetic property names
+(camelCase, SG_/-Switches affixes, building/phase suffixes, shared words):
+
+  - all-pairs: what finalize did before SwitchGroupIndex - score every zone
+    against every switch group (get_match_candidates), and the greedy
+    matcher's linear scan of every group per tier and domain pass.
+  - index: SwitchGroupIndex lookups, scoring only groups that can match.
+
+Both paths must produce identical candidate rankings and identical greedy
+assignments; the script exits non-zero if they differ. All-pairs is too
+slow to run over 5k zones by default, so it runs on the first --sample
+zones (the greedy matcher is order-dependent, so both paths get the same
+prefix) and the full time is extrapolated. Pass --sample 0 to run it all.
+
+No Redis or SmartZone access is needed.
+
+Usage:
+    docker compose exec backend python scripts/bench_switch_group_matching.py [--zones N] [--groups N] [--sample N]
+
+Example:
+    docker compose exec backend python scripts/bench_switch_group_matching.py --zones 5000 --groups 5000
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path (same pattern as other scripts/ entries)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from routers.sz.phases.finalize import (
+    SwitchGroupIndex,
+    _STOP_WORDS,
+    _extract_words,
+    _longest_common_prefix,
+    _match_switch_groups_to_zones,
+    _normalize_name,
+    get_match_candidates,
+    score_switch_group_match,
+)
+from schemas.sz_audit import SwitchGroupSummary
+
+WORDS = [
+    "oak", "maple", "cedar", "willow", "harbor", "summit", "river", "lake",
+    "park", "grove", "ridge", "meadow", "creek", "valley", "heights", "landing",
+    "commons", "crossing", "pointe", "vista", "tower", "court", "gardens", "square",
+    "university", "campus", "hall", "lofts", "residences", "manor",
+]
+NOISE = ["apartments", "village", "station", "north", "south", "phase", "the", "new"]
+DOMAINS = [f"domain-{i}" for i in range(20)]
+
+
+def make_name(rng: random.Random, i: int) -> str:
+    words = rng.sample(WORDS, rng.randint(1, 3))
+    if rng.random() < 0.3:
+        words.append(rng.choice(NOISE))
+    style = rng.random()
+    if style < 0.4:
+        base = "".join(w.capitalize() for w in words)
+    elif style < 0.7:
+        base = "_".join(words)
+    else:
+        base = " ".join(w.capitalize() for w in words)
+    return f"{base}{i}" if rng.random() < 0.6 else f"{base} Bldg {i % 40}"
+
+
+def make_group_name(rng: random.Random, zone_name: str, i: int) -> str:
+    """Switch group names: mostly derived from a zone name, some unrelated."""
+    roll = rng.random()
+    if roll < 0.25:
+        return zone_name
+    if roll < 0.45:
+        return f"SG_{zone_name}"
+    if roll < 0.6:
+        return f"{zone_name}-Switches"
+    if roll < 0.75:
+        return f"{zone_name.split()[0]} ICX {i}"
+    return make_name(rng, i + 100000)
+
+
+def build_data(zone_count: int, group_count: int, seed: int = 7):
+    rng = random.Random(seed)
+    zone_names = [make_name(rng, i) for i in range(zone_count)]
+    zones = [(name, rng.choice(DOMAINS)) for name in zone_names]
+    groups = [
+        {
+            "id": f"sg-{i}",
+            "name": make_group_name(rng, rng.choice(zone_names), i),
+            "domain_id": rng.choice(DOMAINS),
+            "switch_count": rng.randint(1, 24),
+        }
+        for i in range(group_count)
+    ]
+    rng.shuffle(groups)
+    return zones, groups
+
+
+# -----------------------------------------------------------------------------
+# All-pairs matching (pre SwitchGroupIndex finalize logic, kept here for comparison)
+# -----------------------------------------------------------------------------
+
+def all_pairs_candidates(zone_name, zone_domain_id, all_switch_groups, top_n=3, min_score=20):
+    candidates = []
+    for sg in all_switch_groups:
+        score, match_type, match_reason = score_switch_group_match(
+            zone_name, zone_domain_id, sg.get("name", ""), sg.get("domain_id", "")
+        )
+        if score >= min_score:
+            candidates.append({
+                "switch_group_id": sg.get("id", ""),
+                "switch_group_name": sg.get("name", ""),
+                "switch_count": sg.get("switch_count", 0),
+                "switches_online": sg.get("switches_online", 0),
+                "switches_offline": sg.get("switches_offline", 0),
+                "score": score,
+                "match_type": match_type,
+                "match_reason": match_reason,
+                "same_domain": zone_domain_id == sg.get("domain_id", ""),
+            })
+    candidates.sort(key=lambda c: (-c["score"], c["switch_group_name"]))
+    return candidates[:top_n]
+
+
+def all_pairs_greedy(zones, all_switch_groups):
+    sgs = [
+        {
+            "id": sg["id"],
+            "domain_id": sg["domain_id"],
+            "normalized": _normalize_name(sg["name"]),
+            "name_lower": sg["name"].lower(),
+            "words": _extract_words(sg["name"]),
+        }
+        for sg in all_switch_groups
+    ]
+    matched = set()
+    assignments = []
+
+    def find_match(zone_domain_id, match_fn):
+        for same_domain in (True, False):
+            for sg in sgs:
+                if sg["id"] in matched:
+                    continue
+                if (not same_domain or sg["domain_id"] == zone_domain_id) and match_fn(sg):
+                    matched.add(sg["id"])
+                    return sg["id"]
+        return None
+
+    for zone_name, zone_domain_id in zones:
+        lower = zone_name.lower()
+        normalized = _normalize_name(zone_name)
+        significant = set(_extract_words(zone_name)) - _STOP_WORDS
+
+        def overlap(sg):
+            common = significant & (set(sg["words"]) - _STOP_WORDS)
+            return len(common) >= 2 or (len(common) == 1 and len(next(iter(common))) >= 5)
+
+        tiers = [lambda sg: sg["name_lower"] == lower]
+        if normalized:
+            tiers.append(lambda sg: sg["normalized"] == normalized)
+        if len(lower) >= 3:
+            tiers.append(lambda sg: len(sg["name_lower"]) >= 3 and (
+                lower in sg["name_lower"] or sg["name_lower"] in lower))
+        if significant:
+            tiers.append(overlap)
+        if len(normalized) >= 6:
+            tiers.append(lambda sg: len(sg["normalized"]) >= 6 and len(
+                _longest_common_prefix(normalized, sg["normalized"])) >= 6)
+
+        match = None
+        for match_fn in tiers:
+            match = find_match(zone_domain_id, match_fn)
+            if match:
+                break
+        assignments.append(match)
+    return assignments
+
+
+def index_greedy(zones, all_switch_groups):
+    zone_objs = [
+        SimpleNamespace(zone_name=name, domain_id=domain_id, user_set_mapping=False, matched_switch_groups=[])
+        for name, domain_id in zones
+    ]
+    raw = {}
+    for sg in all_switch_groups:
+        raw.setdefault(sg["domain_id"], []).append(sg)
+    summaries = [SwitchGroupSummary(id=sg["id"], name=sg["name"]) for sg in all_switch_groups]
+    _match_switch_groups_to_zones(zone_objs, raw, summaries)
+    return [z.matched_switch_groups[0].id if z.matched_switch_groups else None for z in zone_objs]
+
+
+def grouped_by_domain(all_switch_groups):
+    """Switch groups in the order finalize flattens switch_groups_raw."""
+    raw = {}
+    for sg in all_switch_groups:
+        raw.setdefault(sg["domain_id"], []).append(sg)
+    return [sg for sgs in raw.values() for sg in sgs]
+
+
+# -----------------------------------------------------------------------------
+# Benchmark
+# -----------------------------------------------------------------------------
+
+def main(zone_count, group_count, sample):
+    zones, groups = build_data(zone_count, group_count)
+    groups = grouped_by_domain(groups)
+    sampled = zones[:sample] if sample else zones
+    scale = len(zones) / len(sampled)
+    print(f"zones={len(zones)} switch_groups={len(groups)} all-pairs sample={len(sampled)} zones")
+
+    # Candidate ranking (audit /switch-group-candidates)
+    t0 = time.perf_counter()
+    legacy = [all_pairs_candidates(name, domain, groups) for name, domain in sampled]
+    legacy_time = (time.perf_counter() - t0) * scale
+
+    t0 = time.perf_counter()
+    index = SwitchGroupIndex(groups)
+    build_time = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    indexed = [get_match_candidates(name, domain, groups, index=index) for name, domain in zones]
+    index_time = time.perf_counter() - t0
+
+    if indexed[:len(sampled)] != legacy:
+        print("MISMATCH: candidate rankings differ")
+        sys.exit(1)
+    print(
+        f"candidates   all-pairs: {legacy_time:8.2f}s{' (extrapolated)' if scale > 1 else ''}   "
+        f"index: {build_time * 1000:6.1f}ms build + {index_time * 1000:7.1f}ms lookup   "
+        f"speedup {legacy_time / (build_time + index_time):6.0f}x   rankings identical"
+    )
+
+    # Greedy assignment (finalize phase)
+    t0 = time.perf_counter()
+    legacy_matches = all_pairs_greedy(sampled, groups)
+    legacy_time = (time.perf_counter() - t0) * scale
+
+    t0 = time.perf_counter()
+    index_matches = index_greedy(zones, groups)
+    index_time = time.perf_counter() - t0
+
+    if sample:
+        # Same zone prefix, same greedy order -> same assignments
+        check = index_greedy(sampled, groups)
+    else:
+        check = index_matches
+    if check != legacy_matches:
+        print("MISMATCH: greedy assignments differ")
+        sys.exit(1)
+    matched = sum(1 for m in index_matches if m)
+    print(
+        f"greedy match all-pairs: {legacy_time:8.2f}s{' (extrapolated)' if scale > 1 else ''}   "
+        f"index: {index_time * 1000:7.1f}ms (incl. build)   "
+        f"speedup {legacy_time / index_time:6.0f}x   "
+        f"assignments identical ({matched}/{len(zones)} zones matched)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--zones", type=int, default=5000)
+    parser.add_argument("--groups", type=int, default=5000)
+    parser.add_argument("--sample", type=int, default=250, help="zones run through all-pairs (0 = all)")
+    args = parser.parse_args()
+    main(args.zones, args.groups, args.sample)
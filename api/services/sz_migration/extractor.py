@@ -1,22 +1,28 @@
 """
 SZ Migration Extractor — M0 Extraction Orchestrator
 
-Ordered extraction with reference chasing:
-1. Fetch zone detail
-2. Fetch all WLANs (paginated, full detail each)
-3. Fetch WLAN Groups (members come inline)
-4. Fetch all AP Groups (full detail with radioConfig parsing)
-5. Fetch all APs (paginated)
-6. Scan all WLANs for foreign key references → deduplicate → fetch each once
-7. Assemble SZMigrationSnapshot
-
-Progress callback fires at each sub-step for SSE integration.
+Staged extraction with reference chasing:
+1. Fetch zone detail (sets the zone's API version)
+2. Fetch the WLAN, WLAN Group and AP Group lists and the first AP page together
+3. Fetch WLAN details, AP Group details and remaining AP pages concurrently;
+   each WLAN's foreign key references are chased as soon as its detail arrives
+4. Assemble SZMigrationSnapshot
+
+Detail fetches share one bounded pool sized from SZClient's rate limit (the
+client's token bucket still paces the actual requests). Referenced AAA and
+policy objects go through a per-extraction memo keyed by API resource, so an
+object referenced by many WLANs (or by two reference types that resolve to
+the same path) is fetched once.
+
+Progress callback fires at each sub-step for SSE integration. Plain and
+async callbacks are both supported; async ones run in emission order.
 """
 
 import asyncio
+import inspect
 import logging
 import time
-from typing import Callable, Optional, Dict, Any, List
+from typing import Awaitable, Callable, Optional, Dict, Any, List, Tuple, Union
 
 from schemas.sz_migration import (
     SZMigrationSnapshot,
@@ -29,13 +35,74 @@ from schemas.sz_migration import (
     SZReferencedObject,
     SZExtractionWarning,
 )
+from szapi.client import rate_budget_concurrency
 from szapi.services.wlans import WlanService
+from szapi.services.policies import REFERENCE_TYPE_PATHS
 from services.sz_migration.version_map import detect_zone_api_version
 
 logger = logging.getLogger(__name__)
 
 # Type alias for the progress callback
-ProgressCallback = Optional[Callable[[str, str, Dict[str, Any]], None]]
+ProgressCallback = Optional[Callable[[str, str, Dict[str, Any]], Union[None, Awaitable[None]]]]
+
+# Detail fetches in flight per extraction: one slot per REQUESTS_PER_SLOT
+# req/s of the client's rate limit, so the pool never queues far ahead of
+# the token bucket
+REQUESTS_PER_SLOT = 5
+MAX_EXTRACTION_CONCURRENCY = 20
+
+AP_PAGE_LIMIT = 100  # Safety cap on AP pages per zone
+
+
+def extraction_concurrency(sz_client) -> int:
+    """Number of concurrent detail fetches for a controller, from its rate budget."""
+    return rate_budget_concurrency(sz_client, REQUESTS_PER_SLOT, MAX_EXTRACTION_CONCURRENCY)
+
+
+class ReferenceMemo:
+    """
+    Per-extraction memo of referenced-object fetches.
+
+    Keyed by the API resource a reference resolves to, so WLANs referencing
+    the same object share one request, even while it is still in flight.
+    """
+
+    def __init__(self, sz_client, zone_id: str, limit: asyncio.Semaphore):
+        self.sz_client = sz_client
+        self.zone_id = zone_id
+        self.limit = limit
+        self._tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    @staticmethod
+    def resource_key(ref_type: str, ref_id: str) -> Tuple[str, str]:
+        if ref_type in ("auth_service", "accounting_service"):
+            return (ref_type, ref_id)
+        return (REFERENCE_TYPE_PATHS.get(ref_type, ref_type), ref_id)
+
+    @property
+    def fetch_count(self) -> int:
+        return len(self._tasks)
+
+    def get(self, ref_type: str, ref_id: str) -> asyncio.Task:
+        """Start (or join) the fetch for a reference; the task returns the raw object."""
+        key = self.resource_key(ref_type, ref_id)
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.create_task(self._fetch(ref_type, ref_id))
+        return task
+
+    async def _fetch(self, ref_type: str, ref_id: str) -> Dict[str, Any]:
+        async with self.limit:
+            if ref_type == "auth_service":
+                return await self.sz_client.aaa.get_auth_service(ref_id)
+            if ref_type == "accounting_service":
+                return await self.sz_client.aaa.get_accounting_service(ref_id)
+            return await self.sz_client.policies.get_referenced_object(self.zone_id, ref_type, ref_id)
+
+    def cancel(self) -> None:
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
 
 
 async def extract_zone_snapshot(
@@ -50,129 +117,203 @@ async def extract_zone_snapshot(
         sz_client: Authenticated SZClient instance (already in context manager)
         zone_id: Zone UUID to extract
         on_progress: Optional callback(phase, message, data) for SSE progress
+                     (plain function or coroutine function)
 
     Returns:
         Complete SZMigrationSnapshot
     """
     start_time = time.time()
     warnings: List[SZExtractionWarning] = []
+    progress_tail: Optional[asyncio.Task] = None
+
+    async def chain_progress(previous: Optional[asyncio.Task], pending: Awaitable[None]):
+        if previous is not None:
+            try:
+                await previous
+            except asyncio.CancelledError:
+                if inspect.iscoroutine(pending):
+                    pending.close()  # Never started - don't leave it unawaited
+                raise
+        try:
+            await pending
+        except Exception as e:
+            logger.debug(f"Extraction progress callback failed: {e}")
 
     def progress(phase: str, message: str, data: Optional[Dict] = None):
+        nonlocal progress_tail
         logger.info(f"[extraction:{zone_id[:8]}] {phase}: {message}")
         if on_progress:
-            on_progress(phase, message, data or {})
-
-    # ── Step 1: Zone detail ──────────────────────────────────────────
-    progress("zone", "Fetching zone details...")
-    zone_raw = await sz_client.zones.get_zone_full_details(zone_id)
-
-    zone_radio_config = None
-    if zone_raw.get("radioConfig"):
-        zone_radio_config = SZRadioConfig.from_sz_response(zone_raw["radioConfig"])
-
-    zone_snapshot = SZZoneSnapshot(
-        id=zone_raw["id"],
-        name=zone_raw.get("name", ""),
-        description=zone_raw.get("description"),
-        country_code=zone_raw.get("countryCode"),
-        radio_config=zone_radio_config,
-        raw=zone_raw,
-    )
-    # ── Detect zone firmware → set API version for zone-specific calls ──
-    controller_api_version = sz_client.api_version
-    zone_firmware = zone_raw.get("version")
-    zone_api_version = detect_zone_api_version(zone_firmware, fallback=controller_api_version)
-
-    if zone_api_version and zone_api_version != controller_api_version:
-        sz_client.api_version = zone_api_version
-        progress("zone", f"Zone '{zone_snapshot.name}' firmware {zone_firmware} → using API {zone_api_version}", {
-            "country_code": zone_snapshot.country_code,
-            "zone_firmware": zone_firmware,
-            "api_version": zone_api_version,
-        })
-    else:
-        progress("zone", f"Zone '{zone_snapshot.name}' loaded (API {controller_api_version})", {
-            "country_code": zone_snapshot.country_code,
-            "zone_firmware": zone_firmware,
-            "api_version": controller_api_version,
-        })
-
-    # ── Step 2: All WLANs (list then detail each) ────────────────────
-    progress("wlans", "Fetching WLAN list...")
-    wlan_list = await sz_client.wlans.get_all_wlans_paginated(zone_id)
-    progress("wlans", f"Found {len(wlan_list)} WLANs, fetching full details...")
-
-    wlans: List[SZWLANFull] = []
-    for i, wlan_summary in enumerate(wlan_list):
-        wlan_id = wlan_summary["id"]
+            result = on_progress(phase, message, data or {})
+            if inspect.isawaitable(result):
+                # Chained so async callbacks land in emission order
+                progress_tail = asyncio.create_task(chain_progress(progress_tail, result))
+
+    try:
+        # ── Step 1: Zone detail ──────────────────────────────────────────
+        progress("zone", "Fetching zone details...")
+        zone_raw = await sz_client.zones.get_zone_full_details(zone_id)
+
+        zone_radio_config = None
+        if zone_raw.get("radioConfig"):
+            zone_radio_config = SZRadioConfig.from_sz_response(zone_raw["radioConfig"])
+
+        zone_snapshot = SZZoneSnapshot(
+            id=zone_raw["id"],
+            name=zone_raw.get("name", ""),
+            description=zone_raw.get("description"),
+            country_code=zone_raw.get("countryCode"),
+            radio_config=zone_radio_config,
+            raw=zone_raw,
+        )
+        # ── Detect zone firmware → set API version for zone-specific calls ──
+        controller_api_version = sz_client.api_version
+        zone_firmware = zone_raw.get("version")
+        zone_api_version = detect_zone_api_version(zone_firmware, fallback=controller_api_version)
+
+        if zone_api_version and zone_api_version != controller_api_version:
+            sz_client.api_version = zone_api_version
+            progress("zone", f"Zone '{zone_snapshot.name}' firmware {zone_firmware} → using API {zone_api_version}", {
+                "country_code": zone_snapshot.country_code,
+                "zone_firmware": zone_firmware,
+                "api_version": zone_api_version,
+            })
+        else:
+            progress("zone", f"Zone '{zone_snapshot.name}' loaded (API {controller_api_version})", {
+                "country_code": zone_snapshot.country_code,
+                "zone_firmware": zone_firmware,
+                "api_version": controller_api_version,
+            })
+
+        # ── Step 2: Lists (one round trip's worth of wall time) ──────────
+        progress("wlans", "Fetching WLAN, WLAN Group and AP Group lists...")
+        wlan_list, wlan_group_list, ap_group_list, aps_result = await asyncio.gather(
+            sz_client.wlans.get_all_wlans_paginated(zone_id),
+            sz_client.wlans.get_all_wlan_groups_paginated(zone_id),
+            sz_client.apgroups.get_all_ap_groups_paginated(zone_id),
+            sz_client.aps.get_aps_by_zone(zone_id),
+        )
+        all_aps_raw = aps_result.get("list", []) if isinstance(aps_result, dict) else aps_result
+        total_ap_count = aps_result.get("totalCount", len(all_aps_raw)) if isinstance(aps_result, dict) else len(all_aps_raw)
+
+        progress("wlans", f"Found {len(wlan_list)} WLANs, fetching full details...")
+
+        # ── Step 3: Details, AP pages and references concurrently ────────
+        concurrency = extraction_concurrency(sz_client)
+        limit = asyncio.Semaphore(concurrency)
+        memo = ReferenceMemo(sz_client, zone_id, limit)
+        logger.debug(f"[extraction:{zone_id[:8]}] Fetching details with {concurrency} concurrent requests")
+
+        # Results go into slots so output order matches the SZ list order
+        wlan_slots: List[Optional[SZWLANFull]] = [None] * len(wlan_list)
+        apg_slots: List[Optional[Dict[str, Any]]] = [None] * len(ap_group_list)
+        wlans_done = 0
+
+        async def fetch_wlan(i: int, wlan_summary: Dict[str, Any]):
+            nonlocal wlans_done
+            wlan_id = wlan_summary["id"]
+            try:
+                async with limit:
+                    wlan_detail = await sz_client.wlans.get_wlan_details(zone_id, wlan_id)
+                auth_type = WlanService.extract_auth_type(wlan_detail)
+                wlan_full = SZWLANFull.from_sz_response(wlan_detail, auth_type)
+                wlan_slots[i] = wlan_full
+                # Chase this WLAN's references now rather than after all WLANs
+                for ref_type, ref_id in wlan_full.get_all_reference_ids():
+                    memo.get(ref_type, ref_id)
+            except Exception as e:
+                logger.warning(f"Failed to fetch WLAN detail for {wlan_id}: {e}")
+                warnings.append(SZExtractionWarning(
+                    phase="wlans",
+                    message=f"Failed to fetch WLAN '{wlan_summary.get('name', wlan_id)}': {e}",
+                    details={"wlan_id": wlan_id},
+                ))
+
+            wlans_done += 1
+            if wlans_done % 10 == 0 or wlans_done == len(wlan_list):
+                progress("wlans", f"WLAN details: {wlans_done}/{len(wlan_list)}", {
+                    "completed": wlans_done,
+                    "total": len(wlan_list),
+                })
+
+        async def fetch_ap_group(i: int, apg_summary: Dict[str, Any]):
+            apg_id = apg_summary["id"]
+            try:
+                async with limit:
+                    apg_slots[i] = await sz_client.apgroups.get_ap_group_details(zone_id, apg_id)
+            except Exception as e:
+                logger.warning(f"Failed to fetch AP Group detail for {apg_id}: {e}")
+                warnings.append(SZExtractionWarning(
+                    phase="ap_groups",
+                    message=f"Failed to fetch AP Group '{apg_summary.get('name', apg_id)}': {e}",
+                    details={"ap_group_id": apg_id},
+                ))
+
+        # Remaining AP pages (the first page may be truncated); the page count
+        # is known from the first page, so they are fetched together
+        ap_pages: List[int] = []
+        if all_aps_raw and len(all_aps_raw) < total_ap_count:
+            pages_needed = -(-total_ap_count // len(all_aps_raw))
+            ap_pages = list(range(1, min(pages_needed, AP_PAGE_LIMIT + 1)))
+            progress("aps", f"Fetching remaining APs ({len(all_aps_raw)}/{total_ap_count})...")
+        ap_page_slots: List[List[Dict[str, Any]]] = [[] for _ in ap_pages]
+
+        async def fetch_ap_page(i: int, page: int):
+            async with limit:
+                more_result = await sz_client.aps.get_aps_by_zone(zone_id, page=page)
+            ap_page_slots[i] = more_result.get("list", []) if isinstance(more_result, dict) else more_result
+
         try:
-            wlan_detail = await sz_client.wlans.get_wlan_details(zone_id, wlan_id)
-            auth_type = WlanService.extract_auth_type(wlan_detail)
-            wlan_full = SZWLANFull.from_sz_response(wlan_detail, auth_type)
-            wlans.append(wlan_full)
-        except Exception as e:
-            logger.warning(f"Failed to fetch WLAN detail for {wlan_id}: {e}")
-            warnings.append(SZExtractionWarning(
-                phase="wlans",
-                message=f"Failed to fetch WLAN '{wlan_summary.get('name', wlan_id)}': {e}",
-                details={"wlan_id": wlan_id},
+            await asyncio.gather(
+                *(fetch_wlan(i, w) for i, w in enumerate(wlan_list)),
+                *(fetch_ap_group(i, g) for i, g in enumerate(ap_group_list)),
+                *(fetch_ap_page(i, page) for i, page in enumerate(ap_pages)),
+            )
+        except BaseException:
+            memo.cancel()
+            raise
+
+        wlans: List[SZWLANFull] = [w for w in wlan_slots if w is not None]
+        progress("wlans", f"Extracted {len(wlans)} WLANs")
+
+        # WLAN Groups (members come inline with the list)
+        wlan_groups: List[SZWLANGroup] = []
+        for wg_raw in wlan_group_list:
+            members = []
+            for m in wg_raw.get("members", []):
+                members.append(SZWLANGroupMember(
+                    id=m.get("id", ""),
+                    name=m.get("name"),
+                    ssid=m.get("ssid"),
+                    access_vlan=m.get("accessVlan"),
+                    nas_id=m.get("nasId"),
+                ))
+            wlan_groups.append(SZWLANGroup(
+                id=wg_raw["id"],
+                name=wg_raw.get("name", ""),
+                description=wg_raw.get("description"),
+                members=members,
+                raw=wg_raw,
             ))
 
-        if (i + 1) % 10 == 0 or i == len(wlan_list) - 1:
-            progress("wlans", f"WLAN details: {i + 1}/{len(wlan_list)}", {
-                "completed": i + 1,
-                "total": len(wlan_list),
-            })
+        progress("wlan_groups", f"Extracted {len(wlan_groups)} WLAN Groups")
 
-    progress("wlans", f"Extracted {len(wlans)} WLANs")
-
-    # ── Step 3: WLAN Groups ──────────────────────────────────────────
-    progress("wlan_groups", "Fetching WLAN Groups...")
-    wlan_group_list = await sz_client.wlans.get_all_wlan_groups_paginated(zone_id)
-
-    wlan_groups: List[SZWLANGroup] = []
-    for wg_raw in wlan_group_list:
-        members = []
-        for m in wg_raw.get("members", []):
-            members.append(SZWLANGroupMember(
-                id=m.get("id", ""),
-                name=m.get("name"),
-                ssid=m.get("ssid"),
-                access_vlan=m.get("accessVlan"),
-                nas_id=m.get("nasId"),
-            ))
-        wlan_groups.append(SZWLANGroup(
-            id=wg_raw["id"],
-            name=wg_raw.get("name", ""),
-            description=wg_raw.get("description"),
-            members=members,
-            raw=wg_raw,
-        ))
-
-    progress("wlan_groups", f"Extracted {len(wlan_groups)} WLAN Groups")
-
-    # ── Step 4: AP Groups (detail each for radioConfig) ──────────────
-    progress("ap_groups", "Fetching AP Groups...")
-    ap_group_list = await sz_client.apgroups.get_all_ap_groups_paginated(zone_id)
-    progress("ap_groups", f"Found {len(ap_group_list)} AP Groups, fetching details...")
-
-    # Pre-fetch all APs for counting (we'll reuse this in step 5)
-    progress("aps", "Fetching AP list for counts...")
-    aps_result = await sz_client.aps.get_aps_by_zone(zone_id)
-    all_aps_raw = aps_result.get("list", []) if isinstance(aps_result, dict) else aps_result
-
-    # Count APs per group
-    ap_counts: Dict[str, int] = {}
-    for ap in all_aps_raw:
-        gid = ap.get("apGroupId")
-        if gid:
-            ap_counts[gid] = ap_counts.get(gid, 0) + 1
-
-    ap_groups: List[SZAPGroupEnriched] = []
-    for i, apg_summary in enumerate(ap_group_list):
-        apg_id = apg_summary["id"]
-        try:
-            apg_detail = await sz_client.apgroups.get_ap_group_details(zone_id, apg_id)
+        # APs: stop at the first empty page (total shrank mid-walk)
+        for page_aps in ap_page_slots:
+            if not page_aps:
+                break
+            all_aps_raw.extend(page_aps)
+
+        # Count APs per group
+        ap_counts: Dict[str, int] = {}
+        for ap in all_aps_raw:
+            gid = ap.get("apGroupId")
+            if gid:
+                ap_counts[gid] = ap_counts.get(gid, 0) + 1
+
+        ap_groups: List[SZAPGroupEnriched] = []
+        for apg_detail in apg_slots:
+            if apg_detail is None:
+                continue
             apg_radio_config = None
             if apg_detail.get("radioConfig"):
                 apg_radio_config = SZRadioConfig.from_sz_response(apg_detail["radioConfig"])
@@ -182,62 +323,29 @@ async def extract_zone_snapshot(
                 name=apg_detail.get("name", ""),
                 description=apg_detail.get("description"),
                 radio_config=apg_radio_config,
-                ap_count=ap_counts.get(apg_id, 0),
+                ap_count=ap_counts.get(apg_detail["id"], 0),
                 raw=apg_detail,
             ))
-        except Exception as e:
-            logger.warning(f"Failed to fetch AP Group detail for {apg_id}: {e}")
-            warnings.append(SZExtractionWarning(
-                phase="ap_groups",
-                message=f"Failed to fetch AP Group '{apg_summary.get('name', apg_id)}': {e}",
-                details={"ap_group_id": apg_id},
-            ))
-
-    progress("ap_groups", f"Extracted {len(ap_groups)} AP Groups")
-
-    # ── Step 5: APs (already fetched above) ──────────────────────────
-    # Paginate through all APs if needed (the initial fetch may be truncated)
-    total_ap_count = aps_result.get("totalCount", len(all_aps_raw)) if isinstance(aps_result, dict) else len(all_aps_raw)
-
-    if len(all_aps_raw) < total_ap_count:
-        progress("aps", f"Fetching remaining APs ({len(all_aps_raw)}/{total_ap_count})...")
-        page = 1
-        while len(all_aps_raw) < total_ap_count:
-            more_result = await sz_client.aps.get_aps_by_zone(zone_id, page=page)
-            more_aps = more_result.get("list", []) if isinstance(more_result, dict) else more_result
-            if not more_aps:
-                break
-            all_aps_raw.extend(more_aps)
-            page += 1
-            if page > 100:
-                break
-
-    progress("aps", f"Extracted {len(all_aps_raw)} APs")
 
-    # ── Step 6: Chase references ─────────────────────────────────────
-    progress("references", "Scanning WLANs for foreign key references...")
+        progress("ap_groups", f"Extracted {len(ap_groups)} AP Groups")
+        progress("aps", f"Extracted {len(all_aps_raw)} APs")
 
-    # Collect all unique references across all WLANs
-    unique_refs: Dict[str, tuple] = {}  # key: "type:id" → (ref_type, ref_id)
-    for wlan in wlans:
-        for ref_type, ref_id in wlan.get_all_reference_ids():
-            key = f"{ref_type}:{ref_id}"
-            if key not in unique_refs:
-                unique_refs[key] = (ref_type, ref_id)
+        # ── Step 4: Collect chased references ────────────────────────────
+        # Collect all unique references across all WLANs (fetches already started)
+        unique_refs: Dict[str, tuple] = {}  # key: "type:id" → (ref_type, ref_id)
+        for wlan in wlans:
+            for ref_type, ref_id in wlan.get_all_reference_ids():
+                key = f"{ref_type}:{ref_id}"
+                if key not in unique_refs:
+                    unique_refs[key] = (ref_type, ref_id)
 
-    progress("references", f"Found {len(unique_refs)} unique references to chase")
+        progress("references", f"Found {len(unique_refs)} unique references ({memo.fetch_count} fetches)")
 
-    referenced_objects: Dict[str, SZReferencedObject] = {}
+        referenced_objects: Dict[str, SZReferencedObject] = {}
 
-    if unique_refs:
         for i, (key, (ref_type, ref_id)) in enumerate(unique_refs.items()):
             try:
-                if ref_type == "auth_service":
-                    raw = await sz_client.aaa.get_auth_service(ref_id)
-                elif ref_type == "accounting_service":
-                    raw = await sz_client.aaa.get_accounting_service(ref_id)
-                else:
-                    raw = await sz_client.policies.get_referenced_object(zone_id, ref_type, ref_id)
+                raw = await memo.get(ref_type, ref_id)
 
                 referenced_objects[key] = SZReferencedObject(
                     ref_type=ref_type,
@@ -266,40 +374,50 @@ async def extract_zone_snapshot(
                     "total": len(unique_refs),
                 })
 
-    progress("references", f"Resolved {len(referenced_objects)} referenced objects")
-
-    # ── Step 7: Assemble snapshot ────────────────────────────────────
-    elapsed = round(time.time() - start_time, 2)
-
-    extraction_metadata = {
-        "extracted_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-        "duration_seconds": elapsed,
-        "zone_id": zone_id,
-        "zone_firmware_version": zone_firmware,
-        "api_version_used": sz_client.api_version,
-        "controller_api_version": controller_api_version,
-        "counts": {
-            "wlans": len(wlans),
-            "wlan_groups": len(wlan_groups),
-            "ap_groups": len(ap_groups),
-            "aps": len(all_aps_raw),
-            "referenced_objects": len(referenced_objects),
-            "warnings": len(warnings),
-        },
-        "api_stats": sz_client.get_api_stats(),
-    }
-
-    snapshot = SZMigrationSnapshot(
-        zone=zone_snapshot,
-        wlans=wlans,
-        wlan_groups=wlan_groups,
-        ap_groups=ap_groups,
-        aps=all_aps_raw,
-        referenced_objects=referenced_objects,
-        extraction_metadata=extraction_metadata,
-        warnings=warnings,
-    )
-
-    progress("complete", f"Extraction complete in {elapsed}s", snapshot.summary())
+        progress("references", f"Resolved {len(referenced_objects)} referenced objects")
+
+        # ── Assemble snapshot ────────────────────────────────────────────
+        elapsed = round(time.time() - start_time, 2)
+
+        extraction_metadata = {
+            "extracted_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "duration_seconds": elapsed,
+            "zone_id": zone_id,
+            "zone_firmware_version": zone_firmware,
+            "api_version_used": sz_client.api_version,
+            "controller_api_version": controller_api_version,
+            "concurrency": concurrency,
+            "counts": {
+                "wlans": len(wlans),
+                "wlan_groups": len(wlan_groups),
+                "ap_groups": len(ap_groups),
+                "aps": len(all_aps_raw),
+                "referenced_objects": len(referenced_objects),
+                "reference_fetches": memo.fetch_count,
+                "warnings": len(warnings),
+            },
+            "api_stats": sz_client.get_api_stats(),
+        }
+
+        snapshot = SZMigrationSnapshot(
+            zone=zone_snapshot,
+            wlans=wlans,
+            wlan_groups=wlan_groups,
+            ap_groups=ap_groups,
+            aps=all_aps_raw,
+            referenced_objects=referenced_objects,
+            extraction_metadata=extraction_metadata,
+            warnings=warnings,
+        )
+
+        progress("complete", f"Extraction complete in {elapsed}s", snapshot.summary())
+    except asyncio.CancelledError:
+        if progress_tail is not None:
+            progress_tail.cancel()
+        raise
+    finally:
+        # On failure too, so no callback task outlives the extraction
+        if progress_tail is not None:
+            await asyncio.gather(progress_tail, return_exceptions=True)
 
     return snapshot
@@ -20,6 +20,7 @@ from szapi.services.system import SystemService
 from szapi.services.aaa import AAAService
 from szapi.services.policies import PoliciesService
 from szapi.services.events import EventService
+from szapi.stats import ApiStats, get_controller_stats
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +72,20 @@ class AsyncRateLimiter:
                 self.allowance -= 1.0
 
 
+def rate_budget_concurrency(sz_client, requests_per_task: float, maximum: int) -> int:
+    """
+    Number of concurrent tasks that together fill a client's rate budget.
+
+    Args:
+        sz_client: SZClient (anything without a rate limiter counts as 100 req/s)
+        requests_per_task: Requests per second one task sustains, roughly
+        maximum: Upper bound on the result
+    """
+    limiter = getattr(sz_client, '_rate_limiter', None)
+    rate = getattr(limiter, 'rate', 100.0)
+    return max(1, min(maximum, int(rate // requests_per_task)))
+
+
 class SZClient:
     """
     Client for Ruckus SmartZone API
@@ -123,16 +138,10 @@ class SZClient:
         # Default 100 req/s gives headroom under SmartZone's ~120 req/s limit
         self._rate_limiter = AsyncRateLimiter(rate=rate_limit, per=1.0)
 
-        # API stats tracking
-        self._stats = {
-            'total_calls': 0,
-            'start_time': None,
-            'last_call_time': None,
-            'calls_per_minute': [],  # Rolling window of timestamps
-            'errors': 0,
-            'endpoints': {}  # Per-endpoint call counts
-        }
-        self._stats_lock = asyncio.Lock()
+        # API stats tracking: this client's own stats (get_api_stats) plus
+        # the process-wide stats for the controller (metrics endpoint)
+        self._stats = ApiStats()
+        self._controller_stats = get_controller_stats(f"{host}:{port}")
 
         # HTTP client with timeout and SSL verification settings
         self.client = httpx.AsyncClient(
@@ -255,74 +264,37 @@ class SZClient:
         ):
             await self.login()
 
-    async def _track_api_call(self, endpoint: str):
-        """Track an API call for statistics"""
-        async with self._stats_lock:
-            now = time.time()
-
-            # Initialize start time on first call
-            if self._stats['start_time'] is None:
-                self._stats['start_time'] = now
-
-            self._stats['total_calls'] += 1
-            self._stats['last_call_time'] = now
-
-            # Track calls per minute (rolling 60-second window)
-            self._stats['calls_per_minute'].append(now)
-            # Remove calls older than 60 seconds
-            cutoff = now - 60
-            self._stats['calls_per_minute'] = [
-                t for t in self._stats['calls_per_minute'] if t > cutoff
-            ]
-
-            # Track per-endpoint counts (simplified endpoint)
-            # Extract base endpoint (e.g., "/v12_0/rkszones" from "/v12_0/rkszones/abc/wlans")
-            endpoint_parts = endpoint.split('/')
-            if len(endpoint_parts) >= 3:
-                base_endpoint = '/'.join(endpoint_parts[:3])
-            else:
-                base_endpoint = endpoint
-
-            self._stats['endpoints'][base_endpoint] = self._stats['endpoints'].get(base_endpoint, 0) + 1
+    def _track_api_call(self, endpoint: str):
+        """Track an API call for statistics (O(1), no lock - never awaits)"""
+        now = time.time()
+        self._stats.record_call(endpoint, now)
+        self._controller_stats.record_call(endpoint, now)
 
-    async def _track_api_error(self):
-        """Track an API error"""
-        async with self._stats_lock:
-            self._stats['errors'] += 1
+    def _track_api_result(
+        self,
+        endpoint: str,
+        started: float,
+        error: bool = False,
+        status_code: Optional[int] = None
+    ):
+        """Track a finished API call's latency and outcome"""
+        latency_ms = (time.perf_counter() - started) * 1000
+        self._stats.record_result(endpoint, latency_ms, error, status_code)
+        self._controller_stats.record_result(endpoint, latency_ms, error, status_code)
 
     def get_api_stats(self) -> Dict[str, Any]:
         """
         Get current API statistics
 
         Returns:
-            Dict with API call statistics
+            Dict with API call statistics (totals, rolling rate, error rate,
+            latency p50/p95/p99 overall and per endpoint)
         """
-        now = time.time()
-        elapsed = now - self._stats['start_time'] if self._stats['start_time'] else 0
-        calls_in_last_minute = len(self._stats['calls_per_minute'])
-
-        return {
-            'total_calls': self._stats['total_calls'],
-            'errors': self._stats['errors'],
-            'elapsed_seconds': round(elapsed, 1),
-            'avg_calls_per_second': round(self._stats['total_calls'] / elapsed, 2) if elapsed > 0 else 0,
-            'calls_last_minute': calls_in_last_minute,
-            'current_rate_per_second': round(calls_in_last_minute / 60, 2),
-            'top_endpoints': dict(
-                sorted(self._stats['endpoints'].items(), key=lambda x: x[1], reverse=True)[:5]
-            )
-        }
+        return self._stats.snapshot()
 
     def reset_api_stats(self):
         """Reset API statistics"""
-        self._stats = {
-            'total_calls': 0,
-            'start_time': None,
-            'last_call_time': None,
-            'calls_per_minute': [],
-            'errors': 0,
-            'endpoints': {}
-        }
+        self._stats.reset()
 
     async def _request(
         self,
@@ -349,7 +321,7 @@ class SZClient:
         await self.ensure_authenticated()
 
         # Update API stats
-        await self._track_api_call(endpoint)
+        self._track_api_call(endpoint)
 
         # Use root URL for alternate APIs like switchm
         base = self.root_url if use_root_url else self.base_url
@@ -366,9 +338,13 @@ class SZClient:
         if kwargs.get("json"):
             logger.debug(f"  Body: {kwargs.get('json')}")
 
+        started = time.perf_counter()
         try:
             response = await self.client.request(method, url, **kwargs)
             logger.debug(f"SmartZone API Response: {response.status_code} from {method} {endpoint}")
+            self._track_api_result(
+                endpoint, started, error=response.is_error, status_code=response.status_code
+            )
 
             response.raise_for_status()
             response_data = response.json()
@@ -383,7 +359,6 @@ class SZClient:
             return response_data
 
         except httpx.HTTPStatusError as e:
-            await self._track_api_error()
             status_code = e.response.status_code
             logger.error(f"SmartZone API Error: {status_code} from {method} {endpoint}")
 
@@ -407,6 +382,11 @@ class SZClient:
                 friendly_msg = f"SmartZone API error ({status_code}) on {method} {endpoint}"
 
             raise ValueError(friendly_msg) from e
+        except httpx.HTTPError as e:
+            # Transport failure (timeout, connection reset) - no response
+            self._track_api_result(endpoint, started, error=True)
+            logger.error(f"SmartZone API Exception: {type(e).__name__} from {method} {endpoint}: {str(e)}")
+            raise
         except Exception as e:
             logger.error(f"SmartZone API Exception: {type(e).__name__} from {method} {endpoint}: {str(e)}")
             raise
@@ -7,13 +7,30 @@ Uses v11_1 API endpoints:
 - GET /v11_1/aps - Basic AP list (minimal fields)
 - POST /v11_1/query/ap - Query APs with full details
 - GET /v11_1/aps/{apMac} - Individual AP details
+
+Controller-wide enumeration (iter_all_aps / get_all_aps) fans out across
+zones and pages: every zone's first page is fetched concurrently, and each
+zone's remaining pages follow as soon as its totalCount is known. All
+requests still pass through the client's rate limiter.
 """
 
-from typing import Dict, List, Any
+import asyncio
+from typing import AsyncIterator, Dict, List, Any, Optional, Sequence, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+AP_PAGE_SIZE = 1000             # SZ max listSize / query limit
+AP_PAGE_CONCURRENCY = 8         # pages in flight during controller-wide enumeration
+AP_MAX_PAGES_PER_ZONE = 100     # safety cap
+
+
+def project_ap(ap: Dict[str, Any], fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+    """Keep only the requested AP fields (all fields when fields is None)."""
+    if not fields:
+        return ap
+    return {f: ap[f] for f in fields if f in ap}
+
 
 class ApService:
     def __init__(self, client):
@@ -23,7 +40,8 @@ class ApService:
         self,
         zone_id: str,
         page: int = 0,
-        limit: int = 1000
+        limit: int = 1000,
+        fields: Optional[Sequence[str]] = None
     ) -> Dict[str, Any]:
         """
         Get all APs in a specific zone with full details using query endpoint.
@@ -32,30 +50,90 @@ class ApService:
             zone_id: Zone UUID
             page: Page number (default 0)
             limit: Results per page (default 1000, max 1000)
+            fields: Optional AP attributes to return (e.g. ["apMac", "serial",
+                    "status"]); requested from the query endpoint and
+                    applied to the returned list
 
         Returns:
             Dict with 'list' of AP objects and pagination info
         """
         # Try POST /query/ap first - returns full details
         try:
-            return await self._query_aps_by_zone(zone_id, page, limit)
+            result = await self._query_aps_by_zone(zone_id, page, limit, fields)
         except Exception as e:
             logger.debug(f"Query endpoint failed, falling back to GET: {e}")
 
-        # Fallback to basic GET endpoint
+            # Fallback to basic GET endpoint
+            result = await self._get_aps_by_zone(zone_id, page, min(limit, 1000))
+
+        if fields and isinstance(result, dict) and result.get("list"):
+            result["list"] = [project_ap(ap, fields) for ap in result["list"]]
+        return result
+
+    async def count_aps_by_zone(self, zone_id: str, status: Optional[str] = None) -> int:
+        """
+        Count a zone's APs with a one-row POST /query/ap.
+
+        Args:
+            zone_id: Zone UUID
+            status: Optional AP status to count ("Online", "Offline",
+                    "Flagged"), sent as a STATUS extra filter
+
+        Returns:
+            totalCount of the matching APs
+
+        Raises:
+            Exception: If the query fails or returns no totalCount (there is
+                       no GET fallback that can filter on status)
+        """
+        result = await self._query_aps_by_zone(zone_id, 0, 1, ["apMac"], status=status)
+        total = result.get("totalCount") if isinstance(result, dict) else None
+        if not isinstance(total, int):
+            raise Exception(f"AP query for zone {zone_id} returned no totalCount")
+        return total
+
+    async def _get_aps_by_zone(self, zone_id: str, page: int, list_size: int) -> Dict[str, Any]:
+        """
+        One page of a zone's APs from GET /aps.
+
+        index is an entry offset. SZ may return fewer entries than listSize
+        asked for, so the page is filled with further requests, each starting
+        after the entries actually received.
+        """
         endpoint = f"/{self.client.api_version}/aps"
-        params = {
-            "index": page,
-            "listSize": min(limit, 1000),
-            "zoneId": zone_id
-        }
-        return await self.client._request("GET", endpoint, params=params)
+        index = page * list_size
+        result: Optional[Dict[str, Any]] = None
+        aps: List[Dict[str, Any]] = []
+        while len(aps) < list_size:
+            params = {
+                "index": index,
+                "listSize": list_size - len(aps),
+                "zoneId": zone_id
+            }
+            chunk = await self.client._request("GET", endpoint, params=params)
+            received = chunk.get("list") or []
+            aps.extend(received)
+            index += len(received)
+
+            more = chunk.get("hasMore")
+            if more is None:
+                total = chunk.get("totalCount")
+                more = isinstance(total, int) and index < total
+            if result is None:
+                result = chunk  # totalCount/firstIndex of the page
+            result["hasMore"] = more
+            if not received or not more:
+                break
+        result["list"] = aps
+        return result
 
     async def _query_aps_by_zone(
         self,
         zone_id: str,
         page: int = 0,
-        limit: int = 1000
+        limit: int = 1000,
+        fields: Optional[Sequence[str]] = None,
+        status: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Query APs using POST endpoint which returns full details.
@@ -66,6 +144,8 @@ class ApService:
             zone_id: Zone UUID
             page: Page number (0-indexed)
             limit: Results per page
+            fields: Optional attribute projection (QueryCriteria.attributes)
+            status: Optional AP status filter (QueryCriteria.extraFilters)
 
         Returns:
             Dict with 'list' of AP objects with full details
@@ -90,6 +170,10 @@ class ApService:
             "page": page + 1,  # API uses 1-based pagination
             "limit": min(limit, 1000)
         }
+        if fields:
+            body["attributes"] = list(fields)
+        if status:
+            body["extraFilters"] = [{"type": "STATUS", "value": status}]
 
         result = await self.client._request("POST", endpoint, json=body)
 
@@ -99,51 +183,159 @@ class ApService:
 
         return result
 
-    async def get_all_aps(self) -> List[Dict[str, Any]]:
+    async def get_all_aps(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        zones: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get all APs across all zones in the SmartZone
 
+        Args:
+            fields: Optional AP attributes to return (zoneId/zoneName are
+                    always added)
+            zones: Zone objects to enumerate (default: all zones)
+
         Returns:
-            List of all AP objects
+            List of all AP objects, in zone then page order
         """
-        all_aps = []
+        pages: List[Tuple[int, int, List[Dict[str, Any]]]] = []
+        async for zone_index, page, aps in self._iter_ap_pages(fields, zones):
+            pages.append((zone_index, page, aps))
+        pages.sort(key=lambda p: (p[0], p[1]))
 
-        # Get all zones
-        zones = await self.client.zones.get_zones()
-
-        # Get APs from each zone
-        for zone in zones:
-            zone_id = zone.get("id")
-            zone_name = zone.get("name", "Unknown")
+        all_aps = [ap for _, _, aps in pages for ap in aps]
+        logger.info(f"Retrieved {len(all_aps)} total APs from SmartZone")
+        return all_aps
 
-            logger.info(f"Fetching APs from zone: {zone_name} ({zone_id})")
+    async def iter_all_aps(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        zones: Optional[List[Dict[str, Any]]] = None,
+        max_concurrency: int = AP_PAGE_CONCURRENCY
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream APs across all zones as pages arrive (no ordering guarantee).
 
-            page = 0
-            while True:
-                result = await self.get_aps_by_zone(zone_id, page=page)
+        Usage:
+            async for ap in sz_client.aps.iter_all_aps(fields=["apMac", "serial", "status"]):
+                ...
 
-                aps = result.get("list", [])
-                if not aps:
-                    break
-
-                # Add zone info to each AP
-                for ap in aps:
-                    ap["zoneName"] = zone_name
-                    ap["zoneId"] = zone_id
+        Args:
+            fields: Optional AP attributes to return (zoneId/zoneName are
+                    always added)
+            zones: Zone objects to enumerate (default: all zones)
+            max_concurrency: Max page requests in flight
 
-                all_aps.extend(aps)
+        Yields:
+            AP objects tagged with zoneId and zoneName
+        """
+        async for _, _, aps in self._iter_ap_pages(fields, zones, max_concurrency):
+            for ap in aps:
+                yield ap
 
-                # Check if there are more pages
-                total = result.get("totalCount", 0)
-                current_count = len(all_aps)
+    async def _iter_ap_pages(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        zones: Optional[List[Dict[str, Any]]] = None,
+        max_concurrency: int = AP_PAGE_CONCURRENCY
+    ) -> AsyncIterator[Tuple[int, int, List[Dict[str, Any]]]]:
+        """
+        Yield (zone_index, page, aps) as pages complete.
 
-                if current_count >= total:
+        Each zone's page count comes from its own totalCount (the effective
+        page size is the first page's length, since SZ may clamp limit).
+        Zones that report no totalCount are walked until a short page.
+        """
+        if zones is None:
+            zones = await self.client.zones.get_zones()
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        # Pages and errors flow through the queue; every task ends with a
+        # `done` marker so the consumer knows when all work has drained
+        results: asyncio.Queue = asyncio.Queue()
+        done = object()
+        tasks: List[asyncio.Task] = []
+
+        def spawn(coro) -> None:
+            async def run():
+                try:
+                    await coro
+                except Exception as e:
+                    await results.put(e)
+                finally:
+                    await results.put(done)
+            tasks.append(asyncio.create_task(run()))
+
+        def tag(aps: List[Dict[str, Any]], zone: Dict[str, Any]) -> List[Dict[str, Any]]:
+            zone_id = zone.get("id")
+            zone_name = zone.get("name", "Unknown")
+            for ap in aps:
+                # Add zone info to each AP
+                ap["zoneName"] = zone_name
+                ap["zoneId"] = zone_id
+            return aps
+
+        async def fetch(zone: Dict[str, Any], page: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get_aps_by_zone(
+                    zone.get("id"), page=page, limit=AP_PAGE_SIZE, fields=fields
+                )
+
+        async def fetch_page(zone_index: int, zone: Dict[str, Any], page: int):
+            result = await fetch(zone, page)
+            aps = result.get("list", [])
+            if aps:
+                await results.put((zone_index, page, tag(aps, zone)))
+
+        async def walk_zone(zone_index: int, zone: Dict[str, Any]):
+            result = await fetch(zone, 0)
+            aps = result.get("list", [])
+            if not aps:
+                return
+            await results.put((zone_index, 0, tag(aps, zone)))
+
+            # Page count from this zone's own total, at the page size SZ
+            # actually returned
+            total = result.get("totalCount")
+            if isinstance(total, int):
+                page_count = min(-(-total // len(aps)), AP_MAX_PAGES_PER_ZONE)
+                logger.info(
+                    f"Fetching APs from zone: {zone.get('name', 'Unknown')} ({zone.get('id')}) - "
+                    f"{total} APs, {page_count} page(s)"
+                )
+                for page in range(1, page_count):
+                    spawn(fetch_page(zone_index, zone, page))
+                return
+
+            # No totalCount - walk until an empty or short page
+            page_size = len(aps)
+            page = 0
+            while (result.get("hasMore") or len(aps) >= page_size) and page + 1 < AP_MAX_PAGES_PER_ZONE:
+                page += 1
+                result = await fetch(zone, page)
+                aps = result.get("list", [])
+                if not aps:
                     break
+                await results.put((zone_index, page, tag(aps, zone)))
 
-                page += 1
+        for zone_index, zone in enumerate(zones):
+            spawn(walk_zone(zone_index, zone))
 
-        logger.info(f"Retrieved {len(all_aps)} total APs from SmartZone")
-        return all_aps
+        try:
+            finished = 0
+            while finished < len(tasks):
+                item = await results.get()
+                if item is done:
+                    finished += 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
 
     async def get_ap_details(self, ap_mac: str) -> Dict[str, Any]:
         """
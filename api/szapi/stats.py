@@ -0,0 +1,302 @@
+"""
+SmartZone API call statistics
+
+Constant-time stats for SZClient._request. Every update is a handful of
+integer increments with no awaits, so it needs no lock (asyncio runs one
+coroutine at a time) and costs the same at 1 req/s or 100 req/s:
+
+- Rolling rate: 60 one-second buckets in a ring, reused as time moves on,
+  instead of a list of timestamps filtered on every call
+- Per-endpoint latency: a fixed-bucket histogram per normalized endpoint
+  (IDs replaced by {id}); p50/p95/p99 are estimated from the buckets
+- Per-endpoint error counts and error rates
+
+Each SZClient keeps its own ApiStats (get_api_stats, per audit/extraction)
+and also feeds a process-wide ApiStats per controller (host:port), which
+backs the Prometheus-style metrics endpoint.
+"""
+
+import re
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+# Latency bucket upper bounds in milliseconds (last bucket is +Inf)
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000,
+)
+
+RATE_WINDOW_SECONDS = 60
+MAX_ENDPOINTS = 200  # cap on distinct normalized endpoints per ApiStats
+_LABEL_CACHE_SIZE = 4096
+
+_VERSION_SEGMENT = re.compile(r"^v\d+_\d+$")
+_ID_SEGMENT = re.compile(
+    r"^("
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"  # UUID
+    r"|([0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}"  # MAC
+    r"|\d+"
+    r"|[0-9a-fA-F]{16,}"
+    r")$"
+)
+
+_label_cache: Dict[str, str] = {}
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """
+    Collapse an SZ endpoint into a low-cardinality label.
+
+    "/v12_0/rkszones/<uuid>/wlans/3" → "/rkszones/{id}/wlans/{id}"
+    """
+    label = _label_cache.get(endpoint)
+    if label is not None:
+        return label
+    path = endpoint.split("?", 1)[0]
+    parts = [p for p in path.split("/") if p]
+    if parts and _VERSION_SEGMENT.match(parts[0]):
+        parts = parts[1:]
+    label = "/" + "/".join("{id}" if _ID_SEGMENT.match(p) else p for p in parts)
+    if len(_label_cache) >= _LABEL_CACHE_SIZE:
+        _label_cache.clear()
+    _label_cache[endpoint] = label
+    return label
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (O(log buckets) observe, no allocation)."""
+
+    __slots__ = ("counts", "total", "sum_ms")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+
+    def observe(self, latency_ms: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+        self.total += 1
+        self.sum_ms += latency_ms
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Estimate the q-th percentile (0-100) in ms.
+
+        Interpolates linearly inside the bucket holding the target rank; the
+        +Inf bucket reports the last finite bound.
+        """
+        if not self.total:
+            return None
+        rank = q / 100 * self.total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if not count:
+                continue
+            if seen + count >= rank:
+                if i >= len(LATENCY_BUCKETS_MS):
+                    return float(LATENCY_BUCKETS_MS[-1])
+                lower = LATENCY_BUCKETS_MS[i - 1] if i > 0 else 0.0
+                upper = LATENCY_BUCKETS_MS[i]
+                return round(lower + (upper - lower) * (rank - seen) / count, 1)
+            seen += count
+        return float(LATENCY_BUCKETS_MS[-1])
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        return {
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "avg": round(self.sum_ms / self.total, 1) if self.total else None,
+        }
+
+
+class EndpointStats:
+    """Calls, errors and latency for one normalized endpoint."""
+
+    __slots__ = ("calls", "errors", "latency")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+
+class ApiStats:
+    """
+    Lock-free SZ API statistics.
+
+    Usage (from SZClient._request):
+        stats.record_call(endpoint)                           # when the call starts
+        stats.record_result(endpoint, latency_ms, error=...)  # when it finishes
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.start_time: Optional[float] = None
+        self.last_call_time: Optional[float] = None
+        self.total_calls = 0
+        self.errors = 0
+        self.status_codes: Dict[int, int] = {}
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self.latency = LatencyHistogram()
+        # Ring of per-second call counts; _ring_second[i] is the epoch
+        # second bucket i currently counts (stale buckets read as 0)
+        self._ring = [0] * RATE_WINDOW_SECONDS
+        self._ring_second = [0] * RATE_WINDOW_SECONDS
+
+    # ----- recording -----
+
+    def record_call(self, endpoint: str, now: Optional[float] = None) -> None:
+        """Count a call toward totals, the rolling rate and its endpoint."""
+        now = time.time() if now is None else now
+        if self.start_time is None:
+            self.start_time = now
+        self.total_calls += 1
+        self.last_call_time = now
+
+        second = int(now)
+        slot = second % RATE_WINDOW_SECONDS
+        if self._ring_second[slot] != second:
+            self._ring_second[slot] = second
+            self._ring[slot] = 0
+        self._ring[slot] += 1
+
+        self._endpoint(endpoint).calls += 1
+
+    def record_result(
+        self,
+        endpoint: str,
+        latency_ms: float,
+        error: bool = False,
+        status_code: Optional[int] = None,
+    ) -> None:
+        """Record a finished call's latency and outcome."""
+        stats = self._endpoint(endpoint)
+        stats.latency.observe(latency_ms)
+        self.latency.observe(latency_ms)
+        if error:
+            stats.errors += 1
+            self.errors += 1
+        if status_code is not None:
+            self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+
+    def _endpoint(self, endpoint: str) -> EndpointStats:
+        label = normalize_endpoint(endpoint)
+        stats = self.endpoints.get(label)
+        if stats is None:
+            if len(self.endpoints) >= MAX_ENDPOINTS:
+                label = "/other"
+                stats = self.endpoints.get(label)
+            if stats is None:
+                stats = self.endpoints[label] = EndpointStats()
+        return stats
+
+    # ----- reading -----
+
+    def calls_in_window(self, now: Optional[float] = None) -> int:
+        """Calls in the last RATE_WINDOW_SECONDS (O(window), read side only)."""
+        second = int(time.time() if now is None else now)
+        oldest = second - RATE_WINDOW_SECONDS
+        return sum(
+            count for count, bucket_second in zip(self._ring, self._ring_second)
+            if bucket_second > oldest
+        )
+
+    def snapshot(self, top: int = 5) -> Dict:
+        """Stats dict in the shape SZClient.get_api_stats has always returned, plus latency."""
+        now = time.time()
+        elapsed = now - self.start_time if self.start_time else 0
+        calls_in_last_minute = self.calls_in_window(now)
+        by_calls = sorted(self.endpoints.items(), key=lambda x: x[1].calls, reverse=True)
+
+        return {
+            'total_calls': self.total_calls,
+            'errors': self.errors,
+            'error_rate': round(self.errors / self.total_calls, 4) if self.total_calls else 0,
+            'elapsed_seconds': round(elapsed, 1),
+            'avg_calls_per_second': round(self.total_calls / elapsed, 2) if elapsed > 0 else 0,
+            'calls_last_minute': calls_in_last_minute,
+            'current_rate_per_second': round(calls_in_last_minute / RATE_WINDOW_SECONDS, 2),
+            'latency_ms': self.latency.summary(),
+            'status_codes': dict(self.status_codes),
+            'top_endpoints': {label: stats.calls for label, stats in by_calls[:top]},
+            'endpoints': {
+                label: {
+                    'calls': stats.calls,
+                    'errors': stats.errors,
+                    'error_rate': round(stats.errors / stats.calls, 4) if stats.calls else 0,
+                    'latency_ms': stats.latency.summary(),
+                }
+                for label, stats in by_calls
+            },
+        }
+
+
+# -----------------------------------------------------------------------------
+# Process-wide per-controller stats
+# -----------------------------------------------------------------------------
+
+_controller_stats: Dict[str, ApiStats] = {}
+
+
+def get_controller_stats(controller: str) -> ApiStats:
+    """Process-wide stats for a controller ("host:port"), created on first use."""
+    stats = _controller_stats.get(controller)
+    if stats is None:
+        stats = _controller_stats[controller] = ApiStats()
+    return stats
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus(controllers: Optional[List[str]] = None) -> str:
+    """
+    Render controller stats in the Prometheus text exposition format.
+
+    Args:
+        controllers: "host:port" keys to include (default: all)
+    """
+    keys = controllers if controllers is not None else sorted(_controller_stats)
+    lines = [
+        "# HELP sz_api_requests_total SmartZone API requests",
+        "# TYPE sz_api_requests_total counter",
+    ]
+    errors = [
+        "# HELP sz_api_request_errors_total SmartZone API requests that failed",
+        "# TYPE sz_api_request_errors_total counter",
+    ]
+    histogram = [
+        "# HELP sz_api_request_duration_ms SmartZone API request latency",
+        "# TYPE sz_api_request_duration_ms histogram",
+    ]
+    rate = [
+        "# HELP sz_api_requests_per_second SmartZone API request rate over the last minute",
+        "# TYPE sz_api_requests_per_second gauge",
+    ]
+
+    for controller in keys:
+        stats = _controller_stats.get(controller)
+        if stats is None:
+            continue
+        ctl = _escape_label(controller)
+        rate.append(
+            f'sz_api_requests_per_second{{controller="{ctl}"}} '
+            f'{stats.calls_in_window() / RATE_WINDOW_SECONDS:.3f}'
+        )
+        for label, ep in sorted(stats.endpoints.items()):
+            labels = f'controller="{ctl}",endpoint="{_escape_label(label)}"'
+            lines.append(f'sz_api_requests_total{{{labels}}} {ep.calls}')
+            errors.append(f'sz_api_request_errors_total{{{labels}}} {ep.errors}')
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS_MS, ep.latency.counts):
+                cumulative += count
+                histogram.append(f'sz_api_request_duration_ms_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+            histogram.append(f'sz_api_request_duration_ms_bucket{{{labels},le="+Inf"}} {ep.latency.total}')
+            histogram.append(f'sz_api_request_duration_ms_sum{{{labels}}} {ep.latency.sum_ms:.1f}')
+            histogram.append(f'sz_api_request_duration_ms_count{{{labels}}} {ep.latency.total}')
+
+    return "\n".join(lines + errors + histogram + rate) + "\n"
@@ -146,33 +146,12 @@ class InventoryPhase(PhaseExecutor):
                 # Fetch passphrases in this pool (paginated)
                 # Use POST query — GET endpoint can silently return 0
                 try:
-                    all_passphrases = []
-                    page = 1
-                    page_size = 500
-                    while True:
-                        pp_response = (
-                            await self.r1_client.dpsk.query_passphrases(
-                                pool_id=pool_id,
-                                tenant_id=self.tenant_id,
-                                page=page,
-                                limit=page_size,
-                            )
-                        )
-                        passphrases = (
-                            pp_response.get(
-                                'data',
-                                pp_response.get('content', [])
-                            )
-                            if isinstance(pp_response, dict)
-                            else pp_response
-                        ) or []
-                        all_passphrases.extend(passphrases)
-
-                        # Check if more pages
-                        total = pp_response.get('totalCount', 0) if isinstance(pp_response, dict) else 0
-                        if len(all_passphrases) >= total or len(passphrases) < page_size:
-                            break
-                        page += 1
+                    pp_response = await self.r1_client.dpsk.query_all_passphrases(
+                        pool_id=pool_id,
+                        tenant_id=self.tenant_id,
+                        page_size=500,
+                    )
+                    all_passphrases = pp_response['data']
 
                     logger.info(
                         f"[Inventory]   Pool {pool_name}: "
@@ -367,27 +346,13 @@ class InventoryPhase(PhaseExecutor):
         # Only if venue_id is set - AP groups are venue-specific
         if self.venue_id:
             try:
-                ag_response = await self.r1_client.venues.query_ap_groups(
+                ag_response = await self.r1_client.venues.query_all_ap_groups(
                     tenant_id=self.tenant_id,
                     venue_id=self.venue_id,
-                    page=1,
-                    limit=100,
+                    page_size=100,
                 )
-                ag_items = ag_response.get('data', [])
-                ag_total = ag_response.get('totalCount', len(ag_items))
-
-                # Paginate if more pages exist
-                if ag_total > len(ag_items):
-                    page_size = len(ag_items) or 100
-                    pages_needed = (ag_total + page_size - 1) // page_size
-                    for page_num in range(2, pages_needed + 1):
-                        page_resp = await self.r1_client.venues.query_ap_groups(
-                            tenant_id=self.tenant_id,
-                            venue_id=self.venue_id,
-                            page=page_num,
-                            limit=100,
-                        )
-                        ag_items.extend(page_resp.get('data', []))
+                ag_items = ag_response['data']
+                ag_total = ag_response['totalCount']
 
                 logger.info(
                     f"[Inventory] AP groups: fetched {len(ag_items)}"
@@ -509,13 +474,10 @@ async def _audit_venue_for_cloudpath(r1_client, tenant_id: str) -> Dict[str, Lis
 
             # Fetch passphrases
             try:
-                pp_response = await r1_client.dpsk.query_passphrases(
-                    pool_id=pool_id, tenant_id=tenant_id, page=1, limit=1000
+                pp_response = await r1_client.dpsk.query_all_passphrases(
+                    pool_id=pool_id, tenant_id=tenant_id, page_size=1000
                 )
-                passphrases = (
-                    pp_response.get('data', pp_response.get('content', []))
-                    if isinstance(pp_response, dict) else pp_response
-                ) or []
+                passphrases = pp_response['data']
                 for pp in passphrases:
                     inventory['passphrases'].append({
                         'id': pp.get('id'),
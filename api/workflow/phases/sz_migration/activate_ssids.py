@@ -133,13 +133,13 @@ class ActivateSSIDsPhase(PhaseExecutor):
         }
 
         if self.r1_client.ec_type == "MSP" and self.tenant_id:
-            response = self.r1_client.post(
+            response = await self.r1_client.apost(
                 "/networkActivations/query",
                 payload=query_body,
                 override_tenant_id=self.tenant_id,
             )
         else:
-            response = self.r1_client.post(
+            response = await self.r1_client.apost(
                 "/networkActivations/query",
                 payload=query_body,
             )
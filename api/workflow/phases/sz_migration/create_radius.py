@@ -146,7 +146,7 @@ class CreateRadiusProfilesPhase(PhaseExecutor):
 
                 # Check if reused or created (find_or_create logs this)
                 was_existing = bool(
-                    self.r1_client.radius_profiles.find_radius_profile_by_name(
+                    await self.r1_client.radius_profiles.find_radius_profile_by_name(
                         self.tenant_id, name
                     )
                 )
@@ -9,6 +9,7 @@ Key components:
 - Phase Registry: @register_phase decorator (workflow.phases.registry)
 - ActivityTracker: Centralized R1 activity polling (workflow.v2.activity_tracker)
 - DependencyGraph: DAG-based dependency resolution (workflow.v2.graph)
+- PhaseScheduler: Incremental ready-queue used by the Brain (workflow.v2.scheduler)
 - RedisStateManagerV2: Multi-worker state persistence (workflow.v2.state_manager)
 
 Usage:
@@ -22,6 +23,7 @@ from workflow.v2.brain import WorkflowBrain
 from workflow.v2.activity_tracker import ActivityTracker
 from workflow.v2.state_manager import RedisStateManagerV2
 from workflow.v2.graph import DependencyGraph
+from workflow.v2.scheduler import PhaseScheduler
 from workflow.v2.models import (
     WorkflowJobV2,
     UnitMapping,
@@ -47,6 +49,7 @@ __all__ = [
     "ActivityTracker",
     "RedisStateManagerV2",
     "DependencyGraph",
+    "PhaseScheduler",
 
     # Models
     "WorkflowJobV2",
@@ -4,9 +4,14 @@ Centralized Activity Tracker
 Manages bulk polling of R1 async activities across all phases and units.
 
 Features:
-- Single background poller for ALL pending activities across all jobs
-- 3s polling interval with bulk time-based query (POST /activities/query)
-- Uses fromTime/toTime filters to fetch all activities since workflow start
+- Push: subscribes to R1 activity webhooks (relayed over Redis pub/sub by
+  the webhook receiver), so a tracked requestId completes as soon as R1
+  reports a terminal status instead of on the next poll
+- Single background poller for ALL pending activities across all jobs, as
+  the fallback when webhooks are late, missing or not configured
+- Bulk time-based query (POST /activities/query); fromTime slides forward
+  to the oldest still-pending activity, and pages past 500 rows until every
+  pending requestId is matched
 - Matches returned activities by requestId against pending set
 - Falls back to individual GET /activities/{id} if bulk query fails
 - Redis-backed for multi-worker visibility
@@ -27,7 +32,9 @@ Usage:
 """
 
 import asyncio
+import json
 import logging
+import time
 from typing import Dict, Optional
 from datetime import datetime, timezone, timedelta
 
@@ -46,6 +53,16 @@ def _ts() -> str:
 # R1 activities are slow (typically 30-90s), so polling faster just wastes API calls.
 POLL_INTERVAL = 10.0
 
+# While webhooks are arriving, polling is only a safety net for missed ones
+WEBHOOK_POLL_INTERVAL = 30.0
+WEBHOOK_ACTIVE_WINDOW = 60.0   # seconds since the last webhook to count as "arriving"
+
+# Bulk query window / paging. fromTime trails the oldest pending activity by
+# FROM_TIME_BUFFER for clock skew; MAX_QUERY_PAGES bounds one cycle's cost.
+FROM_TIME_BUFFER = timedelta(seconds=30)
+QUERY_PAGE_SIZE = 500
+MAX_QUERY_PAGES = 20
+
 # Max time to track a single activity before timeout
 # Must be less than PHASE_EXECUTION_TIMEOUT (600s) to allow the phase
 # to handle the timeout result before the phase itself times out.
@@ -57,6 +74,9 @@ MAX_CONSECUTIVE_ERRORS = 10    # Stop polling after this many consecutive failur
 # Concurrency control for fallback individual GETs
 MAX_CONCURRENT_ACTIVITY_POLLS = 25
 
+SUCCESS_STATUSES = ("SUCCESS", "COMPLETED", "COMPLETE", "DONE")
+FAILURE_STATUSES = ("FAIL", "FAILED", "ERROR", "FAILURE")
+
 # Fields to request from the activities query
 ACTIVITY_QUERY_FIELDS = [
     "startDatetime",
@@ -74,9 +94,10 @@ class ActivityTracker:
     """
     Centralized tracker for R1 async activities.
 
-    Collects activities from all phases across all jobs, polls them
-    in bulk via POST /activities/query with time-based filtering,
-    and notifies waiting coroutines on completion.
+    Collects activities from all phases across all jobs, completes them
+    from webhook notifications where possible, polls the rest in bulk via
+    POST /activities/query with time-based filtering, and notifies waiting
+    coroutines on completion.
     """
 
     def __init__(
@@ -94,12 +115,13 @@ class ActivityTracker:
         self._events: Dict[str, asyncio.Event] = {}       # activity_id → completion event
         self._results: Dict[str, ActivityResult] = {}      # activity_id → result
 
-        # Time-based query tracking
-        self._from_time: Optional[str] = None  # ISO timestamp for fromTime filter
-
-        # Background poller control
+        # Background poller / webhook listener control
         self._polling = False
         self._poll_task: Optional[asyncio.Task] = None
+        self._listen_task: Optional[asyncio.Task] = None
+        self._last_webhook_at = 0.0  # monotonic time of last webhook for a tracked activity
+        self._confirming: set[str] = set()  # activity_ids with a webhook confirm in flight
+        self._confirm_tasks: set[asyncio.Task] = set()  # keeps confirm tasks referenced
         self._stop_event = asyncio.Event()
         self._poll_cycle = 0
 
@@ -108,6 +130,7 @@ class ActivityTracker:
         self._total_completed = 0
         self._consecutive_errors = 0
         self._bulk_query_failures = 0
+        self._webhook_completions = 0
         # Last poll cycle status breakdown (e.g. {"INPROGRESS": 12, "SUCCESS": 3})
         self._last_poll_status: Dict[str, int] = {}
 
@@ -142,12 +165,6 @@ class ActivityTracker:
         self._events[activity_id] = asyncio.Event()
         self._total_registered += 1
 
-        # Set fromTime on first registration (with 30s buffer for clock skew)
-        if self._from_time is None:
-            buffer = datetime.now(timezone.utc) - timedelta(seconds=30)
-            self._from_time = buffer.strftime("%Y-%m-%dT%H:%M:%SZ")
-            logger.info(f"[{_ts()}] ActivityTracker fromTime set to {self._from_time}")
-
         # Persist to Redis for multi-worker visibility
         await self.state.register_activity(ref)
 
@@ -289,6 +306,8 @@ class ActivityTracker:
             "total_completed": self._total_completed,
             "polling": self._polling,
             "bulk_query_failures": self._bulk_query_failures,
+            "webhook_completions": self._webhook_completions,
+            "webhooks_active": self._webhooks_active(),
         }
 
     # =========================================================================
@@ -296,19 +315,29 @@ class ActivityTracker:
     # =========================================================================
 
     def _ensure_polling(self) -> None:
-        """Start the background polling loop if not already running."""
+        """Start the background polling loop (and webhook listener) if not already running."""
         if not self._polling:
             self._polling = True
             self._stop_event.clear()
             self._poll_task = asyncio.create_task(self._poll_loop())
+        if self._listen_task is None or self._listen_task.done():
+            self._listen_task = asyncio.create_task(self._listen_loop())
+
+    def _webhooks_active(self) -> bool:
+        """True if a webhook for one of our activities arrived recently."""
+        return (
+            self._last_webhook_at > 0
+            and time.monotonic() - self._last_webhook_at < WEBHOOK_ACTIVE_WINDOW
+        )
 
     async def _poll_loop(self) -> None:
         """
         Background loop that polls R1 for all pending activities.
 
-        Uses a single POST /activities/query with fromTime/toTime filters
-        to fetch all activities in one request, then matches against pending set.
-        Polls every 10 seconds.
+        Uses POST /activities/query with fromTime/toTime filters to fetch
+        activities since the oldest pending one, then matches against the
+        pending set. Polls every 10 seconds, or every 30 seconds while
+        webhooks are completing activities.
         """
         self._polling = True
         self._poll_cycle = 0
@@ -350,10 +379,11 @@ class ActivityTracker:
                         )
 
                 # Wait for interval or stop signal
+                interval = WEBHOOK_POLL_INTERVAL if self._webhooks_active() else POLL_INTERVAL
                 try:
                     await asyncio.wait_for(
                         self._stop_event.wait(),
-                        timeout=POLL_INTERVAL
+                        timeout=interval
                     )
                     break  # Stop event was set
                 except asyncio.TimeoutError:
@@ -440,6 +470,22 @@ class ActivityTracker:
     # Bulk Time-Based Query (primary method)
     # =========================================================================
 
+    def _query_from_time(self, activity_ids: list[str]) -> str:
+        """
+        fromTime for the bulk query: the oldest still-pending activity minus
+        a clock-skew buffer. The window slides forward as old activities
+        complete, so a long job doesn't keep re-reading its whole history.
+        """
+        registered = [
+            self._pending[aid].registered_at
+            for aid in activity_ids if aid in self._pending
+        ]
+        if registered:
+            oldest = min(registered).replace(tzinfo=timezone.utc)
+        else:
+            oldest = datetime.now(timezone.utc) - timedelta(minutes=5)
+        return (oldest - FROM_TIME_BUFFER).strftime("%Y-%m-%dT%H:%M:%SZ")
+
     async def _poll_activities_bulk_time(
         self,
         activity_ids: list[str],
@@ -448,67 +494,94 @@ class ActivityTracker:
         """
         Poll activities using POST /activities/query with fromTime/toTime.
 
+        Pages through the window (newest first) until every pending
+        activity has been matched, the window is exhausted, or
+        MAX_QUERY_PAGES is reached.
+
         Returns dict mapping activity_id -> activity data.
         Raises exception on failure (caller falls back to individual GETs).
         """
-        # Build time window: fromTime = workflow start, toTime = now + 1min buffer
+        # Build time window: fromTime = oldest pending, toTime = now + 1min buffer
         now = datetime.now(timezone.utc)
         to_time = (now + timedelta(minutes=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
-        from_time = self._from_time or (now - timedelta(minutes=5)).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        payload = {
-            "fields": ACTIVITY_QUERY_FIELDS,
-            "page": 1,
-            "pageSize": 500,
-            "sortField": "startDatetime",
-            "sortOrder": "DESC",
-            "filters": {
-                "fromTime": from_time,
-                "toTime": to_time,
-            },
-        }
+        from_time = self._query_from_time(activity_ids)
 
-        loop = asyncio.get_event_loop()
+        pending_set = set(activity_ids)
+        result = {}
+        page = 1
+        seen = 0
+        total_count = 0
+
+        while True:
+            payload = {
+                "fields": ACTIVITY_QUERY_FIELDS,
+                "page": page,
+                "pageSize": QUERY_PAGE_SIZE,
+                "sortField": "startDatetime",
+                "sortOrder": "DESC",
+                "filters": {
+                    "fromTime": from_time,
+                    "toTime": to_time,
+                },
+            }
 
-        def _do_query():
             if self.r1_client.ec_type == "MSP":
-                return self.r1_client.post(
+                response = await self.r1_client.apost(
                     "/activities/query",
                     payload=payload,
                     override_tenant_id=self.tenant_id
                 )
             else:
-                return self.r1_client.post(
+                response = await self.r1_client.apost(
                     "/activities/query",
                     payload=payload
                 )
 
-        response = await loop.run_in_executor(None, _do_query)
-
-        if not response.ok:
-            raise RuntimeError(
-                f"POST /activities/query failed: {response.status_code} - "
-                f"{response.text[:200]}"
-            )
+            if not response.ok:
+                if result:
+                    # Later page failed - keep what we matched, poll the rest next cycle
+                    logger.debug(
+                        f"[{_ts()}] Cycle #{cycle_id}: Bulk query page {page} failed "
+                        f"({response.status_code}), using {len(result)} matches so far"
+                    )
+                    break
+                raise RuntimeError(
+                    f"POST /activities/query failed: {response.status_code} - "
+                    f"{response.text[:200]}"
+                )
 
-        data = response.json()
-        activities = data.get('data', [])
-        total_count = data.get('totalCount', '?')
+            data = response.json()
+            activities = data.get('data', [])
+            total_count = data.get('totalCount', 0) or 0
+            seen += len(activities)
+
+            # Build lookup dict by requestId, only for activities we're tracking
+            for activity in activities:
+                req_id = activity.get('requestId')
+                if req_id and req_id in pending_set:
+                    result[req_id] = activity
+
+            if (
+                len(result) >= len(pending_set)
+                or not activities
+                or seen >= total_count
+            ):
+                break
+            if page >= MAX_QUERY_PAGES:
+                logger.warning(
+                    f"[{_ts()}] Cycle #{cycle_id}: Bulk query stopped at page {page} "
+                    f"({seen}/{total_count} activities since {from_time}); "
+                    f"{len(pending_set) - len(result)} pending not yet matched"
+                )
+                break
+            page += 1
 
         logger.debug(
             f"[{_ts()}] Cycle #{cycle_id}: Bulk query returned "
-            f"{len(activities)} activities (totalCount={total_count}, "
+            f"{seen} activities over {page} page(s) (totalCount={total_count}, "
             f"fromTime={from_time})"
         )
 
-        # Build lookup dict by requestId, only for activities we're tracking
-        pending_set = set(activity_ids)
-        result = {}
-        for activity in activities:
-            req_id = activity.get('requestId')
-            if req_id and req_id in pending_set:
-                result[req_id] = activity
-
         if result:
             logger.debug(
                 f"[{_ts()}] Cycle #{cycle_id}: Matched {len(result)}/{len(activity_ids)} "
@@ -536,17 +609,12 @@ class ActivityTracker:
             f"via individual GETs"
         )
 
-        loop = asyncio.get_event_loop()
         semaphore = asyncio.Semaphore(MAX_CONCURRENT_ACTIVITY_POLLS)
 
         async def fetch_one(activity_id: str):
             async with semaphore:
                 try:
-                    return activity_id, await loop.run_in_executor(
-                        None,
-                        self._fetch_activity_sync,
-                        activity_id
-                    )
+                    return activity_id, await self._fetch_activity(activity_id)
                 except Exception as e:
                     logger.debug(f"[{_ts()}] Failed to fetch {activity_id[:8]}: {e}")
                     return activity_id, None
@@ -568,13 +636,10 @@ class ActivityTracker:
 
         return results, errors
 
-    def _fetch_activity_sync(self, activity_id: str) -> dict | None:
-        """
-        Synchronously fetch a single activity via GET /activities/{id}.
-        Runs in thread pool executor.
-        """
+    async def _fetch_activity(self, activity_id: str) -> dict | None:
+        """Fetch a single activity via GET /activities/{id}."""
         try:
-            response = self.r1_client.get(
+            response = await self.r1_client.aget(
                 f"/activities/{activity_id}",
                 override_tenant_id=self.tenant_id
             )
@@ -591,6 +656,99 @@ class ActivityTracker:
             logger.debug(f"Activity {activity_id[:8]} fetch error: {e}")
             return None
 
+    # =========================================================================
+    # Webhook Push
+    # =========================================================================
+
+    async def _listen_loop(self) -> None:
+        """
+        Complete pending activities from R1 webhooks.
+
+        The webhook receiver publishes every R1 activity notification on a
+        Redis channel (any worker may receive the HTTP call). Notifications
+        for requestIds this tracker owns are handled immediately; the rest
+        are ignored. Runs while activities are pending, like the poller.
+        """
+        try:
+            pubsub = await self.state.subscribe_activity_updates()
+        except Exception as e:
+            logger.warning(
+                f"[{_ts()}] ActivityTracker webhook subscription failed ({e}) "
+                f"- relying on polling"
+            )
+            return
+
+        try:
+            while self._pending and not self._stop_event.is_set():
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if not message or message.get("type") != "message":
+                    continue
+                try:
+                    update = json.loads(message["data"])
+                except (TypeError, ValueError):
+                    continue
+                activity = update.get("activity") or {}
+                activity_id = activity.get("requestId") or activity.get("id")
+                if not activity_id or activity_id not in self._pending:
+                    continue
+
+                self._last_webhook_at = time.monotonic()
+                status = (activity.get("status") or "").upper()
+                terminal = status in SUCCESS_STATUSES or status in FAILURE_STATUSES
+                if terminal and activity_id not in self._confirming:
+                    self._confirming.add(activity_id)
+                    task = asyncio.create_task(self._complete_from_webhook(activity_id, activity))
+                    self._confirm_tasks.add(task)
+                    task.add_done_callback(self._confirm_tasks.discard)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"[{_ts()}] ActivityTracker webhook listener error: {e}")
+        finally:
+            # Unfinished confirms fall back to the poller
+            await self._cancel_confirm_tasks()
+            try:
+                await pubsub.unsubscribe()
+                await pubsub.close()
+            except Exception:
+                pass
+
+    async def _cancel_confirm_tasks(self) -> None:
+        tasks = list(self._confirm_tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _complete_from_webhook(self, activity_id: str, activity: dict) -> None:
+        """
+        Finish an activity a webhook reported as terminal.
+
+        Webhook payloads are trimmed (no resourceId, sometimes no error
+        detail), so fetch the full activity once; use the webhook payload if
+        that fetch fails or R1 hasn't caught up with its own notification.
+        """
+        try:
+            data = None
+            if self.r1_client:
+                try:
+                    data = await self._fetch_activity(activity_id)
+                except Exception as e:
+                    logger.debug(f"[{_ts()}] Webhook confirm fetch for {activity_id[:8]} failed: {e}")
+
+            status = ((data or {}).get("status") or "").upper()
+            if status not in SUCCESS_STATUSES and status not in FAILURE_STATUSES:
+                data = activity
+
+            if activity_id in self._pending:
+                self._webhook_completions += 1
+                logger.debug(f"[{_ts()}] Activity {activity_id[:8]}... completed via webhook")
+                await self._process_activity_result(activity_id, data)
+        finally:
+            self._confirming.discard(activity_id)
+
     # =========================================================================
     # Result Processing
     # =========================================================================
@@ -617,14 +775,14 @@ class ActivityTracker:
                 f"after {age}s (unit={ref.unit_id}, phase={ref.phase_id})"
             )
 
-        if status in ("SUCCESS", "COMPLETED", "COMPLETE", "DONE"):
+        if status in SUCCESS_STATUSES:
             await self._handle_completion(
                 activity_id,
                 success=True,
                 resource_id=data.get("resourceId"),
                 raw_response=data
             )
-        elif status in ("FAIL", "FAILED", "ERROR", "FAILURE"):
+        elif status in FAILURE_STATUSES:
             error_msg = (
                 data.get("errorMessage")
                 or data.get("error")
@@ -710,14 +868,11 @@ class ActivityTracker:
             self._events[activity_id] = asyncio.Event()
 
         if self._pending:
-            # Set fromTime based on earliest restored activity
-            earliest = min(ref.registered_at for ref in self._pending.values())
-            buffer = earliest - timedelta(seconds=30)
-            self._from_time = buffer.strftime("%Y-%m-%dT%H:%M:%SZ")
-
+            # Poll window starts at the earliest restored activity
+            from_time = self._query_from_time(list(self._pending))
             logger.info(
                 f"ActivityTracker restored {len(self._pending)} "
-                f"pending activities from Redis (fromTime={self._from_time})"
+                f"pending activities from Redis (fromTime={from_time})"
             )
             self._ensure_polling()
 
@@ -729,4 +884,10 @@ class ActivityTracker:
                 await asyncio.wait_for(self._poll_task, timeout=5.0)
             except asyncio.TimeoutError:
                 self._poll_task.cancel()
+        if self._listen_task and not self._listen_task.done():
+            try:
+                await asyncio.wait_for(self._listen_task, timeout=5.0)
+            except asyncio.TimeoutError:
+                self._listen_task.cancel()
+        await self._cancel_confirm_tasks()
         logger.info("ActivityTracker stopped")
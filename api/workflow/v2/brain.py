@@ -23,7 +23,7 @@ import asyncio
 import logging
 import time
 import uuid
-from typing import Dict, Any, Optional, List, Set, Tuple, TYPE_CHECKING
+from typing import Dict, Any, Optional, List, Set, TYPE_CHECKING
 from datetime import datetime
 
 from workflow.v2.models import (
@@ -37,6 +37,7 @@ from workflow.v2.models import (
 )
 from utils.safe_eval import safe_eval
 from workflow.v2.graph import DependencyGraph
+from workflow.v2.scheduler import PhaseScheduler
 from workflow.v2.state_manager import RedisStateManagerV2
 from workflow.v2.activity_tracker import ActivityTracker
 
@@ -46,8 +47,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# How long to wait between checking for ready work
-SCHEDULE_INTERVAL = 0.25  # seconds
+# Upper bound on how long the scheduler blocks waiting for a phase task to
+# finish. Scheduling itself is driven by task completion; this only bounds
+# cancellation checks, metadata refresh from other workers and heartbeats.
+HOUSEKEEPING_INTERVAL = 1.0  # seconds
 
 # Concurrency control: limit parallel phase executions to prevent Redis connection exhaustion
 # With 50 units, unbounded parallelism can spawn 50+ concurrent tasks, each doing 3-5 Redis ops
@@ -391,115 +394,142 @@ class WorkflowBrain:
         # overhead for no-op phase executions.
         await self._pre_complete_resolved_phases(job)
 
-        # Track in-flight work
+        # Ready-queue scheduler: re-evaluates only the units whose tasks
+        # finish, instead of rescanning every unit on a timer
+        scheduler = PhaseScheduler(job, graph)
+        scheduler.start()
+
+        # Track in-flight work. Finished tasks report their key on a queue
+        # so the loop wakes exactly when there is something to schedule.
         in_flight: Dict[str, asyncio.Task] = {}  # "unit:phase" → task
+        finished: asyncio.Queue = asyncio.Queue()
         last_reconcile = time.time()
+        last_housekeeping = 0.0
+
+        def launch(key: str, coro) -> None:
+            task = asyncio.create_task(coro)
+            task.add_done_callback(lambda _t, k=key: finished.put_nowait(k))
+            in_flight[key] = task
 
         try:
-            while not await self._is_workflow_complete(job, graph):
-                # Check for cancellation
-                if await self.state.is_cancelled(job.id):
-                    logger.info(f"Job {job.id}: Cancelled by user")
-                    job.status = JobStatus.CANCELLED
-                    job.errors.append("Cancelled by user")
-                    break
+            while True:
+                if scheduler.is_complete():
+                    # Cross-check with the full scan once before finishing;
+                    # if something changed underneath the scheduler, resync.
+                    if await self._is_workflow_complete(job, graph):
+                        break
+                    logger.warning(
+                        f"Job {job.id}: scheduler reported completion early; "
+                        f"resyncing all units"
+                    )
+                    scheduler.resync()
 
-                # Find all ready work
-                ready_work = self._find_ready_work(job, graph)
+                # Cancellation and metadata refresh hit Redis, so they run
+                # on an interval rather than on every task completion
+                now_ts = time.time()
+                if now_ts - last_housekeeping >= HOUSEKEEPING_INTERVAL:
+                    last_housekeeping = now_ts
+                    if await self.state.is_cancelled(job.id):
+                        logger.info(f"Job {job.id}: Cancelled by user")
+                        job.status = JobStatus.CANCELLED
+                        job.errors.append("Cancelled by user")
+                        break
+                    await self._refresh_job_metadata(job)
+                    scheduler.sync_global_status()
 
-                # Launch ready work that isn't already in flight
+                # Launch newly ready work
                 # Use semaphore to limit concurrent phase executions
-                for unit_id, phase_id in ready_work:
+                for unit_id, phase_id in scheduler.pop_ready():
                     key = f"{unit_id}:{phase_id}"
                     if key not in in_flight:
-                        task = asyncio.create_task(
-                            self._execute_phase_with_limit(job, unit_id, phase_id)
-                        )
-                        in_flight[key] = task
+                        launch(key, self._execute_phase_with_limit(job, unit_id, phase_id))
 
-                # Also check for ready global phases
-                ready_global = self._find_ready_global_phases(job, graph)
-                for phase_id in ready_global:
+                for phase_id in scheduler.pop_ready_global():
                     key = f"global:{phase_id}"
                     if key not in in_flight:
-                        task = asyncio.create_task(
-                            self._execute_global_phase_with_limit(job, phase_id)
-                        )
-                        in_flight[key] = task
+                        launch(key, self._execute_global_phase_with_limit(job, phase_id))
 
-                if not in_flight:
-                    # No work in flight and nothing ready - shouldn't happen
-                    # unless all work is done or blocked
-                    await asyncio.sleep(SCHEDULE_INTERVAL)
-                    continue
-
-                # Wait for at least one task to complete
-                done, _ = await asyncio.wait(
-                    in_flight.values(),
-                    timeout=SCHEDULE_INTERVAL,
-                    return_when=asyncio.FIRST_COMPLETED
-                )
+                # Block until at least one task finishes. The timeout only
+                # bounds how long housekeeping (cancel, heartbeat) can lag.
+                try:
+                    first_key = await asyncio.wait_for(
+                        finished.get(), timeout=HOUSEKEEPING_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    first_key = None
 
-                # Process completed tasks
                 completed_keys = []
-                for key, task in in_flight.items():
-                    if task.done():
-                        completed_keys.append(key)
-                        try:
-                            result = await task
-                            await self._handle_phase_result(job, result, graph)
-                        except Exception as e:
-                            logger.error(f"Job {job.id}: Phase task error: {e}")
-                            # Task raised an exception instead of returning a
-                            # PhaseResult.  This can happen when:
-                            #   - Activation slot wait times out
-                            #   - Phase execution times out
-                            # Mark the unit/phase as failed so it doesn't stay RUNNING.
-                            parts = key.split(':')
-
-                            # Global phase failure — mark as FAILED so
-                            # downstream phases don't wait forever.
-                            if len(parts) == 2 and parts[0] == "global":
-                                global_phase_id = parts[1]
-                                error_msg = str(e)
-                                await self.state.update_global_phase_status(
-                                    job.id, global_phase_id, PhaseStatus.FAILED
-                                )
-                                job.global_phase_status[global_phase_id] = PhaseStatus.FAILED
-                                job.errors.append(
-                                    f"Phase '{global_phase_id}' failed: {error_msg}"
-                                )
-                                await self._publish_event(job.id, "phase_failed", {
-                                    "phase_id": global_phase_id,
-                                    "error": error_msg,
-                                })
-                                logger.error(
-                                    f"Job {job.id}: Global phase '{global_phase_id}' "
-                                    f"failed: {error_msg}"
-                                )
+                if first_key is not None:
+                    completed_keys.append(first_key)
+                while not finished.empty():
+                    completed_keys.append(finished.get_nowait())
 
-                            # Per-unit phase failure
-                            elif len(parts) == 2 and parts[0] != "global":
-                                unit_id_err, phase_id_err = parts
-                                unit_err = job.units.get(unit_id_err)
-                                if unit_err and unit_err.status != UnitStatus.FAILED:
-                                    # Release leaked activation slot if the exception
-                                    # bypassed normal slot release (e.g. phase timeout)
-                                    if unit_id_err in self._activation_slots:
-                                        self._activation_slots.discard(unit_id_err)
-                                        async with self._venue_wide_condition:
-                                            self._venue_wide_count -= 1
-                                            self._venue_wide_condition.notify_all()
-
-                                    # Try deactivate-and-requeue before marking failed.
-                                    # Works for both new activations (slot just released
-                                    # above) and recovery units (no slot held).
-                                    requeued = await self._try_deactivate_and_requeue(
-                                        job, unit_id_err, phase_id_err, None
-                                    )
-                                    if requeued:
-                                        continue  # Unit reset; skip failure marking
+                # Process completed tasks
+                global_finished = False
+                for key in completed_keys:
+                    task = in_flight.pop(key, None)
+                    if task is None:
+                        continue
+                    parts = key.split(':')
+                    try:
+                        result = task.result()
+                        await self._handle_phase_result(job, result, graph)
+                        if len(parts) == 2 and parts[0] == "global":
+                            job.global_phase_status[parts[1]] = (
+                                PhaseStatus.COMPLETED if result.success
+                                else PhaseStatus.FAILED
+                            )
+                            if result.success and result.outputs:
+                                job.global_phase_results[parts[1]] = result.outputs
+                    except Exception as e:
+                        logger.error(f"Job {job.id}: Phase task error: {e}")
+                        # Task raised an exception instead of returning a
+                        # PhaseResult.  This can happen when:
+                        #   - Activation slot wait times out
+                        #   - Phase execution times out
+                        # Mark the unit/phase as failed so it doesn't stay RUNNING.
+
+                        # Global phase failure — mark as FAILED so
+                        # downstream phases don't wait forever.
+                        if len(parts) == 2 and parts[0] == "global":
+                            global_phase_id = parts[1]
+                            error_msg = str(e)
+                            await self.state.update_global_phase_status(
+                                job.id, global_phase_id, PhaseStatus.FAILED
+                            )
+                            job.global_phase_status[global_phase_id] = PhaseStatus.FAILED
+                            job.errors.append(
+                                f"Phase '{global_phase_id}' failed: {error_msg}"
+                            )
+                            await self._publish_event(job.id, "phase_failed", {
+                                "phase_id": global_phase_id,
+                                "error": error_msg,
+                            })
+                            logger.error(
+                                f"Job {job.id}: Global phase '{global_phase_id}' "
+                                f"failed: {error_msg}"
+                            )
 
+                        # Per-unit phase failure
+                        elif len(parts) == 2 and parts[0] != "global":
+                            unit_id_err, phase_id_err = parts
+                            unit_err = job.units.get(unit_id_err)
+                            if unit_err and unit_err.status != UnitStatus.FAILED:
+                                # Release leaked activation slot if the exception
+                                # bypassed normal slot release (e.g. phase timeout)
+                                if unit_id_err in self._activation_slots:
+                                    self._activation_slots.discard(unit_id_err)
+                                    async with self._venue_wide_condition:
+                                        self._venue_wide_count -= 1
+                                        self._venue_wide_condition.notify_all()
+
+                                # Try deactivate-and-requeue before marking failed.
+                                # Works for both new activations (slot just released
+                                # above) and recovery units (no slot held).
+                                requeued = await self._try_deactivate_and_requeue(
+                                    job, unit_id_err, phase_id_err, None
+                                )
+                                if not requeued:
                                     error_msg = str(e)
                                     await self.state.update_unit_phase_status(
                                         job.id, unit_id_err, phase_id_err,
@@ -515,29 +545,19 @@ class WorkflowBrain:
                                         "success": False,
                                     })
 
-                for key in completed_keys:
-                    del in_flight[key]
-
-                # Refresh global job metadata from Redis (other workers may
-                # have updated global_phase_status, created_resources, etc.)
-                # Uses get_job_metadata() to avoid reloading all 261+ units —
-                # in-memory units are already kept in sync by Fix 1 (each
-                # update_unit_phase_status call applies the result to job.units).
-                # Non-fatal: a transient Redis error during this cosmetic
-                # refresh must not hit the top-level handler and fail the
-                # whole job. Keep last-known metadata and retry next loop.
-                try:
-                    refreshed = await self.state.get_job_metadata(job.id)
-                    if refreshed:
-                        job.global_phase_status = refreshed.global_phase_status
-                        job.global_phase_results = refreshed.global_phase_results
-                        job.created_resources = refreshed.created_resources
-                        job.errors = refreshed.errors
-                except Exception as e:
-                    logger.warning(
-                        f"Job {job.id}: metadata refresh failed ({e}); "
-                        f"continuing with in-memory state"
-                    )
+                    # Feed the outcome back into the ready queue
+                    if len(parts) == 2 and parts[0] == "global":
+                        global_finished = True
+                        scheduler.global_finished(parts[1])
+                    elif len(parts) == 2:
+                        scheduler.unit_finished(parts[0], parts[1])
+
+                # A global phase finished: pull its status/results (and
+                # anything other workers wrote) from Redis before scheduling
+                # its dependents.
+                if global_finished:
+                    await self._refresh_job_metadata(job)
+                    scheduler.sync_global_status()
 
                 # Periodic heartbeat (every 15 seconds) - ensures frontend
                 # sees progress even during long-running phases like 3-step config
@@ -550,13 +570,17 @@ class WorkflowBrain:
                 # phases are in-flight — either new activations or recovery
                 # 3-step configs). Each call fetches all WiFi networks from
                 # R1 to count venue-wide SSIDs, so keep it infrequent.
-                has_activation_work = any(
+                if now_ts - last_reconcile >= 30 and any(
                     ':activate_network' in key for key in in_flight
-                )
-                if has_activation_work and now_ts - last_reconcile >= 30:
+                ):
                     last_reconcile = now_ts
                     await self._reconcile_venue_wide_limit(job)
 
+            # Final metadata sync so the closing save_job() keeps resources
+            # and errors recorded by phases since the last refresh
+            if job.status != JobStatus.CANCELLED:
+                await self._refresh_job_metadata(job)
+
         except Exception as e:
             logger.error(f"Job {job.id}: Workflow execution error: {e}")
             job.status = JobStatus.FAILED
@@ -730,96 +754,31 @@ class WorkflowBrain:
     # Work Scheduling
     # =========================================================================
 
-    def _find_ready_work(
-        self,
-        job: WorkflowJobV2,
-        graph: DependencyGraph
-    ) -> List[Tuple[str, str]]:
+    async def _refresh_job_metadata(self, job: WorkflowJobV2) -> None:
         """
-        Find all (unit_id, phase_id) pairs ready to execute.
+        Refresh global job metadata from Redis.
 
-        A per-unit phase is ready when:
-        1. All dependencies are satisfied FOR THAT UNIT
-        2. The unit isn't already running a phase
-        3. The phase hasn't already completed/failed for that unit
+        Other workers (and global phase tasks) update global_phase_status,
+        created_resources, etc. in the job blob. Uses get_job_metadata() to
+        avoid reloading all units: in-memory units are already kept in sync
+        (each update_unit_phase_status call applies the result to job.units).
 
-        Returns:
-            List of (unit_id, phase_id) tuples
+        Non-fatal: a transient Redis error during this refresh must not hit
+        the top-level handler and fail the whole job. Keeps last-known
+        metadata and retries on the next refresh.
         """
-        ready = []
-        global_completed = {
-            pid for pid, status in job.global_phase_status.items()
-            if status == PhaseStatus.COMPLETED
-        }
-
-        for unit_id, unit in job.units.items():
-            if unit.status == UnitStatus.FAILED:
-                continue  # Skip failed units
-            if unit.current_phase is not None:
-                continue  # Unit is busy
-
-            completed_set = set(unit.completed_phases)
-            failed_set = set(unit.failed_phases)
-
-            ready_phases = graph.get_ready_work_for_unit(
-                unit_completed=completed_set,
-                unit_current=unit.current_phase,
-                global_completed=global_completed
-            )
-
-            # Filter out already completed/failed phases
-            for phase_id in ready_phases:
-                if phase_id not in completed_set and phase_id not in failed_set:
-                    ready.append((unit_id, phase_id))
-
-        return ready
-
-    def _find_ready_global_phases(
-        self,
-        job: WorkflowJobV2,
-        graph: DependencyGraph
-    ) -> List[str]:
-        """
-        Find global phases (per_unit=False) that are ready to execute.
-
-        Global phases can depend on:
-        - Other global phases (must be in global_completed)
-        - Per-unit phases (must be completed for ALL units)
-        """
-        ready = []
-        global_completed = {
-            pid for pid, status in job.global_phase_status.items()
-            if status == PhaseStatus.COMPLETED
-        }
-
-        # Build set of per-unit phases that are complete for ALL units
-        per_unit_completed_all = set()
-        per_unit_phase_ids = {p.id for p in job.phase_definitions if p.per_unit}
-
-        for phase_id in per_unit_phase_ids:
-            # Check if all units have completed this phase
-            all_complete = all(
-                phase_id in unit.completed_phases
-                for unit in job.units.values()
-            )
-            if all_complete:
-                per_unit_completed_all.add(phase_id)
-
-        for phase_def in job.phase_definitions:
-            if phase_def.per_unit:
-                continue  # Skip per-unit phases
-            if phase_def.id in job.global_phase_status:
-                continue  # Already started/completed/failed (incl. Phase 0)
-
-            # Check dependencies - can be global OR per-unit (all units done)
-            deps_met = all(
-                dep in global_completed or dep in per_unit_completed_all
-                for dep in phase_def.depends_on
+        try:
+            refreshed = await self.state.get_job_metadata(job.id)
+            if refreshed:
+                job.global_phase_status = refreshed.global_phase_status
+                job.global_phase_results = refreshed.global_phase_results
+                job.created_resources = refreshed.created_resources
+                job.errors = refreshed.errors
+        except Exception as e:
+            logger.warning(
+                f"Job {job.id}: metadata refresh failed ({e}); "
+                f"continuing with in-memory state"
             )
-            if deps_met:
-                ready.append(phase_def.id)
-
-        return ready
 
     # =========================================================================
     # Phase Execution
@@ -1990,7 +1949,7 @@ class WorkflowBrain:
                 f"resetting unit for retry ({self._ssid_gate_status()})"
             )
 
-            # Reset the unit to PENDING so _find_ready_work picks it up again.
+            # Reset the unit to PENDING so the scheduler picks it up again.
             # Clear the stale validation flags — the SSID is no longer on the
             # venue, so it needs a fresh Scenario C activation (not recovery).
             unit.status = UnitStatus.PENDING
@@ -0,0 +1,290 @@
+"""
+Incremental Ready-Queue Scheduler
+
+Tracks which (unit, phase) pairs and global phases are ready to execute
+for a running WorkflowJobV2, updating only what an event touched.
+
+The brain's loop used to rebuild completed/failed sets for every unit,
+re-scan every unit for each global phase, and re-check workflow completion
+across all units on every 250 ms tick: O(units × phases) work several times
+a second regardless of whether anything had changed. Instead:
+
+- A unit is re-evaluated only when one of its phase tasks finishes. A
+  completed phase checks just its per-unit successors; failures, requeues
+  and units that were busy when work became ready re-check the whole unit.
+- Per-unit phase completions are counted, so a global phase that waits on
+  "phase X done for ALL units" is a counter comparison.
+- A newly completed global phase re-checks only the per-unit phases that
+  depend on it.
+- Workflow completion is "no unit has runnable work left and every global
+  phase is done", kept as a set of unsettled units.
+
+job.units stays the source of truth (the brain and state manager replace
+those objects as phases run); the scheduler diffs each unit against what it
+last observed, so it tolerates units being reset or reloaded underneath it.
+"""
+
+import logging
+from collections import deque
+from typing import Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from utils.safe_eval import safe_eval
+from workflow.v2.graph import DependencyGraph
+from workflow.v2.models import PhaseStatus, UnitStatus, WorkflowJobV2
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_DONE_STATUSES = (PhaseStatus.COMPLETED, PhaseStatus.FAILED, PhaseStatus.SKIPPED)
+
+
+class PhaseScheduler:
+    """
+    Ready-queue of phase work for one job.
+
+    Usage (from WorkflowBrain.execute_workflow):
+        scheduler = PhaseScheduler(job, graph)
+        scheduler.start()
+        while not scheduler.is_complete():
+            for unit_id, phase_id in scheduler.pop_ready(): launch...
+            for phase_id in scheduler.pop_ready_global(): launch...
+            ... on task finish: scheduler.unit_finished(unit_id, phase_id)
+                                scheduler.sync_global_status()
+    """
+
+    def __init__(self, job: WorkflowJobV2, graph: DependencyGraph):
+        self.job = job
+        self.graph = graph
+
+        # skip_if only looks at job options, which don't change mid-run
+        self.skipped: Set[str] = set()
+        for phase_def in job.phase_definitions:
+            if phase_def.skip_if:
+                try:
+                    if safe_eval(phase_def.skip_if, {"options": job.options}):
+                        self.skipped.add(phase_def.id)
+                except Exception:
+                    pass
+
+        self.per_unit_phases: List[str] = [
+            p.id for p in job.phase_definitions if p.per_unit
+        ]
+        self._per_unit_set: FrozenSet[str] = frozenset(self.per_unit_phases)
+        self.global_phases = [p for p in job.phase_definitions if not p.per_unit]
+
+        self._deps: Dict[str, Set[str]] = {
+            pid: graph.get_dependencies(pid) for pid in self.per_unit_phases
+        }
+        # phase → per-unit phases that depend on it (per-unit or global parent)
+        self._unit_successors: Dict[str, Set[str]] = {
+            p.id: graph.get_dependents(p.id) & self._per_unit_set
+            for p in job.phase_definitions
+        }
+
+        # Per-unit phase → number of units that have completed it
+        self._done_count: Dict[str, int] = {pid: 0 for pid in self.per_unit_phases}
+        self._seen_completed: Dict[str, FrozenSet[str]] = {}
+
+        self._global_completed: Set[str] = set()
+        self._unsettled: Set[str] = set()
+
+        # unit → phases to re-check once the unit is idle (None = all phases)
+        self._deferred: Dict[str, Optional[Set[str]]] = {}
+
+        # Work handed out and not yet reported finished
+        self._queued: Set[Tuple[str, str]] = set()
+        self._queued_global: Set[str] = set()
+
+        self._ready: Deque[Tuple[str, str]] = deque()
+        self._ready_global: Deque[str] = deque()
+
+    # =========================================================================
+    # Events
+    # =========================================================================
+
+    def start(self) -> None:
+        """Evaluate every unit once (after pre-completion, before the loop)."""
+        self._global_completed = self._completed_globals()
+        self.resync()
+
+    def resync(self) -> None:
+        """Full re-evaluation of every unit. O(units × phases); rarely needed."""
+        for unit_id in self.job.units:
+            self._observe(unit_id, None)
+        self._check_globals()
+
+    def unit_finished(self, unit_id: str, phase_id: str) -> None:
+        """
+        A per-unit phase task finished (success, failure, requeue or error).
+
+        A completed phase only unblocks its successors. Anything else (failed,
+        reset for retry) re-checks the whole unit.
+        """
+        self._queued.discard((unit_id, phase_id))
+        unit = self.job.units.get(unit_id)
+        if unit is not None and phase_id in unit.completed_phases:
+            candidates = set(self._unit_successors.get(phase_id, ()))
+        else:
+            candidates = None
+        self._observe(unit_id, candidates)
+        self._check_globals()
+
+    def global_finished(self, phase_id: str) -> None:
+        """A global phase task finished; its status is already in job."""
+        self._queued_global.discard(phase_id)
+        self.sync_global_status()
+
+    def sync_global_status(self) -> None:
+        """
+        Pick up global phase status changes (own tasks or other workers).
+
+        Newly completed global phases re-check only their per-unit
+        dependents. Unit settledness depends on global completions too, so
+        those units are re-observed as well.
+        """
+        completed = self._completed_globals()
+        newly_completed = completed - self._global_completed
+        self._global_completed = completed
+        if newly_completed:
+            candidates: Set[str] = set()
+            for phase_id in newly_completed:
+                candidates |= self._unit_successors.get(phase_id, set())
+            logger.debug(
+                f"Job {self.job.id}: global phase(s) {sorted(newly_completed)} "
+                f"completed, re-checking {sorted(candidates)} for "
+                f"{len(self.job.units)} units"
+            )
+            for unit_id in self.job.units:
+                self._observe(unit_id, candidates)
+        self._check_globals()
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def pop_ready(self) -> List[Tuple[str, str]]:
+        """Drain ready (unit_id, phase_id) pairs."""
+        ready = list(self._ready)
+        self._ready.clear()
+        return ready
+
+    def pop_ready_global(self) -> List[str]:
+        """Drain ready global phase IDs."""
+        ready = list(self._ready_global)
+        self._ready_global.clear()
+        return ready
+
+    def is_complete(self) -> bool:
+        """True when no unit has runnable work and every global phase is done."""
+        if self._unsettled or self._ready or self._queued:
+            return False
+        if self._ready_global or self._queued_global:
+            return False
+        for phase_def in self.global_phases:
+            if phase_def.id in self.skipped:
+                continue
+            if self.job.global_phase_status.get(phase_def.id) not in GLOBAL_DONE_STATUSES:
+                return False
+        return True
+
+    def units_done(self, phase_id: str) -> int:
+        """Number of units that have completed a per-unit phase."""
+        return self._done_count.get(phase_id, 0)
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _completed_globals(self) -> Set[str]:
+        return {
+            pid for pid, status in self.job.global_phase_status.items()
+            if status == PhaseStatus.COMPLETED
+        }
+
+    def _observe(self, unit_id: str, candidates: Optional[Iterable[str]]) -> None:
+        """
+        Re-read one unit: update completion counters, settledness, and push
+        any of `candidates` (None = every per-unit phase) that became ready.
+        """
+        unit = self.job.units.get(unit_id)
+        if unit is None:
+            self._unsettled.discard(unit_id)
+            return
+
+        completed = frozenset(unit.completed_phases)
+        previous = self._seen_completed.get(unit_id, frozenset())
+        if completed != previous:
+            for phase_id in completed - previous:
+                if phase_id in self._done_count:
+                    self._done_count[phase_id] += 1
+            for phase_id in previous - completed:
+                if phase_id in self._done_count:
+                    self._done_count[phase_id] -= 1
+            self._seen_completed[unit_id] = completed
+
+        if unit.status == UnitStatus.FAILED:
+            self._unsettled.discard(unit_id)
+            self._deferred.pop(unit_id, None)
+            return
+
+        failed = set(unit.failed_phases)
+
+        # Settledness mirrors WorkflowBrain._is_workflow_complete: a unit is
+        # still in play while some remaining phase has all of its
+        # dependencies completed/failed/skipped (or globally completed).
+        done = completed | failed | self.skipped
+        satisfied = done | self._global_completed
+        if any(
+            pid not in done and self._deps[pid] <= satisfied
+            for pid in self.per_unit_phases
+        ):
+            self._unsettled.add(unit_id)
+        else:
+            self._unsettled.discard(unit_id)
+
+        if unit.current_phase is not None:
+            # Unit is busy; check these again when its running phase finishes
+            self._defer(unit_id, candidates)
+            return
+
+        pending = self._deferred.pop(unit_id, set())
+        if candidates is None or pending is None:
+            to_check: Iterable[str] = self.per_unit_phases
+        else:
+            to_check = set(candidates) | pending
+
+        available = completed | self._global_completed
+        for phase_id in to_check:
+            if phase_id in completed or phase_id in failed:
+                continue
+            key = (unit_id, phase_id)
+            if key in self._queued:
+                continue
+            if self._deps[phase_id] <= available:
+                self._queued.add(key)
+                self._ready.append(key)
+
+    def _defer(self, unit_id: str, candidates: Optional[Iterable[str]]) -> None:
+        if unit_id in self._deferred:
+            existing = self._deferred[unit_id]
+            if existing is None or candidates is None:
+                self._deferred[unit_id] = None
+            else:
+                existing.update(candidates)
+        else:
+            self._deferred[unit_id] = None if candidates is None else set(candidates)
+
+    def _check_globals(self) -> None:
+        """Queue global phases whose dependencies are met. O(global phases)."""
+        total_units = len(self.job.units)
+        for phase_def in self.global_phases:
+            if phase_def.id in self.job.global_phase_status:
+                continue  # Already started/completed/failed (incl. Phase 0)
+            if phase_def.id in self._queued_global:
+                continue
+            if all(
+                dep in self._global_completed
+                or (dep in self._done_count and self._done_count[dep] == total_units)
+                for dep in phase_def.depends_on
+            ):
+                self._queued_global.add(phase_def.id)
+                self._ready_global.append(phase_def.id)
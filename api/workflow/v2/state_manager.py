@@ -6,11 +6,14 @@ Supports per-unit atomic updates for multi-worker parallel execution.
 
 Redis Key Schema:
     workflow:v2:jobs:{job_id}                    → WorkflowJobV2 (full state)
-    workflow:v2:jobs:{job_id}:units:{unit_id}    → UnitMapping (per-unit state)
+    workflow:v2:jobs:{job_id}:units:{unit_id}    → UnitMapping JSON (per-unit state, "json" mode)
+    workflow:v2:jobs:{job_id}:unit_state:{unit_id} → Hash (per-unit state, "hash" mode)
+    workflow:v2:jobs:{job_id}:unit_ids           → Set of unit IDs (unit index, plus a completeness marker)
     workflow:v2:jobs:{job_id}:activities          → Set of pending activity IDs
     workflow:v2:activities:pending                → Hash: activity_id → ActivityRef JSON
     workflow:v2:events:{job_id}                   → Pub/Sub channel for job events
     workflow:v2:events:global                     → Global event channel
+    workflow:v2:activities:updates                → Pub/Sub channel for R1 activity webhooks
     workflow:v2:jobs:index                        → Sorted Set: job_id → timestamp
     workflow:v2:jobs:by_venue:{venue_id}          → Set of job IDs
     workflow:v2:jobs:active                       → Set of running job IDs
@@ -21,13 +24,15 @@ Redis Key Schema:
 import json
 import logging
 import asyncio
+import os
 import redis.asyncio as redis
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Set
 from datetime import datetime, timedelta
 
 from workflow.v2.models import (
     WorkflowJobV2,
     UnitMapping,
+    UnitResolved,
     JobStatus,
     PhaseStatus,
     UnitStatus,
@@ -44,6 +49,134 @@ UNIT_LOCK_TTL_SECONDS = 60     # 1 minute (shorter for fine-grained ops)
 # Key prefixes
 PREFIX = "workflow:v2"
 
+# Per-unit storage layout:
+#   "hash" - one Redis hash per unit; phase start/finish and resolved-field
+#            updates are single Lua calls (no lock, no full-unit rewrite)
+#   "json" - one UnitMapping JSON blob per unit, read-modify-write under a
+#            per-unit lock (original layout)
+# Reads understand both layouts, so switching modes doesn't strand units
+# written by jobs that are already running.
+UNIT_STORAGE = os.getenv("WORKFLOW_V2_UNIT_STORAGE", "hash").lower()
+
+# Hash field namespaces (phase IDs / field names follow the colon). Phase
+# fields hold an ordinal so completed_phases/failed_phases keep their order.
+_DONE = "done:"
+_FAIL = "fail:"
+_ERR = "err:"
+_RES = "res:"
+_EXTRA = "extra:"
+_SEQ = "seq"
+_RESOLVED_FIELDS = frozenset(UnitResolved.model_fields) - {"extra"}
+
+# Units fetched per pipeline / MGET round trip. Bounds the size of any single
+# Redis reply (and the parse burst behind it) on very large jobs.
+UNIT_FETCH_CHUNK = 500
+
+# Member of a unit index that has every unit of its job. An index without it
+# may be partial (a job that saved units before the index existed) and is
+# completed by a SCAN before it is extended.
+_INDEX_COMPLETE = "__complete__"
+
+# Start/complete/fail a phase and return the updated hash in one round trip.
+# KEYS[1] = unit hash
+# ARGV = action ("start" | "complete" | "fail"), phase_id,
+#        current_phase JSON, status JSON, error ("" = none), ttl
+_PHASE_STATUS_LUA = """
+local key = KEYS[1]
+if redis.call('EXISTS', key) == 0 then
+    return {}
+end
+local action, phase = ARGV[1], ARGV[2]
+if action == 'start' then
+    redis.call('HSET', key, 'current_phase', ARGV[3], 'status', ARGV[4])
+else
+    redis.call('HSET', key, 'current_phase', 'null')
+    local prefix = 'done:'
+    if action == 'fail' then
+        prefix = 'fail:'
+    end
+    if redis.call('HEXISTS', key, prefix .. phase) == 0 then
+        redis.call('HSET', key, prefix .. phase, redis.call('HINCRBY', key, 'seq', 1))
+    end
+    if action == 'fail' and ARGV[5] ~= '' then
+        redis.call('HSET', key, 'err:' .. phase, ARGV[5])
+    end
+end
+redis.call('EXPIRE', key, ARGV[6])
+return redis.call('HGETALL', key)
+"""
+
+# Set one field on an existing unit hash.
+# KEYS[1] = unit hash; ARGV = field, value, ttl
+_SET_FIELD_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+
+def _unit_to_hash(unit: UnitMapping) -> Dict[str, str]:
+    """Flatten a UnitMapping into hash fields (values are JSON-encoded)."""
+    data = unit.model_dump(mode="json")
+    completed = data.pop("completed_phases")
+    failed = data.pop("failed_phases")
+    errors = data.pop("phase_errors")
+    resolved = data.pop("resolved")
+    extra = resolved.pop("extra", {})
+
+    fields = {name: json.dumps(value) for name, value in data.items()}
+    for i, phase_id in enumerate(completed + failed):
+        prefix = _DONE if i < len(completed) else _FAIL
+        fields[f"{prefix}{phase_id}"] = str(i)
+    fields[_SEQ] = str(len(completed) + len(failed))
+    for phase_id, error in errors.items():
+        fields[f"{_ERR}{phase_id}"] = error
+    for name, value in resolved.items():
+        fields[f"{_RES}{name}"] = json.dumps(value)
+    for name, value in extra.items():
+        fields[f"{_EXTRA}{name}"] = json.dumps(value)
+    return fields
+
+
+def _unit_from_hash(fields: Dict[str, str]) -> Optional[UnitMapping]:
+    """Rebuild a UnitMapping from its hash fields (inverse of _unit_to_hash)."""
+    if not fields:
+        return None
+    data: Dict[str, Any] = {}
+    done, fail = [], []
+    errors: Dict[str, str] = {}
+    resolved: Dict[str, Any] = {}
+    extra: Dict[str, Any] = {}
+
+    for field, value in fields.items():
+        if field.startswith(_DONE):
+            done.append((int(value), field[len(_DONE):]))
+        elif field.startswith(_FAIL):
+            fail.append((int(value), field[len(_FAIL):]))
+        elif field.startswith(_ERR):
+            errors[field[len(_ERR):]] = value
+        elif field.startswith(_RES):
+            resolved[field[len(_RES):]] = json.loads(value)
+        elif field.startswith(_EXTRA):
+            extra[field[len(_EXTRA):]] = json.loads(value)
+        elif field != _SEQ:
+            data[field] = json.loads(value)
+
+    resolved["extra"] = extra
+    data["resolved"] = resolved
+    data["completed_phases"] = [phase_id for _, phase_id in sorted(done)]
+    data["failed_phases"] = [phase_id for _, phase_id in sorted(fail)]
+    data["phase_errors"] = errors
+    return UnitMapping(**data)
+
+
+def _pairs_to_dict(flat: List[str]) -> Dict[str, str]:
+    """Lua returns HGETALL as a flat [field, value, ...] list."""
+    return dict(zip(flat[::2], flat[1::2]))
+
 
 class RedisStateManagerV2:
     """
@@ -55,8 +188,15 @@ class RedisStateManagerV2:
     - Pub/Sub for event notifications
     """
 
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(self, redis_client: redis.Redis, unit_storage: str = None):
         self.redis = redis_client
+        self.unit_storage = (unit_storage or UNIT_STORAGE).lower()
+        # register_script only computes the SHA; the script is loaded on
+        # first use (EVALSHA, falling back to EVAL)
+        self._phase_status_script = redis_client.register_script(_PHASE_STATUS_LUA)
+        self._set_field_script = redis_client.register_script(_SET_FIELD_LUA)
+        # Jobs whose unit index this instance has seen complete
+        self._indexed_jobs: Set[str] = set()
 
     # =========================================================================
     # Job Operations
@@ -142,15 +282,32 @@ class RedisStateManagerV2:
             except Exception:
                 pass
 
-        # Find all related keys
-        keys = []
-        async for key in self.redis.scan_iter(match=f"{PREFIX}:jobs:{job_id}*"):
-            keys.append(key)
-        async for key in self.redis.scan_iter(match=f"{PREFIX}:units:{job_id}*"):
-            keys.append(key)
+        # Find all related keys. Jobs with a complete unit index name every
+        # key directly; jobs without one (or with a partial one) fall back
+        # to SCAN.
+        self._indexed_jobs.discard(job_id)
+        unit_ids = await self.redis.smembers(self._unit_index_key(job_id))
+        if _INDEX_COMPLETE in unit_ids:
+            unit_ids.discard(_INDEX_COMPLETE)
+            keys = [
+                job_key,
+                f"{PREFIX}:jobs:{job_id}:activities",
+                f"{PREFIX}:jobs:{job_id}:cancelled",
+                f"{PREFIX}:jobs:{job_id}:lock",
+                self._unit_index_key(job_id),
+            ]
+            for unit_id in unit_ids:
+                keys.append(f"{PREFIX}:units:{job_id}:{unit_id}:lock")
+            keys.extend(self._unit_state_keys(job_id, unit_ids))
+        else:
+            keys = [job_key]
+            async for key in self.redis.scan_iter(match=f"{PREFIX}:jobs:{job_id}:*"):
+                keys.append(key)
+            async for key in self.redis.scan_iter(match=f"{PREFIX}:units:{job_id}:*"):
+                keys.append(key)
 
-        if keys:
-            await self.redis.delete(*keys)
+        for i in range(0, len(keys), UNIT_FETCH_CHUNK):
+            await self.redis.delete(*keys[i:i + UNIT_FETCH_CHUNK])
 
         # Clean up indexes
         pipe = self.redis.pipeline()
@@ -223,55 +380,177 @@ class RedisStateManagerV2:
     # Unit Operations (atomic per-unit updates)
     # =========================================================================
 
+    def _unit_key(self, job_id: str, unit_id: str) -> str:
+        """Legacy JSON key for a unit."""
+        return f"{PREFIX}:jobs:{job_id}:units:{unit_id}"
+
+    def _unit_hash_key(self, job_id: str, unit_id: str) -> str:
+        return f"{PREFIX}:jobs:{job_id}:unit_state:{unit_id}"
+
+    def _unit_index_key(self, job_id: str) -> str:
+        return f"{PREFIX}:jobs:{job_id}:unit_ids"
+
+    def _unit_state_keys(self, job_id: str, unit_ids) -> List[str]:
+        """Every per-unit key of a job, in both layouts."""
+        keys = []
+        for unit_id in unit_ids:
+            keys.append(self._unit_key(job_id, unit_id))
+            keys.append(self._unit_hash_key(job_id, unit_id))
+        return keys
+
+    def _queue_unit_write(self, pipe, job_id: str, unit: UnitMapping) -> None:
+        """Queue a full unit write plus its index entry on a pipeline."""
+        if self.unit_storage == "hash":
+            key = self._unit_hash_key(job_id, unit.unit_id)
+            # DEL first so phases/fields removed in memory (e.g. a requeued
+            # unit's failed phase) don't survive in the hash
+            pipe.delete(key, self._unit_key(job_id, unit.unit_id))
+            pipe.hset(key, mapping=_unit_to_hash(unit))
+            pipe.expire(key, JOB_TTL_SECONDS)
+        else:
+            # Drop any hash copy so reads (which prefer the hash) see this write
+            pipe.delete(self._unit_hash_key(job_id, unit.unit_id))
+            pipe.setex(
+                self._unit_key(job_id, unit.unit_id),
+                JOB_TTL_SECONDS,
+                unit.model_dump_json(),
+            )
+        pipe.sadd(self._unit_index_key(job_id), unit.unit_id)
+
     async def save_unit(self, job_id: str, unit: UnitMapping) -> bool:
         """
         Save a single unit's state atomically.
         This is the primary update method for multi-worker execution.
         """
-        key = f"{PREFIX}:jobs:{job_id}:units:{unit.unit_id}"
-        unit_data = unit.model_dump_json()
-        await self.redis.setex(key, JOB_TTL_SECONDS, unit_data)
+        await self._ensure_unit_index(job_id)
+        pipe = self.redis.pipeline(transaction=True)
+        self._queue_unit_write(pipe, job_id, unit)
+        pipe.expire(self._unit_index_key(job_id), JOB_TTL_SECONDS)
+        await pipe.execute()
         return True
 
     async def get_unit(self, job_id: str, unit_id: str) -> Optional[UnitMapping]:
-        """Get a single unit's state."""
-        key = f"{PREFIX}:jobs:{job_id}:units:{unit_id}"
-        data = await self.redis.get(key)
+        """Get a single unit's state (hash layout first, then legacy JSON)."""
+        fields = await self.redis.hgetall(self._unit_hash_key(job_id, unit_id))
+        if fields:
+            return _unit_from_hash(fields)
+        data = await self.redis.get(self._unit_key(job_id, unit_id))
         if not data:
             return None
         return UnitMapping(**json.loads(data))
 
     async def save_all_units(self, job_id: str, units: Dict[str, UnitMapping]) -> bool:
         """Save all units in a pipeline (used during initial setup)."""
+        await self._ensure_unit_index(job_id)
         pipe = self.redis.pipeline()
-        for unit_id, unit in units.items():
-            key = f"{PREFIX}:jobs:{job_id}:units:{unit_id}"
-            pipe.setex(key, JOB_TTL_SECONDS, unit.model_dump_json())
+        for unit in units.values():
+            self._queue_unit_write(pipe, job_id, unit)
+        pipe.expire(self._unit_index_key(job_id), JOB_TTL_SECONDS)
         await pipe.execute()
         return True
 
     async def get_all_units(self, job_id: str) -> Dict[str, UnitMapping]:
-        """Get all units for a job using batch MGET for performance."""
-        # Collect all unit keys via SCAN
-        keys = []
-        async for key in self.redis.scan_iter(
-            match=f"{PREFIX}:jobs:{job_id}:units:*"
-        ):
-            keys.append(key)
-
-        if not keys:
-            return {}
-
-        # Batch fetch all values in one MGET call instead of N individual GETs
-        values = await self.redis.mget(keys)
-
+        """Get all units for a job, keyed by unit_id (see iter_units)."""
         units = {}
-        for data in values:
-            if data:
-                unit = UnitMapping(**json.loads(data))
+        async for chunk in self.iter_units(job_id):
+            for unit in chunk:
                 units[unit.unit_id] = unit
         return units
 
+    async def iter_units(
+        self,
+        job_id: str,
+        chunk_size: int = UNIT_FETCH_CHUNK,
+    ) -> AsyncIterator[List[UnitMapping]]:
+        """
+        Stream a job's units in chunks.
+
+        Unit IDs come from the job's unit index, so cost scales with the job
+        rather than with everything else in Redis. Each chunk is one pipeline
+        of HGETALLs plus, for units still in the JSON layout, one MGET; it is
+        parsed and yielded before the next is fetched.
+
+        Jobs saved before the index existed, whose index is missing or
+        partial (no completeness marker), are found with a one-off SCAN, and
+        the index is backfilled so later reads skip it.
+        """
+        unit_ids = await self.redis.smembers(self._unit_index_key(job_id))
+        if _INDEX_COMPLETE in unit_ids:
+            unit_ids.discard(_INDEX_COMPLETE)
+            unit_ids = sorted(unit_ids)
+        else:
+            unit_ids = await self._backfill_unit_index(job_id)
+        self._indexed_jobs.add(job_id)
+
+        for i in range(0, len(unit_ids), chunk_size):
+            chunk_ids = unit_ids[i:i + chunk_size]
+
+            pipe = self.redis.pipeline(transaction=False)
+            for unit_id in chunk_ids:
+                pipe.hgetall(self._unit_hash_key(job_id, unit_id))
+            hashes = await pipe.execute()
+
+            units = []
+            legacy_ids = []
+            for unit_id, fields in zip(chunk_ids, hashes):
+                if fields:
+                    units.append(_unit_from_hash(fields))
+                else:
+                    legacy_ids.append(unit_id)
+
+            if legacy_ids:
+                values = await self.redis.mget(
+                    [self._unit_key(job_id, unit_id) for unit_id in legacy_ids]
+                )
+                for data in values:
+                    if data:
+                        units.append(UnitMapping(**json.loads(data)))
+
+            if units:
+                yield units
+
+    async def _ensure_unit_index(self, job_id: str) -> None:
+        """
+        Complete a job's unit index before adding to it.
+
+        A job that saved units before the index existed has no index, or one
+        holding only the units saved since. Writing to it as is would leave a
+        partial set that reads trust, so its unit keys are backfilled first.
+        Costs one SISMEMBER per job and instance, plus one SCAN per job.
+        """
+        if job_id in self._indexed_jobs:
+            return
+        if not await self.redis.sismember(self._unit_index_key(job_id), _INDEX_COMPLETE):
+            await self._backfill_unit_index(job_id)
+        self._indexed_jobs.add(job_id)
+
+    async def _backfill_unit_index(self, job_id: str) -> List[str]:
+        """
+        Add every unit key of a job (both layouts) to its unit index and mark
+        it complete. Returns the job's unit IDs.
+        """
+        scanned = set()
+        prefixes = (
+            f"{PREFIX}:jobs:{job_id}:units:",
+            f"{PREFIX}:jobs:{job_id}:unit_state:",
+        )
+        async for key in self.redis.scan_iter(match=f"{PREFIX}:jobs:{job_id}:*"):
+            for prefix in prefixes:
+                if key.startswith(prefix):
+                    scanned.add(key[len(prefix):])
+
+        # Units saved concurrently are SADDed by their writer, so the result
+        # is the union of the SCAN and whatever the index already holds
+        index_key = self._unit_index_key(job_id)
+        pipe = self.redis.pipeline()
+        pipe.sadd(index_key, _INDEX_COMPLETE, *scanned)
+        pipe.expire(index_key, JOB_TTL_SECONDS)
+        pipe.smembers(index_key)
+        unit_ids = (await pipe.execute())[-1]
+        unit_ids.discard(_INDEX_COMPLETE)
+        logger.info(f"Backfilled unit index for job {job_id} ({len(unit_ids)} units)")
+        return sorted(unit_ids)
+
     async def update_unit_phase_status(
         self,
         job_id: str,
@@ -284,7 +563,33 @@ class RedisStateManagerV2:
         """
         Update a unit's phase status atomically.
         Returns the updated unit mapping.
+
+        Hash-stored units are updated by a single Lua call that also returns
+        the new state; units in the JSON layout use a locked read-modify-write.
         """
+        if self.unit_storage == "hash":
+            if completed:
+                action = "complete"
+            elif failed:
+                action = "fail"
+            else:
+                action = "start"
+            flat = await self._phase_status_script(
+                keys=[self._unit_hash_key(job_id, unit_id)],
+                args=[
+                    action,
+                    phase_id,
+                    json.dumps(phase_id),
+                    json.dumps(UnitStatus.RUNNING.value),
+                    (error or "") if failed else "",
+                    JOB_TTL_SECONDS,
+                ],
+            )
+            if flat:
+                return _unit_from_hash(_pairs_to_dict(flat))
+            # Not stored as a hash yet (job started before the switch):
+            # the locked path below migrates it on save_unit()
+
         async with self._unit_lock(job_id, unit_id):
             unit = await self.get_unit(job_id, unit_id)
             if not unit:
@@ -319,6 +624,21 @@ class RedisStateManagerV2:
         Update a single resolved field on a unit.
         Used to enrich unit mapping as phases complete.
         """
+        if self.unit_storage == "hash":
+            # Known UnitResolved fields get their own hash field; anything
+            # else goes to the extensible extra dict
+            prefix = _RES if field_name in _RESOLVED_FIELDS else _EXTRA
+            updated = await self._set_field_script(
+                keys=[self._unit_hash_key(job_id, unit_id)],
+                args=[
+                    f"{prefix}{field_name}",
+                    json.dumps(value, default=str),
+                    JOB_TTL_SECONDS,
+                ],
+            )
+            if updated:
+                return True
+
         async with self._unit_lock(job_id, unit_id):
             unit = await self.get_unit(job_id, unit_id)
             if not unit:
@@ -454,6 +774,26 @@ class RedisStateManagerV2:
         await pubsub.subscribe(f"{PREFIX}:events:{job_id}")
         return pubsub
 
+    async def publish_activity_update(
+        self,
+        activity: Dict[str, Any],
+        tenant_id: str = None
+    ) -> None:
+        """
+        Broadcast an R1 activity notification (from the webhook receiver)
+        to ActivityTrackers on every worker.
+        """
+        await self.redis.publish(
+            f"{PREFIX}:activities:updates",
+            json.dumps({"tenant_id": tenant_id, "activity": activity}, default=str)
+        )
+
+    async def subscribe_activity_updates(self):
+        """Get a pub/sub subscription for R1 activity notifications."""
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(f"{PREFIX}:activities:updates")
+        return pubsub
+
     # =========================================================================
     # Cancellation
     # =========================================================================
@@ -501,9 +841,12 @@ class RedisStateManagerV2:
         Clean up stale Redis indexes where job data has already expired.
 
         Prunes: jobs:index, jobs:active, jobs:by_venue:*, and the
-        legacy v1 workflow:jobs:index.
+        legacy v1 workflow:jobs:index. For every expired job found along the
+        way, unit state that outlived the job blob (unit keys get their TTL
+        refreshed on each write) is deleted through the job's unit index.
         """
-        stats = {"index": 0, "active": 0, "by_venue": 0, "v1_index": 0}
+        stats = {"index": 0, "active": 0, "by_venue": 0, "v1_index": 0, "units": 0}
+        expired_job_ids = set()
 
         # 1. Clean v2 jobs:index — remove entries whose job data no longer exists
         all_indexed = await self.redis.zrange(f"{PREFIX}:jobs:index", 0, -1)
@@ -516,6 +859,7 @@ class RedisStateManagerV2:
             if stale_ids:
                 await self.redis.zrem(f"{PREFIX}:jobs:index", *stale_ids)
                 stats["index"] = len(stale_ids)
+                expired_job_ids.update(stale_ids)
 
         # 2. Clean jobs:active — remove entries whose job data no longer exists
         active_ids = await self.redis.smembers(f"{PREFIX}:jobs:active")
@@ -528,6 +872,7 @@ class RedisStateManagerV2:
             if stale_ids:
                 await self.redis.srem(f"{PREFIX}:jobs:active", *stale_ids)
                 stats["active"] = len(stale_ids)
+                expired_job_ids.update(stale_ids)
 
         # 3. Clean by_venue sets — remove stale job IDs, delete empty sets
         by_venue_keys = []
@@ -546,6 +891,7 @@ class RedisStateManagerV2:
             if stale_ids:
                 await self.redis.srem(venue_key, *stale_ids)
                 stats["by_venue"] += len(stale_ids)
+                expired_job_ids.update(stale_ids)
             # Remove the set entirely if now empty
             if await self.redis.scard(venue_key) == 0:
                 await self.redis.delete(venue_key)
@@ -567,13 +913,37 @@ class RedisStateManagerV2:
             if await self.redis.zcard(v1_index_key) == 0:
                 await self.redis.delete(v1_index_key)
 
+        # 5. Delete unit state left behind by expired jobs, via their unit index
+        for job_id in expired_job_ids:
+            stats["units"] += await self._prune_unit_state(job_id)
+
         logger.info(
             f"Redis cleanup complete: {stats['index']} from index, "
             f"{stats['active']} from active, {stats['by_venue']} from by_venue, "
-            f"{stats['v1_index']} from v1 index"
+            f"{stats['v1_index']} from v1 index, {stats['units']} orphaned unit keys"
         )
         return stats
 
+    async def _prune_unit_state(self, job_id: str) -> int:
+        """
+        Delete every unit key of a job listed in its unit index. A job whose
+        index is not marked complete also has its unit keys SCANned.
+        """
+        unit_ids = await self.redis.smembers(self._unit_index_key(job_id))
+        if not unit_ids:
+            return 0
+        complete = _INDEX_COMPLETE in unit_ids
+        unit_ids.discard(_INDEX_COMPLETE)
+        keys = self._unit_state_keys(job_id, unit_ids)
+        if not complete:
+            async for key in self.redis.scan_iter(match=f"{PREFIX}:jobs:{job_id}:unit*:*"):
+                keys.append(key)
+        deleted = 0
+        for i in range(0, len(keys), UNIT_FETCH_CHUNK):
+            deleted += await self.redis.delete(*keys[i:i + UNIT_FETCH_CHUNK])
+        await self.redis.delete(self._unit_index_key(job_id))
+        return deleted
+
 
 class _RedisLock:
     """Async context manager for distributed Redis locks."""